@@ -83,6 +83,7 @@ def runtests():
     if args.bench:
         benchmarks = [
             "wagtail.admin.tests.benches",
+            "wagtail.search.tests.benches",
         ]
 
         argv = [sys.argv[0], "test", "-v2"] + benchmarks + rest
@@ -1,12 +1,22 @@
 import logging
 import uuid
+from collections import defaultdict
 
 from django.core.exceptions import PermissionDenied
-from modelcluster.models import get_all_child_relations
+from django.db import connection, transaction
+from django.utils import timezone
+from modelcluster.models import (
+    ClusterableModel,
+    get_all_child_m2m_relations,
+    get_all_child_relations,
+)
 
 from wagtail.log_actions import log
+from wagtail.log_actions import registry as log_registry
 from wagtail.models.copying import _copy, _copy_m2m_relations
 from wagtail.models.i18n import TranslatableMixin
+from wagtail.models.reference_index import ReferenceIndex
+from wagtail.search import index
 from wagtail.signals import page_published
 
 logger = logging.getLogger("wagtail")
@@ -31,6 +41,13 @@ class CopyPagePermissionError(PermissionDenied):
 class CopyPageAction:
     """
     Copies pages and page trees.
+
+    When ``bulk`` is ``True``, the descendants of a recursively copied page are created
+    with a fixed number of queries per page type rather than one page at a time: their tree
+    paths are allocated all at once, and their rows, child objects, revisions and log
+    entries are inserted in bulk. ``save()`` is not called on the copied descendants, and
+    the ``page_published`` signal is only sent for them if ``send_published_signals`` is
+    ``True``.
     """
 
     def __init__(
@@ -46,6 +63,8 @@ class CopyPageAction:
         process_child_object=None,
         log_action="wagtail.copy",
         reset_translation_key=True,
+        bulk=False,
+        send_published_signals=False,
     ):
         # Note: These four parameters don't apply to any copied children
         self.page = page
@@ -60,6 +79,8 @@ class CopyPageAction:
         self.process_child_object = process_child_object
         self.log_action = log_action
         self.reset_translation_key = reset_translation_key
+        self.bulk = bulk
+        self.send_published_signals = send_published_signals
         self._uuid_mapping = {}
 
     def generate_translation_key(self, old_uuid):
@@ -111,15 +132,7 @@ class CopyPageAction:
                         "You do not have permission to publish a page at the destination"
                     )
 
-    def _copy_page(
-        self, page, to=None, update_attrs=None, exclude_fields=None, _mpnode_attrs=None
-    ):
-        specific_page = page.specific
-        exclude_fields = (
-            specific_page.default_exclude_fields_in_copy
-            + specific_page.exclude_fields_in_copy
-            + (exclude_fields or [])
-        )
+    def _get_base_update_attrs(self, update_attrs=None):
         if self.keep_live:
             base_update_attrs = {
                 "alias_of": None,
@@ -131,6 +144,7 @@ class CopyPageAction:
                 "live_revision": None,
                 "first_published_at": None,
                 "last_published_at": None,
+                "last_published_by": None,
                 "alias_of": None,
             }
 
@@ -144,6 +158,12 @@ class CopyPageAction:
         if update_attrs:
             base_update_attrs.update(update_attrs)
 
+        return base_update_attrs
+
+    def _copy_specific_page(self, specific_page, exclude_fields, base_update_attrs):
+        """
+        Returns an unsaved copy of the page along with its (also unsaved) child objects
+        """
         page_copy, child_object_map = _copy(
             specific_page, exclude_fields=exclude_fields, update_attrs=base_update_attrs
         )
@@ -162,6 +182,85 @@ class CopyPageAction:
                     child_object.translation_key
                 )
 
+        return page_copy, child_object_map
+
+    def _get_revision_content_for_copy(
+        self, revision, specific_page, page_copy, child_object_map
+    ):
+        # Update ID fields in content
+        revision_content = revision.content
+        revision_content["pk"] = page_copy.pk
+
+        for child_relation in get_all_child_relations(specific_page):
+            accessor_name = child_relation.get_accessor_name()
+            try:
+                child_objects = revision_content[accessor_name]
+            except KeyError:
+                # KeyErrors are possible if the revision was created
+                # before this child relation was added to the database
+                continue
+
+            for child_object in child_objects:
+                child_object[child_relation.field.name] = page_copy.pk
+                # Remap primary key to copied versions
+                # If the primary key is not recognised (eg, the child object has been deleted from the database)
+                # set the primary key to None
+                copied_child_object = child_object_map.get(
+                    (child_relation, child_object["pk"])
+                )
+                child_object["pk"] = (
+                    copied_child_object.pk if copied_child_object else None
+                )
+                if self.reset_translation_key and "translation_key" in child_object:
+                    child_object["translation_key"] = self.generate_translation_key(
+                        child_object["translation_key"]
+                    )
+
+        return revision_content
+
+    def _get_log_data(self, page, page_copy, parent, to):
+        return {
+            "page": {
+                "id": page_copy.id,
+                "title": page_copy.get_admin_display_title(),
+                "locale": {
+                    "id": page_copy.locale_id,
+                    "language_code": page_copy.locale.language_code,
+                },
+            },
+            "source": {
+                "id": parent.id,
+                "title": parent.specific_deferred.get_admin_display_title(),
+            }
+            if parent
+            else None,
+            "destination": {
+                "id": to.id,
+                "title": to.specific_deferred.get_admin_display_title(),
+            }
+            if to
+            else None,
+            "keep_live": page_copy.live and self.keep_live,
+            "source_locale": {
+                "id": page.locale_id,
+                "language_code": page.locale.language_code,
+            },
+        }
+
+    def _copy_page(
+        self, page, to=None, update_attrs=None, exclude_fields=None, _mpnode_attrs=None
+    ):
+        specific_page = page.specific
+        exclude_fields = (
+            specific_page.default_exclude_fields_in_copy
+            + specific_page.exclude_fields_in_copy
+            + (exclude_fields or [])
+        )
+        base_update_attrs = self._get_base_update_attrs(update_attrs)
+        page_copy, child_object_map = self._copy_specific_page(
+            specific_page, exclude_fields, base_update_attrs
+        )
+
         # Save the new page
         if _mpnode_attrs:
             # We've got a tree position already reserved. Perform a quick save
@@ -191,42 +290,9 @@ class CopyPageAction:
                 revision.submitted_for_moderation = False
                 revision.approved_go_live_at = None
                 revision.object_id = page_copy.id
-
-                # Update ID fields in content
-                revision_content = revision.content
-                revision_content["pk"] = page_copy.pk
-
-                for child_relation in get_all_child_relations(specific_page):
-                    accessor_name = child_relation.get_accessor_name()
-                    try:
-                        child_objects = revision_content[accessor_name]
-                    except KeyError:
-                        # KeyErrors are possible if the revision was created
-                        # before this child relation was added to the database
-                        continue
-
-                    for child_object in child_objects:
-                        child_object[child_relation.field.name] = page_copy.pk
-                        # Remap primary key to copied versions
-                        # If the primary key is not recognised (eg, the child object has been deleted from the database)
-                        # set the primary key to None
-                        copied_child_object = child_object_map.get(
-                            (child_relation, child_object["pk"])
-                        )
-                        child_object["pk"] = (
-                            copied_child_object.pk if copied_child_object else None
-                        )
-                        if (
-                            self.reset_translation_key
-                            and "translation_key" in child_object
-                        ):
-                            child_object[
-                                "translation_key"
-                            ] = self.generate_translation_key(
-                                child_object["translation_key"]
-                            )
-
-                revision.content = revision_content
+                revision.content = self._get_revision_content_for_copy(
+                    revision, specific_page, page_copy, child_object_map
+                )
 
                 # Save
                 revision.save()
@@ -248,6 +314,7 @@ class CopyPageAction:
         if self.keep_live:
             page_copy.live_revision = latest_revision_as_page_revision
             page_copy.last_published_at = latest_revision_as_page_revision.created_at
+            page_copy.last_published_by = self.user
             page_copy.first_published_at = latest_revision_as_page_revision.created_at
             page_copy.save(clean=False)
 
@@ -265,33 +332,7 @@ class CopyPageAction:
                 instance=page_copy,
                 action=self.log_action,
                 user=self.user,
-                data={
-                    "page": {
-                        "id": page_copy.id,
-                        "title": page_copy.get_admin_display_title(),
-                        "locale": {
-                            "id": page_copy.locale_id,
-                            "language_code": page_copy.locale.language_code,
-                        },
-                    },
-                    "source": {
-                        "id": parent.id,
-                        "title": parent.specific_deferred.get_admin_display_title(),
-                    }
-                    if parent
-                    else None,
-                    "destination": {
-                        "id": to.id,
-                        "title": to.specific_deferred.get_admin_display_title(),
-                    }
-                    if to
-                    else None,
-                    "keep_live": page_copy.live and self.keep_live,
-                    "source_locale": {
-                        "id": page.locale_id,
-                        "language_code": page.locale.language_code,
-                    },
-                },
+                data=self._get_log_data(page, page_copy, parent, to),
             )
             if page_copy.live and self.keep_live:
                 # Log the publish if the use chose to keep the copied page live
@@ -308,7 +349,10 @@ class CopyPageAction:
         # Copy child pages
         from wagtail.models import Page
 
-        if self.recursive:
+        if self.recursive and self.bulk:
+            self._bulk_copy_descendants(page, page_copy)
+
+        elif self.recursive:
             numchild = 0
 
             for child_page in page.get_children().specific().iterator():
@@ -328,6 +372,343 @@ class CopyPageAction:
 
         return page_copy
 
+    def _bulk_copy_descendants(self, page, page_copy):
+        """
+        Copies all of the descendants of ``page`` under ``page_copy``, inserting them in
+        bulk. The copies keep the same positions relative to ``page_copy`` as the originals
+        have relative to ``page``, so the tree paths of the whole subtree are known upfront.
+        """
+        from wagtail.models import Locale, Page
+
+        descendants = list(page.get_descendants().order_by("path").specific())
+        if not descendants:
+            return
+
+        locales = Locale.objects.in_bulk()
+        copies_by_path = {page.path: page_copy}
+        sources_by_path = {page.path: page}
+        # (source page, page copy, child object map) for each descendant, in tree order
+        copied_pages = []
+
+        for specific_page in descendants:
+            parent_path = specific_page.path[: -Page.steplen]
+            parent_copy = copies_by_path[parent_path]
+
+            exclude_fields = (
+                specific_page.default_exclude_fields_in_copy
+                + specific_page.exclude_fields_in_copy
+            )
+            new_page, child_object_map = self._copy_specific_page(
+                specific_page, exclude_fields, self._get_base_update_attrs()
+            )
+            new_page.path = page_copy.path + specific_page.path[len(page.path) :]
+            new_page.depth = page_copy.depth + specific_page.depth - page.depth
+            new_page.numchild = 0
+            new_page.set_url_path(parent_copy)
+            parent_copy.numchild += 1
+
+            specific_page.locale = locales[specific_page.locale_id]
+            new_page.locale = locales[new_page.locale_id]
+
+            copies_by_path[specific_page.path] = new_page
+            sources_by_path[specific_page.path] = specific_page
+            copied_pages.append((specific_page, new_page, child_object_map))
+
+        with transaction.atomic():
+            page_copy.save(clean=False, update_fields=["numchild"])
+
+            base_pages = self._bulk_insert_pages(
+                [new_page for specific_page, new_page, child_object_map in copied_pages]
+            )
+            self._bulk_insert_child_objects(copied_pages)
+
+            latest_revisions = self._bulk_insert_revisions(copied_pages)
+            for base_page, (specific_page, new_page, child_object_map) in zip(
+                base_pages, copied_pages
+            ):
+                revision = latest_revisions[new_page.pk]
+                new_page.latest_revision = base_page.latest_revision = revision
+                if self.keep_live:
+                    new_page.live_revision = base_page.live_revision = revision
+                    new_page.last_published_at = (
+                        base_page.last_published_at
+                    ) = revision.created_at
+                    new_page.last_published_by = base_page.last_published_by = self.user
+                    new_page.first_published_at = (
+                        base_page.first_published_at
+                    ) = revision.created_at
+
+            Page.objects.bulk_update(
+                base_pages,
+                [
+                    "latest_revision",
+                    "live_revision",
+                    "last_published_at",
+                    "last_published_by",
+                    "first_published_at",
+                ],
+                batch_size=1000,
+            )
+
+            if self.log_action:
+                self._bulk_log_copies(
+                    copied_pages, copies_by_path, sources_by_path, latest_revisions
+                )
+
+            pages_by_model = defaultdict(list)
+            for specific_page, new_page, child_object_map in copied_pages:
+                pages_by_model[type(new_page)].append(new_page)
+            for model, pages in pages_by_model.items():
+                index.insert_or_update_objects(model, pages)
+
+            # The pages were inserted without sending post_save, which would have added
+            # them to the reference index
+            ReferenceIndex.create_for_objects(
+                [new_page for specific_page, new_page, child_object_map in copied_pages]
+            )
+
+            if self.send_published_signals:
+                for specific_page, new_page, child_object_map in copied_pages:
+                    if new_page.live:
+                        page_published.send(
+                            sender=new_page.specific_class,
+                            instance=new_page,
+                            revision=latest_revisions[new_page.pk],
+                        )
+
+        logger.info(
+            "Pages copied in bulk: %d descendants of id=%d under id=%d",
+            len(copied_pages),
+            page.id,
+            page_copy.id,
+        )
+
+    def _bulk_insert_pages(self, new_pages):
+        """
+        Inserts the rows of the given (specific) pages: the base Page rows with bulk_create,
+        then the rows of each table in their inheritance chain. Returns the list of base
+        Page instances, which share their primary keys with the given pages.
+        """
+        from wagtail.models import Page
+
+        base_pages = [
+            Page(
+                **{
+                    field.attname: getattr(new_page, field.attname)
+                    for field in Page._meta.concrete_fields
+                    if not field.primary_key
+                }
+            )
+            for new_page in new_pages
+        ]
+        Page.objects.bulk_create(base_pages, batch_size=1000)
+
+        if not connection.features.can_return_rows_from_bulk_insert:
+            # Paths are unique, so use them to find out the IDs of the new rows
+            ids_by_path = dict(
+                Page.objects.filter(
+                    path__in=[base_page.path for base_page in base_pages]
+                ).values_list("path", "id")
+            )
+            for base_page in base_pages:
+                base_page.id = ids_by_path[base_page.path]
+                base_page._state.adding = False
+                base_page._state.db = connection.alias
+
+        pages_by_model = defaultdict(list)
+        for base_page, new_page in zip(base_pages, new_pages):
+            new_page.id = base_page.id
+            for model in type(new_page)._meta.get_parent_list():
+                for parent_link in model._meta.parents.values():
+                    setattr(new_page, parent_link.attname, base_page.id)
+            for parent_link in new_page._meta.parents.values():
+                setattr(new_page, parent_link.attname, base_page.id)
+            new_page._state.adding = False
+            new_page._state.db = base_page._state.db
+            pages_by_model[type(new_page)].append(new_page)
+
+        for model, pages in pages_by_model.items():
+            # Insert into the tables of the inheritance chain below Page, starting with
+            # the table nearest to Page. This is the same as saving each page with
+            # save_base(raw=True) for every model in the chain, but in one query per table.
+            chain = [
+                parent
+                for parent in reversed(model._meta.get_parent_list())
+                if parent is not Page
+            ]
+            if model is not Page:
+                chain.append(model)
+
+            for chain_model in chain:
+                fields = chain_model._meta.local_concrete_fields
+                batch_size = connection.ops.bulk_batch_size(fields, pages) or len(pages)
+                for i in range(0, len(pages), batch_size):
+                    chain_model._base_manager._insert(
+                        pages[i : i + batch_size], fields=fields, using=connection.alias
+                    )
+
+        return base_pages
+
+    def _bulk_insert_child_objects(self, copied_pages):
+        child_objects_by_model = defaultdict(list)
+        for specific_page, new_page, child_object_map in copied_pages:
+            for (child_relation, old_pk), child_object in child_object_map.items():
+                setattr(child_object, child_relation.field.attname, new_page.id)
+                child_objects_by_model[type(child_object)].append(child_object)
+
+            # Copy m2m relations now that the page exists in the database
+            exclude_fields = (
+                specific_page.default_exclude_fields_in_copy
+                + specific_page.exclude_fields_in_copy
+            )
+            _copy_m2m_relations(specific_page, new_page, exclude_fields=exclude_fields)
+            for field in get_all_child_m2m_relations(new_page):
+                getattr(new_page, field.name).commit()
+
+        for model, child_objects in child_objects_by_model.items():
+            if (
+                connection.features.can_return_rows_from_bulk_insert
+                and not model._meta.parents
+                and not issubclass(model, ClusterableModel)
+            ):
+                model._default_manager.bulk_create(child_objects, batch_size=1000)
+            else:
+                # The primary keys of the child objects are needed to remap the child
+                # objects in revisions, and child objects using multi-table inheritance
+                # or with child relations of their own can't be inserted in bulk
+                for child_object in child_objects:
+                    child_object.save()
+
+    def _bulk_insert_revisions(self, copied_pages):
+        """
+        Inserts the copied revisions of each page (if ``copy_revisions`` is set) and a new
+        latest revision for each page. Returns a dict mapping the ID of each page copy to
+        its new latest revision.
+        """
+        from wagtail.models import Revision, get_default_page_content_type
+
+        page_content_type = get_default_page_content_type()
+        revisions = []
+
+        if self.copy_revisions:
+            copied_pages_by_source_id = {
+                str(specific_page.pk): (specific_page, new_page, child_object_map)
+                for specific_page, new_page, child_object_map in copied_pages
+            }
+            source_ids = list(copied_pages_by_source_id.keys())
+            for i in range(0, len(source_ids), 500):
+                for revision in Revision.page_revisions.filter(
+                    object_id__in=source_ids[i : i + 500]
+                ).order_by("created_at", "pk"):
+                    (
+                        specific_page,
+                        new_page,
+                        child_object_map,
+                    ) = copied_pages_by_source_id[revision.object_id]
+                    revisions.append(
+                        Revision(
+                            content_type_id=revision.content_type_id,
+                            base_content_type_id=revision.base_content_type_id,
+                            object_id=str(new_page.pk),
+                            submitted_for_moderation=False,
+                            created_at=revision.created_at,
+                            user_id=revision.user_id,
+                            object_str=revision.object_str,
+                            content=self._get_revision_content_for_copy(
+                                revision, specific_page, new_page, child_object_map
+                            ),
+                        )
+                    )
+
+        # Create a new revision for each page, for the same reasons as _copy_page does
+        now = timezone.now()
+        latest_revisions = {
+            new_page.pk: Revision(
+                content_type_id=new_page.content_type_id,
+                base_content_type=page_content_type,
+                object_id=str(new_page.pk),
+                created_at=now,
+                user=self.user,
+                object_str=str(new_page),
+                content=new_page.serializable_data(),
+            )
+            for specific_page, new_page, child_object_map in copied_pages
+        }
+
+        # bulk_create() skips Revision.save(), so the content is encoded here. The earlier
+        # revisions of each copy aren't in the database yet, so none are stored as deltas
+        for revision in revisions:
+            revision._encode_content(allow_delta=False)
+        Revision.objects.bulk_create(revisions, batch_size=1000)
+        if connection.features.can_return_rows_from_bulk_insert:
+            for revision in latest_revisions.values():
+                revision._encode_content(allow_delta=False)
+            Revision.objects.bulk_create(latest_revisions.values(), batch_size=1000)
+        else:
+            # The IDs of the latest revisions are needed to point the pages to them
+            for revision in latest_revisions.values():
+                revision.save()
+
+        return latest_revisions
+
+    def _bulk_log_copies(
+        self, copied_pages, copies_by_path, sources_by_path, latest_revisions
+    ):
+        from django.contrib.auth import get_user_model
+
+        from wagtail.models import Page
+
+        if not self.user:
+            # Fetch the owners of the pages up front, to log the creation of each page
+            owners = get_user_model().objects.in_bulk(
+                {new_page.owner_id for specific_page, new_page, _ in copied_pages}
+                - {None}
+            )
+            for specific_page, new_page, child_object_map in copied_pages:
+                if new_page.owner_id in owners:
+                    new_page.owner = owners[new_page.owner_id]
+
+        log_entries = []
+        for specific_page, new_page, child_object_map in copied_pages:
+            parent_path = specific_page.path[: -Page.steplen]
+
+            # Page.save() logs the creation of new pages
+            log_entries.append(
+                log_registry.build_log_entry(
+                    new_page,
+                    "wagtail.create",
+                    user=self.user or new_page.owner,
+                    content_changed=True,
+                )
+            )
+            log_entries.append(
+                log_registry.build_log_entry(
+                    new_page,
+                    self.log_action,
+                    user=self.user,
+                    data=self._get_log_data(
+                        specific_page,
+                        new_page,
+                        sources_by_path[parent_path],
+                        copies_by_path[parent_path],
+                    ),
+                )
+            )
+            if new_page.live and self.keep_live:
+                # Log the publish if the use chose to keep the copied page live
+                log_entries.append(
+                    log_registry.build_log_entry(
+                        new_page,
+                        "wagtail.publish",
+                        user=self.user,
+                        revision=latest_revisions[new_page.pk],
+                    )
+                )
+
+        log_entries = [log_entry for log_entry in log_entries if log_entry]
+        if log_entries:
+            type(log_entries[0]).objects.bulk_create(log_entries, batch_size=1000)
+
     def execute(self, skip_permission_checks=False):
         self.check(skip_permission_checks=skip_permission_checks)
 
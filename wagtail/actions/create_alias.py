@@ -129,6 +129,7 @@ class CreatePageAliasAction:
             "draft_title": page.title,
             # Likewise, an alias page can't have unpublished changes if it's live
             "has_unpublished_changes": not page.live,
+            "last_published_by": user if page.live else None,
         }
 
         if update_slug:
@@ -1,6 +1,6 @@
 from django.core.exceptions import PermissionDenied
 
-from wagtail.log_actions import log
+from wagtail.log_actions import LogEntryBuffer, log
 
 
 class DeletePagePermissionError(PermissionDenied):
@@ -33,9 +33,10 @@ class DeletePageAction:
         # works around a bug in treebeard <= 3.0 where calling SpecificPage.delete() fails to delete
         # child pages that are not instances of SpecificPage
         if type(page) is Page:
-            for child in page.get_descendants().specific().iterator():
-                self.log_deletion(child)
-            self.log_deletion(page.specific)
+            with LogEntryBuffer():
+                for child in page.get_descendants().specific().iterator():
+                    self.log_deletion(child)
+                self.log_deletion(page.specific)
 
             # this is a Page instance, so carry on as we were
             return super(Page, page).delete(*args, **kwargs)
@@ -44,6 +44,9 @@ class PublishPageRevisionAction(PublishRevisionAction):
                 "You do not have permission to publish this page"
             )
 
+    def _set_published_by(self, page, user):
+        page.last_published_by = user
+
     def _after_publish(self):
         from wagtail.models import COMMENTS_RELATION_NAME
 
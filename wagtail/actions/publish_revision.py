@@ -71,6 +71,13 @@ class PublishRevisionAction:
             content_changed=self.changed,
         )
 
+    def _set_published_by(self, object, user):
+        """
+        Called alongside setting ``last_published_at`` when the object goes live, so that
+        subclasses for models that record the publishing user can set it
+        """
+        pass
+
     def _after_publish(self):
         published.send(
             sender=type(self.object),
@@ -112,6 +119,7 @@ class PublishRevisionAction:
         if object.live:
             now = timezone.now()
             object.last_published_at = now
+            self._set_published_by(object, user)
             object.live_revision = revision
 
             if object.first_published_at is None:
@@ -0,0 +1,446 @@
+import uuid
+
+from django.core.cache import cache
+from django.db import connections, models, router, transaction
+from modelcluster.models import get_all_child_m2m_relations, get_all_child_relations
+
+from wagtail.log_actions import registry as log_registry
+from wagtail.models.copying import _get_copyable_m2m_fields
+from wagtail.models.i18n import TranslatableMixin
+from wagtail.models.reference_index import ReferenceIndex, pause_reference_index_updates
+from wagtail.search import index
+from wagtail.signals import page_aliases_updated, page_published
+
+# Fields that belong to each alias rather than to the content it follows. These are the
+# fields that Page.with_content_json preserves, plus the ones the alias keeps regardless of
+# the content (its slug and position in the tree) and the ones that are set explicitly
+# when an alias is updated.
+ALIAS_PRESERVED_FIELDS = [
+    "content_type",
+    "path",
+    "depth",
+    "numchild",
+    "url_path",
+    "slug",
+    "draft_title",
+    "live",
+    "has_unpublished_changes",
+    "owner",
+    "locked",
+    "locked_at",
+    "locked_by",
+    "latest_revision",
+    "latest_revision_created_at",
+    "first_published_at",
+    "translation_key",
+    "locale",
+    "alias_of",
+]
+
+# Many to many fields that aren't copied to aliases
+ALIAS_EXCLUDE_FIELDS = [
+    "id",
+    "path",
+    "depth",
+    "numchild",
+    "url_path",
+    "index_entries",
+    "postgres_index_entries",
+]
+
+
+class UpdatePageAliasesAction:
+    """
+    Publishes all aliases that follow the given page with the latest content from the page,
+    including any aliases of those aliases.
+
+    The updated field values are built from the content once, and written to all aliases
+    with a single update per database table. Child relations of all aliases are replaced
+    in bulk, the aliases are reindexed together and a single ``page_aliases_updated``
+    signal is sent once all of them have been updated, so that receivers (such as the
+    frontend cache invalidator) can handle them in one go.
+
+    :param page: The page whose aliases should be updated
+    :type page: Page
+    :param revision: The revision of the original page that we are updating to (used for logging purposes)
+    :type revision: Revision, optional
+    :param user: The user who is publishing (used for logging purposes)
+    :type user: User, optional
+    """
+
+    def __init__(
+        self, page, *, revision=None, user=None, _content=None, _updated_ids=None
+    ):
+        self.page = page
+        self.revision = revision
+        self.user = user
+        self._content = _content
+        self._updated_ids = _updated_ids
+
+    def _get_update_values(self, model, content):
+        """
+        Returns a dict of the values to write to every alias, keyed by field attname
+        """
+        page = model.from_serializable_data(content)
+
+        values = {
+            field.attname: getattr(page, field.attname)
+            for field in model._meta.concrete_fields
+            if not field.primary_key
+            and not (field.remote_field and field.remote_field.parent_link)
+            and field.name not in ALIAS_PRESERVED_FIELDS
+        }
+
+        # Aliases don't have revisions, so update the fields that would normally be
+        # updated by save_revision, and publish the alias if it's currently in draft
+        values.update(
+            {
+                "draft_title": page.title,
+                "latest_revision_created_at": self.page.latest_revision_created_at,
+                "last_published_by_id": self.page.last_published_by_id,
+                "live": True,
+                "has_unpublished_changes": False,
+            }
+        )
+
+        # Parental many to many fields are stored in their own tables
+        m2m_values = {
+            field: [obj.pk for obj in getattr(page, field.name).all()]
+            for field in get_all_child_m2m_relations(model)
+        }
+
+        return values, m2m_values
+
+    def _get_aliases(self, model, source_ids, updated_ids):
+        return list(
+            model.objects.filter(alias_of_id__in=source_ids)
+            .exclude(id__in=updated_ids)
+            .annotate_site_root_state()
+            .order_by("path")
+        )
+
+    def _update_url_paths(self, model, aliases):
+        from wagtail.models import Page
+
+        parent_paths = {alias.path[: -Page.steplen] for alias in aliases}
+        parent_url_paths = dict(
+            Page.objects.filter(path__in=parent_paths).values_list("path", "url_path")
+        )
+
+        # Aliases can have their own slugs so they can be siblings of the original, so
+        # their url_path is kept in line with their slug rather than the original page's.
+        # The aliases are ordered by path, so each alias is handled after its ancestors.
+        changed_aliases = []
+        for alias in aliases:
+            parent_url_path = parent_url_paths.get(alias.path[: -Page.steplen])
+            url_path = (
+                "/" if parent_url_path is None else parent_url_path + alias.slug + "/"
+            )
+            if alias.url_path == url_path:
+                continue
+
+            old_url_path = alias.url_path
+            alias.url_path = url_path
+            changed_aliases.append(alias)
+
+            if alias.numchild:
+                # Update the descendants of the alias, as Page.save does when the slug
+                # changes, including the ones that have already been loaded
+                alias._update_descendant_url_paths(old_url_path, url_path)
+
+                for path, descendant_url_path in parent_url_paths.items():
+                    if path.startswith(alias.path):
+                        parent_url_paths[path] = (
+                            url_path + descendant_url_path[len(old_url_path) :]
+                        )
+                for descendant in aliases:
+                    if (
+                        descendant.path.startswith(alias.path)
+                        and descendant is not alias
+                    ):
+                        descendant.url_path = (
+                            url_path + descendant.url_path[len(old_url_path) :]
+                        )
+
+        if changed_aliases:
+            model._base_manager.bulk_update(changed_aliases, ["url_path"])
+
+    def _update_m2m_relations(self, aliases, m2m_values):
+        alias_ids = [alias.pk for alias in aliases]
+
+        for field, related_ids in m2m_values.items():
+            through = field.remote_field.through
+            source_attname = through._meta.get_field(field.m2m_field_name()).attname
+            target_attname = through._meta.get_field(
+                field.m2m_reverse_field_name()
+            ).attname
+
+            through._default_manager.filter(
+                **{source_attname + "__in": alias_ids}
+            ).delete()
+            through._default_manager.bulk_create(
+                [
+                    through(**{source_attname: alias_id, target_attname: related_id})
+                    for alias_id in alias_ids
+                    for related_id in related_ids
+                ],
+                batch_size=1000,
+            )
+
+    def _copy_child_object(self, child_object, child_relation, alias, source):
+        child_object = type(child_object)(
+            **{
+                field.attname: getattr(child_object, field.attname)
+                for field in child_object._meta.concrete_fields
+                if not field.primary_key
+            }
+        )
+        setattr(child_object, child_relation.field.attname, alias.pk)
+
+        if isinstance(child_object, TranslatableMixin):
+            # Child object's locale must always match the page
+            child_object.locale_id = alias.locale_id
+
+            # If the alias isn't a translation of the original page, change the child
+            # object's translation_keys so they are not either
+            if alias.translation_key != source.translation_key:
+                child_object.translation_key = uuid.uuid4()
+
+        return child_object
+
+    def _bulk_insert_multi_table_objects(self, model, objs):
+        """
+        Inserts objects of a model that uses multi-table inheritance, which bulk_create
+        doesn't support: the rows of the root model with bulk_create, then the rows of
+        each table in the inheritance chain below it with a single query per table.
+        """
+        connection = connections[router.db_for_write(model)]
+        chain = [model] + model._meta.get_parent_list()
+
+        if not connection.features.can_return_rows_from_bulk_insert or any(
+            len(chain_model._meta.parents) > 1 for chain_model in chain
+        ):
+            # The primary keys of the root rows are needed to insert the other rows, and
+            # the inheritance chain must be a straight line
+            for obj in objs:
+                obj.save()
+            return
+
+        root_model, *chain = reversed(chain)
+        root_objs = [
+            root_model(
+                **{
+                    field.attname: getattr(obj, field.attname)
+                    for field in root_model._meta.concrete_fields
+                    if not field.primary_key
+                }
+            )
+            for obj in objs
+        ]
+        root_model._base_manager.using(connection.alias).bulk_create(
+            root_objs, batch_size=1000
+        )
+
+        for root_obj, obj in zip(root_objs, objs):
+            for chain_model in chain:
+                for parent_link in chain_model._meta.parents.values():
+                    setattr(obj, parent_link.attname, root_obj.pk)
+            obj._state.adding = False
+            obj._state.db = connection.alias
+
+        # This is the same as saving each object with save_base(raw=True) for every
+        # model in the chain, but in one query per table
+        for chain_model in chain:
+            fields = chain_model._meta.local_concrete_fields
+            batch_size = connection.ops.bulk_batch_size(fields, objs) or len(objs)
+            for i in range(0, len(objs), batch_size):
+                chain_model._base_manager._insert(
+                    objs[i : i + batch_size], fields=fields, using=connection.alias
+                )
+
+    def _update_child_relations(self, model, aliases, sources):
+        """
+        Replaces the child objects of each alias with copies of the child objects of the
+        page it is an alias of. Returns a dict mapping each child relation to a dict of the
+        new child objects of each alias, keyed by alias ID.
+        """
+        alias_ids = [alias.pk for alias in aliases]
+        child_objects = {}
+
+        for child_relation in get_all_child_relations(model):
+            related_model = child_relation.related_model
+            child_objects[child_relation] = {}
+
+            for alias in aliases:
+                source, source_child_objects = sources[alias.alias_of_id]
+                child_objects[child_relation][alias.pk] = [
+                    self._copy_child_object(child_object, child_relation, alias, source)
+                    for child_object in source_child_objects[child_relation]
+                ]
+
+            related_model._default_manager.filter(
+                **{child_relation.field.attname + "__in": alias_ids}
+            ).delete()
+
+            new_child_objects = [
+                child_object
+                for alias_child_objects in child_objects[child_relation].values()
+                for child_object in alias_child_objects
+            ]
+            if related_model._meta.parents:
+                self._bulk_insert_multi_table_objects(related_model, new_child_objects)
+            else:
+                related_model._default_manager.bulk_create(
+                    new_child_objects, batch_size=1000
+                )
+
+        return child_objects
+
+    def _update_aliases(self, specific_page, model, content, updated_ids):
+        values, m2m_values = self._get_update_values(model, content)
+
+        # Other many to many relations are taken from the original page rather than its
+        # content. Those with a through table can be written in bulk like the parental
+        # ones, and any other kinds of relation (such as tags) are set on each alias.
+        other_m2m_fields = []
+        for field in _get_copyable_m2m_fields(model, ALIAS_EXCLUDE_FIELDS):
+            if isinstance(field, models.ManyToManyField):
+                m2m_values[field] = list(
+                    getattr(specific_page, field.name).values_list("pk", flat=True)
+                )
+            else:
+                other_m2m_fields.append(field)
+
+        sources = {
+            specific_page.pk: (
+                specific_page,
+                {
+                    child_relation: list(
+                        getattr(specific_page, child_relation.get_accessor_name())
+                        .all()
+                        .order_by("pk")
+                    )
+                    for child_relation in get_all_child_relations(model)
+                },
+            )
+        }
+        updated_aliases = []
+        self._alias_child_objects = {}
+
+        # Update any aliases of the aliases as well, one level at a time. Each level
+        # takes its child objects from the level above it rather than the original page,
+        # as the child objects of aliases in other locales may have been changed to match.
+
+        # Design note:
+        # It could be argued that this will be faster if we just changed these alias-of-alias
+        # pages to all point to the original page and avoid having to update them recursively.
+        #
+        # But, it's useful to have a record of how aliases have been chained.
+        # For example, In Wagtail Localize, we use aliases to create mirrored trees, but those
+        # trees themselves could have aliases within them. If an alias within a tree is
+        # converted to a regular page, we want the alias in the mirrored tree to follow that
+        # new page and stop receiving updates from the original page.
+        while sources:
+            aliases = self._get_aliases(model, list(sources.keys()), updated_ids)
+            if not aliases:
+                break
+
+            # Keep track of the aliases that have been updated. This is just in case someone
+            # has created an alias loop (which is impossible to do with the UI Wagtail provides)
+            updated_ids.update(alias.pk for alias in aliases)
+
+            model._base_manager.filter(pk__in=[alias.pk for alias in aliases]).update(
+                **values
+            )
+            for alias in aliases:
+                for attname, value in values.items():
+                    setattr(alias, attname, value)
+
+            self._update_url_paths(model, aliases)
+
+            self._update_m2m_relations(aliases, m2m_values)
+
+            for alias in aliases:
+                for field in other_m2m_fields:
+                    getattr(alias, field.name).set(
+                        getattr(specific_page, field.name).all()
+                    )
+
+            child_objects = self._update_child_relations(model, aliases, sources)
+
+            if any(alias.is_site_root() for alias in aliases):
+                cache.delete("wagtail_site_root_paths")
+
+            sources = {
+                alias.pk: (
+                    alias,
+                    {
+                        child_relation: alias_child_objects[alias.pk]
+                        for child_relation, alias_child_objects in child_objects.items()
+                    },
+                )
+                for alias in aliases
+            }
+            # The new child objects are passed on to the reference index, unless the
+            # database didn't return their primary keys when they were inserted
+            for alias_pk, (alias, alias_child_objects) in sources.items():
+                self._alias_child_objects[alias_pk] = {
+                    child_relation: objs
+                    for child_relation, objs in alias_child_objects.items()
+                    if all(obj.pk is not None for obj in objs)
+                }
+            updated_aliases.extend(aliases)
+
+        # Log the publish of the aliases
+        log_entries = [
+            log_registry.build_log_entry(alias, "wagtail.publish", user=self.user)
+            for alias in updated_aliases
+        ]
+        log_entries = [log_entry for log_entry in log_entries if log_entry]
+        if log_entries:
+            type(log_entries[0]).objects.bulk_create(log_entries, batch_size=1000)
+
+        return updated_aliases
+
+    def execute(self):
+        specific_page = self.page.specific
+        model = self.page.specific_class
+
+        # Only compute this if necessary since it's quite a heavy operation
+        content = self._content
+        if content is None:
+            content = specific_page.serializable_data()
+
+        updated_ids = set(self._updated_ids or [])
+        updated_ids.add(self.page.pk)
+
+        # The rows of the aliases in the reference index are rebuilt in bulk afterwards,
+        # rather than as each relation is changed
+        with transaction.atomic(), pause_reference_index_updates():
+            aliases = self._update_aliases(specific_page, model, content, updated_ids)
+
+        if not aliases:
+            return aliases
+
+        index.insert_or_update_objects(model, aliases)
+
+        ReferenceIndex.rebuild_for_objects(
+            aliases, child_objects=self._alias_child_objects
+        )
+
+        for alias in aliases:
+            page_published.send(
+                sender=model,
+                instance=alias,
+                revision=self.revision,
+                alias=True,
+            )
+
+        page_aliases_updated.send(
+            sender=model,
+            instance=specific_page,
+            aliases=aliases,
+            revision=self.revision,
+        )
+
+        return aliases
@@ -1,5 +1,6 @@
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Count, Model
+from django.db.models import Count, Exists, IntegerField, Model, Q
+from django.db.models.functions import Cast
 from modelcluster.fields import ParentalKey
 from taggit.models import Tag
 
@@ -8,7 +9,7 @@ from taggit.models import Tag
 # wagtail.admin.models ensures that this happens in advance of running wagtail.admin's
 # system checks.
 from wagtail.admin import panels  # NOQA
-from wagtail.models import Page
+from wagtail.models import Page, ReferenceIndex
 
 
 # A dummy model that exists purely to attach the access_admin permission type to, so that it
@@ -27,7 +28,33 @@ class Admin(Model):
 def get_object_usage(obj):
     """Returns a queryset of pages that link to a particular object"""
 
-    pages = Page.objects.none()
+    # The reference index records the references held by pages and their child objects,
+    # including those within StreamFields and rich text, against the base Page model
+    page_ids = (
+        ReferenceIndex.get_references_to(obj)
+        .filter(base_content_type=ContentType.objects.get_for_model(Page))
+        .annotate(page_id=Cast("object_id", output_field=IntegerField()))
+        .values("page_id")
+    )
+    pages = Q(pk__in=page_ids)
+
+    # Until the index has been populated by the rebuild_references_index command, such as
+    # just after upgrading, fall back to the pages that refer to the object through a
+    # foreign key, either directly or from one of their child objects
+    relation_pages = _get_object_usage_from_relations(obj)
+    if relation_pages:
+        pages |= Q(~Exists(ReferenceIndex.objects.all())) & relation_pages
+
+    return Page.objects.filter(pages)
+
+
+def _get_object_usage_from_relations(obj):
+    """
+    Returns a Q object matching the pages that refer to the object through a foreign key,
+    or an empty Q object if there are no relations between the object and pages
+    """
+
+    pages = Q()
 
     # get all the relation objects for obj
     relations = [
@@ -40,7 +67,7 @@ def get_object_usage(obj):
 
         # if the relation is between obj and a page, get the page
         if issubclass(related_model, Page):
-            pages |= Page.objects.filter(
+            pages |= Q(
                 id__in=related_model._base_manager.filter(
                     **{relation.field.name: obj.id}
                 ).values_list("id", flat=True)
@@ -52,7 +79,7 @@ def get_object_usage(obj):
                 if isinstance(f, ParentalKey) and issubclass(
                     f.remote_field.model, Page
                 ):
-                    pages |= Page.objects.filter(
+                    pages |= Q(
                         id__in=related_model._base_manager.filter(
                             **{relation.field.name: obj.id}
                         ).values_list(f.attname, flat=True)
@@ -0,0 +1,609 @@
+"""
+Paginators for admin listings of large tables.
+
+Django's ``Paginator`` fetches each page with ``OFFSET``, which means the database has to
+read through every row before the requested page, and counts the full result set with
+``COUNT(*)``. Both become slow once a table has millions of rows.
+
+``KeysetPaginator`` fetches the pages after the first one by seeking past the last row of
+the previous page instead (known as keyset or seek pagination), which is as fast for the
+last page as for the first, provided the listing is ordered by indexed columns. The
+position is passed to the next page as an opaque cursor in place of the page number, so
+templates that link to ``page.next_page_number`` and ``page.previous_page_number`` work
+unchanged. Any listing that can't be paginated this way, such as search results or
+querysets ordered by annotations, is paginated by offset as before.
+
+When ``WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD`` is set, tables that the database's query
+planner expects to hold at least that many rows are counted from the planner's statistics
+rather than with ``COUNT(*)``.
+
+``MergedKeysetPaginator`` applies the same approach to listings that combine the rows of
+several querysets, such as the site history report, which lists the log entries of every
+log entry model.
+"""
+import base64
+import binascii
+import heapq
+import json
+from functools import reduce
+from itertools import dropwhile, islice
+from operator import itemgetter, or_
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models
+from django.db.models.expressions import Col, F, OrderBy
+from django.db.models.lookups import Exact
+from django.db.models.sql.where import AND
+from django.utils.functional import cached_property
+
+from wagtail.search.paginator import SearchResultsPaginator
+
+CURSOR_PREFIX = "k"
+
+
+def get_estimated_count(queryset):
+    """
+    Returns the number of rows the database's query planner expects the queryset to return,
+    or None if the database can't provide an estimate.
+
+    PostgreSQL estimates the result of any query. MySQL can only estimate the number of
+    rows in a whole table, so unfiltered querysets are the only ones that are estimated.
+    """
+    query = queryset.query
+    if query.is_sliced or query.distinct or query.combinator:
+        return None
+
+    connection = connections[queryset.db]
+
+    if connection.vendor == "postgresql":
+        sql, params = queryset.order_by().query.get_compiler(using=queryset.db).as_sql()
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    if connection.vendor == "mysql" and not query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        if row and row[0] is not None:
+            return int(row[0])
+
+    return None
+
+
+def get_count(queryset):
+    """
+    Returns the number of objects in the queryset. If ``WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD``
+    is set and the database expects the queryset to return at least that many rows, the
+    estimate is returned instead of counting the rows.
+    """
+    threshold = getattr(settings, "WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD", None)
+
+    if threshold is not None and isinstance(queryset, models.QuerySet):
+        estimate = get_estimated_count(queryset)
+        if estimate is not None and estimate >= threshold:
+            return estimate
+
+    return queryset.count()
+
+
+def encode_cursor(data):
+    """
+    Encodes the JSON-serialisable data that marks a position in a listing as a cursor
+    to pass in place of a page number
+    """
+    encoded = base64.urlsafe_b64encode(
+        json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":")).encode()
+    )
+    return CURSOR_PREFIX + encoded.decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Returns the data encoded in a cursor, or None if the value isn't a valid cursor
+    """
+    if not isinstance(cursor, str) or not cursor.startswith(CURSOR_PREFIX):
+        return None
+
+    encoded = cursor[len(CURSOR_PREFIX) :]
+    try:
+        data = json.loads(base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)))
+    except (binascii.Error, ValueError):
+        return None
+
+    return data if isinstance(data, dict) else None
+
+
+class KeysetPage(Page):
+    """
+    A page of results fetched by ``KeysetPaginator``. The next and previous page numbers
+    are cursors that mark the position of the page in the results, except for the first
+    page, which is always numbered 1.
+    """
+
+    def __init__(self, object_list, number, paginator, has_previous, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_previous = has_previous
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def next_page_number(self):
+        if not self.has_next():
+            raise EmptyPage("That page contains no results")
+        return self.paginator.get_cursor(self.object_list[-1], self.number + 1)
+
+    def previous_page_number(self):
+        if not self.has_previous():
+            raise EmptyPage("That page number is less than 1")
+        if self.number <= 2 or not self.object_list:
+            return 1
+        return self.paginator.get_cursor(
+            self.object_list[0], self.number - 1, reverse=True
+        )
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return (self.number - 1) * self.paginator.per_page + 1
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1
+
+
+class KeysetPaginator(SearchResultsPaginator):
+    """
+    A paginator that seeks to each page of a queryset that is ordered by indexed columns,
+    rather than skipping over the rows before it. The primary key is added to the ordering
+    if needed to make it unique.
+
+    Cursors are accepted anywhere a page number is, and plain page numbers are still
+    fetched by offset so that existing links keep working. Orphans are not merged into
+    the last page when seeking, as the paginator doesn't know which page is the last one.
+    """
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, models.QuerySet):
+            return get_count(self.object_list)
+        return super().count
+
+    @cached_property
+    def keyset_ordering(self):
+        """
+        A list of ``(field, descending)`` tuples to seek through the results with, or None
+        if the object list can't be paginated by keyset
+        """
+        if not isinstance(self.object_list, models.QuerySet):
+            return None
+
+        query = self.object_list.query
+        if (
+            query.is_sliced
+            or query.distinct
+            or query.combinator
+            or query.extra_order_by
+        ):
+            return None
+
+        model = self.object_list.model
+        if query.order_by:
+            order_by = query.order_by
+        elif query.default_ordering and model._meta.ordering:
+            order_by = model._meta.ordering
+        else:
+            return None
+
+        ordering = []
+        for item in order_by:
+            if isinstance(item, str):
+                name, descending = item.lstrip("-"), item.startswith("-")
+            elif isinstance(item, OrderBy) and isinstance(item.expression, F):
+                name, descending = item.expression.name, item.descending
+            elif isinstance(item, F):
+                name, descending = item.name, False
+            else:
+                return None
+
+            try:
+                field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+
+            if (
+                (field.is_relation and not field.primary_key)
+                or field.null
+                or not field.concrete
+            ):
+                return None
+
+            ordering.append((field, descending))
+
+            # The rest of the ordering can't change the order of unique values
+            if field.primary_key or field.unique:
+                break
+        else:
+            # Use the primary key to tell apart rows that have the same values
+            ordering.append((model._meta.pk, ordering[-1][1]))
+
+        if not self._is_indexed(
+            model, ordering[0][0], self._get_exact_filter_fields(query)
+        ):
+            return None
+
+        return ordering
+
+    def _get_exact_filter_fields(self, query):
+        """
+        Returns the names of the fields of the model that the query is filtered to a
+        single value of
+        """
+        where = query.where
+        if where.connector != AND or where.negated:
+            return set()
+
+        return {
+            child.lhs.target.name
+            for child in where.children
+            if isinstance(child, Exact)
+            and isinstance(child.lhs, Col)
+            and child.lhs.alias == query.base_table
+        }
+
+    def _is_indexed(self, model, field, filtered_fields=()):
+        if field.primary_key or field.unique or field.db_index:
+            return True
+
+        opts = model._meta
+        indexed_fields = [
+            [name.lstrip("-") for name in index.fields]
+            for index in opts.indexes
+            if index.fields
+        ]
+        indexed_fields += [
+            list(fields)
+            for fields in list(opts.unique_together)
+            + list(getattr(opts, "index_together", ()))
+        ]
+
+        # The leading columns of an index that the query is filtered to a single value
+        # of don't change its order, e.g. an index on (page, submit_time) orders the
+        # submissions of each page by submit_time
+        for fields in indexed_fields:
+            remaining_fields = list(dropwhile(filtered_fields.__contains__, fields))
+            if remaining_fields and remaining_fields[0] == field.name:
+                return True
+
+        return False
+
+    def get_cursor(self, obj, number, reverse=False):
+        """
+        Returns a cursor for the page numbered ``number``, which starts after the given
+        object, or ends before it if ``reverse`` is true
+        """
+        data = {
+            "n": number,
+            "o": self._get_ordering_names(),
+            "v": [
+                field.value_to_string(obj) for field, descending in self.keyset_ordering
+            ],
+            "r": reverse,
+        }
+        return encode_cursor(data)
+
+    def _get_ordering_names(self):
+        return [
+            ("-" if descending else "") + field.attname
+            for field, descending in self.keyset_ordering
+        ]
+
+    def _decode_cursor(self, cursor):
+        if self.keyset_ordering is None:
+            return None
+
+        data = decode_cursor(cursor)
+        if data is None:
+            return None
+
+        try:
+            number = int(data["n"])
+            reverse = bool(data["r"])
+            values = [
+                field.to_python(value)
+                for (field, descending), value in zip(self.keyset_ordering, data["v"])
+            ]
+        except (ValueError, TypeError, KeyError, ValidationError):
+            return None
+
+        # The ordering of the listing may have changed since the cursor was made
+        if data.get("o") != self._get_ordering_names() or number < 1:
+            return None
+
+        return number, values, reverse
+
+    def _get_seek_filter(self, values, reverse):
+        conditions = []
+        for i, ((field, descending), value) in enumerate(
+            zip(self.keyset_ordering, values)
+        ):
+            lookup = "lt" if descending != reverse else "gt"
+            condition = {
+                previous_field.attname: previous_value
+                for (previous_field, _), previous_value in zip(
+                    self.keyset_ordering[:i], values[:i]
+                )
+            }
+            condition[f"{field.attname}__{lookup}"] = value
+            conditions.append(models.Q(**condition))
+
+        return reduce(or_, conditions)
+
+    def _get_keyset_page(self, number, values, reverse):
+        queryset = self.object_list.filter(self._get_seek_filter(values, reverse))
+
+        if reverse:
+            queryset = queryset.order_by(
+                *[
+                    ("" if descending else "-") + field.attname
+                    for field, descending in self.keyset_ordering
+                ]
+            )
+        else:
+            queryset = queryset.order_by(*self._get_ordering_names())
+
+        object_list = list(queryset[: self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+
+        if reverse:
+            object_list.reverse()
+            # Start again from the first page if the page before this one no longer exists
+            if not has_more:
+                number = 1
+            return KeysetPage(object_list, number, self, number > 1, True)
+
+        return KeysetPage(object_list, number, self, True, has_more)
+
+    def page(self, number):
+        if self.keyset_ordering is None:
+            return super().page(number)
+
+        cursor = self._decode_cursor(number)
+        if cursor is not None:
+            return self._get_keyset_page(*cursor)
+
+        try:
+            is_first_page = int(number) == 1
+        except (TypeError, ValueError):
+            is_first_page = False
+
+        # The first page is fetched without counting the results, as it always exists
+        number = 1 if is_first_page else self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(
+            self.object_list.order_by(*self._get_ordering_names())[
+                bottom : bottom + self.per_page + 1
+            ]
+        )
+        if is_first_page and len(object_list) <= self.per_page:
+            # All the results are on the first page, so they don't need to be counted
+            self.__dict__["count"] = len(object_list)
+
+        return KeysetPage(
+            object_list[: self.per_page],
+            number,
+            self,
+            number > 1,
+            len(object_list) > self.per_page,
+        )
+
+    def get_page(self, number):
+        if self.keyset_ordering is None:
+            return super().get_page(number)
+
+        try:
+            return self.page(number)
+        except PageNotAnInteger:
+            return self.page(1)
+        except EmptyPage:
+            return self.page(self.num_pages)
+
+
+class MergedKeysetPaginator(Paginator):
+    """
+    Paginates the rows of several ``values()`` querysets, such as querysets of different
+    models, as a single listing ordered by ``ordering_field``. Rows with the same value are
+    ordered by the position of their queryset in the list, and then by primary key.
+
+    Each page is fetched by seeking every queryset past the last row of the previous page
+    and merging the results, rather than by ordering the union of the querysets and
+    skipping over the rows before the page. The rows must include ``pk`` and
+    ``ordering_field``, which should be an indexed, non-null column of each model. Plain
+    page numbers are still accepted, and fetch the rows up to the end of the page from
+    each queryset.
+
+    The rows are only counted when a plain page number past the first page is requested,
+    so ``count_is_known`` is false on the other pages and the page count isn't shown.
+    """
+
+    def __init__(
+        self,
+        querysets,
+        per_page,
+        ordering_field,
+        descending=False,
+        orphans=0,
+        allow_empty_first_page=True,
+    ):
+        self.querysets = list(querysets)
+        self.ordering_field = ordering_field
+        self.descending = descending
+        # The sort keys of the rows on the fetched pages, to make cursors from
+        self._row_keys = {}
+        super().__init__(
+            self.querysets,
+            per_page,
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+        )
+
+    @cached_property
+    def count(self):
+        return sum(get_count(queryset) for queryset in self.querysets)
+
+    @property
+    def count_is_known(self):
+        return "count" in self.__dict__
+
+    def _get_ordering_names(self, reverse=False):
+        prefix = "-" if self.descending != reverse else ""
+        return [prefix + self.ordering_field, prefix + "pk"]
+
+    def _fetch(self, querysets, limit, reverse=False):
+        """
+        Returns the first ``limit`` rows of the listing from the given ``(index, queryset)``
+        pairs, or the last ``limit`` rows in reverse order if ``reverse`` is true
+        """
+        results = []
+        for index, queryset in querysets:
+            rows = queryset.order_by(*self._get_ordering_names(reverse))[:limit]
+            results.append(
+                [((row[self.ordering_field], index, row["pk"]), row) for row in rows]
+            )
+
+        object_list = []
+        for key, row in islice(
+            heapq.merge(
+                *results, key=itemgetter(0), reverse=self.descending != reverse
+            ),
+            limit,
+        ):
+            self._row_keys[id(row)] = key
+            object_list.append(row)
+        return object_list
+
+    def get_cursor(self, row, number, reverse=False):
+        """
+        Returns a cursor for the page numbered ``number``, which starts after the given
+        row, or ends before it if ``reverse`` is true
+        """
+        value, index, pk = self._row_keys[id(row)]
+        opts = self.querysets[index].model._meta
+        field = opts.get_field(self.ordering_field)
+        # value_to_string reads the values from the attributes of an object
+        obj = SimpleNamespace(**{field.attname: value, opts.pk.attname: pk})
+        return encode_cursor(
+            {
+                "n": number,
+                "o": self._get_ordering_names(),
+                "v": [field.value_to_string(obj), index, opts.pk.value_to_string(obj)],
+                "r": reverse,
+            }
+        )
+
+    def _decode_cursor(self, cursor):
+        data = decode_cursor(cursor)
+        if data is None:
+            return None
+
+        try:
+            number = int(data["n"])
+            reverse = bool(data["r"])
+            value, index, pk = data["v"]
+            model = self.querysets[index].model
+            key = (
+                model._meta.get_field(self.ordering_field).to_python(value),
+                index,
+                model._meta.pk.to_python(pk),
+            )
+        except (ValueError, TypeError, KeyError, IndexError, ValidationError):
+            return None
+
+        if data.get("o") != self._get_ordering_names() or number < 1 or index < 0:
+            return None
+
+        return number, key, reverse
+
+    def _get_keyset_page(self, number, key, reverse):
+        value, cursor_index, pk = key
+        lookup = "lt" if self.descending != reverse else "gt"
+        field_lookup = f"{self.ordering_field}__{lookup}"
+
+        querysets = []
+        for index, queryset in enumerate(self.querysets):
+            if index == cursor_index:
+                seek_filter = models.Q(**{field_lookup: value}) | models.Q(
+                    **{self.ordering_field: value, f"pk__{lookup}": pk}
+                )
+            elif (index < cursor_index) == (lookup == "lt"):
+                # Rows with the same value as the cursor come after it in this queryset
+                seek_filter = models.Q(**{field_lookup + "e": value})
+            else:
+                seek_filter = models.Q(**{field_lookup: value})
+            querysets.append((index, queryset.filter(seek_filter)))
+
+        object_list = self._fetch(querysets, self.per_page + 1, reverse)
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+
+        if reverse:
+            object_list.reverse()
+            # Start again from the first page if the page before this one no longer exists
+            if not has_more:
+                number = 1
+            return KeysetPage(object_list, number, self, number > 1, True)
+
+        return KeysetPage(object_list, number, self, True, has_more)
+
+    def page(self, number):
+        cursor = self._decode_cursor(number)
+        if cursor is not None:
+            return self._get_keyset_page(*cursor)
+
+        try:
+            is_first_page = int(number) == 1
+        except (TypeError, ValueError):
+            is_first_page = False
+
+        # The first page is fetched without counting the rows, as it always exists
+        number = 1 if is_first_page else self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        object_list = self._fetch(
+            enumerate(self.querysets), bottom + self.per_page + 1
+        )[bottom:]
+        if is_first_page and len(object_list) <= self.per_page:
+            # All the rows are on the first page, so they don't need to be counted
+            self.__dict__["count"] = len(object_list)
+
+        return KeysetPage(
+            object_list[: self.per_page],
+            number,
+            self,
+            number > 1,
+            len(object_list) > self.per_page,
+        )
+
+    def get_page(self, number):
+        try:
+            return self.page(number)
+        except PageNotAnInteger:
+            return self.page(1)
+        except EmptyPage:
+            return self.page(self.num_pages)
@@ -466,13 +466,19 @@ def paginate(context, page, base_url="", page_key="p", classnames=""):
         Extra classes to add to the next/previous links.
     """
     request = context["request"]
+    paginator = page.paginator
     return {
         "base_url": base_url,
         "classnames": classnames,
         "request": request,
         "page": page,
         "page_key": page_key,
-        "paginator": page.paginator,
+        "paginator": paginator,
+        # Paginators that don't count the results for every page, such as
+        # MergedKeysetPaginator, leave out the page count when it isn't known
+        "num_pages": paginator.num_pages
+        if getattr(paginator, "count_is_known", True)
+        else None,
     }
 
 
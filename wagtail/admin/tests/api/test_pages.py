@@ -4,7 +4,8 @@ import json
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
-from django.test.utils import override_settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
@@ -154,6 +155,25 @@ class TestAdminPageListing(AdminAPITestCase, TestPageListing):
         content = json.loads(response.content.decode("UTF-8"))
         self.assertIn("meta", content)
 
+    def test_html_url_query_count(self):
+        def get_url_queries(**params):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.get_response(**params)
+            self.assertEqual(response.status_code, 200)
+
+            # The admin listing makes other queries for each page (such as counting
+            # its children), so only count the ones made to compute the URLs
+            return [
+                query["sql"]
+                for query in ctx.captured_queries
+                if '"wagtailcore_site"' in query["sql"] or '"cache"' in query["sql"]
+            ]
+
+        # Warm up any caches
+        self.get_response(limit=1)
+
+        self.assertEqual(len(get_url_queries(limit=20)), len(get_url_queries(limit=1)))
+
     # FIELDS
 
     # Not applicable to the admin API
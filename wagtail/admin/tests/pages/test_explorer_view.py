@@ -1,7 +1,9 @@
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
 from django.core import paginator
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from wagtail import hooks
@@ -58,6 +60,33 @@ class TestPageExplorer(TestCase, WagtailTestUtils):
             page_ids, [self.new_page.id, self.old_page.id, self.child_page.id]
         )
 
+    def test_explore_query_count_does_not_depend_on_number_of_pages(self):
+        def add_pages(count):
+            for i in range(count):
+                page = self.root_page.add_child(
+                    instance=SimplePage(title="Page", content="hello", live=True)
+                )
+                page.add_child(
+                    instance=SimplePage(title="Child", content="hello", live=True)
+                )
+                page.save_revision().publish()
+
+        def get_query_count():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(
+                    reverse("wagtailadmin_explore", args=(self.root_page.id,))
+                )
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        add_pages(2)
+        # Warm up any caches used by the admin
+        get_query_count()
+        query_count = get_query_count()
+
+        add_pages(10)
+        self.assertEqual(get_query_count(), query_count)
+
     def test_explore_root(self):
         response = self.client.get(reverse("wagtailadmin_explore_root"))
         self.assertEqual(response.status_code, 200)
@@ -0,0 +1,298 @@
+import datetime
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from wagtail.admin.paginator import (
+    KeysetPage,
+    KeysetPaginator,
+    MergedKeysetPaginator,
+    get_count,
+)
+from wagtail.contrib.forms.models import FormSubmission
+from wagtail.images.models import Image
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import ModelLogEntry, Page, PageLogEntry
+from wagtail.test.testapp.models import Advert
+
+
+class TestKeysetPaginator(TestCase):
+    def setUp(self):
+        for i in range(7):
+            Advert.objects.create(text="Advert %d" % i)
+
+    def walk_forwards(self, paginator):
+        page = paginator.get_page(1)
+        pages = [page]
+        while page.has_next():
+            page = paginator.get_page(page.next_page_number())
+            pages.append(page)
+        return pages
+
+    def walk_backwards(self, paginator, page):
+        pages = [page]
+        while page.has_previous():
+            page = paginator.get_page(page.previous_page_number())
+            pages.append(page)
+        return pages
+
+    def test_keyset_ordering(self):
+        pk = Advert._meta.pk
+
+        paginator = KeysetPaginator(Advert.objects.order_by("-pk"), per_page=3)
+        self.assertEqual(paginator.keyset_ordering, [(pk, True)])
+
+        # Image.created_at is indexed, so it can be used with the pk as a tie-breaker
+        created_at = Image._meta.get_field("created_at")
+        paginator = KeysetPaginator(Image.objects.order_by("-created_at"), per_page=3)
+        self.assertEqual(
+            paginator.keyset_ordering, [(created_at, True), (Image._meta.pk, True)]
+        )
+
+    def test_keyset_ordering_with_index_on_filtered_field(self):
+        page = Page.objects.get(depth=1)
+        submit_time = FormSubmission._meta.get_field("submit_time")
+
+        # FormSubmission has an index on (page, submit_time), which orders the
+        # submissions of a single page by submit_time
+        paginator = KeysetPaginator(
+            FormSubmission.objects.filter(page=page).order_by("-submit_time"),
+            per_page=3,
+        )
+        self.assertEqual(
+            paginator.keyset_ordering,
+            [(submit_time, True), (FormSubmission._meta.pk, True)],
+        )
+
+        paginator = KeysetPaginator(
+            FormSubmission.objects.order_by("-submit_time"), per_page=3
+        )
+        self.assertIsNone(paginator.keyset_ordering)
+
+    def test_keyset_ordering_not_available(self):
+        # Not indexed
+        paginator = KeysetPaginator(Advert.objects.order_by("text"), per_page=3)
+        self.assertIsNone(paginator.keyset_ordering)
+
+        # Nullable
+        paginator = KeysetPaginator(Advert.objects.order_by("url", "pk"), per_page=3)
+        self.assertIsNone(paginator.keyset_ordering)
+
+        # Not a queryset
+        paginator = KeysetPaginator(list(Advert.objects.order_by("pk")), per_page=3)
+        self.assertIsNone(paginator.keyset_ordering)
+
+    def test_walk_pages(self):
+        queryset = Advert.objects.order_by("-pk")
+        paginator = KeysetPaginator(queryset, per_page=3)
+
+        pages = self.walk_forwards(paginator)
+        self.assertTrue(all(isinstance(page, KeysetPage) for page in pages))
+        self.assertEqual([page.number for page in pages], [1, 2, 3])
+        self.assertEqual([advert for page in pages for advert in page], list(queryset))
+        self.assertEqual(
+            [(page.start_index(), page.end_index()) for page in pages],
+            [(1, 3), (4, 6), (7, 7)],
+        )
+
+        pages = self.walk_backwards(paginator, pages[-1])
+        self.assertEqual([page.number for page in pages], [3, 2, 1])
+        self.assertEqual(
+            [advert for page in reversed(pages) for advert in page], list(queryset)
+        )
+
+    def test_walk_pages_with_ties(self):
+        for i in range(7):
+            Image.objects.create(title="Test image %d" % i, file=get_test_image_file())
+        # Give some images the same created_at, so the pk has to tell them apart
+        created_at = timezone.now() - datetime.timedelta(days=1)
+        Image.objects.filter(
+            pk__in=Image.objects.order_by("pk").values_list("pk", flat=True)[:5]
+        ).update(created_at=created_at)
+
+        queryset = Image.objects.order_by("-created_at")
+        paginator = KeysetPaginator(queryset, per_page=2)
+
+        pages = self.walk_forwards(paginator)
+        self.assertEqual(len(pages), 4)
+        self.assertEqual(
+            [image for page in pages for image in page],
+            list(queryset.order_by("-created_at", "-pk")),
+        )
+
+        pages = self.walk_backwards(paginator, pages[-1])
+        self.assertEqual(len(pages), 4)
+        self.assertEqual(pages[-1].number, 1)
+
+    def test_page_from_cursor_does_not_count(self):
+        paginator = KeysetPaginator(Advert.objects.order_by("pk"), per_page=3)
+        cursor = paginator.get_page(1).next_page_number()
+
+        paginator = KeysetPaginator(Advert.objects.order_by("pk"), per_page=3)
+        with self.assertNumQueries(1):
+            page = paginator.get_page(cursor)
+
+        self.assertEqual(page.number, 2)
+        self.assertEqual(len(page), 3)
+
+    def test_first_page_does_not_count(self):
+        paginator = KeysetPaginator(Advert.objects.order_by("pk"), per_page=3)
+        with self.assertNumQueries(1):
+            page = paginator.get_page(1)
+        self.assertTrue(page.has_next())
+
+        # When all the results fit on the first page, they are counted from it
+        paginator = KeysetPaginator(Advert.objects.order_by("pk"), per_page=10)
+        with self.assertNumQueries(1):
+            page = paginator.get_page(1)
+            self.assertEqual(paginator.count, 7)
+            self.assertEqual(paginator.num_pages, 1)
+        self.assertFalse(page.has_next())
+
+    def test_page_number(self):
+        queryset = Advert.objects.order_by("pk")
+        paginator = KeysetPaginator(queryset, per_page=3)
+
+        page = paginator.get_page(2)
+        self.assertIsInstance(page, KeysetPage)
+        self.assertEqual(list(page), list(queryset[3:6]))
+
+        # Out of range page numbers show the last page
+        page = paginator.get_page(10)
+        self.assertEqual(page.number, 3)
+        self.assertFalse(page.has_next())
+
+    def test_invalid_cursor(self):
+        paginator = KeysetPaginator(Advert.objects.order_by("pk"), per_page=3)
+        for cursor in ["kfoo", "k", "foo", None]:
+            page = paginator.get_page(cursor)
+            self.assertEqual(page.number, 1)
+
+    def test_cursor_for_different_ordering(self):
+        paginator = KeysetPaginator(Advert.objects.order_by("pk"), per_page=3)
+        cursor = paginator.get_page(1).next_page_number()
+
+        paginator = KeysetPaginator(Advert.objects.order_by("-pk"), per_page=3)
+        self.assertEqual(paginator.get_page(cursor).number, 1)
+
+
+class TestGetCount(TestCase):
+    def setUp(self):
+        for i in range(3):
+            Advert.objects.create(text="Advert %d" % i)
+
+    def test_count(self):
+        self.assertEqual(get_count(Advert.objects.all()), 3)
+
+    @override_settings(WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_estimated_count(self):
+        with mock.patch(
+            "wagtail.admin.paginator.get_estimated_count", return_value=5000
+        ):
+            self.assertEqual(get_count(Advert.objects.all()), 5000)
+            paginator = KeysetPaginator(Advert.objects.order_by("pk"), per_page=3)
+            self.assertEqual(paginator.count, 5000)
+
+        # Estimates below the threshold are ignored
+        with mock.patch(
+            "wagtail.admin.paginator.get_estimated_count", return_value=500
+        ):
+            self.assertEqual(get_count(Advert.objects.all()), 3)
+
+
+class TestMergedKeysetPaginator(TestCase):
+    def setUp(self):
+        page = Page.objects.get(id=1)
+        advert = Advert.objects.create(text="Advert")
+        now = timezone.now()
+
+        # Some log entries of each model share a timestamp
+        for i in range(5):
+            PageLogEntry.objects.log_action(
+                page, "wagtail.edit", timestamp=now - datetime.timedelta(minutes=i)
+            )
+        for i in range(3, 7):
+            ModelLogEntry.objects.log_action(
+                advert, "wagtail.edit", timestamp=now - datetime.timedelta(minutes=i)
+            )
+
+        self.querysets = [
+            PageLogEntry.objects.values("pk", "timestamp"),
+            ModelLogEntry.objects.values("pk", "timestamp"),
+        ]
+        self.expected_keys = sorted(
+            [
+                (row["timestamp"], index, row["pk"])
+                for index, queryset in enumerate(self.querysets)
+                for row in queryset
+            ],
+            reverse=True,
+        )
+
+    def get_keys(self, paginator, page):
+        return [paginator._row_keys[id(row)] for row in page.object_list]
+
+    def test_walk_pages(self):
+        paginator = MergedKeysetPaginator(
+            self.querysets, per_page=3, ordering_field="timestamp", descending=True
+        )
+        self.assertEqual(paginator.count, 9)
+
+        page = paginator.get_page(1)
+        keys = self.get_keys(paginator, page)
+        numbers = [page.number]
+        while page.has_next():
+            page = paginator.get_page(page.next_page_number())
+            keys += self.get_keys(paginator, page)
+            numbers.append(page.number)
+
+        self.assertEqual(keys, self.expected_keys)
+        self.assertEqual(numbers, [1, 2, 3])
+        self.assertEqual(page.start_index(), 7)
+
+        # and back again
+        keys = self.get_keys(paginator, page)
+        while page.has_previous():
+            page = paginator.get_page(page.previous_page_number())
+            keys = self.get_keys(paginator, page) + keys
+        self.assertEqual(keys, self.expected_keys)
+        self.assertEqual(page.number, 1)
+
+    def test_page_number(self):
+        paginator = MergedKeysetPaginator(
+            self.querysets, per_page=4, ordering_field="timestamp", descending=True
+        )
+        page = paginator.get_page(2)
+        self.assertEqual(self.get_keys(paginator, page), self.expected_keys[4:8])
+        self.assertTrue(page.has_next())
+
+        page = paginator.get_page(99)
+        self.assertEqual(page.number, 3)
+        self.assertEqual(self.get_keys(paginator, page), self.expected_keys[8:])
+
+    def test_invalid_cursor(self):
+        paginator = MergedKeysetPaginator(
+            self.querysets, per_page=3, ordering_field="timestamp", descending=True
+        )
+        for cursor in ["kfoo", "k", "foo", None]:
+            self.assertEqual(paginator.get_page(cursor).number, 1)
+
+    def test_pages_are_not_counted(self):
+        paginator = MergedKeysetPaginator(
+            self.querysets, per_page=3, ordering_field="timestamp", descending=True
+        )
+        # One query for each queryset on each page, and no COUNT queries
+        with self.assertNumQueries(4):
+            page = paginator.get_page(1)
+            page = paginator.get_page(page.next_page_number())
+        self.assertEqual(page.number, 2)
+        self.assertFalse(paginator.count_is_known)
+
+        paginator = MergedKeysetPaginator(
+            self.querysets, per_page=10, ordering_field="timestamp", descending=True
+        )
+        with self.assertNumQueries(2):
+            paginator.get_page(1)
+        self.assertTrue(paginator.count_is_known)
+        self.assertEqual(paginator.count, 9)
@@ -311,6 +311,16 @@ class TestAgingPagesView(TestCase, WagtailTestUtils):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "wagtailadmin/reports/aging_pages.html")
 
+    def test_last_published_by_is_read_from_page(self):
+        self.publish_home_page()
+        self.home.refresh_from_db()
+        self.assertEqual(self.home.last_published_by, self.user)
+
+        # The publishing user is stored on the page, not looked up in the audit log
+        PageLogEntry.objects.all().delete()
+        response = self.get()
+        self.assertContains(response, self.user.get_username())
+
     def test_displays_only_published_pages(self):
         response = self.get()
         self.assertContains(response, "No pages found.")
@@ -8,6 +8,7 @@ from django.views.generic import FormView
 from wagtail import hooks
 from wagtail.admin import messages
 from wagtail.admin.views.pages.utils import get_valid_next_url_from_request
+from wagtail.log_actions import LogEntryBuffer
 
 
 class BulkAction(ABC, FormView):
@@ -139,9 +140,11 @@ class BulkAction(ABC, FormView):
             )
             if before_hook_result is not None:
                 return before_hook_result
-            num_parent_objects, num_child_objects = self.execute_action(
-                objects, **self.get_execution_context()
-            )
+            # Write the log entries for all the objects in bulk once the action is done
+            with LogEntryBuffer():
+                num_parent_objects, num_child_objects = self.execute_action(
+                    objects, **self.get_execution_context()
+                )
             after_hook_result = self.__run_after_hooks(
                 self.action_type, request, objects
             )
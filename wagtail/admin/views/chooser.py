@@ -1,7 +1,6 @@
 import re
 
 from django.conf import settings
-from django.core.paginator import Paginator
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.template.response import TemplateResponse
@@ -19,9 +18,11 @@ from wagtail.admin.forms.choosers import (
 )
 from wagtail.admin.forms.search import SearchForm
 from wagtail.admin.modal_workflow import render_modal_workflow
+from wagtail.admin.paginator import KeysetPaginator
 from wagtail.admin.ui.tables import Column, DateColumn, Table
 from wagtail.coreutils import resolve_model_string
 from wagtail.models import Locale, Page, Site, UserPagePermissionsProxy
+from wagtail.search.paginator import SearchResultsPaginator
 
 
 def shared_context(request, extra_context=None):
@@ -322,7 +323,7 @@ class BrowseView(View):
         # Pagination
         # We apply pagination first so we don't need to walk the entire list
         # in the block below
-        paginator = Paginator(pages, per_page=25)
+        paginator = KeysetPaginator(pages, per_page=25)
         pages = paginator.get_page(request.GET.get("p"))
 
         # Annotate each page with can_choose/can_decend flags
@@ -426,7 +427,7 @@ class SearchView(View):
         else:
             pages = pages.none()
 
-        paginator = Paginator(pages, per_page=25)
+        paginator = SearchResultsPaginator(pages, per_page=25)
         pages = paginator.get_page(request.GET.get("p"))
 
         for page in pages:
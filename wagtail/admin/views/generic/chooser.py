@@ -5,7 +5,6 @@ from django.core.exceptions import (
     ObjectDoesNotExist,
     PermissionDenied,
 )
-from django.core.paginator import Paginator
 from django.forms.models import modelform_factory
 from django.http import Http404
 from django.template.loader import render_to_string
@@ -24,6 +23,7 @@ from wagtail.admin.forms.choosers import (
     SearchFilterMixin,
 )
 from wagtail.admin.modal_workflow import render_modal_workflow
+from wagtail.admin.paginator import KeysetPaginator
 from wagtail.admin.ui.tables import Table, TitleColumn
 from wagtail.coreutils import resolve_model_string
 from wagtail.models import CollectionMember, TranslatableMixin
@@ -155,7 +155,7 @@ class BaseChooseView(ModalPageFurnitureMixin, ModelLookupMixin, ContextMixin, Vi
         objects = self.apply_object_list_ordering(objects)
         objects = self.filter_object_list(objects)
 
-        paginator = Paginator(objects, per_page=self.per_page)
+        paginator = KeysetPaginator(objects, per_page=self.per_page)
         return paginator.get_page(request.GET.get("p"))
 
     def get(self, request):
@@ -20,6 +20,7 @@ from django.views.generic.list import BaseListView
 from wagtail.actions.unpublish import UnpublishAction
 from wagtail.admin import messages
 from wagtail.admin.forms.search import SearchForm
+from wagtail.admin.paginator import KeysetPaginator
 from wagtail.admin.panels import get_edit_handler
 from wagtail.admin.templatetags.wagtailadmin_tags import user_display_name
 from wagtail.admin.ui.tables import DateColumn, StatusTagColumn, Table, TitleColumn
@@ -86,6 +87,7 @@ class IndexView(
     filters = None
     filterset_class = None
     table_class = Table
+    paginator_class = KeysetPaginator
 
     def setup(self, request, *args, **kwargs):
         super().setup(request, *args, **kwargs)
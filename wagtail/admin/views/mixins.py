@@ -1,15 +1,20 @@
 import csv
 import datetime
+import tempfile
+import time
 from collections import OrderedDict
+from itertools import islice
 
 from django.core.exceptions import FieldDoesNotExist
-from django.http import HttpResponse, StreamingHttpResponse
+from django.db.models import QuerySet, prefetch_related_objects
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils.dateformat import Formatter
 from django.utils.encoding import force_str
 from django.utils.formats import get_format
 from xlsxwriter.workbook import Workbook
 
-from wagtail.coreutils import multigetattr
+from wagtail.admin.paginator import get_count
+from wagtail.coreutils import delete_in_batches, multigetattr
 
 
 class Echo:
@@ -141,6 +146,8 @@ class SpreadsheetExportMixin:
     }
     # A dictionary of column heading overrides in the format {field: heading}
     export_headings = {}
+    # The number of items fetched from the database at a time while exporting
+    export_chunk_size = 2000
 
     def get_filename(self):
         """Gets the base filename for the exported spreadsheet, without extensions"""
@@ -201,6 +208,39 @@ class SpreadsheetExportMixin:
         except (AttributeError, FieldDoesNotExist):
             return force_str(field)
 
+    def prepare_export_chunk(self, items):
+        """
+        Returns the list of items to export from a chunk of the queryset. Override this to
+        fetch any extra data needed for the export in bulk, one chunk at a time.
+        """
+        return items
+
+    def iter_export_items(self, queryset):
+        """
+        Iterate over the items to export from queryset, fetching export_chunk_size items
+        from the database at a time rather than loading the whole queryset into memory
+        """
+        if not isinstance(queryset, QuerySet):
+            yield from self.prepare_export_chunk(list(queryset))
+            return
+
+        # QuerySet.iterator() doesn't prefetch related objects on all Django versions,
+        # so prefetch them for each chunk instead
+        prefetch_lookups = queryset._prefetch_related_lookups
+        if prefetch_lookups:
+            queryset = queryset.prefetch_related(None)
+
+        items = queryset.iterator(chunk_size=self.export_chunk_size)
+        while True:
+            chunk = list(islice(items, self.export_chunk_size))
+            if not chunk:
+                break
+
+            if prefetch_lookups:
+                prefetch_related_objects(chunk, *prefetch_lookups)
+
+            yield from self.prepare_export_chunk(chunk)
+
     def stream_csv(self, queryset):
         """Generate a csv file line by line from queryset, to be used in a StreamingHTTPResponse"""
         writer = csv.DictWriter(Echo(), fieldnames=self.list_export)
@@ -208,15 +248,18 @@ class SpreadsheetExportMixin:
             {field: self.get_heading(queryset, field) for field in self.list_export}
         )
 
-        for item in queryset:
+        for item in self.iter_export_items(queryset):
             yield self.write_csv_row(writer, self.to_row_dict(item))
 
     def write_xlsx(self, queryset, output):
-        """Write an xlsx workbook from a queryset"""
+        """
+        Write an xlsx workbook from a queryset. The rows are flushed to temporary files as
+        they are written, so output should be a file rather than an in-memory buffer to
+        keep memory usage constant.
+        """
         workbook = Workbook(
             output,
             {
-                "in_memory": True,
                 "constant_memory": True,
                 "remove_timezone": True,
                 "default_date_format": ExcelDateFormatter().get(),
@@ -227,21 +270,23 @@ class SpreadsheetExportMixin:
         for col_number, field in enumerate(self.list_export):
             worksheet.write(0, col_number, self.get_heading(queryset, field))
 
-        for row_number, item in enumerate(queryset):
+        for row_number, item in enumerate(self.iter_export_items(queryset)):
             self.write_xlsx_row(worksheet, self.to_row_dict(item), row_number + 1)
 
         workbook.close()
 
     def write_xlsx_response(self, queryset):
-        response = HttpResponse(
-            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
-        response["Content-Disposition"] = 'attachment; filename="{}.xlsx"'.format(
-            self.get_filename()
-        )
-        self.write_xlsx(queryset, response)
+        output = tempfile.TemporaryFile()
+        self.write_xlsx(queryset, output)
+        output.seek(0)
 
-        return response
+        # FileResponse streams the file in blocks and closes it once it's been sent
+        return FileResponse(
+            output,
+            as_attachment=True,
+            filename="{}.xlsx".format(self.get_filename()),
+            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
 
     def write_csv_response(self, queryset):
         stream = self.stream_csv(queryset)
@@ -271,3 +316,52 @@ class SpreadsheetExportMixin:
     @property
     def csv_export_url(self):
         return self.get_export_url("csv")
+
+
+class BatchedDeletionMixin:
+    """
+    A mixin for views that delete a potentially very large number of objects.
+
+    Each POST request deletes objects in batches of deletion_batch_size for up to
+    deletion_time_limit seconds. If any objects are left after that, the view should
+    include the "wagtailadmin/shared/deletion_progress.html" template, which submits a
+    form to continue the deletion with another request, so that no single request runs
+    for long enough to time out.
+    """
+
+    deletion_batch_size = 1000
+    # The number of seconds to spend deleting objects in each request
+    deletion_time_limit = 5
+
+    def get_previously_deleted_count(self):
+        """Returns the number of objects deleted by earlier requests"""
+        try:
+            return max(int(self.request.POST.get("deleted_count", 0)), 0)
+        except ValueError:
+            return 0
+
+    def delete_objects(self, queryset, before_delete=None):
+        """
+        Deletes the objects in queryset until they have all been deleted or the time limit
+        is reached. Returns the number of objects deleted by this and earlier requests, and
+        whether all of the objects have been deleted. before_delete is passed on to
+        delete_in_batches.
+        """
+        deleted_count = self.get_previously_deleted_count()
+        start_time = time.monotonic()
+
+        for batch_count in delete_in_batches(
+            queryset, self.deletion_batch_size, before_delete=before_delete
+        ):
+            deleted_count += batch_count
+            if time.monotonic() - start_time >= self.deletion_time_limit:
+                return deleted_count, not queryset.exists()
+
+        return deleted_count, True
+
+    def get_deletion_progress_context(self, queryset, deleted_count):
+        return {
+            "deleted_count": deleted_count,
+            "remaining_count": get_count(queryset),
+            "model_opts": queryset.model._meta,
+        }
@@ -85,7 +85,9 @@ def index(request, parent_page_id=None):
     if getattr(settings, "WAGTAIL_WORKFLOW_ENABLED", True):
         pages = pages.prefetch_workflow_states()
 
-    pages = pages.annotate_site_root_state().annotate_approved_schedule()
+    pages = (
+        pages.annotate_site_root_state().annotate_approved_schedule().annotate_urls()
+    )
 
     # Pagination
     if do_paginate:
@@ -1,6 +1,5 @@
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.core.paginator import Paginator
 from django.http import Http404
 from django.template.response import TemplateResponse
 from django.views.decorators.vary import vary_on_headers
@@ -8,6 +7,7 @@ from django.views.decorators.vary import vary_on_headers
 from wagtail.admin.auth import user_has_any_page_permission, user_passes_test
 from wagtail.admin.forms.search import SearchForm
 from wagtail.models import Page
+from wagtail.search.paginator import SearchResultsPaginator
 from wagtail.search.query import MATCH_ALL
 from wagtail.search.utils import parse_query_string
 
@@ -112,7 +112,7 @@ def search(request):
     else:
         form = SearchForm()
 
-    paginator = Paginator(pages, per_page=20)
+    paginator = SearchResultsPaginator(pages, per_page=20)
     pages = paginator.get_page(request.GET.get("p"))
 
     if request.headers.get("x-requested-with") == "XMLHttpRequest":
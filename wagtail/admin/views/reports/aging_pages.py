@@ -1,7 +1,6 @@
 import django_filters
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import OuterRef, Subquery
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.admin.filters import ContentTypeFilter, WagtailFilterSet
@@ -59,34 +58,44 @@ class AgingPagesView(PageReportView):
         }
 
     def decorate_paginated_queryset(self, queryset):
-        User = get_user_model()
-        user_ids = set(queryset.values_list("last_published_by", flat=True))
+        # Pages that went live without recording last_published_by, such as pages that
+        # set_last_published_by hasn't backfilled yet, fall back to the user of their
+        # latest publish log entry
+        logged_usernames = {}
+        unrecorded_page_ids = [
+            page.pk for page in queryset if page.last_published_by_id is None
+        ]
+        if unrecorded_page_ids:
+            log_entries = (
+                PageLogEntry.objects.filter(
+                    page_id__in=unrecorded_page_ids,
+                    action__in=["wagtail.publish", "wagtail.publish.scheduled"],
+                )
+                .order_by("page_id", "-timestamp", "-id")
+                .values_list("page_id", "user__" + get_user_model().USERNAME_FIELD)
+            )
+            for page_id, username in log_entries:
+                logged_usernames.setdefault(page_id, username)
 
-        username_mapping = {
-            user.pk: user.get_username()
-            for user in User.objects.filter(pk__in=user_ids)
-        }
         for page in queryset:
             if page.last_published_by:
-                page.last_published_by_user = username_mapping[page.last_published_by]
+                page.last_published_by_user = page.last_published_by.get_username()
+            else:
+                page.last_published_by_user = logged_usernames.get(page.pk)
 
         return queryset
 
     def get_queryset(self):
-        latest_publishing_log = PageLogEntry.objects.filter(
-            page=OuterRef("pk"), action__exact="wagtail.publish"
-        )
+        # last_published_by is stored on each page when it's published, and the pages are
+        # ordered by the indexed last_published_at column
         self.queryset = (
             UserPagePermissionsProxy(self.request.user)
             .publishable_pages()
             .exclude(last_published_at__isnull=True)
             .prefetch_workflow_states()
-            .select_related("content_type")
+            .select_related("content_type", "last_published_by__wagtail_userprofile")
             .annotate_approved_schedule()
             .order_by("last_published_at")
-            .annotate(
-                last_published_by=Subquery(latest_publishing_log.values("user")[:1])
-            )
         )
 
         return super().get_queryset()
@@ -15,28 +15,26 @@ from wagtail.admin.filters import (
     DateRangePickerWidget,
     WagtailFilterSet,
 )
+from wagtail.admin.paginator import MergedKeysetPaginator
 from wagtail.coreutils import get_content_type_label
 from wagtail.log_actions import registry as log_action_registry
-from wagtail.models import PageLogEntry
+from wagtail.models import LogEntrySummary, PageLogEntry
 
 from .base import ReportView
 
 
 def get_users_for_filter():
-    user_ids = set()
-    for log_model in log_action_registry.get_log_entry_models():
-        user_ids.update(log_model.objects.all().get_user_ids())
-
+    # Taken from the log entry summary, rather than from every log entry
     User = get_user_model()
-    return User.objects.filter(pk__in=user_ids).order_by(User.USERNAME_FIELD)
+    return User.objects.filter(pk__in=LogEntrySummary.get_user_ids()).order_by(
+        User.USERNAME_FIELD
+    )
 
 
 def get_content_types_for_filter():
-    content_type_ids = set()
-    for log_model in log_action_registry.get_log_entry_models():
-        content_type_ids.update(log_model.objects.all().get_content_type_ids())
-
-    return ContentType.objects.filter(pk__in=content_type_ids).order_by("model")
+    return ContentType.objects.filter(
+        pk__in=LogEntrySummary.get_content_type_ids()
+    ).order_by("model")
 
 
 class SiteHistoryReportFilterSet(WagtailFilterSet):
@@ -84,6 +82,7 @@ class LogEntriesView(ReportView):
     title = _("Site history")
     header_icon = "history"
     filterset_class = SiteHistoryReportFilterSet
+    paginator_class = MergedKeysetPaginator
 
     export_headings = {
         "object_id": _("ID"),
@@ -133,7 +132,10 @@ class LogEntriesView(ReportView):
            annotation to indicate which model it is, and filter this with filter_queryset
         2. Form a union() queryset from these queries, and order it by -timestamp
            (this is the result returned from get_filtered_queryset)
-        3. Apply pagination (done in MultipleObjectMixin.get_context_data)
+        3. Apply pagination (done in MultipleObjectMixin.get_context_data). Rather than
+           paginating the union, MergedKeysetPaginator seeks each of the per-model querysets
+           past the previous page by timestamp and merges them, so that no query has to sort
+           or skip over the combined log
         4. (In decorate_paginated_queryset:) For each model included in the result set, look up
            the set of model instances by ID. Use these to form a final list of model instances
            in the same order as the query.
@@ -145,6 +147,7 @@ class LogEntriesView(ReportView):
         # an index number to each one; this index number will be used to distinguish models
         # in the combined results
         self.log_models = list(log_action_registry.get_log_entry_models())
+        self.log_entry_querysets = []
 
         for log_model_index, log_model in enumerate(self.log_models):
             sub_queryset = (
@@ -157,6 +160,7 @@ class LogEntriesView(ReportView):
             filters, sub_queryset = self.filter_queryset(sub_queryset)
             # disable any native ordering on the queryset; we will re-apply it on the combined result
             sub_queryset = sub_queryset.order_by()
+            self.log_entry_querysets.append(sub_queryset)
             if queryset is None:
                 queryset = sub_queryset
             else:
@@ -164,6 +168,16 @@ class LogEntriesView(ReportView):
 
         return filters, queryset.order_by("-timestamp")
 
+    def get_paginator(self, queryset, per_page, orphans=0, **kwargs):
+        return self.paginator_class(
+            self.log_entry_querysets,
+            per_page,
+            ordering_field="timestamp",
+            descending=True,
+            orphans=orphans,
+            **kwargs,
+        )
+
     def decorate_paginated_queryset(self, queryset):
         # build lists of ids from queryset, grouped by log model index
         pks_by_log_model_index = defaultdict(list)
@@ -23,7 +23,6 @@ class ReportView(SpreadsheetExportMixin, IndexView):
         self.is_export = self.request.GET.get("export") in self.FORMATS
         if self.is_export:
             self.paginate_by = None
-            self.object_list = self.decorate_paginated_queryset(self.object_list)
             return self.as_spreadsheet(self.object_list, self.request.GET.get("export"))
         else:
             context = self.get_context_data()
@@ -32,6 +31,10 @@ class ReportView(SpreadsheetExportMixin, IndexView):
             )
             return self.render_to_response(context)
 
+    def prepare_export_chunk(self, items):
+        # Exports are decorated one chunk at a time, rather than all at once
+        return self.decorate_paginated_queryset(items)
+
     def get_context_data(self, *args, object_list=None, **kwargs):
         queryset = object_list if object_list is not None else self.object_list
 
@@ -14,7 +14,9 @@ from .base import PageReportView
 
 def get_users_for_filter():
     User = get_user_model()
-    return User.objects.filter(locked_pages__isnull=False).order_by(User.USERNAME_FIELD)
+    return User.objects.filter(
+        pk__in=Page.objects.filter(locked=True).values("locked_by")
+    ).order_by(User.USERNAME_FIELD)
 
 
 class LockedPagesReportFilterSet(WagtailFilterSet):
@@ -50,6 +52,7 @@ class LockedPagesView(PageReportView):
                 | Page.objects.filter(locked_by=self.request.user)
             )
             .filter(locked=True)
+            .select_related("locked_by")
             .specific(defer=True)
         )
 
@@ -4,10 +4,15 @@ from django.conf import settings
 from rest_framework.pagination import BasePagination
 from rest_framework.response import Response
 
+from wagtail.search.backends.base import BaseSearchResults, InvalidCursorError
+
 from .utils import BadRequestError
 
 
 class WagtailPagination(BasePagination):
+    next_cursor = None
+    use_cursor = False
+
     def paginate_queryset(self, queryset, request, view=None):
         limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
 
@@ -33,20 +38,49 @@ class WagtailPagination(BasePagination):
         stop = offset + limit
 
         self.view = view
+
+        if "cursor" in request.GET:
+            if not isinstance(queryset, BaseSearchResults):
+                raise BadRequestError("cursor can only be used with search")
+
+            if "offset" in request.GET:
+                raise BadRequestError("cursor cannot be used with offset")
+
+            try:
+                results = queryset.search_after(request.GET["cursor"] or None)[:limit]
+                results.results()
+            except InvalidCursorError:
+                raise BadRequestError("cursor is not valid")
+
+            self.use_cursor = True
+            self.next_cursor = results.next_cursor
+            self.total_count = queryset.count()
+            return results
+
+        if isinstance(queryset, BaseSearchResults):
+            # Run the search before counting, so that backends which report the total
+            # number of hits alongside the results don't need a separate count request
+            results = queryset[start:stop]
+            results.results()
+            self.total_count = queryset.count()
+            return results
+
         self.total_count = queryset.count()
         return queryset[start:stop]
 
     def get_paginated_response(self, data):
+        meta = OrderedDict(
+            [
+                ("total_count", self.total_count),
+            ]
+        )
+
+        if self.use_cursor:
+            meta["next_cursor"] = self.next_cursor
+
         data = OrderedDict(
             [
-                (
-                    "meta",
-                    OrderedDict(
-                        [
-                            ("total_count", self.total_count),
-                        ]
-                    ),
-                ),
+                ("meta", meta),
                 ("items", data),
             ]
         )
@@ -334,9 +334,12 @@ class BaseSerializer(serializers.ModelSerializer):
         for field in fields:
             try:
                 if field.field_name == "admin_display_title":
-                    instance = instance.specific_deferred
-
-                attribute = field.get_attribute(instance)
+                    # Only this field needs the specific page. The other fields keep
+                    # using the instance from the queryset, which carries annotations
+                    # such as the URLs computed by annotate_urls()
+                    attribute = field.get_attribute(instance.specific_deferred)
+                else:
+                    attribute = field.get_attribute(instance)
             except SkipField:
                 continue
 
@@ -4,8 +4,9 @@ from unittest import mock
 
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import TestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 
@@ -265,6 +266,25 @@ class TestPageListing(TestCase, WagtailTestUtils):
         content = json.loads(response.content.decode("UTF-8"))
         self.assertEqual(len(content["items"]), 0)
 
+    def test_html_url_query_count(self):
+        # Warm up any caches
+        self.get_response(limit=1)
+
+        with CaptureQueriesContext(connection) as one_page_queries:
+            self.get_response(limit=1)
+
+        # The URLs of all the pages are computed together, so the number of queries
+        # doesn't depend on the number of pages
+        with self.assertNumQueries(len(one_page_queries)):
+            response = self.get_response(limit=10)
+
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertEqual(len(content["items"]), 10)
+        for page in content["items"]:
+            self.assertEqual(
+                page["meta"]["html_url"], Page.objects.get(id=page["id"]).full_url
+            )
+
     # FIELDS
 
     def test_fields_default(self):
@@ -1097,6 +1117,43 @@ class TestPageListing(TestCase, WagtailTestUtils):
 
         self.assertEqual(page_id_list, [19, 5, 16, 18])
 
+    def test_search_with_cursor(self):
+        response = self.get_response(search="blog", order="title", limit=2, cursor="")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(self.get_page_id_list(content), [19, 5])
+        self.assertEqual(content["meta"]["total_count"], 4)
+        self.assertIsNotNone(content["meta"]["next_cursor"])
+
+        response = self.get_response(
+            search="blog", order="title", limit=2, cursor=content["meta"]["next_cursor"]
+        )
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(self.get_page_id_list(content), [16, 18])
+        self.assertEqual(content["meta"]["total_count"], 4)
+
+    def test_search_with_invalid_cursor_gives_error(self):
+        response = self.get_response(search="blog", cursor="foo")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "cursor is not valid"})
+
+    def test_cursor_without_search_gives_error(self):
+        response = self.get_response(cursor="")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "cursor can only be used with search"})
+
+    def test_cursor_with_offset_gives_error(self):
+        response = self.get_response(search="blog", cursor="", offset=2)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "cursor cannot be used with offset"})
+
     def test_search_with_order_on_non_filterable_field(self):
         response = self.get_response(
             type="demosite.BlogEntryPage", search="blog", order="body"
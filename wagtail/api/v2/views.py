@@ -50,6 +50,7 @@ class BaseAPIViewSet(GenericViewSet):
             "order",
             "search",
             "search_operator",
+            "cursor",
             # Used by jQuery for cache-busting. See #1671
             "_",
             # Required by BrowsableAPIRenderer
@@ -562,17 +563,20 @@ class PagesAPIViewSet(BaseAPIViewSet):
             raise BadRequestError("type doesn't exist")
 
         if not models:
-            return self.get_base_queryset()
+            queryset = self.get_base_queryset()
 
         elif len(models) == 1:
             # If a single page type has been specified, swap out the Page-based queryset for one based on
             # the specific page model so that we can filter on any custom APIFields defined on that model
-            return models[0].objects.filter(
+            queryset = models[0].objects.filter(
                 id__in=self.get_base_queryset().values_list("id", flat=True)
             )
 
         else:  # len(models) > 1
-            return self.get_base_queryset().type(*models)
+            queryset = self.get_base_queryset().type(*models)
+
+        # Compute the URLs used by the html_url field for all pages at once
+        return queryset.annotate_urls()
 
     def get_object(self):
         base = super().get_object()
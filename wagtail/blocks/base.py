@@ -249,6 +249,17 @@ class Block(metaclass=BaseBlock):
         """
         return []
 
+    def extract_references(self, value):
+        """
+        Yields a (model, object_id, model_path, content_path) tuple for each object that 'value'
+        refers to, to be recorded in the reference index. 'value' is in the JSON-ish representation
+        returned by get_prep_value, so that references can be found without converting the value
+        to its native form. model_path and content_path locate the reference within the value, as
+        dotted paths of block names and block IDs respectively; they are blank where the reference
+        is the value itself.
+        """
+        return []
+
     def check(self, **kwargs):
         """
         Hook for the Django system checks framework -
@@ -605,6 +616,13 @@ def get_help_icon():
     )
 
 
+def join_block_path(*parts):
+    """
+    Joins the names or IDs of nested blocks into a dotted path, skipping blank parts
+    """
+    return ".".join(part for part in parts if part)
+
+
 DECONSTRUCT_ALIASES = {
     Block: "wagtail.blocks.Block",
 }
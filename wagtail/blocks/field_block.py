@@ -16,6 +16,7 @@ from wagtail.coreutils import camelcase_to_underscore, resolve_model_string
 from wagtail.rich_text import (
     RichText,
     RichTextMaxLengthValidator,
+    extract_references_from_rich_text,
     get_text_for_indexing,
 )
 from wagtail.telepath import Adapter, register
@@ -701,6 +702,9 @@ class RichTextBlock(FieldBlock):
         source = force_str(value.source)
         return [get_text_for_indexing(source)]
 
+    def extract_references(self, value):
+        yield from extract_references_from_rich_text(force_str(value))
+
     class Meta:
         icon = "doc-full"
 
@@ -822,6 +826,10 @@ class ChooserBlock(FieldBlock):
             value = value.pk
         return super().clean(value)
 
+    def extract_references(self, value):
+        if value is not None:
+            yield self.model_class, str(value), "", ""
+
     class Meta:
         # No icon specified here, because that depends on the purpose that the
         # block is being used for. Feel encouraged to specify an icon in your
@@ -11,7 +11,7 @@ from django.utils.translation import gettext as _
 from wagtail.admin.staticfiles import versioned_static
 from wagtail.telepath import Adapter, register
 
-from .base import Block, BoundBlock, get_help_icon
+from .base import Block, BoundBlock, get_help_icon, join_block_path
 
 __all__ = ["ListBlock", "ListBlockValidationError"]
 
@@ -319,6 +319,25 @@ class ListBlock(Block):
 
         return content
 
+    def extract_references(self, value):
+        for item in value:
+            if self._item_is_in_block_format(item):
+                child_value, child_id = item["value"], item["id"]
+            else:
+                child_value, child_id = item, None
+            for (
+                model,
+                object_id,
+                model_path,
+                content_path,
+            ) in self.child_block.extract_references(child_value):
+                yield (
+                    model,
+                    object_id,
+                    join_block_path("item", model_path),
+                    join_block_path(child_id, content_path),
+                )
+
     def check(self, **kwargs):
         errors = super().check(**kwargs)
         errors.extend(self.child_block.check(**kwargs))
@@ -13,7 +13,13 @@ from django.utils.translation import gettext as _
 from wagtail.admin.staticfiles import versioned_static
 from wagtail.telepath import Adapter, register
 
-from .base import Block, BoundBlock, DeclarativeSubBlocksMetaclass, get_help_icon
+from .base import (
+    Block,
+    BoundBlock,
+    DeclarativeSubBlocksMetaclass,
+    get_help_icon,
+    join_block_path,
+)
 
 __all__ = [
     "BaseStreamBlock",
@@ -329,6 +335,25 @@ class BaseStreamBlock(Block):
 
         return content
 
+    def extract_references(self, value):
+        for child in value:
+            try:
+                child_block = self.child_blocks[child["type"]]
+            except KeyError:
+                continue
+            for (
+                model,
+                object_id,
+                model_path,
+                content_path,
+            ) in child_block.extract_references(child["value"]):
+                yield (
+                    model,
+                    object_id,
+                    join_block_path(child["type"], model_path),
+                    join_block_path(child.get("id"), content_path),
+                )
+
     def deconstruct(self):
         """
         Always deconstruct StreamBlock instances as if they were plain StreamBlocks with all of the
@@ -11,7 +11,13 @@ from django.utils.safestring import mark_safe
 from wagtail.admin.staticfiles import versioned_static
 from wagtail.telepath import Adapter, register
 
-from .base import Block, BoundBlock, DeclarativeSubBlocksMetaclass, get_help_icon
+from .base import (
+    Block,
+    BoundBlock,
+    DeclarativeSubBlocksMetaclass,
+    get_help_icon,
+    join_block_path,
+)
 
 __all__ = ["BaseStructBlock", "StructBlock", "StructValue"]
 
@@ -234,6 +240,23 @@ class BaseStructBlock(Block):
 
         return content
 
+    def extract_references(self, value):
+        for name, block in self.child_blocks.items():
+            if name not in value:
+                continue
+            for (
+                model,
+                object_id,
+                model_path,
+                content_path,
+            ) in block.extract_references(value[name]):
+                yield (
+                    model,
+                    object_id,
+                    join_block_path(name, model_path),
+                    join_block_path(name, content_path),
+                )
+
     def deconstruct(self):
         """
         Always deconstruct StructBlock instances as if they were plain StructBlocks with all of the
@@ -0,0 +1,80 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from wagtail.contrib.forms.utils import get_form_types
+from wagtail.coreutils import delete_in_batches
+from wagtail.log_actions import log
+from wagtail.models import Page
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Delete form submissions made before the given date"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--before",
+            required=True,
+            type=datetime.date.fromisoformat,
+            help="Delete submissions made before this date, in YYYY-MM-DD format",
+        )
+        parser.add_argument(
+            "--page",
+            type=int,
+            help="Only delete submissions of the form page with this ID",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of submissions to delete at a time (default: %d)"
+            % DEFAULT_BATCH_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        verbosity = options.get("verbosity", 1)
+        batch_size = options.get("batch_size") or DEFAULT_BATCH_SIZE
+        before = timezone.make_aware(
+            datetime.datetime.combine(options["before"], datetime.time.min)
+        )
+
+        form_pages = Page.objects.filter(content_type__in=get_form_types())
+        if options.get("page"):
+            form_pages = form_pages.filter(id=options["page"])
+            if not form_pages.exists():
+                raise CommandError("There is no form page with ID %d" % options["page"])
+
+        total_deleted = 0
+        for page in form_pages.specific().iterator():
+            submissions = page.get_submission_class()._default_manager.filter(
+                page=page, submit_time__lt=before
+            )
+
+            deleted = 0
+            for batch_count in delete_in_batches(submissions, batch_size):
+                deleted += batch_count
+                if verbosity >= 1:
+                    self.stdout.write(
+                        "Deleted %d submissions of '%s'..." % (deleted, page.title)
+                    )
+
+            if deleted:
+                # Log a single entry for each page, rather than one for each submission
+                log(
+                    instance=page,
+                    action="wagtail_forms.delete_submissions",
+                    data={"count": deleted},
+                )
+                total_deleted += deleted
+
+        if total_deleted:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "Successfully deleted %d form submissions" % total_deleted
+                )
+            )
+        else:
+            self.stdout.write("No form submissions deleted")
@@ -46,6 +46,8 @@ class AbstractFormSubmission(models.Model):
 
     submit_time = models.DateTimeField(verbose_name=_("submit time"), auto_now_add=True)
 
+    wagtail_reference_index_ignore = True
+
     def get_data(self):
         """
         Returns dict with form data.
@@ -70,6 +72,14 @@ class AbstractFormSubmission(models.Model):
 class FormSubmission(AbstractFormSubmission):
     """Data for a Form submission."""
 
+    class Meta(AbstractFormSubmission.Meta):
+        # Lets the submissions of a page be listed by submit time without sorting them
+        indexes = [
+            models.Index(
+                fields=["page", "submit_time"], name="wagtailforms_page_submit_idx"
+            ),
+        ]
+
 
 class AbstractFormField(Orderable):
     """
@@ -0,0 +1,66 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from wagtail.contrib.forms.models import FormSubmission
+from wagtail.models import Page, PageLogEntry
+from wagtail.test.testapp.models import CustomFormPageSubmission
+
+
+class TestDeleteFormSubmissionsCommand(TestCase):
+    fixtures = ["test.json"]
+
+    def run_command(self, *args, **options):
+        output = StringIO()
+        call_command("delete_form_submissions", *args, stdout=output, **options)
+        output.seek(0)
+        return output.read()
+
+    def test_delete_before_date(self):
+        form_page = Page.objects.get(url_path="/home/contact-us/")
+        custom_form_page = Page.objects.get(url_path="/home/contact-us-one-more-time/")
+        form_submission_count = FormSubmission.objects.filter(page=form_page).count()
+        custom_submission_count = CustomFormPageSubmission.objects.count()
+
+        output = self.run_command("--before=2013-06-01")
+
+        # The submissions made in 2013 have been deleted from both pages
+        self.assertIn("Successfully deleted 2 form submissions", output)
+        self.assertEqual(
+            FormSubmission.objects.filter(page=form_page).count(),
+            form_submission_count - 1,
+        )
+        self.assertEqual(
+            CustomFormPageSubmission.objects.count(), custom_submission_count - 1
+        )
+        self.assertFalse(FormSubmission.objects.filter(submit_time__year=2013).exists())
+
+        # One log entry is created for each page
+        for page in [form_page, custom_form_page]:
+            log_entry = PageLogEntry.objects.get(
+                page=page, action="wagtail_forms.delete_submissions"
+            )
+            self.assertEqual(log_entry.data, {"count": 1})
+
+    def test_delete_for_page(self):
+        form_page = Page.objects.get(url_path="/home/contact-us/")
+
+        self.run_command("--before=2020-01-01", page=form_page.id, batch_size=1)
+
+        self.assertFalse(FormSubmission.objects.filter(page=form_page).exists())
+        self.assertTrue(CustomFormPageSubmission.objects.exists())
+
+    def test_nothing_to_delete(self):
+        output = self.run_command("--before=2000-01-01")
+        self.assertIn("No form submissions deleted", output)
+        self.assertFalse(
+            PageLogEntry.objects.filter(
+                action="wagtail_forms.delete_submissions"
+            ).exists()
+        )
+
+    def test_page_not_found(self):
+        with self.assertRaises(CommandError):
+            self.run_command("--before=2020-01-01", page=9999)
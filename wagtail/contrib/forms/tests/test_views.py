@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import datetime
 from io import BytesIO
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
@@ -16,7 +17,8 @@ from wagtail.contrib.forms.tests.utils import (
     make_form_page,
     make_form_page_with_custom_submission,
 )
-from wagtail.models import Locale, Page
+from wagtail.contrib.forms.views import DeleteSubmissionsView, SubmissionsListView
+from wagtail.models import Locale, Page, PageLogEntry
 from wagtail.test.testapp.models import (
     CustomFormPageSubmission,
     ExtendedFormField,
@@ -641,6 +643,35 @@ class TestFormsSubmissionsExport(TestCase, WagtailTestUtils):
         data_lines = response.getvalue().decode().split("\n")
         self.assertEqual(104, len(data_lines))
 
+    @mock.patch.object(SubmissionsListView, "export_chunk_size", 2)
+    def test_list_submissions_export_in_chunks(self):
+        for i in range(5):
+            FormSubmission.objects.create(
+                page=self.form_page,
+                form_data={"your_email": "new@example-%s.com" % i},
+            )
+
+        response = self.client.get(
+            reverse("wagtailforms:list_submissions", args=(self.form_page.id,)),
+            {"export": "csv"},
+        )
+        self.assertEqual(response.status_code, 200)
+        data_lines = response.getvalue().decode().splitlines()
+        # The heading row, followed by the 7 submissions in order of submission
+        self.assertEqual(len(data_lines), 8)
+        self.assertIn("old@example.com", data_lines[1])
+        self.assertIn("new@example-4.com", data_lines[7])
+
+        response = self.client.get(
+            reverse("wagtailforms:list_submissions", args=(self.form_page.id,)),
+            {"export": "xlsx"},
+        )
+        self.assertEqual(response.status_code, 200)
+        worksheet = load_workbook(filename=BytesIO(response.getvalue()))["Sheet1"]
+        cell_array = [[cell.value for cell in row] for row in worksheet.rows]
+        self.assertEqual(len(cell_array), 8)
+        self.assertEqual(cell_array[7][1], "new@example-4.com")
+
     def test_list_submissions_csv_export_after_filter_form_submissions_for_user_hook(
         self,
     ):
@@ -1245,6 +1276,80 @@ class TestDeleteFormSubmission(TestCase, WagtailTestUtils):
             reverse("wagtailforms:list_submissions", args=(self.form_page.id,)),
         )
 
+    def test_delete_submissions_up_to_date(self):
+        delete_url = reverse(
+            "wagtailforms:delete_submissions", args=(self.form_page.id,)
+        )
+        response = self.client.get(delete_url + "?date_to=2013-01-01")
+        self.assertTemplateUsed(response, "wagtailforms/confirm_delete.html")
+        self.assertEqual(response.context["submission_count"], 1)
+
+        response = self.client.post(delete_url + "?date_to=2013-01-01")
+
+        # Only the submission made on or before the date is gone
+        self.assertEqual(
+            [
+                submission.submit_time.year
+                for submission in FormSubmission.objects.all()
+            ],
+            [2014],
+        )
+        self.assertRedirects(
+            response,
+            reverse("wagtailforms:list_submissions", args=(self.form_page.id,)),
+        )
+
+        # A single log entry is created for the deleted submissions
+        log_entry = PageLogEntry.objects.get(
+            page=self.form_page, action="wagtail_forms.delete_submissions"
+        )
+        self.assertEqual(log_entry.data, {"count": 1})
+        self.assertEqual(log_entry.message, "Deleted one form submission")
+
+    def test_delete_submissions_over_several_requests(self):
+        delete_url = (
+            reverse("wagtailforms:delete_submissions", args=(self.form_page.id,))
+            + "?date_to=2020-01-01"
+        )
+
+        # Delete one submission per request, and stop after the first batch
+        with mock.patch.object(
+            DeleteSubmissionsView, "deletion_batch_size", 1
+        ), mock.patch.object(DeleteSubmissionsView, "deletion_time_limit", 0):
+            response = self.client.post(delete_url)
+
+            # The progress is shown, with a form to carry on deleting
+            self.assertEqual(response.status_code, 200)
+            self.assertTemplateUsed(
+                response, "wagtailadmin/shared/deletion_progress.html"
+            )
+            self.assertEqual(response.context["deleted_count"], 1)
+            self.assertEqual(response.context["remaining_count"], 1)
+            self.assertEqual(FormSubmission.objects.count(), 1)
+
+            response = self.client.post(delete_url, {"deleted_count": 1})
+
+        self.assertEqual(FormSubmission.objects.count(), 0)
+        self.assertRedirects(
+            response,
+            reverse("wagtailforms:list_submissions", args=(self.form_page.id,)),
+        )
+        log_entry = PageLogEntry.objects.get(
+            page=self.form_page, action="wagtail_forms.delete_submissions"
+        )
+        self.assertEqual(log_entry.data, {"count": 2})
+
+    def test_list_submissions_links_to_delete_up_to_date(self):
+        response = self.client.get(
+            reverse("wagtailforms:list_submissions", args=(self.form_page.id,))
+            + "?date_to=2013-06-01"
+        )
+        self.assertContains(
+            response,
+            reverse("wagtailforms:delete_submissions", args=(self.form_page.id,))
+            + "?date_to=2013-06-01",
+        )
+
     def test_delete_submission_bad_permissions(self):
         self.login(username="eventeditor", password="password")
 
@@ -6,13 +6,16 @@ from django.core.exceptions import PermissionDenied
 from django.core.paginator import InvalidPage
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
+from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy, ngettext
 from django.views.generic import ListView, TemplateView
 
 from wagtail.admin import messages
-from wagtail.admin.views.mixins import SpreadsheetExportMixin
+from wagtail.admin.paginator import KeysetPaginator, get_count
+from wagtail.admin.views.mixins import BatchedDeletionMixin, SpreadsheetExportMixin
 from wagtail.contrib.forms.forms import SelectDateForm
 from wagtail.contrib.forms.utils import get_forms_for_user
+from wagtail.log_actions import log
 from wagtail.models import Locale, Page
 
 
@@ -28,6 +31,7 @@ class SafePaginateListView(ListView):
 
     paginate_by = 20
     page_kwarg = "p"
+    paginator_class = KeysetPaginator
 
     def paginate_queryset(self, queryset, page_size):
         """Paginate the queryset if needed with nice defaults on invalid param."""
@@ -47,9 +51,15 @@ class SafePaginateListView(ListView):
             if page_request == "last":
                 page_number = paginator.num_pages
             else:
-                page_number = 0
+                # Either a cursor given out by KeysetPaginator, or an invalid page
+                page_number = page_request
         try:
-            if page_number > paginator.num_pages:
+            # The first page always exists, so only count the results for later ones
+            if (
+                isinstance(page_number, int)
+                and page_number > 1
+                and page_number > paginator.num_pages
+            ):
                 page_number = paginator.num_pages  # page out of range, show last page
             page = paginator.page(page_number)
         except InvalidPage:
@@ -111,24 +121,53 @@ class FormPagesListView(SafePaginateListView):
         return context
 
 
-class DeleteSubmissionsView(TemplateView):
-    """Delete the selected submissions"""
+class DeleteSubmissionsView(BatchedDeletionMixin, TemplateView):
+    """
+    Delete the selected submissions, or all submissions up to and including the date given
+    by the date_to parameter
+    """
 
     template_name = "wagtailforms/confirm_delete.html"
     page = None
     submissions = None
     success_url = "wagtailforms:list_submissions"
 
+    def get_date_to(self):
+        """Returns the date to delete all submissions up to, if one was given"""
+        select_date_form = SelectDateForm(self.request.GET)
+        if select_date_form.is_valid():
+            return select_date_form.cleaned_data.get("date_to")
+
     def get_queryset(self):
         """Returns a queryset for the selected submissions"""
-        submission_ids = self.request.GET.getlist("selected-submissions")
         submission_class = self.page.get_submission_class()
+
+        date_to = self.get_date_to()
+        if date_to:
+            # Include the whole day, as the submissions listing does when filtering
+            return submission_class._default_manager.filter(
+                page=self.page, submit_time__lt=date_to + datetime.timedelta(days=1)
+            )
+
+        submission_ids = self.request.GET.getlist("selected-submissions")
         return submission_class._default_manager.filter(id__in=submission_ids)
 
     def handle_delete(self, submissions):
-        """Deletes the given queryset"""
-        count = submissions.count()
-        submissions.delete()
+        """
+        Deletes the given queryset in batches. Returns False if the time limit for the
+        request was reached before all of the submissions were deleted.
+        """
+        count, finished = self.delete_objects(submissions)
+        if not finished:
+            self.deleted_count = count
+            return False
+
+        # Log a single entry for all the deleted submissions, rather than one each
+        log(
+            instance=self.page,
+            action="wagtail_forms.delete_submissions",
+            data={"count": count},
+        )
         messages.success(
             self.request,
             ngettext(
@@ -138,6 +177,7 @@ class DeleteSubmissionsView(TemplateView):
             )
             % {"count": count},
         )
+        return True
 
     def get_success_url(self):
         """Returns the success URL to redirect to after a successful deletion"""
@@ -155,8 +195,18 @@ class DeleteSubmissionsView(TemplateView):
         self.submissions = self.get_queryset()
 
         if self.request.method == "POST":
-            self.handle_delete(self.submissions)
-            return redirect(self.get_success_url(), page_id)
+            # handle_delete may be overridden to return None when it has finished
+            if self.handle_delete(self.submissions) is not False:
+                return redirect(self.get_success_url(), page_id)
+
+            # Show the progress so far, and carry on deleting with another request
+            return self.render_to_response(
+                self.get_context_data(
+                    **self.get_deletion_progress_context(
+                        self.submissions, self.deleted_count
+                    )
+                )
+            )
 
         return super().dispatch(request, *args, **kwargs)
 
@@ -168,6 +218,8 @@ class DeleteSubmissionsView(TemplateView):
             {
                 "page": self.page,
                 "submissions": self.submissions,
+                "submission_count": get_count(self.submissions),
+                "date_to": self.get_date_to(),
             }
         )
 
@@ -259,6 +311,21 @@ class SubmissionsListView(SpreadsheetExportMixin, SafePaginateListView):
         ordering = self.get_validated_ordering()
         return [values[0] + name for name, values in ordering.items()]
 
+    def get_delete_up_to_date_url(self):
+        """
+        Returns the URL for deleting every submission up to the date being filtered by,
+        if there is one
+        """
+        if self.select_date_form.is_valid():
+            date_to = self.select_date_form.cleaned_data.get("date_to")
+            if date_to:
+                return "%s?%s" % (
+                    reverse(
+                        "wagtailforms:delete_submissions", args=(self.form_page.id,)
+                    ),
+                    urlencode({"date_to": date_to.isoformat()}),
+                )
+
     def get_filtering(self):
         """Return filering as a dict for submissions queryset"""
         self.select_date_form = SelectDateForm(self.request.GET)
@@ -343,6 +410,7 @@ class SubmissionsListView(SpreadsheetExportMixin, SafePaginateListView):
                     "select_date_form": self.select_date_form,
                     "data_headings": data_headings,
                     "data_rows": data_rows,
+                    "delete_up_to_date_url": self.get_delete_up_to_date_url(),
                 }
             )
 
@@ -1,10 +1,12 @@
 from django.urls import include, path, reverse
 from django.utils.translation import gettext_lazy as _
+from django.utils.translation import ngettext
 
 from wagtail import hooks
 from wagtail.admin.menu import MenuItem
 from wagtail.contrib.forms import urls
 from wagtail.contrib.forms.utils import get_forms_for_user
+from wagtail.log_actions import LogFormatter
 
 
 @hooks.register("register_admin_urls")
@@ -29,3 +31,21 @@ def register_forms_menu_item():
         icon_name="form",
         order=700,
     )
+
+
+@hooks.register("register_log_actions")
+def register_forms_log_actions(actions):
+    @actions.register_action("wagtail_forms.delete_submissions")
+    class DeleteSubmissionsActionFormatter(LogFormatter):
+        label = _("Delete form submissions")
+
+        def format_message(self, log_entry):
+            try:
+                count = log_entry.data["count"]
+                return ngettext(
+                    "Deleted one form submission",
+                    "Deleted %(count)d form submissions",
+                    count,
+                ) % {"count": count}
+            except KeyError:
+                return _("Deleted form submissions")
@@ -1,17 +1,33 @@
 from django.apps import apps
 
-from wagtail.contrib.frontend_cache.utils import purge_page_from_cache
-from wagtail.signals import page_published, page_unpublished
+from wagtail.contrib.frontend_cache.utils import PurgeBatch, purge_page_from_cache
+from wagtail.signals import page_aliases_updated, page_published, page_unpublished
 
 
-def page_published_signal_handler(instance, **kwargs):
-    purge_page_from_cache(instance)
+def page_published_signal_handler(instance, alias=False, **kwargs):
+    # Aliases are purged together by page_aliases_updated_signal_handler once all
+    # aliases of the published page have been updated
+    if not alias:
+        purge_page_from_cache(instance)
 
 
 def page_unpublished_signal_handler(instance, **kwargs):
     purge_page_from_cache(instance)
 
 
+def page_aliases_updated_signal_handler(aliases, **kwargs):
+    from wagtail.models import Site
+
+    # Look up the site root paths once, rather than for each alias
+    site_root_paths = Site.get_site_root_paths()
+    for alias in aliases:
+        alias._wagtail_cached_site_root_paths = site_root_paths
+
+    batch = PurgeBatch()
+    batch.add_pages(aliases)
+    batch.purge()
+
+
 def register_signal_handlers():
     # Get list of models that are page types
     Page = apps.get_model("wagtailcore", "Page")
@@ -21,3 +37,4 @@ def register_signal_handlers():
     for model in indexed_models:
         page_published.connect(page_published_signal_handler, sender=model)
         page_unpublished.connect(page_unpublished_signal_handler, sender=model)
+        page_aliases_updated.connect(page_aliases_updated_signal_handler, sender=model)
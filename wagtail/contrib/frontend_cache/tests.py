@@ -510,6 +510,33 @@ class TestCachePurgingSignals(TestCase):
             PURGED_URLS, ["http://localhost/events/", "http://localhost/events/past/"]
         )
 
+    def test_purge_aliases_on_publish(self):
+        page = EventIndex.objects.get(url_path="/home/events/")
+        page.create_alias(update_slug="events-alias")
+        page.create_alias(update_slug="events-alias-2")
+
+        with mock.patch.object(
+            MockBackend,
+            "purge_batch",
+            autospec=True,
+            side_effect=lambda backend, urls: PURGED_URLS.extend(urls),
+        ) as purge_batch:
+            page.save_revision().publish()
+
+        # The page is purged on its own, then its aliases are purged together
+        self.assertEqual(purge_batch.call_count, 2)
+        self.assertEqual(
+            PURGED_URLS,
+            [
+                "http://localhost/events/",
+                "http://localhost/events/past/",
+                "http://localhost/events-alias/",
+                "http://localhost/events-alias/past/",
+                "http://localhost/events-alias-2/",
+                "http://localhost/events-alias-2/past/",
+            ],
+        )
+
     def test_purge_on_unpublish(self):
         page = EventIndex.objects.get(url_path="/home/events/")
         page.unpublish()
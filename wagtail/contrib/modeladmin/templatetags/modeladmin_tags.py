@@ -113,10 +113,18 @@ def result_list(context):
     return context
 
 
+def _get_page_var_value(page_number):
+    # Page numbers are 0-indexed in the query string, but pages fetched by keyset
+    # are identified by a cursor instead
+    if isinstance(page_number, int):
+        return page_number - 1
+    return page_number
+
+
 @register.simple_tag
 def pagination_link_previous(current_page, view):
     if current_page.has_previous():
-        previous_page_number0 = current_page.previous_page_number() - 1
+        previous_page_number0 = _get_page_var_value(current_page.previous_page_number())
         tpl = get_template("wagtailadmin/shared/icon.html")
         icon_svg = tpl.render({"name": "arrow-left", "class_name": "default"})
         return format_html(
@@ -131,7 +139,7 @@ def pagination_link_previous(current_page, view):
 @register.simple_tag
 def pagination_link_next(current_page, view):
     if current_page.has_next():
-        next_page_number0 = current_page.next_page_number() - 1
+        next_page_number0 = _get_page_var_value(current_page.next_page_number())
         tpl = get_template("wagtailadmin/shared/icon.html")
         icon_svg = tpl.render({"name": "arrow-right", "class_name": "default"})
         return format_html(
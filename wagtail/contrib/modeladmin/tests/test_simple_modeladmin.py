@@ -26,7 +26,11 @@ from wagtail.test.modeladmintest.models import (
     Token,
     TranslatableBook,
 )
-from wagtail.test.modeladmintest.wagtail_hooks import BookModelAdmin, EventsAdminGroup
+from wagtail.test.modeladmintest.wagtail_hooks import (
+    AuthorModelAdmin,
+    BookModelAdmin,
+    EventsAdminGroup,
+)
 from wagtail.test.utils import WagtailTestUtils
 
 
@@ -249,6 +253,36 @@ class TestAuthorIndexView(TestCase, WagtailTestUtils):
             response, '<span class="result-count">2 out of 5</span>', html=True
         )
 
+    @mock.patch.object(AuthorModelAdmin, "list_per_page", 2)
+    def test_pagination(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        page_obj = response.context["page_obj"]
+        self.assertEqual(page_obj.number, 1)
+        self.assertEqual(response.context["paginator"].num_pages, 3)
+
+        # Authors are ordered by pk, so the next page is fetched from a cursor
+        cursor = page_obj.next_page_number()
+        self.assertIsInstance(cursor, str)
+        self.assertContains(response, "?p=%s" % cursor)
+
+        response = self.get(p=cursor)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["page_obj"].number, 2)
+        self.assertEqual(
+            list(response.context["object_list"]),
+            list(Author.objects.order_by("-pk")[2:4]),
+        )
+        self.assertContains(response, '<a href="?p=0">', html=False)
+
+        # Page numbers still work
+        response = self.get(p=2)
+        self.assertEqual(response.context["page_obj"].number, 3)
+        self.assertEqual(
+            list(response.context["object_list"]),
+            list(Author.objects.order_by("-pk")[4:]),
+        )
+
     def test_col_extra_class_names(self):
         response = self.get()
         self.assertEqual(response.status_code, 200)
@@ -21,7 +21,7 @@ from django.core.exceptions import (
     PermissionDenied,
     SuspiciousOperation,
 )
-from django.core.paginator import InvalidPage, Paginator
+from django.core.paginator import InvalidPage
 from django.db import models, transaction
 from django.db.models.fields.related import ManyToManyField, OneToOneRel
 from django.shortcuts import get_object_or_404, redirect
@@ -39,6 +39,7 @@ from django.views.generic.edit import FormView
 from django.views.generic.list import MultipleObjectMixin
 
 from wagtail.admin import messages
+from wagtail.admin.paginator import KeysetPaginator, get_count
 from wagtail.admin.ui.tables import Column, DateColumn, Table, UserColumn
 from wagtail.admin.views.generic.base import WagtailAdminTemplateMixin
 from wagtail.admin.views.mixins import SpreadsheetExportMixin
@@ -345,10 +346,14 @@ class IndexView(SpreadsheetExportMixin, WMABaseView):
         self.export = request.GET.get(self.EXPORT_VAR)
 
         # Get search parameters from the query string.
+        # Pages after the first are either numbered from 0, or identified by a cursor
+        # given out by KeysetPaginator
+        self.page_cursor = None
         try:
             self.page_num = int(request.GET.get(self.PAGE_VAR, 0))
         except ValueError:
             self.page_num = 0
+            self.page_cursor = request.GET.get(self.PAGE_VAR)
 
         self.params = dict(request.GET.items())
         if self.PAGE_VAR in self.params:
@@ -691,13 +696,13 @@ class IndexView(SpreadsheetExportMixin, WMABaseView):
 
     def get_context_data(self, **kwargs):
         user = self.request.user
-        all_count = self.get_base_queryset().count()
+        all_count = get_count(self.get_base_queryset())
         queryset = self.get_queryset()
-        result_count = queryset.count()
-        paginator = Paginator(queryset, self.items_per_page)
+        paginator = KeysetPaginator(queryset, self.items_per_page)
+        result_count = paginator.count
 
         try:
-            page_obj = paginator.page(self.page_num + 1)
+            page_obj = paginator.page(self.page_cursor or self.page_num + 1)
         except InvalidPage:
             page_obj = paginator.page(1)
 
@@ -24,7 +24,9 @@ ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 # https://raw.githubusercontent.com/django-import-export/django-import-export/main/import_export/formats/base_formats.py
+import csv
 from importlib import import_module
+from io import BytesIO, StringIO
 
 import tablib
 
@@ -39,6 +41,17 @@ class Format:
         """
         raise NotImplementedError()
 
+    def read_rows(self, in_stream):
+        """
+        Returns the headers and an iterator over the rest of the rows of the given
+        string or file. Formats that can be parsed incrementally read a file as the
+        rows are consumed, rather than loading all of it at once.
+        """
+        if hasattr(in_stream, "read"):
+            in_stream = in_stream.read()
+        dataset = self.create_dataset(in_stream)
+        return dataset.headers, iter(dataset)
+
     def export_data(self, dataset, **kwargs):
         """
         Returns format representation for given dataset.
@@ -137,10 +150,25 @@ class TextFormat(TablibFormat):
 class CSV(TextFormat):
     TABLIB_MODULE = "tablib.formats._csv"
     CONTENT_TYPE = "text/csv"
+    DELIMITER = ","
 
     def create_dataset(self, in_stream, **kwargs):
         return super().create_dataset(in_stream, **kwargs)
 
+    def read_rows(self, in_stream):
+        if isinstance(in_stream, str):
+            in_stream = StringIO(in_stream)
+        reader = csv.reader(in_stream, delimiter=self.DELIMITER)
+        headers = next(reader, [])
+
+        def rows():
+            # Skip blank lines and pad short rows, as tablib does
+            for row in reader:
+                if row:
+                    yield row + [""] * (len(headers) - len(row))
+
+        return headers, rows()
+
 
 class JSON(TextFormat):
     TABLIB_MODULE = "tablib.formats._json"
@@ -153,12 +181,10 @@ class YAML(TextFormat):
     CONTENT_TYPE = "text/yaml"
 
 
-class TSV(TextFormat):
+class TSV(CSV):
     TABLIB_MODULE = "tablib.formats._tsv"
     CONTENT_TYPE = "text/tab-separated-values"
-
-    def create_dataset(self, in_stream, **kwargs):
-        return super().create_dataset(in_stream, **kwargs)
+    DELIMITER = "\t"
 
 
 class ODS(TextFormat):
@@ -199,8 +225,6 @@ class XLSX(TablibFormat):
         """
         Create dataset from first sheet.
         """
-        from io import BytesIO
-
         import openpyxl
 
         xlsx_book = openpyxl.load_workbook(BytesIO(in_stream), read_only=True)
@@ -217,6 +241,18 @@ class XLSX(TablibFormat):
             dataset.append(row_values)
         return dataset
 
+    def read_rows(self, in_stream):
+        import openpyxl
+
+        if isinstance(in_stream, bytes):
+            in_stream = BytesIO(in_stream)
+
+        # Read-only workbooks load the rows of the sheet as they are iterated over
+        xlsx_book = openpyxl.load_workbook(in_stream, read_only=True)
+        rows = xlsx_book.active.values
+        headers = list(next(rows, []))
+        return headers, rows
+
 
 #: These are the default formats for import and export. Whether they can be
 #: used or not is depending on their implementation in the tablib library.
@@ -1,10 +1,12 @@
 import os
+from itertools import chain, islice
 
 import tablib
 from django.core.management.base import BaseCommand
 
-from wagtail.contrib.redirects.forms import RedirectForm
 from wagtail.contrib.redirects.utils import (
+    IMPORT_BATCH_SIZE,
+    BatchRedirectImporter,
     get_format_cls_by_extension,
     get_supported_extensions,
 )
@@ -71,6 +73,13 @@ class Command(BaseCommand):
         parser.add_argument(
             "--limit", help="Limit import to num items", type=int, default=None
         )
+        parser.add_argument(
+            "--batch-size",
+            help="Number of redirects to save at a time (default: %d)"
+            % IMPORT_BATCH_SIZE,
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+        )
 
     def handle(self, *args, **options):
         src = options["src"]
@@ -84,11 +93,8 @@ class Command(BaseCommand):
         ask = options.pop("ask")
         offset = options.pop("offset")
         limit = options.pop("limit")
+        batch_size = options.pop("batch_size") or IMPORT_BATCH_SIZE
 
-        errors = []
-        successes = 0
-        skipped = 0
-        total = 0
         site = None
 
         if site_id:
@@ -106,23 +112,26 @@ class Command(BaseCommand):
         if not format_:
             format_ = extension
 
-        if not get_format_cls_by_extension(format_):
+        format_cls = get_format_cls_by_extension(format_)
+        if not format_cls:
             raise Exception("Invalid format '{0}'".format(extension))
+        input_format = format_cls()
 
         if extension in ["xls", "xlsx"]:
             mode = "rb"
+            open_kwargs = {}
         else:
             mode = "r"
+            open_kwargs = {"newline": ""}
 
-        with open(src, mode) as fh:
-            imported_data = tablib.Dataset().load(fh.read(), format=format_)
-
-            sample_data = tablib.Dataset(
-                *imported_data[: min(len(imported_data), 4)],
-                headers=imported_data.headers,
-            )
+        with open(src, mode, **open_kwargs) as fh:
+            # Rows are parsed as they are imported, rather than loading the whole file
+            headers, rows = input_format.read_rows(fh)
 
+            sample_rows = list(islice(rows, 4))
+            rows = chain(sample_rows, rows)
             try:
+                sample_data = tablib.Dataset(*sample_rows, headers=headers)
                 self.stdout.write("Sample data:")
                 self.stdout.write(str(sample_data))
             except Exception:
@@ -135,73 +144,61 @@ class Command(BaseCommand):
 
             self.stdout.write("Importing redirects:")
 
-            if offset:
-                imported_data = imported_data[offset:]
-            if limit:
-                imported_data = imported_data[:limit]
-
-            for row in imported_data:
-                total += 1
-
-                from_link = row[from_index]
-                to_link = row[to_index]
-
-                data = {
-                    "old_path": from_link,
-                    "redirect_link": to_link,
-                    "is_permanent": permanent,
-                }
-
-                if site:
-                    data["site"] = site.pk
-
-                form = RedirectForm(data)
-                if not form.is_valid():
-                    error = form.errors.as_text().replace("\n", "")
-                    self.stdout.write(
-                        "{}. Error: {} -> {} (Reason: {})".format(
-                            total,
-                            from_link,
-                            to_link,
-                            error,
-                        )
-                    )
-                    errors.append(error)
-                    continue
-
-                if ask:
-                    answer = get_input(
-                        "{}. Found {} -> {} Create? Y/n: ".format(
-                            total,
-                            from_link,
-                            to_link,
-                        )
-                    )
-
-                    if answer != "Y":
-                        skipped += 1
-                        continue
-                else:
-                    self.stdout.write(
-                        "{}. {} -> {}".format(
-                            total,
-                            from_link,
-                            to_link,
-                        )
-                    )
-
-                if dry_run:
-                    successes += 1
-                    continue
-
-                form.save()
-                successes += 1
+            if offset or limit:
+                offset = offset or 0
+                rows = islice(rows, offset, offset + limit if limit else None)
+
+            importer = CommandRedirectImporter(
+                batch_size,
+                site=site,
+                permanent=permanent,
+                dry_run=dry_run,
+                command=self,
+                ask=ask,
+            )
+            for row in rows:
+                importer.add(row[from_index], row[to_index])
+            importer.process()
 
+        summary = importer.get_summary()
         self.stdout.write("\n")
-        self.stdout.write("Found: {}".format(total))
-        self.stdout.write("Created: {}".format(successes))
-        self.stdout.write("Skipped : {}".format(skipped))
-        self.stdout.write("Errors: {}".format(len(errors)))
+        self.stdout.write("Found: {}".format(summary["total"]))
+        self.stdout.write("Created: {}".format(summary["created"]))
+        self.stdout.write("Updated: {}".format(summary["updated"]))
+        self.stdout.write("Skipped : {}".format(summary["skipped"]))
+        self.stdout.write("Errors: {}".format(summary["errors_count"]))
+
+
+class CommandRedirectImporter(BatchRedirectImporter):
+    """
+    Reports the progress of the import as each row is validated, and asks for each
+    redirect to be confirmed if the --ask option is given
+    """
+
+    def __init__(self, *args, command, ask=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.command = command
+        self.ask = ask
+
+    def add_error(self, row_number, from_link, to_link, error):
+        super().add_error(row_number, from_link, to_link, error)
+        self.command.stdout.write(
+            "{}. Error: {} -> {} (Reason: {})".format(
+                row_number, from_link, to_link, error
+            )
+        )
+
+    def confirm(self, row_number, from_link, to_link):
+        if self.ask:
+            answer = get_input(
+                "{}. Found {} -> {} Create? Y/n: ".format(
+                    row_number, from_link, to_link
+                )
+            )
+            return answer == "Y"
+
+        self.command.stdout.write("{}. {} -> {}".format(row_number, from_link, to_link))
+        return True
 
 
 def get_input(msg):  # pragma: no cover
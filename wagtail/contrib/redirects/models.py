@@ -56,6 +56,8 @@ class Redirect(models.Model):
         verbose_name=_("created at"), auto_now_add=True, null=True
     )
 
+    wagtail_reference_index_ignore = True
+
     @property
     def title(self):
         return self.old_path
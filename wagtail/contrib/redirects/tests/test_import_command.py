@@ -332,3 +332,36 @@ class TestImportCommand(TestCase):
         self.assertEqual(redirects[0].old_path, "/one")
         self.assertEqual(redirects[0].redirect_link, "http://one.test/")
         self.assertIs(redirects[0].is_permanent, True)
+
+    def test_existing_redirects_are_updated(self):
+        Redirect.objects.create(old_path="/one", redirect_link="http://old.test/")
+
+        invalid_file = tempfile.NamedTemporaryFile(mode="w+", encoding="utf-8")
+        invalid_file.write("from,to\n")
+        invalid_file.write("/one,http://one.test/\n")
+        invalid_file.write("/two,http://two.test/\n")
+        invalid_file.write("/three,not a url\n")
+        invalid_file.write("/four,http://four.test/")
+        invalid_file.seek(0)
+
+        out = StringIO()
+        call_command(
+            "import_redirects",
+            src=invalid_file.name,
+            format="csv",
+            batch_size=2,
+            stdout=out,
+        )
+
+        self.assertEqual(
+            dict(Redirect.objects.values_list("old_path", "redirect_link")),
+            {
+                "/one": "http://one.test/",
+                "/two": "http://two.test/",
+                "/four": "http://four.test/",
+            },
+        )
+        self.assertIn("Created: 2", out.getvalue())
+        self.assertIn("Updated: 1", out.getvalue())
+        self.assertIn("3. Error: /three -> not a url", out.getvalue())
+        self.assertIn("Errors: 1", out.getvalue())
@@ -2,13 +2,19 @@ import hashlib
 import os
 
 from django.core.files.base import ContentFile
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
+from wagtail.contrib.redirects.base_formats import CSV, TSV, XLSX
+from wagtail.contrib.redirects.models import Redirect
 from wagtail.contrib.redirects.utils import (
+    BatchRedirectImporter,
     get_file_storage,
     get_import_formats,
     write_to_file_storage,
 )
+from wagtail.models import ModelLogEntry, Page, Site
 
 TEST_ROOT = os.path.abspath(os.path.dirname(__file__))
 
@@ -55,3 +61,138 @@ class TestImportUtils(TestCase):
             Exception, "Invalid file storage, must be either 'tmp_file' or 'cache'"
         ):
             get_file_storage()
+
+
+class TestReadRows(TestCase):
+    def test_csv(self):
+        headers, rows = CSV().read_rows("from,to\n/one,http://one.test/\n\n/two\n")
+        self.assertEqual(headers, ["from", "to"])
+        self.assertEqual(list(rows), [["/one", "http://one.test/"], ["/two", ""]])
+
+    def test_csv_file_is_read_incrementally(self):
+        with open("{}/files/example.csv".format(TEST_ROOT), newline="") as f:
+            headers, rows = CSV().read_rows(f)
+            self.assertEqual(next(rows), ["/hello", "http://hello.com/random/"])
+            # The rest of the file hasn't been parsed yet
+            self.assertEqual(len(list(rows)), 2)
+
+    def test_tsv(self):
+        with open("{}/files/example.tsv".format(TEST_ROOT), newline="") as f:
+            headers, rows = TSV().read_rows(f)
+            self.assertEqual(len(headers), 2)
+            self.assertEqual(len(list(rows)), 3)
+
+    def test_xlsx(self):
+        with open("{}/files/example.xlsx".format(TEST_ROOT), "rb") as f:
+            headers, rows = XLSX().read_rows(f)
+            self.assertEqual(headers[:2], ["From", "To"])
+            self.assertEqual(
+                [row[:2] for row in rows],
+                [
+                    ("/one", "https://hello.test/one/"),
+                    ("/two", "https://hello.test/two/"),
+                    ("/three", "https://hello.test/three/"),
+                ],
+            )
+
+
+class TestBatchRedirectImporter(TestCase):
+    fixtures = ["test.json"]
+
+    def test_create_and_update(self):
+        Redirect.objects.create(old_path="/existing", redirect_link="http://old.test/")
+
+        importer = BatchRedirectImporter(10, permanent=False)
+        importer.add("/new", "http://new.test/")
+        importer.add("/existing/", "http://existing.test/")
+        importer.process()
+
+        self.assertEqual(Redirect.objects.count(), 2)
+        self.assertEqual(
+            Redirect.objects.get(old_path="/existing").redirect_link,
+            "http://existing.test/",
+        )
+        self.assertIs(Redirect.objects.get(old_path="/new").is_permanent, False)
+
+        summary = importer.get_summary()
+        self.assertEqual(summary["created"], 1)
+        self.assertEqual(summary["updated"], 1)
+        self.assertEqual(summary["errors_count"], 0)
+
+        self.assertEqual(
+            ModelLogEntry.objects.filter(action="wagtail.create").count(), 1
+        )
+        self.assertEqual(ModelLogEntry.objects.filter(action="wagtail.edit").count(), 1)
+
+    def test_last_row_wins(self):
+        importer = BatchRedirectImporter(2)
+        for i in range(3):
+            importer.add("/path", "http://%d.test/" % i)
+        importer.process()
+
+        redirect = Redirect.objects.get()
+        self.assertEqual(redirect.redirect_link, "http://2.test/")
+
+    def test_paths_are_resolved_to_pages(self):
+        site = Site.objects.get(is_default_site=True)
+        events_page = Page.objects.get(url_path="/home/events/")
+
+        importer = BatchRedirectImporter(10, site=site)
+        importer.add("/old-events", "/events/")
+        importer.add("/old-home", "/")
+        importer.add("/missing", "/not-a-page/")
+        importer.process()
+
+        self.assertEqual(
+            Redirect.objects.get(old_path="/old-events").redirect_page, events_page
+        )
+        self.assertEqual(
+            Redirect.objects.get(old_path="/old-home").redirect_page, site.root_page
+        )
+        self.assertEqual(
+            importer.errors,
+            [["/missing", "/not-a-page/", "Enter a valid URL, or the path of a page."]],
+        )
+
+    def test_errors_do_not_stop_the_import(self):
+        importer = BatchRedirectImporter(10)
+        importer.add("", "http://one.test/")
+        importer.add("/two", "not a url")
+        importer.add("/three", "http://three.test/")
+        importer.process()
+
+        self.assertEqual(
+            list(Redirect.objects.values_list("old_path", flat=True)), ["/three"]
+        )
+        self.assertEqual(
+            importer.errors,
+            [
+                ["", "http://one.test/", "This field is required."],
+                ["/two", "not a url", "Enter a valid URL."],
+            ],
+        )
+
+    def test_queries_do_not_depend_on_number_of_rows(self):
+        def import_rows(count):
+            importer = BatchRedirectImporter(1000)
+            for i in range(count):
+                importer.add(
+                    "/%d/path-%d" % (count, i),
+                    "/events/" if i % 2 else "http://a.test/",
+                )
+            with CaptureQueriesContext(connection) as queries:
+                importer.process()
+            self.assertEqual(importer.get_summary()["created"], count)
+            return len(queries)
+
+        # Populate the caches of site root paths and content types first
+        import_rows(1)
+        self.assertEqual(import_rows(2), import_rows(50))
+
+    def test_dry_run(self):
+        importer = BatchRedirectImporter(10, dry_run=True)
+        importer.add("/new", "http://new.test/")
+        importer.process()
+
+        self.assertEqual(importer.get_summary()["created"], 1)
+        self.assertFalse(Redirect.objects.exists())
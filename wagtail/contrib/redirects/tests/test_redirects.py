@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
+from unittest import mock
+
+from django.contrib.auth.models import Permission
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from wagtail.admin.admin_url_finder import AdminURLFinder
 from wagtail.contrib.redirects import models
-from wagtail.models import Page, Site
+from wagtail.contrib.redirects.views import DeleteMultipleView
+from wagtail.models import ModelLogEntry, Page, Site
 from wagtail.test.routablepage.models import RoutablePageTest
 from wagtail.test.utils import WagtailTestUtils
 
@@ -919,3 +923,103 @@ class TestRedirectsDeleteView(TestCase, WagtailTestUtils):
         # Check that the redirect was deleted
         redirects = models.Redirect.objects.filter(old_path="/test")
         self.assertEqual(redirects.count(), 0)
+
+
+class TestRedirectsDeleteMultipleView(TestCase, WagtailTestUtils):
+    def setUp(self):
+        for i in range(3):
+            models.Redirect.objects.create(
+                old_path="/old-%d" % i, redirect_link="http://www.test.com/"
+            )
+        models.Redirect.objects.create(
+            old_path="/keep", redirect_link="http://www.test.com/"
+        )
+
+        self.login()
+
+    def test_index_links_to_delete_multiple(self):
+        response = self.client.get(reverse("wagtailredirects:index"), {"q": "old"})
+        self.assertContains(
+            response, reverse("wagtailredirects:delete_multiple") + "?q=old"
+        )
+
+    def test_simple(self):
+        response = self.client.get(
+            reverse("wagtailredirects:delete_multiple"), {"q": "old"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(
+            response, "wagtailredirects/confirm_delete_multiple.html"
+        )
+        self.assertEqual(response.context["redirect_count"], 3)
+
+    def test_no_query(self):
+        response = self.client.get(reverse("wagtailredirects:delete_multiple"))
+        self.assertRedirects(response, reverse("wagtailredirects:index"))
+
+    def test_delete(self):
+        first_redirect = models.Redirect.objects.get(old_path="/old-0")
+        response = self.client.post(
+            reverse("wagtailredirects:delete_multiple") + "?q=old"
+        )
+
+        self.assertRedirects(response, reverse("wagtailredirects:index"))
+        self.assertEqual(
+            list(models.Redirect.objects.values_list("old_path", flat=True)),
+            ["/keep"],
+        )
+
+        # A single log entry is created for the deleted redirects
+        log_entry = ModelLogEntry.objects.get(action="wagtail.delete")
+        self.assertEqual(log_entry.object_id, str(first_redirect.pk))
+        self.assertEqual(log_entry.label, "3 redirects matching 'old'")
+        self.assertEqual(log_entry.data, {"count": 3, "query": "old"})
+
+    def test_delete_over_several_requests(self):
+        delete_url = reverse("wagtailredirects:delete_multiple") + "?q=old"
+
+        # Delete two redirects per request, and stop after the first batch
+        with mock.patch.object(
+            DeleteMultipleView, "deletion_batch_size", 2
+        ), mock.patch.object(DeleteMultipleView, "deletion_time_limit", 0):
+            response = self.client.post(delete_url)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.context["deleted_count"], 2)
+            self.assertEqual(response.context["remaining_count"], 1)
+
+            # The deletion of the first batch has been logged
+            log_entry = ModelLogEntry.objects.get(action="wagtail.delete")
+            self.assertEqual(log_entry.data, {"count": 2, "query": "old"})
+
+            response = self.client.post(delete_url, {"deleted_count": 2})
+
+        self.assertRedirects(response, reverse("wagtailredirects:index"))
+        self.assertEqual(models.Redirect.objects.count(), 1)
+
+        # Each batch is logged with a single entry
+        self.assertEqual(
+            [
+                log_entry.data["count"]
+                for log_entry in ModelLogEntry.objects.filter(
+                    action="wagtail.delete"
+                ).order_by("timestamp", "pk")
+            ],
+            [2, 1],
+        )
+
+    def test_delete_without_permission(self):
+        user = self.create_user(username="limited", password="password")
+        user.user_permissions.add(
+            Permission.objects.get(
+                content_type__app_label="wagtailadmin", codename="access_admin"
+            )
+        )
+        self.login(username="limited", password="password")
+        response = self.client.post(
+            reverse("wagtailredirects:delete_multiple") + "?q=old"
+        )
+        self.assertRedirects(
+            response, reverse("wagtailadmin_home"), fetch_redirect_response=False
+        )
+        self.assertEqual(models.Redirect.objects.count(), 4)
@@ -8,6 +8,7 @@ urlpatterns = [
     path("add/", views.add, name="add"),
     path("<int:redirect_id>/", views.edit, name="edit"),
     path("<int:redirect_id>/delete/", views.delete, name="delete"),
+    path("delete/", views.DeleteMultipleView.as_view(), name="delete_multiple"),
     path("import/", views.start_import, name="start_import"),
     path("import/process/", views.process_import, name="process_import"),
     path("report", views.RedirectsReportView.as_view(), name="report"),
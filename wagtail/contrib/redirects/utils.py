@@ -1,7 +1,17 @@
+from contextlib import contextmanager
+
+from django import forms
 from django.conf import settings
+from django.db import transaction
+from django.utils.encoding import force_str
+from django.utils.translation import gettext as _
 
 from wagtail.contrib.redirects.base_formats import DEFAULT_FORMATS
+from wagtail.contrib.redirects.models import Redirect
 from wagtail.contrib.redirects.tmp_storages import CacheStorage, TempFolderStorage
+from wagtail.coreutils import BatchProcessor
+from wagtail.log_actions import registry as log_registry
+from wagtail.models import Page, Site
 
 
 def write_to_file_storage(import_file, input_format):
@@ -16,6 +26,23 @@ def write_to_file_storage(import_file, input_format):
     return file_storage
 
 
+@contextmanager
+def open_import_file(file_storage, input_format, encoding="utf-8"):
+    """
+    Opens a stored import file to be read with ``input_format.read_rows()``. Text files
+    in the temporary folder are passed on as a file, so that they can be parsed as they
+    are read rather than being loaded into memory first.
+    """
+    if isinstance(file_storage, TempFolderStorage) and not input_format.is_binary():
+        with open(file_storage.get_full_path(), encoding=encoding, newline="") as f:
+            yield f
+    else:
+        data = file_storage.read(input_format.get_read_mode())
+        if not input_format.is_binary() and encoding:
+            data = force_str(data, encoding)
+        yield data
+
+
 def get_supported_extensions():
     return ("csv", "tsv", "xls", "xlsx")
 
@@ -48,3 +75,205 @@ def get_file_storage():
 
 class RedirectsCacheStorage(CacheStorage):
     CACHE_PREFIX = "wagtail-redirects-"
+
+
+IMPORT_BATCH_SIZE = 1000
+
+
+class BatchRedirectImporter(BatchProcessor):
+    """
+    Creates or updates redirects from the rows of an import file, a batch at a time.
+
+    Add each row's "from" and "to" values with ``add()``, and remember to call
+    ``process()`` once all the rows have been added. Each batch is saved with a fixed
+    number of queries, however many rows it holds: "to" values that are paths are
+    resolved to pages in one query, and the redirects that already exist for the
+    batch's paths are fetched in another, so that they can be updated with
+    ``bulk_update()`` while the rest are created with ``bulk_create()``. Where a path
+    appears more than once, the last row wins.
+
+    Rows that aren't valid are recorded in ``errors`` as ``[from, to, error]`` lists,
+    and the import carries on with the rest.
+    """
+
+    def __init__(self, max_size: int, *, site=None, permanent=True, dry_run=False):
+        super().__init__(max_size)
+        self.site = site
+        self.permanent = permanent
+        self.dry_run = dry_run
+        self.errors = []
+        self.success_count = 0
+        self.skipped_count = 0
+        self.created_count = 0
+        self.updated_count = 0
+
+        self.old_path_field = Redirect._meta.get_field("old_path").formfield()
+        self.redirect_link_field = Redirect._meta.get_field("redirect_link").formfield()
+
+    def add(self, from_link, to_link) -> None:
+        super().add((self.added_count + 1, from_link, to_link))
+
+    def confirm(self, row_number, from_link, to_link):
+        """
+        Called for each valid row before it's saved. Return False to skip the row.
+        """
+        return True
+
+    def add_error(self, row_number, from_link, to_link, error):
+        self.errors.append([from_link, to_link, error])
+
+    def clean_row(self, from_link, to_link):
+        """
+        Returns the redirect's attributes for the row, without resolving paths to pages.
+        Raises ValidationError if the row isn't valid.
+        """
+        old_path = Redirect.normalise_path(self.old_path_field.clean(from_link))
+        self.old_path_field.clean(old_path)
+
+        to_link = force_str(to_link or "").strip()
+        try:
+            return {
+                "old_path": old_path,
+                "redirect_link": self.redirect_link_field.clean(to_link),
+            }
+        except forms.ValidationError:
+            # Paths are looked up as the URLs of pages when the batch is processed
+            if to_link.startswith("/"):
+                return {"old_path": old_path, "redirect_path": to_link}
+            raise
+
+    def get_pages_for_paths(self, paths):
+        """
+        Returns a dict that maps each of the given paths to the ids of the pages that have
+        that URL on the import's site, or on any site if there isn't one.
+        """
+        root_paths = {
+            root.root_path
+            for root in Site.get_site_root_paths()
+            if self.site is None or root.site_id == self.site.pk
+        }
+        paths_by_url_path = {}
+        for path in paths:
+            path_components = path.strip("/")
+            for root_path in root_paths:
+                url_path = (
+                    root_path + path_components + "/" if path_components else root_path
+                )
+                paths_by_url_path.setdefault(url_path, set()).add(path)
+
+        pages_by_path = {}
+        for page_id, url_path in Page.objects.filter(
+            url_path__in=paths_by_url_path
+        ).values_list("pk", "url_path"):
+            for path in paths_by_url_path[url_path]:
+                pages_by_path.setdefault(path, set()).add(page_id)
+        return pages_by_path
+
+    def _do_processing(self):
+        rows = []
+        for row_number, from_link, to_link in self.items:
+            try:
+                rows.append(
+                    (row_number, from_link, to_link, self.clean_row(from_link, to_link))
+                )
+            except forms.ValidationError as e:
+                self.add_error(row_number, from_link, to_link, ", ".join(e.messages))
+
+        pages_by_path = self.get_pages_for_paths(
+            {
+                values["redirect_path"]
+                for *_, values in rows
+                if "redirect_path" in values
+            }
+        )
+
+        values_by_old_path = {}
+        for row_number, from_link, to_link, values in rows:
+            if "redirect_path" in values:
+                page_ids = pages_by_path.get(values.pop("redirect_path"), ())
+                if len(page_ids) != 1:
+                    error = (
+                        _("This path is the URL of pages on more than one site.")
+                        if page_ids
+                        else _("Enter a valid URL, or the path of a page.")
+                    )
+                    self.add_error(row_number, from_link, to_link, error)
+                    continue
+                values.update(redirect_page_id=next(iter(page_ids)), redirect_link="")
+            else:
+                values["redirect_page_id"] = None
+
+            if not self.confirm(row_number, from_link, to_link):
+                self.skipped_count += 1
+                continue
+
+            self.success_count += 1
+            values_by_old_path[values["old_path"]] = values
+
+        if values_by_old_path:
+            self.save(values_by_old_path)
+
+    def save(self, values_by_old_path):
+        existing_redirects = {
+            redirect.old_path: redirect
+            for redirect in Redirect.objects.filter(
+                site=self.site, old_path__in=values_by_old_path
+            )
+        }
+        new_redirects = []
+        for old_path, values in values_by_old_path.items():
+            redirect = existing_redirects.get(old_path) or Redirect(site=self.site)
+            redirect.old_path = old_path
+            redirect.redirect_page_id = values["redirect_page_id"]
+            redirect.redirect_page_route_path = ""
+            redirect.redirect_link = values["redirect_link"]
+            redirect.is_permanent = self.permanent
+            if redirect.pk is None:
+                new_redirects.append(redirect)
+
+        self.created_count += len(new_redirects)
+        self.updated_count += len(existing_redirects)
+        if self.dry_run:
+            return
+
+        with transaction.atomic():
+            Redirect.objects.bulk_update(
+                existing_redirects.values(),
+                [
+                    "redirect_page",
+                    "redirect_page_route_path",
+                    "redirect_link",
+                    "is_permanent",
+                ],
+            )
+            Redirect.objects.bulk_create(new_redirects)
+
+            if any(redirect.pk is None for redirect in new_redirects):
+                # The database doesn't return the ids of created rows, which are needed
+                # to log their creation
+                new_redirects = Redirect.objects.filter(
+                    site=self.site,
+                    old_path__in=[redirect.old_path for redirect in new_redirects],
+                )
+
+            log_entries = [
+                log_registry.build_log_entry(redirect, "wagtail.create")
+                for redirect in new_redirects
+            ] + [
+                log_registry.build_log_entry(redirect, "wagtail.edit")
+                for redirect in existing_redirects.values()
+            ]
+            log_entries = [log_entry for log_entry in log_entries if log_entry]
+            if log_entries:
+                type(log_entries[0]).objects.bulk_create(log_entries)
+
+    def get_summary(self):
+        return {
+            "errors": self.errors,
+            "errors_count": len(self.errors),
+            "successes": self.success_count,
+            "created": self.created_count,
+            "updated": self.updated_count,
+            "skipped": self.skipped_count,
+            "total": self.added_count,
+        }
@@ -1,5 +1,6 @@
 import os
 
+import tablib
 from django.core.exceptions import PermissionDenied, SuspiciousOperation
 from django.core.paginator import Paginator
 from django.db import transaction
@@ -7,15 +8,20 @@ from django.db.models import Q
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.response import TemplateResponse
 from django.urls import reverse
+from django.utils.decorators import method_decorator
 from django.utils.encoding import force_str
+from django.utils.text import Truncator
 from django.utils.translation import gettext as _
 from django.utils.translation import ngettext
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.vary import vary_on_headers
+from django.views.generic import TemplateView
 
 from wagtail.admin import messages
 from wagtail.admin.auth import PermissionPolicyChecker
 from wagtail.admin.forms.search import SearchForm
+from wagtail.admin.paginator import get_count
+from wagtail.admin.views.mixins import BatchedDeletionMixin
 from wagtail.admin.views.reports import ReportView
 from wagtail.contrib.redirects import models
 from wagtail.contrib.redirects.filters import RedirectsReportFilterSet
@@ -27,10 +33,13 @@ from wagtail.contrib.redirects.forms import (
 )
 from wagtail.contrib.redirects.permissions import permission_policy
 from wagtail.contrib.redirects.utils import (
+    IMPORT_BATCH_SIZE,
+    BatchRedirectImporter,
     get_file_storage,
     get_format_cls_by_extension,
     get_import_formats,
     get_supported_extensions,
+    open_import_file,
     write_to_file_storage,
 )
 from wagtail.log_actions import log
@@ -38,6 +47,14 @@ from wagtail.log_actions import log
 permission_checker = PermissionPolicyChecker(permission_policy)
 
 
+def search_redirects(redirects, query_string):
+    return redirects.filter(
+        Q(old_path__icontains=query_string)
+        | Q(redirect_page__url_path__icontains=query_string)
+        | Q(redirect_link__icontains=query_string)
+    )
+
+
 @permission_checker.require_any("add", "change", "delete")
 @vary_on_headers("X-Requested-With")
 def index(request):
@@ -48,11 +65,7 @@ def index(request):
 
     # Search
     if query_string:
-        redirects = redirects.filter(
-            Q(old_path__icontains=query_string)
-            | Q(redirect_page__url_path__icontains=query_string)
-            | Q(redirect_link__icontains=query_string)
-        )
+        redirects = search_redirects(redirects, query_string)
 
     # Ordering (A bit useless at the moment as only 'old_path' is allowed)
     if ordering not in ["old_path"]:
@@ -73,6 +86,9 @@ def index(request):
                 "ordering": ordering,
                 "redirects": redirects,
                 "query_string": query_string,
+                "user_can_delete": permission_policy.user_has_permission(
+                    request.user, "delete"
+                ),
             },
         )
     else:
@@ -83,6 +99,9 @@ def index(request):
                 "ordering": ordering,
                 "redirects": redirects,
                 "query_string": query_string,
+                "user_can_delete": permission_policy.user_has_permission(
+                    request.user, "delete"
+                ),
                 "search_form": SearchForm(
                     data={"q": query_string} if query_string else None,
                     placeholder=_("Search redirects"),
@@ -165,6 +184,81 @@ def delete(request, redirect_id):
     )
 
 
+class DeleteMultipleView(BatchedDeletionMixin, TemplateView):
+    """Delete all of the redirects matching a search query"""
+
+    template_name = "wagtailredirects/confirm_delete_multiple.html"
+
+    @method_decorator(permission_checker.require("delete"))
+    def dispatch(self, request, *args, **kwargs):
+        self.query_string = request.GET.get("q", "")
+        if not self.query_string:
+            return redirect("wagtailredirects:index")
+
+        self.redirects = self.get_queryset()
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_queryset(self):
+        return search_redirects(models.Redirect.objects.all(), self.query_string)
+
+    def post(self, request, *args, **kwargs):
+        if not self.redirects.exists():
+            return redirect("wagtailredirects:index")
+
+        count, finished = self.delete_objects(
+            self.redirects, before_delete=self.log_deletions
+        )
+        if not finished:
+            return self.render_to_response(
+                self.get_context_data(
+                    **self.get_deletion_progress_context(self.redirects, count)
+                )
+            )
+
+        messages.success(
+            request,
+            ngettext(
+                "%(count)d redirect has been deleted.",
+                "%(count)d redirects have been deleted.",
+                count,
+            )
+            % {"count": count},
+        )
+        return redirect("wagtailredirects:index")
+
+    def log_deletions(self, redirects):
+        # Log a single entry for each batch of deleted redirects, rather than one each,
+        # against the first redirect of the batch as the log needs an object to refer to.
+        # Logging each batch alongside its deletion keeps the deletions that were made
+        # before a request's time limit was reached in the log.
+        first_redirect = redirects.order_by("pk").first()
+        if first_redirect is None:
+            return
+
+        count = redirects.count()
+        log(
+            instance=first_redirect,
+            action="wagtail.delete",
+            title=ngettext(
+                "%(count)d redirect matching '%(query)s'",
+                "%(count)d redirects matching '%(query)s'",
+                count,
+            )
+            % {"count": count, "query": Truncator(self.query_string).chars(100)},
+            data={"count": count, "query": self.query_string},
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(
+            {
+                "query_string": self.query_string,
+                "redirect_count": get_count(self.redirects),
+            }
+        )
+        return context
+
+
 @permission_checker.require("add")
 def add(request):
     if request.method == "POST":
@@ -301,39 +395,38 @@ def process_import(request):
     FileStorage = get_file_storage()
     file_storage = FileStorage(name=management_form.cleaned_data["import_file_name"])
 
-    data = file_storage.read(input_format.get_read_mode())
-    if not input_format.is_binary() and from_encoding:
-        data = force_str(data, from_encoding)
-    dataset = input_format.create_dataset(data)
-
-    # Now check if the rest of the management form is valid
-    form = ConfirmImportForm(
-        dataset.headers,
-        request.POST,
-        request.FILES,
-        initial=management_form.cleaned_data,
-    )
+    with open_import_file(file_storage, input_format, from_encoding) as import_file:
+        headers, rows = input_format.read_rows(import_file)
 
-    if not form.is_valid():
-        return render(
-            request,
-            "wagtailredirects/confirm_import.html",
+        # Now check if the rest of the management form is valid
+        form = ConfirmImportForm(
+            headers,
+            request.POST,
+            request.FILES,
+            initial=management_form.cleaned_data,
+        )
+
+        if not form.is_valid():
+            dataset = tablib.Dataset(*rows, headers=headers)
+            return render(
+                request,
+                "wagtailredirects/confirm_import.html",
+                {
+                    "form": form,
+                    "dataset": dataset,
+                },
+            )
+
+        import_summary = create_redirects_from_dataset(
+            rows,
             {
-                "form": form,
-                "dataset": dataset,
+                "from_index": int(form.cleaned_data["from_index"]),
+                "to_index": int(form.cleaned_data["to_index"]),
+                "permanent": form.cleaned_data["permanent"],
+                "site": form.cleaned_data["site"],
             },
         )
 
-    import_summary = create_redirects_from_dataset(
-        dataset,
-        {
-            "from_index": int(form.cleaned_data["from_index"]),
-            "to_index": int(form.cleaned_data["to_index"]),
-            "permanent": form.cleaned_data["permanent"],
-            "site": form.cleaned_data["site"],
-        },
-    )
-
     file_storage.remove()
 
     if import_summary["errors_count"] > 0:
@@ -357,42 +450,19 @@ def process_import(request):
 
 
 def create_redirects_from_dataset(dataset, config):
-    errors = []
-    successes = 0
-    total = 0
+    """
+    Creates or updates redirects from the rows of dataset, which can be any iterable of
+    rows, so that large files can be imported as they are read.
+    """
+    importer = BatchRedirectImporter(
+        IMPORT_BATCH_SIZE, site=config["site"], permanent=config["permanent"]
+    )
 
     for row in dataset:
-        total += 1
-
-        from_link = row[config["from_index"]]
-        to_link = row[config["to_index"]]
+        importer.add(row[config["from_index"]], row[config["to_index"]])
 
-        data = {
-            "old_path": from_link,
-            "redirect_link": to_link,
-            "is_permanent": config["permanent"],
-        }
-
-        if config["site"]:
-            data["site"] = config["site"].pk
-
-        form = RedirectForm(data)
-        if not form.is_valid():
-            error = to_readable_errors(form.errors.as_text())
-            errors.append([from_link, to_link, error])
-            continue
-
-        with transaction.atomic():
-            redirect = form.save()
-            log(instance=redirect, action="wagtail.create")
-        successes += 1
-
-    return {
-        "errors": errors,
-        "errors_count": len(errors),
-        "successes": successes,
-        "total": total,
-    }
+    importer.process()
+    return importer.get_summary()
 
 
 def to_readable_errors(error):
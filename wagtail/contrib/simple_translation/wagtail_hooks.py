@@ -3,6 +3,7 @@ from typing import List
 from django.conf import settings
 from django.contrib.admin.utils import quote
 from django.contrib.auth.models import Permission
+from django.db.models import Exists, OuterRef
 from django.urls import include, path, reverse
 from django.utils.translation import gettext as _
 
@@ -53,18 +54,40 @@ def page_listing_more_buttons(page, page_perms, next_url=None):
         page_perms.user.has_perm("simple_translation.submit_translation")
         and not page.is_root()
     ):
-        # If there's at least one locale that we haven't translated into yet, show "Translate this page" button
-        has_locale_to_translate_to = Locale.objects.exclude(
-            id__in=page.get_translations(inclusive=True).values_list(
-                "locale_id", flat=True
-            )
-        ).exists()
+        # If there's at least one locale that we haven't translated into yet, show "Translate this page" button.
+        # `_has_locale_to_translate_to` may be populated by the `construct_explorer_page_queryset`
+        # hook below as a performance optimisation
+        has_locale_to_translate_to = getattr(page, "_has_locale_to_translate_to", None)
+        if has_locale_to_translate_to is None:
+            has_locale_to_translate_to = Locale.objects.exclude(
+                id__in=page.get_translations(inclusive=True).values_list(
+                    "locale_id", flat=True
+                )
+            ).exists()
 
         if has_locale_to_translate_to:
             url = reverse("simple_translation:submit_page_translation", args=[page.id])
             yield wagtailadmin_widgets.Button(_("Translate"), url, priority=60)
 
 
+@hooks.register("construct_explorer_page_queryset")
+def annotate_has_locale_to_translate_to(parent_page, pages, request):
+    # Find out whether each page in the explorer has a locale it can be translated into in
+    # the same query as the pages, rather than with a query for each page's buttons
+    if not request.user.has_perm("simple_translation.submit_translation"):
+        return pages
+
+    return pages.annotate(
+        _has_locale_to_translate_to=Exists(
+            Locale.objects.exclude(
+                id__in=Page.objects.filter(
+                    translation_key=OuterRef(OuterRef("translation_key"))
+                ).values("locale_id")
+            )
+        )
+    )
+
+
 @hooks.register("register_snippet_listing_buttons")
 def register_snippet_listing_buttons(snippet, user, next_url=None):
     model = type(snippet)
@@ -34,6 +34,7 @@ class Sitemap(DjangoSitemap):
             .public()
             .order_by("path")
             .defer_streamfields()
+            .annotate_urls(self.request)
             .specific()
         )
 
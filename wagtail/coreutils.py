@@ -11,6 +11,7 @@ from django.conf import settings
 from django.conf.locale import LANG_INFO
 from django.core.exceptions import ImproperlyConfigured, SuspiciousOperation
 from django.core.signals import setting_changed
+from django.db import transaction
 from django.db.models import Model
 from django.db.models.base import ModelBase
 from django.dispatch import receiver
@@ -539,3 +540,39 @@ class BatchCreator(BatchProcessor):
     def get_summary(self):
         opts = self.model._meta
         return f"{self.created_count}/{self.added_count} {opts.verbose_name_plural} were created successfully."
+
+
+def delete_in_batches(queryset, batch_size: int = 1000, before_delete=None):
+    """
+    Deletes the objects in ``queryset`` in batches of ``batch_size``, with one
+    set-based delete per batch, each in its own transaction. The batches are
+    taken in primary key order, so each one starts where the last one ended
+    rather than scanning the rows that have already been deleted.
+
+    If ``before_delete`` is given, it is called with a queryset of the objects
+    in each batch within the batch's transaction, before they are deleted (for
+    example, to log their deletion).
+
+    This is a generator that yields the number of objects deleted by each
+    batch, so that the caller can report progress, or stop between batches
+    and carry on later.
+    """
+    model = queryset.model
+    using = queryset.db
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    last_pk = None
+
+    while True:
+        batch = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+        batch = list(batch[:batch_size])
+        if not batch:
+            return
+
+        with transaction.atomic(using=using):
+            batch_queryset = model._base_manager.using(using).filter(pk__in=batch)
+            if before_delete is not None:
+                before_delete(batch_queryset)
+            batch_queryset.delete()
+
+        last_pk = batch[-1]
+        yield len(batch)
@@ -1,6 +1,7 @@
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.core.files.base import ContentFile
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from wagtail.documents.models import Document
@@ -133,3 +134,35 @@ class TestCollectionPrivacyDocument(TestCase, WagtailTestUtils):
         self.login(username="eventmoderator", password="password")
         response, url = self.get_document(self.login_collection)
         self.assertEqual(response.status_code, 200)
+
+
+@override_settings(
+    WAGTAIL_VIEW_RESTRICTION_CACHE=True,
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    },
+)
+class TestCollectionPrivacyDocumentWithRestrictionCache(TestCollectionPrivacyDocument):
+    def setUp(self):
+        cache.clear()
+        super().setUp()
+
+    def test_unrestricted_collection_does_not_query_restrictions(self):
+        root_collection = Collection.get_first_root_node()
+        list(root_collection.get_view_restrictions())
+
+        with self.assertNumQueries(0):
+            self.assertEqual(list(root_collection.get_view_restrictions()), [])
+
+    def test_new_restriction_is_applied(self):
+        collection = Collection.get_first_root_node()
+        response, url = self.get_document(collection)
+        self.assertEqual(response.status_code, 200)
+
+        CollectionViewRestriction.objects.create(
+            collection=collection, restriction_type=CollectionViewRestriction.LOGIN
+        )
+        response, url = self.get_document(collection)
+        self.assertRedirects(response, "/_util/login/?next={}".format(url))
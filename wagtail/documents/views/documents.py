@@ -19,6 +19,7 @@ from wagtail.documents import get_document_model
 from wagtail.documents.forms import get_document_form
 from wagtail.documents.permissions import permission_policy
 from wagtail.models import Collection
+from wagtail.search.paginator import SearchResultsPaginator
 
 permission_checker = PermissionPolicyChecker(permission_policy)
 
@@ -67,7 +68,7 @@ class BaseListingView(TemplateView):
             self.form = SearchForm(placeholder=_("Search documents"))
 
         # Pagination
-        paginator = Paginator(documents, per_page=20)
+        paginator = SearchResultsPaginator(documents, per_page=20)
         documents = paginator.get_page(self.request.GET.get("p"))
 
         next_url = reverse("wagtaildocs:index")
@@ -8,7 +8,11 @@ from django.db.models.fields.json import KeyTransform
 from django.utils.encoding import force_str
 
 from wagtail.blocks import Block, BlockField, StreamBlock, StreamValue
-from wagtail.rich_text import RichTextMaxLengthValidator, get_text_for_indexing
+from wagtail.rich_text import (
+    RichTextMaxLengthValidator,
+    extract_references_from_rich_text,
+    get_text_for_indexing,
+)
 from wagtail.utils.deprecation import RemovedInWagtail50Warning
 
 
@@ -52,6 +56,9 @@ class RichTextField(models.TextField):
         source = force_str(value)
         return [get_text_for_indexing(source)]
 
+    def extract_references(self, value):
+        yield from extract_references_from_rich_text(force_str(value))
+
 
 # https://github.com/django/django/blob/64200c14e0072ba0ffef86da46b2ea82fd1e019a/django/db/models/fields/subclassing.py#L31-L44
 class Creator:
@@ -238,6 +245,14 @@ class StreamField(models.Field):
     def get_searchable_content(self, value):
         return self.stream_block.get_searchable_content(value)
 
+    def extract_references(self, value):
+        # References are found in the JSON-ish representation of the stream, which a lazy
+        # StreamValue holds without converting its blocks to native values (and loading
+        # the objects chosen in chooser blocks)
+        if isinstance(value, StreamValue):
+            value = self.stream_block.get_prep_value(value)
+        yield from self.stream_block.extract_references(value)
+
     def check(self, **kwargs):
         errors = super().check(**kwargs)
         errors.extend(self.stream_block.check(field=self, **kwargs))
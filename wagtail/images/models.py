@@ -755,6 +755,8 @@ class AbstractRendition(ImageFileMixin, models.Model):
         max_length=16, blank=True, default="", editable=False
     )
 
+    wagtail_reference_index_ignore = True
+
     @property
     def url(self):
         return self.file.url
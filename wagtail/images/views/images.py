@@ -25,6 +25,7 @@ from wagtail.images.models import Filter, SourceImageIOError
 from wagtail.images.permissions import permission_policy
 from wagtail.images.utils import generate_signature
 from wagtail.models import Collection, Site
+from wagtail.search.paginator import SearchResultsPaginator
 
 permission_checker = PermissionPolicyChecker(permission_policy)
 
@@ -116,7 +117,7 @@ class BaseListingView(TemplateView):
             self.form = SearchForm(placeholder=_("Search images"))
 
         entries_per_page = self.get_num_entries_per_page()
-        paginator = Paginator(images, per_page=entries_per_page)
+        paginator = SearchResultsPaginator(images, per_page=entries_per_page)
         images = paginator.get_page(self.request.GET.get("p"))
 
         next_url = reverse("wagtailimages:index")
@@ -4,6 +4,7 @@ from asgiref.local import Local
 from django.utils.functional import LazyObject
 
 from wagtail import hooks
+from wagtail.coreutils import BatchCreator
 from wagtail.utils.registry import ObjectTypeRegistry
 
 
@@ -70,6 +71,67 @@ def get_active_log_context():
     return getattr(_active, "value", empty_log_context)
 
 
+_active_buffer = Local()
+
+
+class LogEntryBuffer:
+    """
+    Collects the log entries for the actions logged within it, and writes them with
+    ``bulk_create`` in batches of up to ``max_size`` per log entry model, rather than
+    saving each one as it's logged. Use it around code that logs many actions at once,
+    such as a bulk action:
+
+        with transaction.atomic(), LogEntryBuffer():
+            for page in pages:
+                log(page, "wagtail.publish")
+
+    Any log entries still held are written when the block exits; if it exits with an
+    exception they are discarded instead, along with the rest of the failed work. Log
+    entries aren't visible to queries until they've been written, and they're created
+    without sending ``post_save`` or calling ``full_clean``, although their actions are
+    still checked to be registered.
+    """
+
+    def __init__(self, max_size=500):
+        self.max_size = max_size
+        self.batch_creators = {}
+
+    def __enter__(self):
+        self._old_buffer = getattr(_active_buffer, "value", None)
+        _active_buffer.value = self
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if self._old_buffer:
+            _active_buffer.value = self._old_buffer
+        else:
+            del _active_buffer.value
+
+        if type is None:
+            self.flush()
+
+    def add(self, log_entry):
+        log_entry_model = type(log_entry)
+        try:
+            batch_creator = self.batch_creators[log_entry_model]
+        except KeyError:
+            batch_creator = self.batch_creators[log_entry_model] = BatchCreator(
+                self.max_size, model=log_entry_model
+            )
+        batch_creator.add(instance=log_entry)
+
+    def flush(self):
+        """
+        Writes any log entries held by the buffer
+        """
+        for batch_creator in self.batch_creators.values():
+            batch_creator.process()
+
+
+def get_active_log_entry_buffer():
+    return getattr(_active_buffer, "value", None)
+
+
 class LogActionRegistry:
     """
     A central store for log actions.
@@ -92,6 +154,9 @@ class LogActionRegistry:
         # All distinct log entry models registered with register_model
         self.log_entry_models = set()
 
+        # Caches the result of looking up the log entry model for an object class
+        self._log_entry_models_by_model = {}
+
     def scan_for_actions(self):
         if not self.has_scanned_for_actions:
             for fn in hooks.get_hooks("register_log_actions"):
@@ -102,6 +167,7 @@ class LogActionRegistry:
     def register_model(self, cls, log_entry_model):
         self.log_entry_models_by_type.register(cls, value=log_entry_model)
         self.log_entry_models.add(log_entry_model)
+        self._log_entry_models_by_model.clear()
 
     def register_action(self, action, *args):
         def register_formatter_class(formatter_cls):
@@ -143,7 +209,12 @@ class LogActionRegistry:
 
     def get_log_model_for_model(self, model):
         self.scan_for_actions()
-        return self.log_entry_models_by_type.get_by_type(model)
+        try:
+            return self._log_entry_models_by_model[model]
+        except KeyError:
+            log_entry_model = self.log_entry_models_by_type.get_by_type(model)
+            self._log_entry_models_by_model[model] = log_entry_model
+            return log_entry_model
 
     def get_log_model_for_instance(self, instance):
         if isinstance(instance, LazyObject):
@@ -163,10 +234,38 @@ class LogActionRegistry:
 
         user = user or get_active_log_context().user
         uuid = uuid or get_active_log_context().uuid
+
+        log_entry_buffer = get_active_log_entry_buffer()
+        if log_entry_buffer is not None:
+            log_entry = log_entry_model.objects.build_log_entry(
+                instance, action, user=user, uuid=uuid, **kwargs
+            )
+            # bulk_create skips full_clean, so check that the action is registered now
+            log_entry.clean()
+            log_entry_buffer.add(log_entry)
+            return log_entry
+
         return log_entry_model.objects.log_action(
             instance, action, user=user, uuid=uuid, **kwargs
         )
 
+    def build_log_entry(self, instance, action, user=None, uuid=None, **kwargs):
+        """
+        Returns an unsaved log entry for the action, as ``log`` would create it, or
+        ``None`` if no log entry model is registered for the object type.
+        """
+        self.scan_for_actions()
+
+        log_entry_model = self.get_log_model_for_instance(instance)
+        if log_entry_model is None:
+            return
+
+        user = user or get_active_log_context().user
+        uuid = uuid or get_active_log_context().uuid
+        return log_entry_model.objects.build_log_entry(
+            instance, action, user=user, uuid=uuid, **kwargs
+        )
+
     def get_logs_for_instance(self, instance):
         log_entry_model = self.get_log_model_for_instance(instance)
         if log_entry_model is None:
@@ -0,0 +1,152 @@
+import datetime
+import gzip
+import json
+import os
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from wagtail.log_actions import registry as log_action_registry
+from wagtail.models import LogEntrySummary
+from wagtail.models.audit_log import get_day_start
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Summarise the audit log, and move log entries older than a given number of days into compressed archive files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Archive log entries older than this number of days. If omitted, the summary is updated without archiving any log entries",
+        )
+        parser.add_argument(
+            "--output-dir",
+            help="Directory to write the archive files to, which is required when archiving",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of log entries to archive at a time (default: %d)"
+            % DEFAULT_BATCH_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        days = options.get("days")
+        output_dir = options.get("output_dir")
+        verbosity = options.get("verbosity", 1)
+
+        if days is not None:
+            if days < 1:
+                raise CommandError("--days must be at least 1")
+            if not output_dir:
+                raise CommandError("--output-dir is required to archive log entries")
+
+        # Archived log entries must be counted in the summary before they are removed
+        summarised_until = LogEntrySummary.update_summary()
+        if days is None:
+            self.stdout.write(self.style.SUCCESS("Updated the log entry summary"))
+            return
+
+        before = min(
+            get_day_start(timezone.now().date() - datetime.timedelta(days=days)),
+            summarised_until,
+        )
+
+        for log_model in log_action_registry.get_log_entry_models():
+
+            def report_progress(entries_archived):
+                if verbosity >= 2:
+                    self.stdout.write(
+                        "Archived %d %s..."
+                        % (entries_archived, log_model._meta.verbose_name_plural)
+                    )
+
+            entries_archived = archive_log_entries(
+                log_model,
+                before,
+                output_dir,
+                batch_size=options.get("batch_size") or DEFAULT_BATCH_SIZE,
+                progress_callback=report_progress,
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "Archived %d %s"
+                    % (entries_archived, log_model._meta.verbose_name_plural)
+                )
+            )
+
+
+def get_archive_path(output_dir, log_model, timestamp):
+    """
+    Returns the path of the archive file for the log entries of the given model from the
+    month of the given timestamp, e.g. ``wagtailcore_pagelogentry/2022-08.jsonl.gz``
+    """
+    return os.path.join(
+        output_dir,
+        "%s_%s" % (log_model._meta.app_label, log_model._meta.model_name),
+        "%s.jsonl.gz" % timestamp.strftime("%Y-%m"),
+    )
+
+
+def archive_log_entries(
+    log_model, before, output_dir, batch_size=DEFAULT_BATCH_SIZE, progress_callback=None
+):
+    """
+    Moves the log entries of ``log_model`` with timestamps before ``before`` into archive
+    files under ``output_dir``, ``batch_size`` entries at a time. Each file holds the log
+    entries of one month as gzipped JSON lines, one object per log entry with the values
+    of its fields, and is added to if it already exists. Each batch is written to the
+    archive files before it is deleted.
+
+    Returns the number of log entries archived.
+    """
+    pk_name = log_model._meta.pk.attname
+    field_names = [field.attname for field in log_model._meta.concrete_fields]
+    queryset = (
+        log_model._base_manager.filter(timestamp__lt=before)
+        .order_by("timestamp", pk_name)
+        .values(*field_names)
+    )
+
+    entries_archived = 0
+    last_row = None
+    while True:
+        batch = queryset
+        if last_row is not None:
+            batch = batch.filter(
+                Q(timestamp__gt=last_row["timestamp"])
+                | Q(timestamp=last_row["timestamp"], pk__gt=last_row[pk_name])
+            )
+        rows = list(batch[:batch_size])
+        if not rows:
+            return entries_archived
+
+        rows_by_path = defaultdict(list)
+        for row in rows:
+            rows_by_path[
+                get_archive_path(output_dir, log_model, row["timestamp"])
+            ].append(row)
+
+        for path, path_rows in rows_by_path.items():
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(path, "at", encoding="utf-8") as archive_file:
+                for row in path_rows:
+                    archive_file.write(json.dumps(row, cls=DjangoJSONEncoder) + "\n")
+
+        with transaction.atomic():
+            log_model._base_manager.filter(
+                pk__in=[row[pk_name] for row in rows]
+            ).delete()
+
+        entries_archived += len(rows)
+        last_row = rows[-1]
+        if progress_callback is not None:
+            progress_callback(entries_archived)
@@ -0,0 +1,120 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from wagtail.models import Revision
+from wagtail.models.revision_content import get_storage_options
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Convert the content of existing revisions to the storage format configured by the WAGTAIL_REVISION_CONTENT_* settings"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of revisions to convert at a time (default: %d)"
+            % DEFAULT_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--decompress",
+            action="store_true",
+            help="Convert compact revisions back to plain JSON",
+        )
+
+    def handle(self, *args, **options):
+        verbosity = options.get("verbosity", 1)
+        decompress = options.get("decompress")
+
+        compression, use_deltas, keyframe_interval = get_storage_options()
+        if not compression and not decompress:
+            raise CommandError(
+                "Revision content compression is not enabled. Set "
+                "WAGTAIL_REVISION_CONTENT_COMPRESSION or WAGTAIL_REVISION_CONTENT_DELTAS, "
+                "or use --decompress to convert compact revisions back to plain JSON."
+            )
+
+        def report_progress(revisions_converted):
+            if verbosity >= 1:
+                self.stdout.write("Converted %d revisions..." % revisions_converted)
+
+        revisions_converted = convert_revisions(
+            decompress=decompress,
+            batch_size=options.get("batch_size") or DEFAULT_BATCH_SIZE,
+            progress_callback=report_progress,
+        )
+
+        if revisions_converted:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "Successfully converted %d revisions" % revisions_converted
+                )
+            )
+        else:
+            self.stdout.write("No revisions converted")
+
+
+def _convert_revision(revision, decompress):
+    # Decode the content before any of the storage fields are changed
+    content = revision.content
+
+    if decompress:
+        revision.content_encoding = ""
+        revision.compressed_content = None
+        revision.delta_base = None
+    else:
+        revision._encode_content()
+        content = None
+
+    # The content itself is unchanged, so any revisions stored as deltas against this
+    # one stay valid and there's no need to go through Revision.save()
+    Revision.objects.filter(pk=revision.pk).update(
+        content=content,
+        content_encoding=revision.content_encoding,
+        compressed_content=revision.compressed_content,
+        delta_base=revision.delta_base,
+    )
+
+
+def convert_revisions(
+    decompress=False, batch_size=DEFAULT_BATCH_SIZE, progress_callback=None
+):
+    """
+    Converts revisions stored as plain JSON to the configured compact storage, or back to
+    plain JSON when ``decompress`` is ``True``. Revisions are converted in batches of
+    ``batch_size``, walking them in order of primary key so that each revision is stored
+    as a delta against an earlier revision that has already been converted.
+    ``progress_callback`` is called with the number of revisions converted so far after
+    each batch.
+
+    Returns the total number of revisions converted.
+    """
+    if decompress:
+        revisions = Revision.objects.exclude(content_encoding="")
+    else:
+        revisions = Revision.objects.filter(content_encoding="")
+    revisions = revisions.order_by("pk")
+
+    converted_revisions_count = 0
+    last_pk = None
+
+    while True:
+        batch = revisions
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+
+        batch = list(batch[:batch_size])
+        if not batch:
+            break
+
+        for revision in batch:
+            _convert_revision(revision, decompress)
+
+        last_pk = batch[-1].pk
+        converted_revisions_count += len(batch)
+
+        if progress_callback is not None:
+            progress_callback(converted_revisions_count)
+
+    return converted_revisions_count
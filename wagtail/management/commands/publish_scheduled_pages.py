@@ -1,7 +1,11 @@
+from django.apps import apps
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from django.utils import dateparse, timezone
 
-from wagtail.models import Page, Revision
+from wagtail.models import DraftStateMixin, Page, Revision
+
+DEFAULT_BATCH_SIZE = 100
 
 
 def revision_date_expired(r):
@@ -15,6 +19,111 @@ def revision_date_expired(r):
         return False
 
 
+def get_draft_state_models():
+    """
+    Returns the concrete models using DraftStateMixin, leaving out models that inherit it
+    from a concrete parent (such as Page subclasses), which are covered by the parent model
+    """
+    return [
+        model
+        for model in apps.get_models()
+        if issubclass(model, DraftStateMixin)
+        and not any(
+            issubclass(parent, DraftStateMixin)
+            for parent in model._meta.get_parent_list()
+        )
+    ]
+
+
+def iter_pk_batches(queryset, batch_size):
+    """
+    Yields the primary keys of the objects in ``queryset`` in batches of ``batch_size``,
+    walking them in order of primary key so that objects processed in between batches
+    (and no longer matched by the queryset) don't cause others to be skipped
+    """
+    last_pk = None
+
+    while True:
+        batch = queryset
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+
+        pks = list(batch.order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return
+
+        yield pks
+        last_pk = pks[-1]
+
+
+def claim(queryset, pk):
+    """
+    Locks the row with the given primary key for the rest of the current transaction and
+    returns the object, if it is still matched by ``queryset``. Rows already locked by
+    another process running this command are skipped, as are objects that have been
+    processed since they were fetched, so that each one is only acted upon once.
+    """
+    return (
+        queryset.select_for_update(
+            skip_locked=connection.features.has_select_for_update_skip_locked
+        )
+        .filter(pk=pk)
+        .first()
+    )
+
+
+def unpublish_expired_objects(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Unpublishes live pages and snippets whose expiry date has passed, each in its own transaction.
+    Returns the number of objects unpublished.
+    """
+    unpublished_count = 0
+
+    for model in get_draft_state_models():
+        expired_objects = model._default_manager.filter(
+            live=True, expire_at__lt=timezone.now()
+        )
+
+        for pks in iter_pk_batches(expired_objects, batch_size):
+            for pk in pks:
+                with transaction.atomic():
+                    obj = claim(expired_objects, pk)
+                    if obj is None:
+                        continue
+
+                    obj.unpublish(
+                        set_expired=True, log_action="wagtail.unpublish.scheduled"
+                    )
+                    unpublished_count += 1
+
+    return unpublished_count
+
+
+def publish_scheduled_revisions(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Publishes the page and snippet revisions whose approved go live date has passed, each
+    in its own transaction. Returns the number of revisions published.
+    """
+    published_count = 0
+    revisions_for_publishing = Revision.objects.filter(
+        approved_go_live_at__lt=timezone.now()
+    )
+
+    for pks in iter_pk_batches(revisions_for_publishing, batch_size):
+        for pk in pks:
+            with transaction.atomic():
+                revision = claim(revisions_for_publishing, pk)
+                if revision is None:
+                    continue
+
+                # just run publish for the revision -- since the approved go
+                # live datetime is before now it will make the object live
+                revision.publish(log_action="wagtail.publish.scheduled")
+                published_count += 1
+
+    return published_count
+
+
 class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
@@ -24,6 +133,13 @@ class Command(BaseCommand):
             default=False,
             help="Dry run -- don't change anything.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of objects to fetch at a time (default: %d)"
+            % DEFAULT_BATCH_SIZE,
+        )
 
     def handle(self, *args, **options):
         dryrun = False
@@ -31,29 +147,33 @@ class Command(BaseCommand):
             self.stdout.write("Will do a dry run.")
             dryrun = True
 
-        # 1. get all expired pages with live = True
-        expired_pages = Page.objects.filter(live=True, expire_at__lt=timezone.now())
+        batch_size = options.get("batch_size") or DEFAULT_BATCH_SIZE
+
+        # 1. get all expired pages and snippets with live = True
         if dryrun:
-            if expired_pages:
+            expired_objects = [
+                obj
+                for model in get_draft_state_models()
+                for obj in model._default_manager.filter(
+                    live=True, expire_at__lt=timezone.now()
+                )
+            ]
+            if expired_objects:
                 self.stdout.write("Expired pages to be deactivated:")
                 self.stdout.write("Expiry datetime\t\tSlug\t\tName")
                 self.stdout.write("---------------\t\t----\t\t----")
-                for ep in expired_pages:
+                for ep in expired_objects:
                     self.stdout.write(
                         "{0}\t{1}\t{2}".format(
-                            ep.expire_at.strftime("%Y-%m-%d %H:%M"), ep.slug, ep.title
+                            ep.expire_at.strftime("%Y-%m-%d %H:%M"),
+                            getattr(ep, "slug", ""),
+                            ep.title if isinstance(ep, Page) else str(ep),
                         )
                     )
             else:
                 self.stdout.write("No expired pages to be deactivated found.")
         else:
-            # Unpublish the expired pages
-            # Cast to list to make sure the query is fully evaluated
-            # before unpublishing anything
-            for page in list(expired_pages):
-                page.unpublish(
-                    set_expired=True, log_action="wagtail.unpublish.scheduled"
-                )
+            unpublish_expired_objects(batch_size=batch_size)
 
         # 2. get all page revisions for moderation that have been expired
         expired_revs = [
@@ -88,7 +208,7 @@ class Command(BaseCommand):
                 er.save()
 
         # 3. get all revisions that need to be published
-        revs_for_publishing = Revision.page_revisions.filter(
+        revs_for_publishing = Revision.objects.filter(
             approved_go_live_at__lt=timezone.now()
         )
         if dryrun:
@@ -102,14 +222,11 @@ class Command(BaseCommand):
                     self.stdout.write(
                         "{0}\t\t{1}\t{2}".format(
                             rp.approved_go_live_at.strftime("%Y-%m-%d %H:%M"),
-                            rev_data.get("slug"),
-                            rev_data.get("title"),
+                            rev_data.get("slug", ""),
+                            rev_data.get("title", rp.object_str),
                         )
                     )
             else:
                 self.stdout.write("No pages to go live.")
         else:
-            for rp in revs_for_publishing:
-                # just run publish for the revision -- since the approved go
-                # live datetime is before now it will make the page live
-                rp.publish(log_action="wagtail.publish.scheduled")
+            publish_scheduled_revisions(batch_size=batch_size)
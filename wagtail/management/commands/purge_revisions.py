@@ -1,8 +1,9 @@
 from django.core.management.base import BaseCommand
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 
-from wagtail.models import Revision
+from wagtail.models import Comment, Revision
 
 try:
     from wagtail.models import WorkflowState
@@ -11,6 +12,8 @@ try:
 except ImportError:
     workflow_support = False
 
+DEFAULT_BATCH_SIZE = 1000
+
 
 class Command(BaseCommand):
     help = "Delete page revisions which are not the latest revision for a page, published or scheduled to be published, or in moderation"
@@ -21,11 +24,27 @@ class Command(BaseCommand):
             type=int,
             help="Only delete revisions older than this number of days",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of revisions to delete at a time (default: %d)"
+            % DEFAULT_BATCH_SIZE,
+        )
 
     def handle(self, *args, **options):
         days = options.get("days")
+        verbosity = options.get("verbosity", 1)
 
-        revisions_deleted = purge_revisions(days=days)
+        def report_progress(revisions_deleted):
+            if verbosity >= 1:
+                self.stdout.write("Deleted %d revisions..." % revisions_deleted)
+
+        revisions_deleted = purge_revisions(
+            days=days,
+            batch_size=options.get("batch_size") or DEFAULT_BATCH_SIZE,
+            progress_callback=report_progress,
+        )
 
         if revisions_deleted:
             self.stdout.write(
@@ -37,7 +56,7 @@ class Command(BaseCommand):
             self.stdout.write("No revisions deleted")
 
 
-def purge_revisions(days=None):
+def get_purgeable_revisions(days=None):
     # exclude revisions which have been submitted for moderation in the old system
     purgeable_revisions = Revision.page_revisions.exclude(
         submitted_for_moderation=True
@@ -58,12 +77,79 @@ def purge_revisions(days=None):
         # only include revisions which were created before the cut off date
         purgeable_revisions = purgeable_revisions.filter(created_at__lt=purgeable_until)
 
+    # don't delete the latest revision for any page, which is the only one that
+    # doesn't have a later revision of the same page
+    later_revisions = Revision.objects.filter(
+        base_content_type_id=OuterRef("base_content_type_id"),
+        object_id=OuterRef("object_id"),
+    ).filter(
+        Q(created_at__gt=OuterRef("created_at"))
+        | Q(created_at=OuterRef("created_at"), pk__gt=OuterRef("pk"))
+    )
+
+    return purgeable_revisions.filter(Exists(later_revisions))
+
+
+def _move_comments_to_next_revision(revision_ids):
+    """
+    Comments created on a revision that is about to be deleted are moved to the next
+    revision of the same page that is being kept, as they may well still apply if they're
+    unresolved. This matches what Revision.delete does for a single revision.
+    """
+    revisions_with_comments = Revision.objects.filter(
+        pk__in=Comment.objects.filter(revision_created_id__in=revision_ids).values(
+            "revision_created_id"
+        )
+    )
+
+    for revision in revisions_with_comments:
+        next_revision = (
+            Revision.objects.filter(
+                base_content_type_id=revision.base_content_type_id,
+                object_id=revision.object_id,
+            )
+            .filter(
+                Q(created_at__gt=revision.created_at)
+                | Q(created_at=revision.created_at, pk__gt=revision.pk)
+            )
+            .exclude(pk__in=revision_ids)
+            .order_by("created_at", "pk")
+            .first()
+        )
+
+        revision.created_comments.all().update(revision_created=next_revision)
+
+
+def purge_revisions(days=None, batch_size=DEFAULT_BATCH_SIZE, progress_callback=None):
+    """
+    Deletes the purgeable revisions in batches of ``batch_size``, walking them in order
+    of primary key. ``progress_callback`` is called with the number of revisions deleted
+    so far after each batch.
+
+    Returns the total number of revisions deleted.
+    """
+    purgeable_revisions = get_purgeable_revisions(days=days).order_by("pk")
+
     deleted_revisions_count = 0
+    last_pk = None
+
+    while True:
+        batch = purgeable_revisions
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+
+        revision_ids = list(batch.values_list("pk", flat=True)[:batch_size])
+        if not revision_ids:
+            break
+
+        with transaction.atomic():
+            _move_comments_to_next_revision(revision_ids)
+            Revision.objects.filter(pk__in=revision_ids).delete()
+
+        last_pk = revision_ids[-1]
+        deleted_revisions_count += len(revision_ids)
 
-    for revision in purgeable_revisions:
-        # don't delete the latest revision for any page
-        if not revision.is_latest_revision():
-            revision.delete()
-            deleted_revisions_count += 1
+        if progress_callback is not None:
+            progress_callback(deleted_revisions_count)
 
     return deleted_revisions_count
@@ -0,0 +1,167 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import django
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from wagtail.models import Page, ReferenceIndex
+from wagtail.models.reference_index import get_indexed_fields
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Rebuild the index of references between objects that is used to report where objects are in use"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of objects to index at a time (default: %d)"
+            % DEFAULT_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Number of worker processes to index objects with (default: 1)",
+        )
+
+    def handle(self, *args, **options):
+        verbosity = options.get("verbosity", 1)
+        processes = options.get("processes") or 1
+        if processes < 1:
+            raise CommandError("--processes must be at least 1")
+
+        def report_progress(model, objects_indexed):
+            if verbosity >= 2:
+                self.stdout.write(
+                    "Indexed %d %s..."
+                    % (objects_indexed, model._meta.verbose_name_plural)
+                )
+
+        objects_indexed, references_indexed = rebuild_references_index(
+            batch_size=options.get("batch_size") or DEFAULT_BATCH_SIZE,
+            processes=processes,
+            progress_callback=report_progress,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Indexed %d references from %d objects"
+                % (references_indexed, objects_indexed)
+            )
+        )
+
+
+def get_querysets_to_index():
+    """
+    Yields a queryset for each model whose objects are indexed in their own right. Pages
+    are indexed by their specific type, so each page type only takes the pages that have
+    that type.
+    """
+    for model in apps.get_models():
+        if not ReferenceIndex.model_is_indexable(model):
+            continue
+
+        queryset = model._base_manager.all()
+        if issubclass(model, Page):
+            queryset = queryset.filter(
+                content_type=ContentType.objects.get_for_model(model)
+            )
+
+        yield queryset
+
+
+def get_batches(queryset, batch_size):
+    """
+    Yields the primary keys of the objects in the queryset, in batches of ``batch_size``
+    taken in primary key order
+    """
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    last_pk = None
+
+    while True:
+        batch = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+        batch = list(batch[:batch_size])
+        if not batch:
+            return
+
+        yield batch
+        last_pk = batch[-1]
+
+
+def index_batch(model_label, pks):
+    """
+    Indexes the objects of the given model with the given primary keys, returning the
+    number of objects and references indexed
+    """
+    model = apps.get_model(model_label)
+    child_relations = get_indexed_fields(model)[2]
+    objects = list(
+        model._base_manager.filter(pk__in=pks).prefetch_related(
+            *[relation.get_accessor_name() for relation in child_relations]
+        )
+    )
+
+    with transaction.atomic():
+        return len(objects), ReferenceIndex.create_for_objects(objects)
+
+
+def init_worker():
+    # Worker processes that are spawned rather than forked start without Django set up
+    django.setup()
+
+
+def rebuild_references_index(
+    batch_size=DEFAULT_BATCH_SIZE, processes=1, progress_callback=None
+):
+    """
+    Clears the reference index and indexes every object that holds references, in batches
+    of ``batch_size``. With more than one process, the batches are indexed in parallel by a
+    pool of worker processes, each with its own database connection.
+    ``progress_callback`` is called with the model and the number of its objects indexed
+    so far after each batch.
+
+    Returns the total number of objects and of references indexed.
+    """
+    ReferenceIndex.objects.all().delete()
+
+    objects_indexed = 0
+    references_indexed = 0
+
+    if processes > 1:
+        # Forked workers mustn't share the database connections of this process
+        connections.close_all()
+        executor = ProcessPoolExecutor(max_workers=processes, initializer=init_worker)
+    else:
+        executor = None
+
+    try:
+        for queryset in get_querysets_to_index():
+            model = queryset.model
+            model_label = model._meta.label
+            batches = get_batches(queryset, batch_size)
+
+            if executor is None:
+                results = (index_batch(model_label, pks) for pks in batches)
+            else:
+                results = executor.map(index_batch, repeat(model_label), batches)
+
+            model_objects_indexed = 0
+            for batch_objects_indexed, batch_references_indexed in results:
+                model_objects_indexed += batch_objects_indexed
+                references_indexed += batch_references_indexed
+                if progress_callback is not None:
+                    progress_callback(model, model_objects_indexed)
+
+            objects_indexed += model_objects_indexed
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return objects_indexed, references_indexed
@@ -0,0 +1,90 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from wagtail.models import Page, PageLogEntry
+
+DEFAULT_BATCH_SIZE = 1000
+
+# The log actions that record a page going live
+PUBLISH_ACTIONS = ["wagtail.publish", "wagtail.publish.scheduled"]
+
+
+class Command(BaseCommand):
+    help = "Set the user who last published each published page from the audit log, for pages published before this was recorded on the page"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of pages to update at a time (default: %d)"
+            % DEFAULT_BATCH_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        verbosity = options.get("verbosity", 1)
+
+        def report_progress(pages_updated):
+            if verbosity >= 2:
+                self.stdout.write("Updated %d pages..." % pages_updated)
+
+        pages_updated = set_last_published_by(
+            batch_size=options.get("batch_size") or DEFAULT_BATCH_SIZE,
+            progress_callback=report_progress,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Set the last published user of %d pages" % pages_updated
+            )
+        )
+
+
+def set_last_published_by(batch_size=DEFAULT_BATCH_SIZE, progress_callback=None):
+    """
+    Sets ``last_published_by`` on the published pages that don't have it set, to the user
+    of their latest publish log entry, ``batch_size`` pages at a time. Each batch is
+    updated with a single query. Pages whose latest publisher has been deleted, or that
+    were last published by the system, are left without a user.
+
+    Returns the number of pages updated.
+    """
+    latest_publisher = (
+        PageLogEntry.objects.filter(
+            page=OuterRef(OuterRef("pk")), action__in=PUBLISH_ACTIONS
+        )
+        .order_by("-timestamp", "-id")
+        .values("user")[:1]
+    )
+    # Log entries may refer to users that no longer exist
+    existing_publisher = (
+        get_user_model().objects.filter(pk=Subquery(latest_publisher)).values("pk")[:1]
+    )
+
+    pks = (
+        Page.objects.filter(
+            last_published_at__isnull=False, last_published_by__isnull=True
+        )
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+    pages_updated = 0
+    last_pk = None
+    while True:
+        batch = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+        batch = list(batch[:batch_size])
+        if not batch:
+            return pages_updated
+
+        with transaction.atomic():
+            Page.objects.filter(pk__in=batch).update(
+                last_published_by=Subquery(existing_publisher)
+            )
+
+        pages_updated += len(batch)
+        last_pk = batch[-1]
+        if progress_callback is not None:
+            progress_callback(pages_updated)
@@ -0,0 +1,46 @@
+# Generated by Django 4.0.10 on 2026-10-18 23:26
+
+import django.core.serializers.json
+from django.db import migrations, models
+import wagtail.models.revision_content
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailcore", "0076_modellogentry_revision"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="revision",
+            name="compressed_content",
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name="revision",
+            name="content_encoding",
+            field=models.CharField(blank=True, default="", max_length=16),
+        ),
+        migrations.AddField(
+            model_name="revision",
+            name="delta_base",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=wagtail.models.revision_content.rebase_revision_deltas,
+                related_name="+",
+                to="wagtailcore.revision",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="revision",
+            name="content",
+            field=wagtail.models.revision_content.RevisionContentField(
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                null=True,
+                verbose_name="content JSON",
+            ),
+        ),
+    ]
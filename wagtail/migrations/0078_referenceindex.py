@@ -0,0 +1,78 @@
+# Generated by Django 4.0.10 on 2026-10-19 09:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("wagtailcore", "0077_revision_compact_content"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReferenceIndex",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("object_id", models.CharField(max_length=255)),
+                ("to_object_id", models.CharField(max_length=255)),
+                ("model_path", models.TextField()),
+                ("content_path", models.TextField()),
+                ("content_path_hash", models.UUIDField()),
+                (
+                    "base_content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "to_content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "reference index",
+                "verbose_name_plural": "reference index",
+                "unique_together": {
+                    (
+                        "base_content_type",
+                        "object_id",
+                        "to_content_type",
+                        "to_object_id",
+                        "content_path_hash",
+                    )
+                },
+            },
+        ),
+        migrations.AddIndex(
+            model_name="referenceindex",
+            index=models.Index(
+                fields=["to_content_type", "to_object_id"],
+                name="wagtailcore_to_cont_d42b8b_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.0.10 on 2026-10-19 13:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("wagtailcore", "0079_logentrysummary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="page",
+            name="last_published_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="last published by",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="page",
+            index=models.Index(
+                fields=["last_published_at"], name="wagtailcore_page_lastpub_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="page",
+            index=models.Index(
+                condition=models.Q(("locked", True)),
+                fields=["locked_by"],
+                name="wagtailcore_page_locked_idx",
+            ),
+        ),
+    ]
@@ -11,8 +11,10 @@ as Page.
 
 import functools
 import logging
+import os
 import uuid
 import warnings
+from collections import defaultdict
 from io import StringIO
 from urllib.parse import urlparse
 
@@ -64,6 +66,7 @@ from wagtail.actions.publish_page_revision import PublishPageRevisionAction
 from wagtail.actions.publish_revision import PublishRevisionAction
 from wagtail.actions.unpublish import UnpublishAction
 from wagtail.actions.unpublish_page import UnpublishPageAction
+from wagtail.actions.update_aliases import UpdatePageAliasesAction
 from wagtail.coreutils import (
     WAGTAIL_APPEND_SLASH,
     camelcase_to_underscore,
@@ -77,7 +80,6 @@ from wagtail.log_actions import log
 from wagtail.query import PageQuerySet
 from wagtail.search import index
 from wagtail.signals import (
-    page_published,
     page_slug_changed,
     pre_validate_delete,
     task_approved,
@@ -92,10 +94,12 @@ from wagtail.signals import (
 from wagtail.url_routing import RouteResult
 from wagtail.utils.deprecation import RemovedInWagtail50Warning
 
+from .ancestors import get_ancestor_cache
 from .audit_log import (  # noqa
     BaseLogEntry,
     BaseLogEntryManager,
     LogEntryQuerySet,
+    LogEntrySummary,
     ModelLogEntry,
 )
 from .collections import (  # noqa
@@ -106,6 +110,7 @@ from .collections import (  # noqa
     CollectionViewRestriction,
     GroupCollectionPermission,
     GroupCollectionPermissionManager,
+    collection_restricted_paths,
     get_root_collection_id,
 )
 from .copying import _copy, _copy_m2m_relations, _extract_field_data  # noqa
@@ -118,8 +123,19 @@ from .i18n import (  # noqa
     bootstrap_translatable_model,
     get_translatable_models,
 )
+from .reference_index import ReferenceIndex  # noqa
+from .revision_content import (
+    RevisionContentField,
+    apply_delta,
+    compress_content,
+    decompress_content,
+    dump_content,
+    get_storage_options,
+    make_delta,
+    rebase_revision_deltas,
+)
 from .sites import Site, SiteManager, SiteRootPath  # noqa
-from .view_restrictions import BaseViewRestriction
+from .view_restrictions import BaseViewRestriction, RestrictedPathMap
 
 logger = logging.getLogger("wagtail")
 
@@ -807,11 +823,17 @@ class LockableMixin(models.Model):
         if self.locked:
             return BasicLock(self)
 
-        if (
-            isinstance(self, DraftStateMixin)
-            and self.revisions.filter(approved_go_live_at__isnull=False).exists()
-        ):
-            return ScheduledForPublishLock(self)
+        if isinstance(self, DraftStateMixin):
+            # `_approved_schedule` may be populated by `annotate_approved_schedule` on
+            # `PageQuerySet` as a performance optimisation
+            approved_schedule = getattr(self, "_approved_schedule", None)
+            if approved_schedule is None:
+                approved_schedule = self.revisions.filter(
+                    approved_go_live_at__isnull=False
+                ).exists()
+
+            if approved_schedule:
+                return ScheduledForPublishLock(self)
 
 
 class AbstractPage(
@@ -896,6 +918,17 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
     latest_revision_created_at = models.DateTimeField(
         verbose_name=_("latest revision created at"), null=True, editable=False
     )
+    # The user who published the live version of the page, kept alongside last_published_at
+    # so that reports don't have to look it up in the audit log
+    last_published_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("last published by"),
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
 
     _revisions = GenericRelation("wagtailcore.Revision", related_query_name="page")
 
@@ -1008,6 +1041,9 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
             # a page without a parent is the tree root, which always has a url_path of '/'
             self.url_path = "/"
 
+        # Any URL computed by `annotate_urls` is now out of date
+        self.__dict__.pop("_annotated_url_parts", None)
+
         return self.url_path
 
     @staticmethod
@@ -1574,122 +1610,13 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         :param user: The user who is publishing (used for logging purposes).
         :type user: User, optional
         """
-        specific_self = self.specific
-
-        # Only compute this if necessary since it's quite a heavy operation
-        if _content is None:
-            _content = self.serializable_data()
-
-        # A list of IDs that have already been updated. This is just in case someone has
-        # created an alias loop (which is impossible to do with the UI Wagtail provides)
-        _updated_ids = _updated_ids or []
-
-        for alias in self.specific_class.objects.filter(alias_of=self).exclude(
-            id__in=_updated_ids
-        ):
-            # FIXME: Switch to the same fields that are excluded from copy
-            # We can't do this right now because we can't exclude fields from with_content_json
-            exclude_fields = [
-                "id",
-                "path",
-                "depth",
-                "numchild",
-                "url_path",
-                "path",
-                "index_entries",
-                "postgres_index_entries",
-            ]
-
-            # Copy field content
-            alias_updated = alias.with_content_json(_content)
-
-            # Publish the alias if it's currently in draft
-            alias_updated.live = True
-            alias_updated.has_unpublished_changes = False
-
-            # Copy child relations
-            child_object_map = specific_self.copy_all_child_relations(
-                target=alias_updated, exclude=exclude_fields
-            )
-
-            # Process child objects
-            # This has two jobs:
-            #  - If the alias is in a different locale, this updates the
-            #    locale of any translatable child objects to match
-            #  - If the alias is not a translation of the original, this
-            #    changes the translation_key field of all child objects
-            #    so they do not clash
-            if child_object_map:
-                alias_is_translation = alias.translation_key == self.translation_key
-
-                def process_child_object(child_object):
-                    if isinstance(child_object, TranslatableMixin):
-                        # Child object's locale must always match the page
-                        child_object.locale = alias_updated.locale
-
-                        # If the alias isn't a translation of the original page,
-                        # change the child object's translation_keys so they are
-                        # not either
-                        if not alias_is_translation:
-                            child_object.translation_key = uuid.uuid4()
-
-                for (rel, previous_id), child_objects in child_object_map.items():
-                    if previous_id is None:
-                        for child_object in child_objects:
-                            process_child_object(child_object)
-                    else:
-                        process_child_object(child_objects)
-
-            # Copy M2M relations
-            _copy_m2m_relations(
-                specific_self, alias_updated, exclude_fields=exclude_fields
-            )
-
-            # Don't change the aliases slug
-            # Aliases can have their own slugs so they can be siblings of the original
-            alias_updated.slug = alias.slug
-            alias_updated.set_url_path(alias_updated.get_parent())
-
-            # Aliases don't have revisions, so update fields that would normally be updated by save_revision
-            alias_updated.draft_title = alias_updated.title
-            alias_updated.latest_revision_created_at = self.latest_revision_created_at
-
-            alias_updated.save(clean=False)
-
-            page_published.send(
-                sender=alias_updated.specific_class,
-                instance=alias_updated,
-                revision=revision,
-                alias=True,
-            )
-
-            # Log the publish of the alias
-            log(
-                instance=alias_updated,
-                action="wagtail.publish",
-                user=user,
-            )
-
-            # Update any aliases of that alias
-
-            # Design note:
-            # It could be argued that this will be faster if we just changed these alias-of-alias
-            # pages to all point to the original page and avoid having to update them recursively.
-            #
-            # But, it's useful to have a record of how aliases have been chained.
-            # For example, In Wagtail Localize, we use aliases to create mirrored trees, but those
-            # trees themselves could have aliases within them. If an alias within a tree is
-            # converted to a regular page, we want the alias in the mirrored tree to follow that
-            # new page and stop receiving updates from the original page.
-            #
-            # Doing it this way requires an extra lookup query per alias but this is small in
-            # comparison to the work required to update the alias.
-
-            alias.update_aliases(
-                revision=revision,
-                _content=_content,
-                _updated_ids=_updated_ids,
-            )
+        UpdatePageAliasesAction(
+            self,
+            revision=revision,
+            user=user,
+            _content=_content,
+            _updated_ids=_updated_ids,
+        ).execute()
 
     update_aliases.alters_data = True
 
@@ -1798,6 +1725,11 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         ``request`` directly, and should just pass it to the original method
         when calling ``super``.
         """
+        # `_annotated_url_parts` may be populated by `annotate_urls` on `PageQuerySet` as a
+        # performance optimisation
+        annotated_url_parts = getattr(self, "_annotated_url_parts", None)
+        if annotated_url_parts is not None and annotated_url_parts[0] is request:
+            return annotated_url_parts[1]
 
         possible_sites = self._get_relevant_site_root_paths(request)
 
@@ -2163,11 +2095,17 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         exclude_fields=None,
         log_action="wagtail.copy",
         reset_translation_key=True,
+        bulk=False,
+        send_published_signals=False,
     ):
         """
         Copies a given page
         :param log_action flag for logging the action. Pass None to skip logging.
             Can be passed an action string. Defaults to 'wagtail.copy'
+        :param bulk: When copying recursively, insert the descendants of the page in bulk
+            rather than saving them one at a time. Recommended for large subtrees.
+        :param send_published_signals: When copying in bulk, send the ``page_published``
+            signal for each live descendant copied.
         """
         return CopyPageAction(
             self,
@@ -2181,6 +2119,8 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
             process_child_object=process_child_object,
             log_action=log_action,
             reset_translation_key=reset_translation_key,
+            bulk=bulk,
+            send_published_signals=send_published_signals,
         ).execute(skip_permission_checks=True)
 
     copy.alters_data = True
@@ -2338,7 +2278,7 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
             self.get_siblings(inclusive).filter(path__lte=self.path).order_by("-path")
         )
 
-    def get_view_restrictions(self):
+    def get_view_restrictions(self, request=None):
         """
         Return a query set of all page view restrictions that apply to this page.
 
@@ -2347,22 +2287,44 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         If any of those pages are aliases, it will resolve them to their source pages
         before querying PageViewRestrictions so alias pages use the same view restrictions
         as their source page and they cannot have their own.
+
+        If a request is given, the ancestors of the page are looked up in the ancestor
+        cache of that request, so they are only queried once per request. When
+        ``WAGTAIL_VIEW_RESTRICTION_CACHE`` is enabled, the restrictions are looked up in
+        the in-memory map of restricted paths instead, without querying the ancestors.
         """
+        if page_restricted_paths.is_enabled():
+            return PageViewRestriction.objects.filter(
+                id__in=page_restricted_paths.get_restriction_ids(self.path)
+            )
+
         page_ids_to_check = set()
+        alias_of_ids = set()
 
-        def add_page_to_check_list(page):
-            # If the page is an alias, add the source page to the check list instead
-            if page.alias_of:
-                add_page_to_check_list(page.alias_of)
+        # Check the current page and each ancestor for view restrictions. If a page is an
+        # alias, add the source page to the check list instead
+        for page in get_ancestor_cache(request).get_ancestors(self, inclusive=True):
+            if page.alias_of_id:
+                alias_of_ids.add(page.alias_of_id)
             else:
                 page_ids_to_check.add(page.id)
 
-        # Check current page for view restrictions
-        add_page_to_check_list(self)
+        # Source pages may be aliases themselves, so keep following them until we get
+        # to pages that aren't aliases
+        resolved_alias_of_ids = set()
+        while alias_of_ids:
+            resolved_alias_of_ids |= alias_of_ids
+            next_alias_of_ids = set()
+
+            for page_id, alias_of_id in Page.objects.filter(
+                id__in=alias_of_ids
+            ).values_list("id", "alias_of_id"):
+                if alias_of_id is None:
+                    page_ids_to_check.add(page_id)
+                elif alias_of_id not in resolved_alias_of_ids:
+                    next_alias_of_ids.add(alias_of_id)
 
-        # Check each ancestor for view restrictions as well
-        for page in self.get_ancestors().only("alias_of"):
-            add_page_to_check_list(page)
+            alias_of_ids = next_alias_of_ids
 
         return PageViewRestriction.objects.filter(page_id__in=page_ids_to_check)
 
@@ -2566,6 +2528,16 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         verbose_name = _("page")
         verbose_name_plural = _("pages")
         unique_together = [("translation_key", "locale")]
+        indexes = [
+            models.Index(
+                fields=["last_published_at"], name="wagtailcore_page_lastpub_idx"
+            ),
+            models.Index(
+                fields=["locked_by"],
+                condition=Q(locked=True),
+                name="wagtailcore_page_locked_idx",
+            ),
+        ]
 
 
 class Orderable(models.Model):
@@ -2637,8 +2609,18 @@ class Revision(models.Model):
         on_delete=models.SET_NULL,
     )
     object_str = models.TextField(default="")
-    content = models.JSONField(
-        verbose_name=_("content JSON"), encoder=DjangoJSONEncoder
+    content = RevisionContentField(
+        verbose_name=_("content JSON"), encoder=DjangoJSONEncoder, null=True
+    )
+    content_encoding = models.CharField(max_length=16, blank=True, default="")
+    compressed_content = models.BinaryField(null=True, editable=False)
+    delta_base = models.ForeignKey(
+        "self",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=rebase_revision_deltas,
+        related_name="+",
     )
     approved_go_live_at = models.DateTimeField(
         verbose_name=_("approved go live at"), null=True, blank=True, db_index=True
@@ -2652,6 +2634,8 @@ class Revision(models.Model):
         "content_type", "object_id", for_concrete_model=False
     )
 
+    wagtail_reference_index_ignore = True
+
     @cached_property
     def base_content_object(self):
         return self.base_content_type.get_object_for_this_type(pk=self.object_id)
@@ -2690,6 +2674,22 @@ class Revision(models.Model):
         if self.base_content_type_id is None:
             self.base_content_type_id = self.content_type_id
 
+        update_fields = kwargs.get("update_fields")
+        if self.pk is None:
+            self._encode_content()
+        elif self._content_changed() and (
+            update_fields is None or "content" in update_fields
+        ):
+            # Revisions stored as deltas against this one were computed from its old content
+            self._rebase_dependent_revisions()
+            self._encode_content()
+            if update_fields is not None:
+                kwargs["update_fields"] = set(update_fields) | {
+                    "content_encoding",
+                    "compressed_content",
+                    "delta_base",
+                }
+
         super().save(*args, **kwargs)
         if self.submitted_for_moderation:
             # ensure that all other revisions of this object have the 'submitted for moderation' flag unset
@@ -2722,6 +2722,113 @@ class Revision(models.Model):
                 revision=self,
             )
 
+    def _get_previous_for_delta(self):
+        revisions = Revision.objects.filter(
+            base_content_type_id=self.base_content_type_id,
+            object_id=self.object_id,
+        )
+        if self.pk is None:
+            revisions = revisions.filter(created_at__lte=self.created_at)
+        else:
+            revisions = revisions.filter(
+                Q(created_at__lt=self.created_at)
+                | Q(created_at=self.created_at, pk__lt=self.pk)
+            )
+
+        return revisions.order_by("-created_at", "-pk").first()
+
+    def _load_content(self):
+        """
+        Returns a ``(content, depth)`` tuple, where ``depth`` is the number of deltas
+        that had to be applied on top of the nearest keyframe to rebuild the content.
+        """
+        deltas = []
+        revision = self
+        while revision.delta_base_id is not None:
+            deltas.append(
+                decompress_content(
+                    revision.compressed_content, revision.content_encoding
+                )
+            )
+            revision = Revision.objects.get(pk=revision.delta_base_id)
+
+        if revision.content_encoding:
+            content = decompress_content(
+                revision.compressed_content, revision.content_encoding
+            )
+        else:
+            content = revision.content
+
+        for delta in reversed(deltas):
+            content = apply_delta(content, delta)
+
+        return content, len(deltas)
+
+    def _decode_content(self):
+        content, depth = self._load_content()
+        # Remember what was decoded, so that save() can tell if the content was changed
+        self._decoded_content_json = dump_content(content)
+        return content
+
+    def _content_changed(self):
+        if not self.content_encoding:
+            # Plain JSON content is written back to the content column as is
+            return False
+
+        content = self.__dict__.get("content")
+        return content is not None and dump_content(content) != getattr(
+            self, "_decoded_content_json", None
+        )
+
+    def _encode_content(self, allow_delta=True):
+        """
+        Sets the fields that store ``self.content`` according to the
+        ``WAGTAIL_REVISION_CONTENT_*`` settings. ``allow_delta=False`` always stores
+        a full snapshot, for revisions whose predecessors are not saved yet.
+        """
+        compression, use_deltas, keyframe_interval = get_storage_options()
+        use_deltas = use_deltas and allow_delta
+        content = self.content
+
+        self.content_encoding = compression or ""
+        self.compressed_content = None
+        self.delta_base = None
+
+        if not compression:
+            return
+
+        if use_deltas:
+            previous_revision = self._get_previous_for_delta()
+            if previous_revision is not None:
+                base_content, depth = previous_revision._load_content()
+                if depth + 1 < keyframe_interval:
+                    self.delta_base = previous_revision
+                    self.compressed_content = compress_content(
+                        make_delta(base_content, content), compression
+                    )
+
+        if self.delta_base is None:
+            self.compressed_content = compress_content(content, compression)
+
+        self._decoded_content_json = dump_content(content)
+
+    def store_content_as_keyframe(self):
+        """
+        Rewrites a revision stored as a delta into a full snapshot, so that it no longer
+        depends on any other revision
+        """
+        content = self.content
+        compression = self.content_encoding
+        self.delta_base = None
+        self.compressed_content = compress_content(content, compression)
+        Revision.objects.filter(pk=self.pk).update(
+            delta_base=None, compressed_content=self.compressed_content
+        )
+
+    def _rebase_dependent_revisions(self):
+        for revision in Revision.objects.filter(delta_base_id=self.pk):
+            revision.store_content_as_keyframe()
+
     def as_object(self):
         return self.content_object.with_content_json(self.content)
 
@@ -2869,6 +2976,8 @@ class GroupPagePermission(models.Model):
         choices=PAGE_PERMISSION_TYPE_CHOICES,
     )
 
+    wagtail_reference_index_ignore = True
+
     class Meta:
         unique_together = ("group", "page", "permission_type")
         verbose_name = _("group page permission")
@@ -2884,6 +2993,96 @@ class GroupPagePermission(models.Model):
         )
 
 
+PAGE_PERMISSIONS_VERSION_KEY = "wagtail_page_permissions_version"
+
+
+class PagePermissionIndex:
+    """
+    The page permissions granted to a user, compiled into a map from the paths of the pages
+    they are granted on to the permission types granted there. The permission types a user
+    has on any page can then be found by looking up each prefix of the page's path, without
+    scanning through all of the user's permissions.
+    """
+
+    def __init__(self, grants):
+        # A tuple of (page path, permission type) pairs
+        self.grants = tuple(grants)
+
+        self.permission_types_by_path = defaultdict(set)
+        for path, permission_type in self.grants:
+            self.permission_types_by_path[path].add(permission_type)
+
+    @classmethod
+    def for_user(cls, user):
+        """
+        Returns the index of the page permissions granted to the given user. When
+        ``WAGTAIL_PAGE_PERMISSION_CACHE`` is enabled, the index is stored in Django's cache,
+        keyed by the user and by a version number that changes whenever page permissions do.
+        """
+        if not getattr(settings, "WAGTAIL_PAGE_PERMISSION_CACHE", False):
+            return cls(cls.get_grants(user))
+
+        version = cache.get(PAGE_PERMISSIONS_VERSION_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.set(PAGE_PERMISSIONS_VERSION_KEY, version, None)
+
+        cache_key = "wagtail_page_permission_index:%s:%s" % (version, user.pk)
+        grants = cache.get(cache_key)
+        if grants is None:
+            grants = cls.get_grants(user)
+            cache.set(cache_key, grants)
+
+        return cls(grants)
+
+    @staticmethod
+    def get_grants(user):
+        return list(
+            GroupPagePermission.objects.filter(group__user=user)
+            .values_list("page__path", "permission_type")
+            .distinct()
+        )
+
+    @staticmethod
+    def invalidate():
+        """
+        Discards the cached indexes of all users. Called whenever group page permissions,
+        the groups of a user, or the paths of pages change.
+        """
+        if getattr(settings, "WAGTAIL_PAGE_PERMISSION_CACHE", False):
+            cache.set(PAGE_PERMISSIONS_VERSION_KEY, uuid.uuid4().hex, None)
+
+    def get_permission_types(self, path):
+        """
+        Returns the set of permission types the user has on the page with the given path
+        """
+        permission_types = set()
+        for length in range(Page.steplen, len(path) + 1, Page.steplen):
+            permission_types.update(
+                self.permission_types_by_path.get(path[:length], ())
+            )
+
+        return permission_types
+
+    def get_paths(self, *permission_types):
+        """
+        Returns a sorted list of the paths of the pages on which the user has been granted
+        any of the given permission types, or any permission at all if none are given
+        """
+        return sorted(
+            path
+            for path, path_permission_types in self.permission_types_by_path.items()
+            if not permission_types
+            or path_permission_types.intersection(permission_types)
+        )
+
+    def has_permission_type(self, permission_type):
+        return any(
+            permission_type in path_permission_types
+            for path_permission_types in self.permission_types_by_path.values()
+        )
+
+
 class UserPagePermissionsProxy:
     """Helper object that encapsulates all the page permission rules that this user has
     across the page hierarchy."""
@@ -2896,6 +3095,10 @@ class UserPagePermissionsProxy:
                 group__user=self.user
             ).select_related("page")
 
+    @cached_property
+    def permission_index(self):
+        return PagePermissionIndex.for_user(self.user)
+
     def revisions_for_moderation(self):
         """Return a queryset of page revisions awaiting moderation that this user has publish permission on"""
 
@@ -2907,19 +3110,12 @@ class UserPagePermissionsProxy:
 
         # get the list of pages for which they have direct publish permission
         # (i.e. they can publish any page within this subtree)
-        publishable_pages_paths = (
-            self.permissions.filter(permission_type="publish")
-            .values_list("page__path", flat=True)
-            .distinct()
-        )
+        publishable_pages_paths = self.permission_index.get_paths("publish")
         if not publishable_pages_paths:
             return Revision.objects.none()
 
-        # compile a filter expression to apply to the Revision.page_revisions.submitted() queryset:
         # return only those pages whose paths start with one of the publishable_pages paths
-        only_my_sections = Q(path__startswith=publishable_pages_paths[0])
-        for page_path in publishable_pages_paths[1:]:
-            only_my_sections = only_my_sections | Q(path__startswith=page_path)
+        only_my_sections = Page.objects.descendant_of_paths_q(publishable_pages_paths)
 
         # return the filtered queryset
         return Revision.page_revisions.submitted().filter(
@@ -2944,32 +3140,37 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Page.objects.all()
 
-        explorable_pages = Page.objects.none()
+        page_permission_paths = self.permission_index.get_paths()
+        if not page_permission_paths:
+            return Page.objects.none()
 
-        # Creates a union queryset of all objects the user has access to add,
-        # edit and publish
-        for perm in self.permissions.filter(
-            Q(permission_type="add")
-            | Q(permission_type="edit")
-            | Q(permission_type="publish")
-            | Q(permission_type="lock")
-        ):
-            explorable_pages |= Page.objects.descendant_of(perm.page, inclusive=True)
+        # All pages the user has access to add, edit and publish
+        explorable_pages_q = Page.objects.descendant_of_paths_q(
+            self.permission_index.get_paths("add", "edit", "publish", "lock")
+        )
 
         # For all pages with specific permissions, add their ancestors as
         # explorable. This will allow deeply nested pages to be accessed in the
         # explorer. For example, in the hierarchy A>B>C>D where the user has
         # 'edit' access on D, they will be able to navigate to D without having
         # explicit access to A, B or C.
-        page_permissions = Page.objects.filter(group_permissions__in=self.permissions)
-        for page in page_permissions:
-            explorable_pages |= page.get_ancestors()
+        explorable_pages_q |= Q(
+            path__in={
+                path[:length]
+                for path in page_permission_paths
+                for length in range(Page.steplen, len(path), Page.steplen)
+            }
+        )
 
-        # Remove unnecessary top-level ancestors that the user has no access to
-        fca_page = page_permissions.first_common_ancestor()
-        explorable_pages = explorable_pages.filter(path__startswith=fca_page.path)
+        # Remove unnecessary top-level ancestors that the user has no access to, by
+        # only including the pages within the first common ancestor of the pages with
+        # specific permissions
+        fca_path = os.path.commonprefix(
+            [path[: -Page.steplen] for path in page_permission_paths]
+        )
+        fca_path = fca_path[: len(fca_path) - len(fca_path) % Page.steplen]
 
-        return explorable_pages
+        return Page.objects.filter(explorable_pages_q, path__startswith=fca_path)
 
     def editable_pages(self):
         """Return a queryset of the pages that this user has permission to edit"""
@@ -2979,21 +3180,26 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Page.objects.all()
 
-        editable_pages = Page.objects.none()
+        editable_pages_q = Q()
 
-        for perm in self.permissions.filter(permission_type="add"):
-            # user has edit permission on any subpage of perm.page
-            # (including perm.page itself) that is owned by them
-            editable_pages |= Page.objects.descendant_of(
-                perm.page, inclusive=True
-            ).filter(owner=self.user)
+        add_paths = self.permission_index.get_paths("add")
+        if add_paths:
+            # user has edit permission on any subpage of the pages they have add
+            # permission on (including those pages themselves) that is owned by them
+            editable_pages_q |= Page.objects.descendant_of_paths_q(add_paths) & Q(
+                owner=self.user
+            )
 
-        for perm in self.permissions.filter(permission_type="edit"):
-            # user has edit permission on any subpage of perm.page
-            # (including perm.page itself) regardless of owner
-            editable_pages |= Page.objects.descendant_of(perm.page, inclusive=True)
+        edit_paths = self.permission_index.get_paths("edit")
+        if edit_paths:
+            # user has edit permission on any subpage of the pages they have edit
+            # permission on (including those pages themselves) regardless of owner
+            editable_pages_q |= Page.objects.descendant_of_paths_q(edit_paths)
+
+        if not editable_pages_q:
+            return Page.objects.none()
 
-        return editable_pages
+        return Page.objects.filter(editable_pages_q)
 
     def can_edit_pages(self):
         """Return True if the user has permission to edit any pages"""
@@ -3007,14 +3213,13 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Page.objects.all()
 
-        publishable_pages = Page.objects.none()
-
-        for perm in self.permissions.filter(permission_type="publish"):
-            # user has publish permission on any subpage of perm.page
-            # (including perm.page itself)
-            publishable_pages |= Page.objects.descendant_of(perm.page, inclusive=True)
+        publish_paths = self.permission_index.get_paths("publish")
+        if not publish_paths:
+            return Page.objects.none()
 
-        return publishable_pages
+        # user has publish permission on any subpage of the pages they have publish
+        # permission on (including those pages themselves)
+        return Page.objects.filter(Page.objects.descendant_of_paths_q(publish_paths))
 
     def can_publish_pages(self):
         """Return True if the user has permission to publish any pages"""
@@ -3027,7 +3232,7 @@ class UserPagePermissionsProxy:
         if not self.user.is_active:
             return False
         else:
-            return self.permissions.filter(permission_type="unlock").exists()
+            return self.permission_index.has_permission_type("unlock")
 
 
 class PagePermissionTester:
@@ -3038,11 +3243,9 @@ class PagePermissionTester:
         self.page_is_root = page.depth == 1  # Equivalent to page.is_root()
 
         if self.user.is_active and not self.user.is_superuser:
-            self.permissions = {
-                perm.permission_type
-                for perm in user_perms.permissions
-                if self.page.path.startswith(perm.page.path)
-            }
+            self.permissions = user_perms.permission_index.get_permission_types(
+                self.page.path
+            )
 
     def user_has_lock(self):
         return self.page.locked_by_id == self.user.pk
@@ -3356,6 +3559,79 @@ class PageViewRestriction(BaseViewRestriction):
         return super().delete(**kwargs)
 
 
+class PageRestrictedPathMap(RestrictedPathMap):
+    """
+    Maps the paths of restricted pages, and of aliases of restricted pages, to the IDs of
+    the page view restrictions that apply to them.
+    """
+
+    cache_key = "wagtail_page_view_restrictions_version"
+    steplen = Page.steplen
+
+    def __init__(self):
+        super().__init__()
+        # The paths of the pages that have restrictions of their own, without their aliases
+        self._restricted_page_paths = ()
+
+    def build(self):
+        paths = {}
+        restriction_ids = defaultdict(list)
+
+        for (
+            restriction_id,
+            page_id,
+            path,
+            alias_of_id,
+        ) in PageViewRestriction.objects.order_by("id").values_list(
+            "id", "page_id", "page__path", "page__alias_of_id"
+        ):
+            # Aliases use the view restrictions of their source page and can't have
+            # their own
+            if alias_of_id is None:
+                restriction_ids[page_id].append(restriction_id)
+                paths[path] = tuple(restriction_ids[page_id])
+
+        self._restricted_page_paths = tuple(paths)
+
+        # Add the aliases of restricted pages, and any aliases of those aliases
+        sources = {
+            page_id: tuple(page_restriction_ids)
+            for page_id, page_restriction_ids in restriction_ids.items()
+        }
+        seen_ids = set(sources)
+        while sources:
+            aliases = (
+                Page.objects.filter(alias_of_id__in=sources)
+                .exclude(id__in=seen_ids)
+                .values_list("id", "path", "alias_of_id")
+            )
+            next_sources = {}
+            for page_id, path, alias_of_id in aliases:
+                paths[path] = next_sources[page_id] = sources[alias_of_id]
+                seen_ids.add(page_id)
+
+            sources = next_sources
+
+        return paths
+
+    def get_private_q(self):
+        """
+        Returns a Q object matching all restricted pages and their descendants. Like
+        ``PageQuerySet.private_q`` without the map, this leaves out the aliases of restricted
+        pages, which only share their restrictions when they're served.
+        """
+        self.get_paths()
+
+        q = Q()
+        for path in self._restricted_page_paths:
+            q |= Q(path__startswith=path)
+
+        return q
+
+
+page_restricted_paths = PageRestrictedPathMap()
+
+
 class WorkflowPage(models.Model):
     page = models.OneToOneField(
         "Page",
@@ -3371,6 +3647,8 @@ class WorkflowPage(models.Model):
         on_delete=models.CASCADE,
     )
 
+    wagtail_reference_index_ignore = True
+
     def get_pages(self):
         """
         Returns a queryset of pages that are affected by this WorkflowPage link.
@@ -3598,6 +3876,8 @@ class Workflow(ClusterableModel):
     )
     objects = WorkflowManager()
 
+    wagtail_reference_index_ignore = True
+
     def __str__(self):
         return self.name
 
@@ -3819,6 +4099,8 @@ class WorkflowState(models.Model):
 
     objects = WorkflowStateManager()
 
+    wagtail_reference_index_ignore = True
+
     def clean(self):
         super().clean()
 
@@ -4009,7 +4291,7 @@ class WorkflowState(models.Model):
         return Revision.page_revisions.filter(
             object_id=str(self.page_id),
             id__in=self.task_states.values_list("page_revision_id", flat=True),
-        ).defer("content")
+        ).defer("content", "compressed_content")
 
     def _get_applicable_task_states(self):
         """Returns the set of task states whose status applies to the current revision"""
@@ -4190,6 +4472,8 @@ class TaskState(models.Model):
 
     objects = TaskStateManager()
 
+    wagtail_reference_index_ignore = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if not self.id:
@@ -4378,9 +4662,9 @@ class PageLogEntryManager(BaseLogEntryManager):
     def get_instance_title(self, instance):
         return instance.specific_deferred.get_admin_display_title()
 
-    def log_action(self, instance, action, **kwargs):
+    def build_log_entry(self, instance, action, **kwargs):
         kwargs.update(page=instance)
-        return super().log_action(instance, action, **kwargs)
+        return super().build_log_entry(instance, action, **kwargs)
 
     def viewable_by_user(self, user):
         q = Q(
@@ -4601,6 +4885,8 @@ class PageSubscription(models.Model):
 
     comment_notifications = models.BooleanField()
 
+    wagtail_reference_index_ignore = True
+
     class Meta:
         unique_together = [
             ("page", "user"),
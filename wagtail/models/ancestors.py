@@ -0,0 +1,104 @@
+"""
+A cache of the ancestor chains of pages.
+
+Checking view restrictions, building breadcrumbs and similar tasks all need to look at the
+ancestors of a page, often several times for the same page during one request. Rather than
+querying the ancestors each time, the ancestor chain is loaded once and kept as a tuple of
+lightweight ``AncestorRecord`` objects, keyed by the treebeard ``path`` of each page. As
+every ancestor of a page has a path that is a prefix of the page's own path, records are
+shared between the chains of all pages in the same section of the tree.
+
+The cache is kept on the request object. When ``WAGTAIL_PAGE_ANCESTOR_CACHE`` is enabled,
+it is also kept for the lifetime of the process, and is discarded whenever a page is saved,
+moved or deleted in any process, using a version number stored in Django's cache.
+"""
+import uuid
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+AncestorRecord = namedtuple("AncestorRecord", ["id", "path", "depth", "alias_of_id"])
+
+ANCESTOR_CACHE_VERSION_KEY = "wagtail_page_ancestor_cache_version"
+
+_process_cache = None
+
+
+class AncestorCache:
+    def __init__(self, version=None):
+        self.version = version
+        self.records = {}
+
+    def get_ancestors(self, page, inclusive=False):
+        """
+        Returns a tuple of ``AncestorRecord`` objects for the ancestors of the given page,
+        starting at the root page and descending to the parent, or to the page itself if
+        ``inclusive`` is true.
+        """
+        from wagtail.models import Page
+
+        paths = [
+            page.path[:length]
+            for length in range(Page.steplen, len(page.path), Page.steplen)
+        ]
+
+        missing_paths = [path for path in paths if path not in self.records]
+        if missing_paths:
+            for values in Page.objects.filter(path__in=missing_paths).values_list(
+                *AncestorRecord._fields
+            ):
+                record = AncestorRecord(*values)
+                self.records[record.path] = record
+
+        ancestors = tuple(self.records[path] for path in paths if path in self.records)
+
+        if inclusive:
+            ancestors += (
+                AncestorRecord(page.id, page.path, page.depth, page.alias_of_id),
+            )
+
+        return ancestors
+
+
+def get_ancestor_cache(request=None):
+    """
+    Returns the ``AncestorCache`` to use for the given request. If no request is given,
+    the process-wide cache is returned if it's enabled, otherwise a new, empty cache.
+    """
+    global _process_cache
+
+    try:
+        return request._wagtail_cached_ancestors
+    except AttributeError:
+        pass
+
+    if getattr(settings, "WAGTAIL_PAGE_ANCESTOR_CACHE", False):
+        version = cache.get(ANCESTOR_CACHE_VERSION_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.set(ANCESTOR_CACHE_VERSION_KEY, version, None)
+
+        if _process_cache is None or _process_cache.version != version:
+            _process_cache = AncestorCache(version)
+
+        ancestor_cache = _process_cache
+    else:
+        ancestor_cache = AncestorCache()
+
+    if request is not None:
+        request._wagtail_cached_ancestors = ancestor_cache
+
+    return ancestor_cache
+
+
+def invalidate_ancestor_cache():
+    """
+    Discards the process-wide ancestor caches of all processes. Called whenever a page is
+    saved, moved or deleted.
+    """
+    global _process_cache
+
+    if getattr(settings, "WAGTAIL_PAGE_ANCESTOR_CACHE", False):
+        _process_cache = None
+        cache.set(ANCESTOR_CACHE_VERSION_KEY, uuid.uuid4().hex, None)
@@ -4,13 +4,15 @@ such as Page, but the definitions here should remain generic and not depend on t
 wagtail.models module or specific models such as Page.
 """
 
-from collections import defaultdict
+import datetime
+from collections import Counter, defaultdict
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -93,6 +95,15 @@ class BaseLogEntryManager(models.Manager):
             - content_changed, deleted - Boolean flags
         :return: The new log entry
         """
+        log_entry = self.build_log_entry(instance, action, **kwargs)
+        log_entry.save(force_insert=True, using=self.db)
+        return log_entry
+
+    def build_log_entry(self, instance, action, **kwargs):
+        """
+        Returns a new, unsaved log entry for the given action, taking the same arguments
+        as ``log_action``. Useful for creating many log entries at once with ``bulk_create``.
+        """
         if instance.pk is None:
             raise ValueError(
                 "Attempted to log an action for object %r with empty primary key"
@@ -105,7 +116,7 @@ class BaseLogEntryManager(models.Manager):
             title = self.get_instance_title(instance)
 
         timestamp = kwargs.pop("timestamp", timezone.now())
-        return self.model.objects.create(
+        return self.model(
             content_type=ContentType.objects.get_for_model(
                 instance, for_concrete_model=False
             ),
@@ -184,6 +195,8 @@ class BaseLogEntry(models.Model):
 
     objects = BaseLogEntryManager()
 
+    wagtail_reference_index_ignore = True
+
     class Meta:
         abstract = True
         verbose_name = _("log entry")
@@ -264,9 +277,9 @@ class BaseLogEntry(models.Model):
 
 
 class ModelLogEntryManager(BaseLogEntryManager):
-    def log_action(self, instance, action, **kwargs):
+    def build_log_entry(self, instance, action, **kwargs):
         kwargs.update(object_id=str(instance.pk))
-        return super().log_action(instance, action, **kwargs)
+        return super().build_log_entry(instance, action, **kwargs)
 
     def for_instance(self, instance):
         return self.filter(
@@ -298,3 +311,157 @@ class ModelLogEntry(BaseLogEntry):
             self.object_verbose_name(),
             self.object_id,
         )
+
+
+def get_day_start(date):
+    """
+    Returns the datetime at the start of the given day, in UTC, for comparing with the
+    timestamps of log entries
+    """
+    day_start = datetime.datetime.combine(date, datetime.time.min)
+    if settings.USE_TZ:
+        day_start = day_start.replace(tzinfo=datetime.timezone.utc)
+    return day_start
+
+
+class LogEntrySummary(models.Model):
+    """
+    The number of log entries of each content type, user and action on each day, across
+    all log entry models. Complete days are added by ``update_summary``, so that the
+    users and content types with logged actions can be found without scanning the whole
+    audit log, and so that the totals are kept when old log entries are archived.
+    """
+
+    date = models.DateField(verbose_name=_("date (UTC)"), db_index=True)
+    content_type = models.ForeignKey(
+        ContentType,
+        models.SET_NULL,
+        verbose_name=_("content type"),
+        blank=True,
+        null=True,
+        related_name="+",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    action = models.CharField(max_length=255, blank=True)
+    count = models.PositiveIntegerField(default=0)
+
+    wagtail_reference_index_ignore = True
+
+    class Meta:
+        verbose_name = _("log entry summary")
+        verbose_name_plural = _("log entry summaries")
+
+    @classmethod
+    def get_summarised_until(cls):
+        """
+        Returns the start of the first day that hasn't been summarised, or None if the
+        summary is empty
+        """
+        last_date = cls.objects.aggregate(last_date=models.Max("date"))["last_date"]
+        if last_date is None:
+            return None
+        return get_day_start(last_date + datetime.timedelta(days=1))
+
+    @classmethod
+    def update_summary(cls, days_per_batch=30):
+        """
+        Summarises the log entries of the complete days since the summary was last updated,
+        ``days_per_batch`` days at a time, and returns the start of the current day, up to
+        which the log entries are now summarised. This must not be run by more than one
+        process at once, as the same days would be counted twice.
+        """
+        log_models = log_action_registry.get_log_entry_models()
+        until = get_day_start(timezone.now().date())
+
+        start = cls.get_summarised_until()
+        if start is None:
+            first_timestamps = [
+                timestamp
+                for timestamp in (
+                    log_model.objects.aggregate(first=models.Min("timestamp"))["first"]
+                    for log_model in log_models
+                )
+                if timestamp is not None
+            ]
+            if not first_timestamps:
+                return until
+            start = get_day_start(min(first_timestamps).date())
+
+        while start < until:
+            end = min(start + datetime.timedelta(days=days_per_batch), until)
+
+            counts = Counter()
+            for log_model in log_models:
+                rows = (
+                    log_model.objects.filter(timestamp__gte=start, timestamp__lt=end)
+                    .order_by()
+                    .annotate(date=TruncDate("timestamp", tzinfo=datetime.timezone.utc))
+                    .values_list("date", "content_type_id", "user_id", "action")
+                    .annotate(entry_count=models.Count("pk"))
+                )
+                for date, content_type_id, user_id, action, entry_count in rows:
+                    counts[(date, content_type_id, user_id, action)] += entry_count
+
+            with transaction.atomic():
+                cls.objects.bulk_create(
+                    [
+                        cls(
+                            date=date,
+                            content_type_id=content_type_id,
+                            user_id=user_id,
+                            action=action,
+                            count=entry_count,
+                        )
+                        for (
+                            date,
+                            content_type_id,
+                            user_id,
+                            action,
+                        ), entry_count in counts.items()
+                    ],
+                    batch_size=1000,
+                )
+
+            start = end
+
+        return until
+
+    @classmethod
+    def _get_distinct_ids(cls, field_name):
+        ids = set(cls.objects.order_by().values_list(field_name, flat=True).distinct())
+
+        # Log entries from the days that haven't been summarised yet
+        summarised_until = cls.get_summarised_until()
+        for log_model in log_action_registry.get_log_entry_models():
+            log_entries = log_model.objects.all()
+            if summarised_until is not None:
+                log_entries = log_entries.filter(timestamp__gte=summarised_until)
+            ids.update(
+                log_entries.order_by().values_list(field_name, flat=True).distinct()
+            )
+
+        ids.discard(None)
+        return ids
+
+    @classmethod
+    def get_user_ids(cls):
+        """
+        Returns the set of IDs of the users who have logged actions, including actions
+        that have been archived
+        """
+        return cls._get_distinct_ids("user_id")
+
+    @classmethod
+    def get_content_type_ids(cls):
+        """
+        Returns the set of IDs of the content types with logged actions, including actions
+        that have been archived
+        """
+        return cls._get_distinct_ids("content_type_id")
@@ -8,7 +8,7 @@ from treebeard.mp_tree import MP_Node
 from wagtail.query import TreeQuerySet
 from wagtail.search import index
 
-from .view_restrictions import BaseViewRestriction
+from .view_restrictions import BaseViewRestriction, RestrictedPathMap
 
 
 class CollectionQuerySet(TreeQuerySet):
@@ -48,6 +48,28 @@ class CollectionViewRestriction(BaseViewRestriction):
         verbose_name_plural = _("collection view restrictions")
 
 
+class CollectionRestrictedPathMap(RestrictedPathMap):
+    """
+    Maps the paths of restricted collections to the IDs of the collection view
+    restrictions on them.
+    """
+
+    cache_key = "wagtail_collection_view_restrictions_version"
+    steplen = MP_Node.steplen
+
+    def build(self):
+        paths = {}
+        for restriction_id, path in CollectionViewRestriction.objects.order_by(
+            "id"
+        ).values_list("id", "collection__path"):
+            paths[path] = paths.get(path, ()) + (restriction_id,)
+
+        return paths
+
+
+collection_restricted_paths = CollectionRestrictedPathMap()
+
+
 class Collection(MP_Node):
     """
     A location in which resources such as images and documents can be grouped
@@ -59,6 +81,8 @@ class Collection(MP_Node):
     # Tell treebeard to order Collections' paths such that they are ordered by name at each level.
     node_order_by = ["name"]
 
+    wagtail_reference_index_ignore = True
+
     def __str__(self):
         return self.name
 
@@ -79,8 +103,17 @@ class Collection(MP_Node):
             self.get_siblings(inclusive).filter(path__lte=self.path).order_by("-path")
         )
 
+    def move(self, target, pos=None):
+        super().move(target, pos=pos)
+        collection_restricted_paths.invalidate()
+
     def get_view_restrictions(self):
         """Return a query set of all collection view restrictions that apply to this collection"""
+        if collection_restricted_paths.is_enabled():
+            return CollectionViewRestriction.objects.filter(
+                id__in=collection_restricted_paths.get_restriction_ids(self.path)
+            )
+
         return CollectionViewRestriction.objects.filter(
             collection__in=self.get_ancestors(inclusive=True)
         )
@@ -170,6 +203,8 @@ class GroupCollectionPermission(models.Model):
         Permission, verbose_name=_("permission"), on_delete=models.CASCADE
     )
 
+    wagtail_reference_index_ignore = True
+
     def __str__(self):
         return "Group %d ('%s') has permission '%s' on collection %d ('%s')" % (
             self.group.id,
@@ -48,6 +48,8 @@ class Locale(models.Model):
     objects = LocaleManager()
     all_objects = models.Manager()
 
+    wagtail_reference_index_ignore = True
+
     class Meta:
         ordering = [
             "language_code",
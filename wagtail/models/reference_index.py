@@ -0,0 +1,563 @@
+"""
+An index of the references between objects, used to find where an object such as an image,
+document or snippet is in use.
+
+Each row of ``ReferenceIndex`` records that a source object refers to a target object, along
+with the path to the field, block or rich text entity that holds the reference. References
+are found in the foreign keys of an object, the blocks of its StreamFields, the links and
+embeds of its rich text fields, and the same fields of its child objects. StreamFields are
+read in their JSON-ish representation, so chosen objects are never loaded. When an object is
+saved, the rows for the fields that have changed since it was loaded are replaced. Finding
+the usage of an object is then a single indexed query, rather than a search through every
+relation that could point to it.
+
+The ``rebuild_references_index`` management command populates the index for existing content.
+"""
+import uuid
+from contextlib import contextmanager
+from functools import lru_cache
+
+from asgiref.local import Local
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models, transaction
+from django.db.models import DEFERRED, Q
+from django.utils.translation import gettext_lazy as _
+from modelcluster.fields import ParentalKey
+from modelcluster.models import ClusterableModel, get_all_child_relations
+
+from wagtail.blocks.base import join_block_path
+from wagtail.fields import RichTextField, StreamField
+
+# Namespace for the UUIDs that stand in for content paths in the unique constraint, as
+# text columns can't be part of a unique index on all databases
+CONTENT_PATH_NAMESPACE = uuid.UUID("c1b7c6a5-0a8b-4b39-9ad9-2e64cb5a7d11")
+
+# Stands in for a field value that isn't known to match the index
+UNKNOWN_STATE = object()
+
+_updates_paused = Local()
+
+
+@contextmanager
+def pause_reference_index_updates():
+    """
+    Stops the index from being updated as objects are saved and deleted within the block,
+    for code that changes many objects and then rebuilds their rows in bulk with
+    ``ReferenceIndex.rebuild_for_objects``
+    """
+    was_paused = reference_index_updates_paused()
+    _updates_paused.value = True
+    try:
+        yield
+    finally:
+        _updates_paused.value = was_paused
+
+
+def reference_index_updates_paused():
+    return getattr(_updates_paused, "value", False)
+
+
+def get_base_model(model):
+    """
+    Returns the model at the root of the multi-table inheritance chain of the given model,
+    e.g. Page for any page type
+    """
+    model = model._meta.concrete_model
+    while model._meta.parents:
+        model = next(iter(model._meta.parents))
+    return model
+
+
+# Models of other packages that only link objects together for their own use
+IGNORED_MODELS = ["taggit.TaggedItem"]
+
+
+def model_is_ignored(model):
+    """
+    Returns True if references to or from the given model aren't recorded in the index.
+    Models opt out by setting ``wagtail_reference_index_ignore = True``; content types and
+    users are always ignored, as nearly every object refers to them, as are the models in
+    ``IGNORED_MODELS``.
+    """
+    return (
+        getattr(model, "wagtail_reference_index_ignore", False)
+        or issubclass(model, ContentType)
+        or model._meta.label == settings.AUTH_USER_MODEL
+        or model._meta.label in IGNORED_MODELS
+    )
+
+
+def get_parental_key(model):
+    """
+    Returns the ParentalKey that makes the given model a child of a ClusterableModel, if any
+    """
+    for field in model._meta.concrete_fields:
+        if isinstance(field, ParentalKey):
+            return field
+
+
+@lru_cache(maxsize=None)
+def get_indexed_fields(model):
+    """
+    Returns a ``(foreign_keys, content_fields, child_relations)`` tuple of the fields of the
+    given model that hold references to be indexed. ``content_fields`` are StreamFields and
+    rich text fields, and ``child_relations`` are the relations to child objects that hold
+    references of their own.
+    """
+    if model_is_ignored(model):
+        return (), (), ()
+
+    foreign_keys = []
+    content_fields = []
+    for field in model._meta.concrete_fields:
+        if isinstance(field, (StreamField, RichTextField)):
+            content_fields.append(field)
+        elif (
+            field.is_relation
+            and not isinstance(field, ParentalKey)
+            and not field.remote_field.parent_link
+            and field.target_field.primary_key
+            and not getattr(field, "wagtail_reference_index_ignore", False)
+            and not model_is_ignored(field.related_model)
+        ):
+            foreign_keys.append(field)
+
+    child_relations = []
+    if issubclass(model, ClusterableModel):
+        child_relations = [
+            relation
+            for relation in get_all_child_relations(model)
+            if any(get_indexed_fields(relation.related_model))
+        ]
+
+    return tuple(foreign_keys), tuple(content_fields), tuple(child_relations)
+
+
+@lru_cache(maxsize=None)
+def get_own_indexed_fields(model):
+    """
+    Returns the foreign keys and content fields of the given model that hold references,
+    leaving out its child relations
+    """
+    foreign_keys, content_fields, child_relations = get_indexed_fields(model)
+    return foreign_keys + content_fields
+
+
+def get_field_state(obj, field, loading=False):
+    """
+    Returns the value of an indexed field of the object in a form that can be compared
+    with its earlier values, and that its references can be extracted from: the ID for
+    a foreign key, the HTML of a rich text field, and the JSON-ish representation of a
+    StreamField. Returns DEFERRED if the field hasn't been loaded.
+
+    While an object is being loaded, StreamField values that aren't lazy (which means
+    they've been given as native values rather than read from the database) are
+    returned as UNKNOWN_STATE instead, as finding their representation isn't free.
+    """
+    value = obj.__dict__.get(field.attname, DEFERRED)
+    if value is DEFERRED or not isinstance(field, StreamField):
+        return value
+    if loading and not value.is_lazy:
+        return UNKNOWN_STATE
+    return tuple(field.stream_block.get_prep_value(value))
+
+
+class ReferenceIndexQuerySet(models.QuerySet):
+    def for_source_object(self, obj):
+        base_content_type = ContentType.objects.get_for_model(get_base_model(type(obj)))
+        return self.filter(base_content_type=base_content_type, object_id=str(obj.pk))
+
+    def to_object(self, obj):
+        to_content_type = ContentType.objects.get_for_model(get_base_model(type(obj)))
+        return self.filter(to_content_type=to_content_type, to_object_id=str(obj.pk))
+
+
+class ReferenceIndex(models.Model):
+    """
+    Records that the object identified by ``base_content_type`` and ``object_id`` refers to
+    the object identified by ``to_content_type`` and ``to_object_id``. Objects are identified
+    by the content type of the model at the root of their inheritance chain, so that a page
+    is always found under Page; ``content_type`` holds the specific type of the source object.
+
+    ``model_path`` is the path to the reference through the fields, child relations and block
+    types of the source model, e.g. ``body.gallery.image``, and ``content_path`` is the path
+    through the actual content of the source object, e.g. ``body.<block id>.image``.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    base_content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    # We do not use an IntegerField since primary keys are not always integers.
+    object_id = models.CharField(max_length=255)
+
+    to_content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    to_object_id = models.CharField(max_length=255)
+
+    model_path = models.TextField()
+    content_path = models.TextField()
+    content_path_hash = models.UUIDField()
+
+    objects = ReferenceIndexQuerySet.as_manager()
+
+    wagtail_reference_index_ignore = True
+
+    class Meta:
+        verbose_name = _("reference index")
+        verbose_name_plural = _("reference index")
+        unique_together = [
+            (
+                "base_content_type",
+                "object_id",
+                "to_content_type",
+                "to_object_id",
+                "content_path_hash",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["to_content_type", "to_object_id"]),
+        ]
+
+    @classmethod
+    def model_is_indexable(cls, model):
+        """
+        Returns True if objects of the given model are indexed in their own right. Child
+        objects of a ClusterableModel are indexed as part of their parent instead.
+        """
+        return get_parental_key(model) is None and any(get_indexed_fields(model))
+
+    @classmethod
+    def model_has_indexed_fields(cls, model, field_names):
+        """
+        Returns True if any of the given field names of the model hold references, so that
+        a save with ``update_fields`` that doesn't include any of them can be skipped
+        """
+        foreign_keys, content_fields, child_relations = get_indexed_fields(model)
+        indexed_field_names = {field.name for field in foreign_keys + content_fields}
+        indexed_field_names.update(field.attname for field in foreign_keys)
+        indexed_field_names.update(
+            relation.get_accessor_name() for relation in child_relations
+        )
+        return not indexed_field_names.isdisjoint(field_names)
+
+    @classmethod
+    def record_field_states(cls, obj):
+        """
+        Remembers the values of the indexed fields of an object as it's loaded from the
+        database, so that the references of only the fields that have changed are updated
+        when it's saved, without reading its rows of the index back
+        """
+        obj._reference_index_field_states = {
+            field.attname: get_field_state(obj, field, loading=True)
+            for field in get_own_indexed_fields(type(obj))
+        }
+
+    @classmethod
+    def _extract_references_from_fields(cls, obj, fields, field_states=None):
+        """
+        Yields a (model, object_id, model_path, content_path) tuple for each reference held
+        by the given indexed fields of the object, taking their values from
+        ``field_states`` where these have already been found
+        """
+        for field in fields:
+            if field_states is not None:
+                state = field_states[field.attname]
+            else:
+                state = get_field_state(obj, field)
+            if state is DEFERRED:
+                getattr(obj, field.attname)
+                state = get_field_state(obj, field)
+            if state is None:
+                continue
+
+            if field.is_relation:
+                yield field.related_model, str(state), field.name, field.name
+                continue
+
+            for model, object_id, model_path, content_path in field.extract_references(
+                state
+            ):
+                yield (
+                    model,
+                    object_id,
+                    join_block_path(field.name, model_path),
+                    join_block_path(field.name, content_path),
+                )
+
+    @classmethod
+    def _extract_references_from_object(cls, obj, child_objects=None):
+        """
+        Yields a (model, object_id, model_path, content_path) tuple for each reference held
+        by the object or its child objects. ``child_objects`` may map child relations to
+        the child objects of the object, where these are already in memory.
+        """
+        yield from cls._extract_references_from_fields(
+            obj, get_own_indexed_fields(type(obj))
+        )
+
+        for relation in get_indexed_fields(type(obj))[2]:
+            accessor_name = relation.get_accessor_name()
+            if child_objects and relation in child_objects:
+                children = child_objects[relation]
+            else:
+                children = getattr(obj, accessor_name).all()
+
+            for child in children:
+                for (
+                    model,
+                    object_id,
+                    model_path,
+                    content_path,
+                ) in cls._extract_references_from_object(child):
+                    yield (
+                        model,
+                        object_id,
+                        join_block_path(accessor_name, model_path),
+                        join_block_path(accessor_name, str(child.pk), content_path),
+                    )
+
+    @classmethod
+    def _get_references(cls, extracted_references, model_path="", content_path=""):
+        """
+        Returns a dict of the extracted references, keyed by the
+        ``(to_content_type_id, to_object_id, content_path_hash)`` that identifies each row
+        of the index for the source object. The paths of references held by a child object
+        are prefixed with the paths of the child object within the source object.
+        """
+        references = {}
+        for (
+            model,
+            object_id,
+            reference_model_path,
+            reference_content_path,
+        ) in extracted_references:
+            to_content_type = ContentType.objects.get_for_model(get_base_model(model))
+            reference_content_path = join_block_path(
+                content_path, reference_content_path
+            )
+            content_path_hash = uuid.uuid5(
+                CONTENT_PATH_NAMESPACE, reference_content_path
+            )
+            references[(to_content_type.id, object_id, content_path_hash)] = (
+                join_block_path(model_path, reference_model_path),
+                reference_content_path,
+            )
+        return references
+
+    @classmethod
+    def _build_rows(cls, source, references):
+        # Pages are indexed under their specific type, even when saved as a plain Page
+        content_type = ContentType.objects.get_for_model(
+            getattr(source, "specific_class", None) or type(source)
+        )
+        base_content_type = ContentType.objects.get_for_model(
+            get_base_model(type(source))
+        )
+        rows = []
+        for key, (model_path, content_path) in references.items():
+            to_content_type_id, to_object_id, content_path_hash = key
+            rows.append(
+                cls(
+                    content_type=content_type,
+                    base_content_type=base_content_type,
+                    object_id=str(source.pk),
+                    to_content_type_id=to_content_type_id,
+                    to_object_id=to_object_id,
+                    model_path=model_path,
+                    content_path=content_path,
+                    content_path_hash=content_path_hash,
+                )
+            )
+        return rows
+
+    @classmethod
+    def _get_source_and_paths(cls, obj):
+        """
+        Returns the object that holds the references of the given object in the index,
+        which is the object itself or the ClusterableModel it's a child object of, along
+        with the model and content paths of the object within it. The source is None if
+        the object's parent no longer exists.
+        """
+        model_path = []
+        content_path = []
+        while True:
+            parental_key = get_parental_key(type(obj))
+            if parental_key is None:
+                return obj, ".".join(model_path), ".".join(content_path)
+
+            accessor_name = parental_key.remote_field.get_accessor_name()
+            model_path.insert(0, accessor_name)
+            content_path[:0] = [accessor_name, str(obj.pk)]
+            try:
+                obj = getattr(obj, parental_key.name)
+            except ObjectDoesNotExist:
+                return None, "", ""
+            if obj is None:
+                return None, "", ""
+
+    @classmethod
+    def update_for_saved_object(cls, obj, created=False, update_fields=None):
+        """
+        Brings the rows of the index for the indexed fields of a saved object up to date.
+        These are the fields whose values have changed since the object was loaded or last
+        saved, or all of them if the object wasn't loaded from the database. The rows are
+        replaced without being read, and if no field has changed, no query is made.
+
+        Child objects of a ClusterableModel update the rows of their own fields within
+        the rows of their parent, and are saved in their own right when the parent is.
+        """
+        fields = get_own_indexed_fields(type(obj))
+        if update_fields is not None:
+            fields = [
+                field
+                for field in fields
+                if field.name in update_fields or field.attname in update_fields
+            ]
+
+        field_states = getattr(obj, "_reference_index_field_states", None)
+        new_field_states = {
+            field.attname: get_field_state(obj, field) for field in fields
+        }
+        if created or field_states is None:
+            changed_fields = fields
+        else:
+            changed_fields = [
+                field
+                for field in fields
+                if new_field_states[field.attname]
+                != field_states.get(field.attname, UNKNOWN_STATE)
+            ]
+
+        if changed_fields:
+            source, model_path, content_path = cls._get_source_and_paths(obj)
+            if source is None:
+                return
+
+            references = cls._get_references(
+                cls._extract_references_from_fields(
+                    obj, changed_fields, new_field_states
+                ),
+                model_path,
+                content_path,
+            )
+            with transaction.atomic():
+                if not created:
+                    changed_paths = Q()
+                    for field in changed_fields:
+                        field_path = join_block_path(content_path, field.name)
+                        changed_paths |= Q(content_path=field_path) | Q(
+                            content_path__startswith=field_path + "."
+                        )
+                    cls.objects.for_source_object(source).filter(changed_paths).delete()
+                if references:
+                    cls.objects.bulk_create(
+                        cls._build_rows(source, references), ignore_conflicts=True
+                    )
+
+        obj._reference_index_field_states = {**(field_states or {}), **new_field_states}
+
+    @classmethod
+    def create_for_objects(cls, objects, batch_size=1000, child_objects=None):
+        """
+        Inserts the rows of the index for objects that aren't in the index yet, such as when
+        the index is being rebuilt, without checking for existing rows. ``child_objects``
+        may map the primary key of each object to a dict of its child objects for each child
+        relation, where these are already in memory.
+        """
+        rows = []
+        for obj in objects:
+            references = cls._get_references(
+                cls._extract_references_from_object(
+                    obj, child_objects and child_objects.get(obj.pk)
+                )
+            )
+            rows.extend(cls._build_rows(obj, references))
+
+        cls.objects.bulk_create(rows, batch_size=batch_size, ignore_conflicts=True)
+        return len(rows)
+
+    @classmethod
+    def rebuild_for_objects(cls, objects, child_objects=None):
+        """
+        Replaces the rows of the index for objects of one model that have been updated in
+        bulk, without post_save being sent for each of them
+        """
+        objects = list(objects)
+        if not objects:
+            return 0
+
+        base_content_type = ContentType.objects.get_for_model(
+            get_base_model(type(objects[0]))
+        )
+        with transaction.atomic():
+            cls.objects.filter(
+                base_content_type=base_content_type,
+                object_id__in=[str(obj.pk) for obj in objects],
+            ).delete()
+            return cls.create_for_objects(objects, child_objects=child_objects)
+
+    @classmethod
+    def remove_for_objects(cls, objects):
+        """
+        Deletes the rows of the index for deleted objects of one model, with a single query
+        for all of them. The references held by child objects are deleted from the rows of
+        their parent. The parent of a child object that isn't nested within another one
+        isn't loaded, as it may be in the middle of being deleted itself.
+        """
+        objects = list(objects)
+        if not objects:
+            return
+
+        model = type(objects[0])
+        parental_key = get_parental_key(model)
+        if parental_key is None:
+            cls.objects.filter(
+                base_content_type=ContentType.objects.get_for_model(
+                    get_base_model(model)
+                ),
+                object_id__in=[str(obj.pk) for obj in objects],
+            ).delete()
+            return
+
+        if get_parental_key(parental_key.related_model) is None:
+            base_content_type = ContentType.objects.get_for_model(
+                get_base_model(parental_key.related_model)
+            )
+            accessor_name = parental_key.remote_field.get_accessor_name()
+            child_paths = Q()
+            for obj in objects:
+                child_paths |= Q(
+                    object_id=str(parental_key.value_from_object(obj)),
+                    content_path__startswith="%s.%s." % (accessor_name, obj.pk),
+                )
+            cls.objects.filter(base_content_type=base_content_type).filter(
+                child_paths
+            ).delete()
+            return
+
+        for obj in objects:
+            source, model_path, content_path = cls._get_source_and_paths(obj)
+            if source is not None:
+                cls.objects.for_source_object(source).filter(
+                    content_path__startswith=content_path + "."
+                ).delete()
+
+    @classmethod
+    def get_references_for_object(cls, obj):
+        """
+        Returns a queryset of the references held by the given object
+        """
+        return cls.objects.for_source_object(obj)
+
+    @classmethod
+    def get_references_to(cls, obj):
+        """
+        Returns a queryset of the references to the given object
+        """
+        return cls.objects.to_object(obj)
@@ -0,0 +1,157 @@
+"""
+Helpers for the compact storage of ``Revision.content``.
+
+By default, each revision stores a full JSON snapshot of the object in its ``content``
+column. When ``WAGTAIL_REVISION_CONTENT_COMPRESSION`` and/or ``WAGTAIL_REVISION_CONTENT_DELTAS``
+are set, new revisions instead store their content compressed in ``compressed_content``,
+optionally as a delta against the previous revision of the same object. Every
+``WAGTAIL_REVISION_KEYFRAME_INTERVAL`` revisions a full snapshot (a "keyframe") is stored,
+so that decoding a revision never has to walk more than that many revisions.
+"""
+import json
+import zlib
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+
+DEFAULT_KEYFRAME_INTERVAL = 10
+
+
+def _get_zstd_codec():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImproperlyConfigured(
+            "The 'zstandard' package is required to compress revision content with zstd"
+        )
+
+    return (
+        lambda data: zstandard.ZstdCompressor().compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+CODECS = {
+    "zlib": lambda: (zlib.compress, zlib.decompress),
+    "zstd": _get_zstd_codec,
+}
+
+
+def get_codec(name):
+    """
+    Returns a ``(compress, decompress)`` pair of functions for the given codec name
+    """
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ImproperlyConfigured(
+            "Unknown revision content compression '%s'. Valid options are: %s"
+            % (name, ", ".join(CODECS))
+        )
+
+
+def get_storage_options():
+    """
+    Returns a ``(compression, use_deltas, keyframe_interval)`` tuple describing how new
+    revisions should store their content. ``compression`` is ``None`` when revisions are
+    stored as plain JSON.
+    """
+    compression = getattr(settings, "WAGTAIL_REVISION_CONTENT_COMPRESSION", None)
+    use_deltas = getattr(settings, "WAGTAIL_REVISION_CONTENT_DELTAS", False)
+    keyframe_interval = getattr(
+        settings, "WAGTAIL_REVISION_KEYFRAME_INTERVAL", DEFAULT_KEYFRAME_INTERVAL
+    )
+
+    if use_deltas and not compression:
+        # Deltas are always stored in the compressed column
+        compression = "zlib"
+
+    return compression, use_deltas, keyframe_interval
+
+
+def dump_content(content):
+    return json.dumps(content, cls=DjangoJSONEncoder, sort_keys=True)
+
+
+def compress_content(content, compression):
+    compress, decompress = get_codec(compression)
+    return compress(dump_content(content).encode("utf-8"))
+
+
+def decompress_content(data, compression):
+    compress, decompress = get_codec(compression)
+    return json.loads(decompress(bytes(data)).decode("utf-8"))
+
+
+def make_delta(base, content):
+    """
+    Returns a delta that turns the ``base`` content into ``content``. Both are the dicts
+    returned by ``serializable_data()``, so the delta replaces whole top-level values.
+    """
+    return {
+        "set": {
+            key: value
+            for key, value in content.items()
+            if key not in base or base[key] != value
+        },
+        "unset": [key for key in base if key not in content],
+    }
+
+
+def apply_delta(base, delta):
+    content = dict(base)
+    for key in delta["unset"]:
+        content.pop(key, None)
+    content.update(delta["set"])
+    return content
+
+
+class RevisionContentDescriptor(DeferredAttribute):
+    """
+    Decodes compact revision content the first time ``Revision.content`` is accessed, so
+    that code reading the attribute always gets the full JSON snapshot.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        value = super().__get__(instance, cls)
+        if value is None and instance.content_encoding:
+            value = instance._decode_content()
+            instance.__dict__[self.field.attname] = value
+
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+
+
+class RevisionContentField(models.JSONField):
+    """
+    The JSON field holding ``Revision.content``. Revisions stored in compact form save
+    ``NULL`` in this column and keep their content in ``Revision.compressed_content``.
+    """
+
+    descriptor_class = RevisionContentDescriptor
+
+    def pre_save(self, model_instance, add):
+        if model_instance.content_encoding:
+            return None
+
+        return super().pre_save(model_instance, add)
+
+
+def rebase_revision_deltas(collector, field, sub_objs, using):
+    """
+    ``on_delete`` handler for ``Revision.delta_base``. Revisions stored as a delta against a
+    revision that is being deleted are rewritten as keyframes, unless they are being deleted too.
+    """
+    deleted_revisions = collector.data.get(field.model, set())
+
+    for revision in sub_objs:
+        if revision not in deleted_revisions:
+            revision.store_content_as_keyframe()
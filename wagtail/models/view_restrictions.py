@@ -4,10 +4,12 @@ documents. These may be subclassed to accommodate specific models such as Page o
 but the definitions here should remain generic and not depend on the base wagtail.models
 module or specific models defined there.
 """
+import uuid
 
 from django.conf import settings
 from django.contrib.auth.models import Group
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
 
@@ -28,6 +30,8 @@ class BaseViewRestriction(models.Model):
     password = models.CharField(verbose_name=_("password"), max_length=255, blank=True)
     groups = models.ManyToManyField(Group, verbose_name=_("groups"), blank=True)
 
+    wagtail_reference_index_ignore = True
+
     def accept_request(self, request):
         if self.restriction_type == BaseViewRestriction.PASSWORD:
             passed_restrictions = request.session.get(
@@ -72,3 +76,71 @@ class BaseViewRestriction(models.Model):
         abstract = True
         verbose_name = _("view restriction")
         verbose_name_plural = _("view restrictions")
+
+
+class RestrictedPathMap:
+    """
+    A map from the tree paths of restricted objects (such as pages or collections) to the
+    IDs of the view restrictions on them, used to tell whether an object is restricted
+    without querying the restrictions on all of its ancestors.
+
+    As very few objects are usually restricted, the map is small enough to be kept in
+    memory for the lifetime of the process. It is rebuilt whenever ``invalidate()`` is called
+    in any process, using a version number stored in Django's cache.
+
+    Subclasses must set ``cache_key`` and ``steplen`` (the length of each step in the tree
+    paths), and implement ``build()``.
+    """
+
+    cache_key = None
+    steplen = None
+
+    def __init__(self):
+        self._version = None
+        self._paths = None
+
+    def build(self):
+        """
+        Returns a dict mapping each restricted path to a tuple of restriction IDs
+        """
+        raise NotImplementedError
+
+    def is_enabled(self):
+        return getattr(settings, "WAGTAIL_VIEW_RESTRICTION_CACHE", False)
+
+    def get_paths(self):
+        version = cache.get(self.cache_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.set(self.cache_key, version, None)
+
+        if self._paths is None or self._version != version:
+            self._paths = self.build()
+            self._version = version
+
+        return self._paths
+
+    def get_restriction_ids(self, path):
+        """
+        Returns the IDs of the restrictions that apply to the object with the given path,
+        including those on its ancestors
+        """
+        paths = self.get_paths()
+
+        return [
+            restriction_id
+            for length in range(self.steplen, len(path) + 1, self.steplen)
+            for restriction_id in paths.get(path[:length], ())
+        ]
+
+    def _bump_version(self):
+        self._paths = None
+        cache.set(self.cache_key, uuid.uuid4().hex, None)
+
+    def invalidate(self):
+        if self.is_enabled():
+            self._bump_version()
+
+            # Other processes may rebuild the map before the change is committed, so
+            # make sure they rebuild it again afterwards
+            transaction.on_commit(self._bump_version)
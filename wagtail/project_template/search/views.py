@@ -12,10 +12,9 @@ def search(request):
     # Search
     if search_query:
         search_results = Page.objects.live().search(search_query)
-        query = Query.get(search_query)
 
         # Record hit
-        query.add_hit()
+        Query.record_hit(search_query)
     else:
         search_results = Page.objects.none()
 
@@ -34,6 +34,51 @@ class TreeQuerySet(MP_NodeQuerySet):
 
         return q
 
+    def descendant_of_paths_q(self, paths):
+        """
+        Returns a Q object matching the nodes with any of the given paths, along with all
+        of their descendants.
+
+        Rather than a ``path__startswith`` condition for every path, paths that are
+        descendants of other paths are dropped, and the remaining ones are matched as
+        ranges of paths, with the ranges of consecutive siblings merged together. This keeps
+        the query compact, however many paths are given.
+        """
+        steplen = self.model.steplen
+        ranges = []
+
+        for path in sorted(set(paths)):
+            if ranges:
+                start, end = ranges[-1]
+                if path.startswith(start) or (end is not None and path < end):
+                    # This path is within the previous range
+                    continue
+
+            # Descendants of this path sort before the path of its next sibling
+            step = self.model._int2str(self.model._str2int(path[-steplen:]) + 1)
+            if len(step) > steplen:
+                # This is the last possible sibling, so fall back to a prefix match
+                ranges.append((path, None))
+                continue
+
+            next_sibling_path = (
+                path[:-steplen] + self.model.alphabet[0] * (steplen - len(step)) + step
+            )
+            if ranges and ranges[-1][1] == path:
+                ranges[-1] = (ranges[-1][0], next_sibling_path)
+            else:
+                ranges.append((path, next_sibling_path))
+
+        q = Q()
+        for start, end in ranges:
+            if end is None:
+                q |= Q(path__startswith=start)
+            else:
+                q |= Q(path__gte=start, path__lt=end)
+
+        # do not match any node if no paths were given.
+        return q if q else Q(pk__in=[])
+
     def descendant_of(self, other, inclusive=False):
         """
         This filters the QuerySet to only contain pages that descend from the specified page.
@@ -145,13 +190,50 @@ class PageQuerySet(SearchableQuerySetMixin, TreeQuerySet):
         super().__init__(*args, **kwargs)
         # set by defer_streamfields()
         self._defer_streamfields = False
+        # set by annotate_urls()
+        self._annotate_urls = False
+        self._annotate_urls_request = None
 
     def _clone(self):
         """Ensure clones inherit custom attribute values."""
         clone = super()._clone()
         clone._defer_streamfields = self._defer_streamfields
+        clone._annotate_urls = self._annotate_urls
+        clone._annotate_urls_request = self._annotate_urls_request
         return clone
 
+    def _fetch_all(self):
+        annotate_urls = self._annotate_urls and self._result_cache is None
+        super()._fetch_all()
+        if annotate_urls:
+            self._result_cache = list(self._with_url_parts(self._result_cache))
+
+    def _iterator(self, use_chunked_fetch, chunk_size):
+        iterator = super()._iterator(use_chunked_fetch, chunk_size)
+        if self._annotate_urls:
+            iterator = self._with_url_parts(iterator)
+        yield from iterator
+
+    def _with_url_parts(self, objects):
+        from wagtail.models import Page
+
+        request = self._annotate_urls_request
+        site_root_paths = None
+
+        for obj in objects:
+            # Skip the results of values() and values_list()
+            if isinstance(obj, Page):
+                if site_root_paths is None:
+                    site_root_paths = obj._get_site_root_paths(request)
+
+                obj._wagtail_cached_site_root_paths = site_root_paths
+                obj._annotated_url_parts = (
+                    request,
+                    Page.get_url_parts(obj, request=request),
+                )
+
+            yield obj
+
     def live_q(self):
         return Q(live=True)
 
@@ -236,7 +318,11 @@ class PageQuerySet(SearchableQuerySetMixin, TreeQuerySet):
         return self.exclude(self.exact_type_q(*types))
 
     def private_q(self):
-        from wagtail.models import PageViewRestriction
+        from wagtail.models import PageViewRestriction, page_restricted_paths
+
+        if page_restricted_paths.is_enabled():
+            q = page_restricted_paths.get_private_q()
+            return q if q else Q(pk__in=[])
 
         q = Q()
         for restriction in PageViewRestriction.objects.select_related("page").all():
@@ -393,6 +479,20 @@ class PageQuerySet(SearchableQuerySetMixin, TreeQuerySet):
             return clone
         return clone.defer(*streamfield_names)
 
+    def annotate_urls(self, request=None):
+        """
+        Performance optimisation for rendering links to many pages, such as in menus,
+        listings and sitemaps. Computes the URL of each page when the queryset is
+        evaluated, looking up the site root paths only once for the whole result set
+        and without fetching the specific pages. The URLs are used by ``get_url_parts``
+        (and so by ``url``, ``full_url``, ``get_url``, ``relative_url`` and the ``pageurl``
+        template tag) when called with the same ``request``.
+        """
+        clone = self._clone()
+        clone._annotate_urls = True
+        clone._annotate_urls_request = request
+        return clone
+
     def specific(self, defer=False):
         """
         This efficiently gets all the specific pages for the queryset, using
@@ -8,7 +8,14 @@ from django.utils.html import strip_tags
 from django.utils.safestring import mark_safe
 
 from wagtail.rich_text.feature_registry import FeatureRegistry
-from wagtail.rich_text.rewriters import EmbedRewriter, LinkRewriter, MultiRuleRewriter
+from wagtail.rich_text.rewriters import (
+    FIND_A_TAG,
+    FIND_EMBED_TAG,
+    EmbedRewriter,
+    LinkRewriter,
+    MultiRuleRewriter,
+    extract_attrs,
+)
 
 features = FeatureRegistry()
 
@@ -49,6 +56,28 @@ def expand_db_html(html):
     return FRONTEND_REWRITER(html)
 
 
+def extract_references_from_rich_text(html):
+    """
+    Yields a (model, object_id, model_path, content_path) tuple for each object referenced by
+    a link or embed within database-representation HTML, as reported by the handler registered
+    for its link type or embed type
+    """
+    link_handlers = features.get_link_types()
+    embed_handlers = features.get_embed_types()
+
+    for regex, type_attribute, handlers in [
+        (FIND_A_TAG, "linktype", link_handlers),
+        (FIND_EMBED_TAG, "embedtype", embed_handlers),
+    ]:
+        for match in regex.finditer(html):
+            attrs = extract_attrs(match.group(1))
+            try:
+                handler = handlers[attrs[type_attribute]]
+            except KeyError:
+                continue
+            yield from handler.extract_references(attrs)
+
+
 def get_text_for_indexing(richtext):
     """
     Return a plain text version of a rich text string, suitable for search indexing;
@@ -112,6 +141,21 @@ class EntityHandler:
         model = cls.get_model()
         return model._default_manager.get(id=attrs["id"])
 
+    @classmethod
+    def extract_references(cls, attrs: dict):
+        """
+        Yields a (model, object_id, model_path, content_path) tuple for each object that
+        the entity with the given attributes refers to. By default, this is the instance
+        returned by get_instance(), identified by the 'id' attribute.
+        """
+        try:
+            model = cls.get_model()
+        except NotImplementedError:
+            return
+
+        if attrs.get("id"):
+            yield model, str(attrs["id"]), "", ""
+
     @staticmethod
     def expand_db_attributes(attrs: dict) -> str:
         """
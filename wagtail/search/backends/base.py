@@ -1,5 +1,9 @@
+import base64
+import datetime
+import json
 from warnings import warn
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models.functions.datetime import Extract as ExtractDate
 from django.db.models.functions.datetime import ExtractYear
 from django.db.models.lookups import Lookup
@@ -8,6 +12,11 @@ from django.db.models.sql.where import SubqueryConstraint, WhereNode
 
 from wagtail.search.index import class_is_indexed, get_indexed_models
 from wagtail.search.query import MATCH_ALL, PlainText
+from wagtail.search.utils import (
+    get_keyset_filter,
+    get_keyset_ordering,
+    get_keyset_values,
+)
 
 
 class FilterError(Exception):
@@ -32,6 +41,42 @@ class OrderByFieldError(FieldError):
     pass
 
 
+class InvalidCursorError(Exception):
+    pass
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # DjangoJSONEncoder truncates microseconds, which would make cursors inexact
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+
+        return super().default(o)
+
+
+def encode_cursor(position):
+    """
+    Encodes a position in a set of search results as an opaque, URL-safe token
+    """
+    data = json.dumps(position, cls=CursorJSONEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decodes a token created by encode_cursor. Raises InvalidCursorError if the token is malformed
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (TypeError, ValueError, AttributeError):
+        raise InvalidCursorError("Invalid cursor: %r" % cursor)
+
+    if not isinstance(position, dict):
+        raise InvalidCursorError("Invalid cursor: %r" % cursor)
+
+    return position
+
+
 class BaseSearchQueryCompiler:
     DEFAULT_OPERATOR = "or"
 
@@ -234,6 +279,16 @@ class BaseSearchResults:
         self._count_cache = None
         self._score_field = None
 
+        # Total number of hits for the query, ignoring any limits. This is shared between
+        # all clones of these results so that backends which report the total alongside a
+        # page of hits can answer count() on any slice without making another request.
+        self._total_hits_cache = {}
+
+        # Set by search_after(). Results fetched in this mode can provide a next_cursor.
+        self._use_cursor = False
+        self._search_after = None
+        self._keyset_ordering = None
+
     def _set_limits(self, start=None, stop=None):
         if stop is not None:
             if self.stop is not None:
@@ -255,6 +310,9 @@ class BaseSearchResults:
         new.start = self.start
         new.stop = self.stop
         new._score_field = self._score_field
+        new._total_hits_cache = self._total_hits_cache
+        new._use_cursor = self._use_cursor
+        new._search_after = self._search_after
         return new
 
     def _do_search(self):
@@ -263,6 +321,132 @@ class BaseSearchResults:
     def _do_count(self):
         raise NotImplementedError
 
+    def _set_total_hits(self, total_hits):
+        self._total_hits_cache["total"] = total_hits
+
+    def _apply_limits_to_count(self, hit_count):
+        hit_count -= self.start
+        if self.stop is not None:
+            hit_count = min(hit_count, self.stop - self.start)
+
+        return max(hit_count, 0)
+
+    def _get_next_position(self, results):
+        """
+        Returns the position (as a JSON-serialisable dict) from which the results that follow
+        ``results`` can be fetched, or None if there are no more results.
+
+        By default, this is the offset of the next result. If the results were fetched from
+        a queryset prepared by _apply_keyset_pagination(), it records the sort values of the
+        last result instead. Other backends that support keyset pagination override this to
+        return their own ``{"after": [...]}`` position.
+        """
+        if self._keyset_ordering is not None:
+            if (
+                results
+                and self.stop is not None
+                and len(results) >= self.stop - self.start
+            ):
+                return {"after": get_keyset_values(self._keyset_ordering, results[-1])}
+            return
+
+        if self.stop is not None and len(results) >= self.stop - self.start:
+            return {"offset": self.stop}
+
+    def search_after(self, cursor):
+        """
+        Returns a copy of these results that starts after the position given by ``cursor``,
+        a token taken from the ``next_cursor`` of an earlier page of results. Pass ``None``
+        to start from the beginning.
+
+        Where the backend supports it, the position is recorded as the sort values of the
+        last result rather than an offset, so fetching a page costs the same no matter how
+        deep into the results it is.
+        """
+        if self.start or self.stop is not None or self._use_cursor:
+            raise TypeError(
+                "search_after() can only be used on unsliced search results"
+            )
+
+        new = self._clone()
+        new._use_cursor = True
+
+        if cursor is not None:
+            position = decode_cursor(cursor)
+
+            if isinstance(position.get("after"), list):
+                new._search_after = position["after"]
+            elif isinstance(position.get("offset"), int) and position["offset"] >= 0:
+                new._set_limits(start=position["offset"])
+            else:
+                raise InvalidCursorError("Invalid cursor: %r" % cursor)
+
+        return new
+
+    def _apply_keyset_pagination(self, queryset):
+        """
+        Used by database backends on results fetched through search_after(). Filters
+        ``queryset`` down to the rows that come after the cursor position, if its ordering
+        allows it. Otherwise the queryset is returned unchanged and offsets are used instead.
+        """
+        if not self._use_cursor:
+            return queryset
+
+        if not queryset.ordered:
+            queryset = queryset.order_by("pk")
+
+        ordering = get_keyset_ordering(queryset)
+
+        if ordering is None:
+            if self._search_after is not None:
+                raise InvalidCursorError(
+                    "This cursor cannot be used with the ordering of these results"
+                )
+
+            return queryset
+
+        self._keyset_ordering = ordering
+
+        if self._search_after is not None:
+            if len(self._search_after) != len(ordering):
+                raise InvalidCursorError(
+                    "This cursor cannot be used with the ordering of these results"
+                )
+
+            queryset = queryset.filter(get_keyset_filter(ordering, self._search_after))
+
+        return queryset
+
+    @property
+    def next_cursor(self):
+        """
+        A token that can be passed to search_after() to fetch the results that follow these
+        ones, or None if there are no more results. Only available on results returned by
+        search_after().
+        """
+        if not self._use_cursor:
+            return None
+
+        position = self._get_next_position(self.results())
+        if position is not None:
+            return encode_cursor(position)
+
+    def iter_all(self, batch_size=100):
+        """
+        Iterates over every result, fetching them from the backend ``batch_size`` at a time.
+        This uses search_after() so it can walk through results that are too deep to reach
+        by slicing.
+        """
+        cursor = None
+
+        while True:
+            batch = self.search_after(cursor)[:batch_size]
+            yield from batch
+
+            cursor = batch.next_cursor
+            if cursor is None:
+                break
+
     def results(self):
         if self._results_cache is None:
             self._results_cache = list(self._do_search())
@@ -272,6 +456,10 @@ class BaseSearchResults:
         if self._count_cache is None:
             if self._results_cache is not None:
                 self._count_cache = len(self._results_cache)
+            elif "total" in self._total_hits_cache:
+                self._count_cache = self._apply_limits_to_count(
+                    self._total_hits_cache["total"]
+                )
             else:
                 self._count_cache = self._do_count()
         return self._count_cache
@@ -364,7 +552,8 @@ class BaseSearchBackend:
     catch_indexing_errors = False
 
     def __init__(self, params):
-        pass
+        # Whether objects are skipped when saving them doesn't change their indexed content
+        self.skip_unchanged = params.pop("SKIP_UNCHANGED", True)
 
     def get_index_for_model(self, model):
         return NullIndex()
@@ -170,7 +170,9 @@ class DatabaseSearchResults(BaseSearchResults):
         else:
             queryset = queryset.filter(q)
 
-        return queryset.distinct()[self.start : self.stop]
+        queryset = self._apply_keyset_pagination(queryset.distinct())
+
+        return queryset[self.start : self.stop]
 
     def _do_search(self):
         queryset = self.get_queryset()
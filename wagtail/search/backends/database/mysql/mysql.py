@@ -88,6 +88,18 @@ class ObjectIndexer:
                 for sub_field in field.fields:
                     yield from self.prepare_field(sub_obj, sub_field)
 
+    @cached_property
+    def prepared_fields(self):
+        """
+        Returns the prepared values of all fields to index, including those of related objects.
+        These are extracted in a single pass and then shared by the title, body and autocomplete columns.
+        """
+        return [
+            prepared_field
+            for field in self.search_fields
+            for prepared_field in self.prepare_field(self.obj, field)
+        ]
+
     @cached_property
     def id(self):
         """
@@ -101,13 +113,12 @@ class ObjectIndexer:
         Returns all values to index as "title". This is the value of all SearchFields that have the field_name 'title'
         """
         texts = []
-        for field in self.search_fields:
-            for current_field, value in self.prepare_field(self.obj, field):
-                if (
-                    isinstance(current_field, SearchField)
-                    and current_field.field_name == "title"
-                ):
-                    texts.append((value))
+        for current_field, value in self.prepared_fields:
+            if (
+                isinstance(current_field, SearchField)
+                and current_field.field_name == "title"
+            ):
+                texts.append((value))
 
         return " ".join(texts)
 
@@ -117,13 +128,12 @@ class ObjectIndexer:
         Returns all values to index as "body". This is the value of all SearchFields excluding the title
         """
         texts = []
-        for field in self.search_fields:
-            for current_field, value in self.prepare_field(self.obj, field):
-                if (
-                    isinstance(current_field, SearchField)
-                    and not current_field.field_name == "title"
-                ):
-                    texts.append((value))
+        for current_field, value in self.prepared_fields:
+            if (
+                isinstance(current_field, SearchField)
+                and not current_field.field_name == "title"
+            ):
+                texts.append((value))
 
         return " ".join(texts)
 
@@ -133,10 +143,9 @@ class ObjectIndexer:
         Returns all values to index as "autocomplete". This is the value of all AutocompleteFields
         """
         texts = []
-        for field in self.search_fields:
-            for current_field, value in self.prepare_field(self.obj, field):
-                if isinstance(current_field, AutocompleteField):
-                    texts.append((value))
+        for current_field, value in self.prepared_fields:
+            if isinstance(current_field, AutocompleteField):
+                texts.append((value))
 
         return " ".join(texts)
 
@@ -553,6 +562,15 @@ class MySQLSearchResults(BaseSearchResults):
             start = self.start
             stop = self.stop
 
+        if self._use_cursor:
+            queryset = self.query_compiler.search(
+                self.query_compiler.get_config(self.backend),
+                None,
+                None,
+                score_field=self._score_field,
+            )
+            return self._apply_keyset_pagination(queryset)[start:stop]
+
         return self.query_compiler.search(
             self.query_compiler.get_config(self.backend),
             start,
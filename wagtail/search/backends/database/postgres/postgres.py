@@ -109,6 +109,18 @@ class ObjectIndexer:
             ]
         )
 
+    @cached_property
+    def prepared_fields(self):
+        """
+        Returns the prepared values of all fields to index, including those of related objects.
+        These are extracted in a single pass and then shared by the title, body and autocomplete columns.
+        """
+        return [
+            prepared_field
+            for field in self.search_fields
+            for prepared_field in self.prepare_field(self.obj, field)
+        ]
+
     @cached_property
     def id(self):
         """
@@ -122,13 +134,12 @@ class ObjectIndexer:
         Returns all values to index as "title". This is the value of all SearchFields that have the field_name 'title'
         """
         texts = []
-        for field in self.search_fields:
-            for current_field, boost, value in self.prepare_field(self.obj, field):
-                if (
-                    isinstance(current_field, SearchField)
-                    and current_field.field_name == "title"
-                ):
-                    texts.append((value, boost))
+        for current_field, boost, value in self.prepared_fields:
+            if (
+                isinstance(current_field, SearchField)
+                and current_field.field_name == "title"
+            ):
+                texts.append((value, boost))
 
         return self.as_vector(texts)
 
@@ -138,13 +149,12 @@ class ObjectIndexer:
         Returns all values to index as "body". This is the value of all SearchFields excluding the title
         """
         texts = []
-        for field in self.search_fields:
-            for current_field, boost, value in self.prepare_field(self.obj, field):
-                if (
-                    isinstance(current_field, SearchField)
-                    and not current_field.field_name == "title"
-                ):
-                    texts.append((value, boost))
+        for current_field, boost, value in self.prepared_fields:
+            if (
+                isinstance(current_field, SearchField)
+                and not current_field.field_name == "title"
+            ):
+                texts.append((value, boost))
 
         return self.as_vector(texts)
 
@@ -154,10 +164,9 @@ class ObjectIndexer:
         Returns all values to index as "autocomplete". This is the value of all AutocompleteFields
         """
         texts = []
-        for field in self.search_fields:
-            for current_field, boost, value in self.prepare_field(self.obj, field):
-                if isinstance(current_field, AutocompleteField):
-                    texts.append((value, boost))
+        for current_field, boost, value in self.prepared_fields:
+            if isinstance(current_field, AutocompleteField):
+                texts.append((value, boost))
 
         return self.as_vector(texts, for_autocomplete=True)
 
@@ -652,6 +661,15 @@ class PostgresSearchResults(BaseSearchResults):
             start = self.start
             stop = self.stop
 
+        if self._use_cursor:
+            queryset = self.query_compiler.search(
+                self.query_compiler.get_config(self.backend),
+                None,
+                None,
+                score_field=self._score_field,
+            )
+            return self._apply_keyset_pagination(queryset)[start:stop]
+
         return self.query_compiler.search(
             self.query_compiler.get_config(self.backend),
             start,
@@ -12,7 +12,10 @@ class BM25(Func):
     function = "bm25"
     output_field = FloatField()
 
-    def __init__(self):
+    def __init__(self, weights=None, table="wagtailsearch_indexentry_fts"):
+        # weights are given in the order in which the columns were declared on the FTS table
+        self.weights = weights or ()
+        self.table = table
         expressions = ()
         super().__init__(*expressions)
 
@@ -23,7 +26,8 @@ class BM25(Func):
         function=None,
         template=None,
     ):
-        sql, params = "bm25(wagtailsearch_indexentry_fts)", []
+        arguments = [self.table] + ["%s"] * len(self.weights)
+        sql, params = "bm25(%s)" % ", ".join(arguments), list(self.weights)
         return sql, params
 
 
@@ -75,12 +79,10 @@ class Lexeme(LexemeCombinable, Value):
 
         template = '"%s"'
 
-        label = ""
         if self.prefix:
-            label += "*"
-
-        if label:
-            param = "{}{}".format(param, label)
+            # The prefix operator must follow the closing quote, otherwise FTS5 takes
+            # the asterisk as part of the string
+            template += "*"
 
         return template, [param]
 
@@ -172,15 +174,19 @@ class CombinedSearchQueryExpression(SearchQueryCombinable, CombinedExpression):
 
 class MatchExpression(Expression):
     filterable = True
-    template = (
-        "wagtailsearch_indexentry_fts MATCH %s"  # TODO: Can the table name be inferred?
-    )
+    template = "%s MATCH %%s"  # TODO: Can the table name be inferred?
     output_field = BooleanField()
 
-    def __init__(self, columns: List[str], query: SearchQueryCombinable) -> None:
+    def __init__(
+        self,
+        columns: List[str],
+        query: SearchQueryCombinable,
+        table: str = "wagtailsearch_indexentry_fts",
+    ) -> None:
         super().__init__(output_field=self.output_field)
         self.columns = columns
         self.query = query
+        self.table = table
 
     def as_sql(self, compiler, connection):
         joined_columns = " ".join(
@@ -195,7 +201,7 @@ class MatchExpression(Expression):
                 column=joined_columns, query=formatted_query
             )
         ]  # Build the full MATCH search query. It will be a parameter to the template, so no SQL injections are possible here.
-        return (self.template, params)
+        return (self.template % self.table, params)
 
 
 class AndNot(SearchQuery):
@@ -2,7 +2,7 @@ from collections import OrderedDict
 from functools import reduce
 
 from django.db import DEFAULT_DB_ALIAS, NotSupportedError, connections, transaction
-from django.db.models import Avg, Count, F, Manager, Q, TextField
+from django.db.models import Avg, Count, F, FloatField, Manager, Q, TextField, Value
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.functions import Cast, Length
 from django.db.utils import OperationalError
@@ -33,6 +33,25 @@ from .query import (
     SearchQueryExpression,
     normalize,
 )
+from .utils import fts5_trigram_available, fts_trigram_table_exists
+
+# True if the trigram FTS table can be used for autocomplete, False if not, None if untested
+USE_TRIGRAM_AUTOCOMPLETE = None
+
+
+def trigram_autocomplete_enabled():
+    """
+    Returns True if autocomplete queries can use the trigram FTS table. This needs
+    SQLite 3.34 or later, and the table to have been created by wagtailsearch migration 0007.
+    """
+    global USE_TRIGRAM_AUTOCOMPLETE
+
+    if USE_TRIGRAM_AUTOCOMPLETE is None:
+        USE_TRIGRAM_AUTOCOMPLETE = (
+            fts5_trigram_available() and fts_trigram_table_exists()
+        )
+
+    return USE_TRIGRAM_AUTOCOMPLETE
 
 
 class ObjectIndexer:
@@ -82,6 +101,18 @@ class ObjectIndexer:
                 for sub_field in field.fields:
                     yield from self.prepare_field(sub_obj, sub_field)
 
+    @cached_property
+    def prepared_fields(self):
+        """
+        Returns the prepared values of all fields to index, including those of related objects.
+        These are extracted in a single pass and then shared by the title, body and autocomplete columns.
+        """
+        return [
+            prepared_field
+            for field in self.search_fields
+            for prepared_field in self.prepare_field(self.obj, field)
+        ]
+
     @cached_property
     def id(self):
         """
@@ -95,13 +126,12 @@ class ObjectIndexer:
         Returns all values to index as "title". This is the value of all SearchFields that have the field_name 'title'
         """
         texts = []
-        for field in self.search_fields:
-            for current_field, value in self.prepare_field(self.obj, field):
-                if (
-                    isinstance(current_field, SearchField)
-                    and current_field.field_name == "title"
-                ):
-                    texts.append((value))
+        for current_field, value in self.prepared_fields:
+            if (
+                isinstance(current_field, SearchField)
+                and current_field.field_name == "title"
+            ):
+                texts.append((value))
 
         return " ".join(texts)
 
@@ -111,13 +141,12 @@ class ObjectIndexer:
         Returns all values to index as "body". This is the value of all SearchFields excluding the title
         """
         texts = []
-        for field in self.search_fields:
-            for current_field, value in self.prepare_field(self.obj, field):
-                if (
-                    isinstance(current_field, SearchField)
-                    and not current_field.field_name == "title"
-                ):
-                    texts.append((value))
+        for current_field, value in self.prepared_fields:
+            if (
+                isinstance(current_field, SearchField)
+                and not current_field.field_name == "title"
+            ):
+                texts.append((value))
 
         return " ".join(texts)
 
@@ -127,10 +156,9 @@ class ObjectIndexer:
         Returns all values to index as "autocomplete". This is the value of all AutocompleteFields
         """
         texts = []
-        for field in self.search_fields:
-            for current_field, value in self.prepare_field(self.obj, field):
-                if isinstance(current_field, AutocompleteField):
-                    texts.append((value))
+        for current_field, value in self.prepared_fields:
+            if isinstance(current_field, AutocompleteField):
+                texts.append((value))
 
         return " ".join(texts)
 
@@ -316,6 +344,8 @@ class SQLiteSearchQueryCompiler(BaseSearchQueryCompiler):
     DEFAULT_OPERATOR = "AND"
     LAST_TERM_IS_PREFIX = False
     TARGET_SEARCH_FIELD_TYPE = SearchField
+    FTS_TABLE = "wagtailsearch_indexentry_fts"
+    FTS_RELATION = "index_entries__sqliteftsindexentry"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -431,9 +461,49 @@ class SQLiteSearchQueryCompiler(BaseSearchQueryCompiler):
             built_query = self.build_search_query_content(query, config=config)
         return built_query
 
+    def get_bm25_weights(self):
+        """
+        Returns the weights to give bm25() for each column of the FTS table, in the order
+        they were declared (autocomplete, body, title).
+
+        The title column is weighted by the boost of the "title" SearchField. All other
+        SearchFields are indexed together into the body column, so that is weighted by
+        their average boost.
+        """
+        if self.fields is None:
+            search_fields = self.queryset.model.get_search_fields()
+        else:
+            search_fields = self.search_fields.values()
+
+        title_boost = 1.0
+        body_boosts = []
+
+        def add_boosts(fields):
+            nonlocal title_boost
+
+            for field in fields:
+                if isinstance(field, RelatedFields):
+                    add_boosts(field.fields)
+                elif isinstance(field, SearchField):
+                    boost = field.boost if field.boost is not None else 1.0
+                    if field.field_name == "title":
+                        title_boost = boost
+                    else:
+                        body_boosts.append(boost)
+
+        add_boosts(search_fields)
+
+        body_boost = sum(body_boosts) / len(body_boosts) if body_boosts else 1.0
+
+        return (1.0, float(body_boost), float(title_boost))
+
     def build_tsrank(self, vector, query, config=None, boost=1.0):
         if isinstance(query, (Phrase, PlainText, Not)):
-            rank_expression = BM25()
+            # bm25() returns more negative numbers for better matches, so it's negated
+            # to give a score that is higher for the most relevant results
+            rank_expression = (
+                BM25(weights=self.get_bm25_weights(), table=self.FTS_TABLE) * -1.0
+            )
 
             if boost != 1.0:
                 rank_expression *= boost
@@ -469,10 +539,10 @@ class SQLiteSearchQueryCompiler(BaseSearchQueryCompiler):
     def get_search_vectors(self):
         return self.get_index_vectors()
 
-    def _build_rank_expression(self, vectors, config):
-
-        # TODO: Come up with my own expression class that compiles down to bm25
+    def get_match_columns(self):
+        return self.fields or ["title", "body"]
 
+    def _build_rank_expression(self, vectors, config):
         rank_expressions = [
             self.build_tsrank(vector, self.query, config=config) * boost
             for vector, boost in vectors
@@ -507,56 +577,55 @@ class SQLiteSearchQueryCompiler(BaseSearchQueryCompiler):
         vectors = self.get_search_vectors()
         rank_expression = self._build_rank_expression(vectors, config)
 
-        combined_vector = vectors[0][
-            0
-        ]  # We create a combined vector for the search results queryset. We start with the first vector and build from there.
-        for vector, boost in vectors[1:]:
-            combined_vector = combined_vector._combine(
-                vector, " ", False
-            )  # We add the subsequent vectors to the combined vector.
-
         expr = MatchExpression(
-            self.fields or ["title", "body"], search_query
+            self.get_match_columns(), search_query, table=self.FTS_TABLE
         )  # Build the FTS match expression.
-        objs = SQLiteFTSIndexEntry.objects.filter(expr).select_related(
-            "index_entry"
-        )  # Perform the FTS search. We'll get entries in the SQLiteFTSIndexEntry model.
-
-        if self.order_by_relevance:
-            objs = objs.order_by(BM25().desc())
-        elif not objs.query.order_by:
-            # Adds a default ordering to avoid issue #3729.
-            queryset = objs.order_by("-pk")
-            rank_expression = F("pk")
-
-        from django.db import connection
-        from django.db.models.sql.subqueries import InsertQuery
-
-        compiler = InsertQuery(IndexEntry).get_compiler(connection=connection)
-
-        try:
-            obj_ids = [
-                obj.index_entry.object_id for obj in objs
-            ]  # Get the IDs of the objects that matched. They're stored in the IndexEntry model, so we need to get that first.
-        except OperationalError as e:
-            raise OperationalError(
-                str(e)
-                + " The original query was: "
-                + compiler.compile(objs.query)[0]
-                + str(compiler.compile(objs.query)[1])
-            ) from e
 
         if not negated:
+            # Join the FTS table onto the source queryset, so that the matches can be
+            # ranked with bm25() and paginated by the database.
             queryset = self.queryset.filter(
-                id__in=obj_ids
-            )  # We need to filter the source queryset to get the objects that matched the search query.
+                **{self.FTS_RELATION + "__isnull": False}
+            ).filter(expr)
         else:
-            queryset = self.queryset.exclude(
-                id__in=obj_ids
-            )  # We exclude the objects that matched the search query from the source queryset, if the query is negated.
+            objs = SQLiteFTSIndexEntry.objects.filter(expr).select_related(
+                "index_entry"
+            )  # Perform the FTS search. We'll get entries in the SQLiteFTSIndexEntry model.
+
+            from django.db import connection
+            from django.db.models.sql.subqueries import InsertQuery
+
+            compiler = InsertQuery(IndexEntry).get_compiler(connection=connection)
+
+            try:
+                obj_ids = [
+                    obj.index_entry.object_id for obj in objs
+                ]  # Get the IDs of the objects that matched. They're stored in the IndexEntry model, so we need to get that first.
+            except OperationalError as e:
+                raise OperationalError(
+                    str(e)
+                    + " The original query was: "
+                    + compiler.compile(objs.query)[0]
+                    + str(compiler.compile(objs.query)[1])
+                ) from e
+
+            # We exclude the objects that matched the search query from the source queryset, as the query is negated.
+            # Those are the only ones bm25() could rank, so there is no relevance ordering here.
+            queryset = self.queryset.exclude(id__in=obj_ids)
+            rank_expression = None
+
+        if self.order_by_relevance and rank_expression is not None:
+            queryset = queryset.order_by(rank_expression.desc(), "-pk")
+
+        elif not queryset.query.order_by:
+            # Adds a default ordering to avoid issue #3729.
+            queryset = queryset.order_by("-pk")
+            rank_expression = F("pk")
 
         if score_field is not None:
-            queryset = queryset.annotate(**{score_field: rank_expression})
+            queryset = queryset.annotate(
+                **{score_field: rank_expression or Value(0.0, FloatField())}
+            )
 
         return queryset[start:stop]
 
@@ -583,6 +652,29 @@ class SQLiteSearchQueryCompiler(BaseSearchQueryCompiler):
 class SQLiteAutocompleteQueryCompiler(SQLiteSearchQueryCompiler):
     LAST_TERM_IS_PREFIX = True
     TARGET_SEARCH_FIELD_TYPE = AutocompleteField
+    TRIGRAM_FTS_TABLE = "wagtailsearch_indexentry_fts_trigram"
+    TRIGRAM_FTS_RELATION = "index_entries__sqliteftstrigramindexentry"
+    # The trigram tokenizer can't match anything shorter than a trigram
+    MIN_TRIGRAM_TERM_LENGTH = 3
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if self.can_use_trigrams():
+            # Match every term anywhere within the indexed words, rather than only
+            # matching the last term as a prefix
+            self.LAST_TERM_IS_PREFIX = False
+            self.FTS_TABLE = self.TRIGRAM_FTS_TABLE
+            self.FTS_RELATION = self.TRIGRAM_FTS_RELATION
+
+    def can_use_trigrams(self):
+        if not isinstance(self.query, PlainText) or not trigram_autocomplete_enabled():
+            return False
+
+        terms = self.query.query_string.split()
+        return bool(terms) and all(
+            len(term) >= self.MIN_TRIGRAM_TERM_LENGTH for term in terms
+        )
 
     def get_config(self, backend):
         return backend.autocomplete_config
@@ -590,9 +682,16 @@ class SQLiteAutocompleteQueryCompiler(SQLiteSearchQueryCompiler):
     def get_search_fields_for_model(self):
         return self.queryset.model.get_autocomplete_search_fields()
 
-    def get_index_vectors(self, search_query):
+    def get_index_vectors(self):
         return [(F("index_entries__autocomplete"), 1.0)]
 
+    def get_match_columns(self):
+        # All AutocompleteFields are indexed together in the autocomplete column
+        return ["autocomplete"]
+
+    def get_bm25_weights(self):
+        return (1.0,)
+
     def get_fields_vectors(self, search_query):
         raise NotImplementedError()
 
@@ -606,6 +705,15 @@ class SQLiteSearchResults(BaseSearchResults):
             start = self.start
             stop = self.stop
 
+        if self._use_cursor:
+            queryset = self.query_compiler.search(
+                self.query_compiler.get_config(self.backend),
+                None,
+                None,
+                score_field=self._score_field,
+            )
+            return self._apply_keyset_pagination(queryset)[start:stop]
+
         return self.query_compiler.search(
             self.query_compiler.get_config(self.backend),
             start,
@@ -659,6 +767,7 @@ class SQLiteSearchBackend(BaseSearchBackend):
         super().__init__(params)
         self.index_name = params.get("INDEX", "default")
         self.config = params.get("SEARCH_CONFIG")
+        self.autocomplete_config = params.get("AUTOCOMPLETE_SEARCH_CONFIG")
 
         if params.get("ATOMIC_REBUILD", False):
             self.rebuilder_class = self.atomic_rebuilder_class
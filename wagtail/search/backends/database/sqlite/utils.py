@@ -33,3 +33,32 @@ def fts_table_exists():
         return False
 
     return True
+
+
+def fts5_trigram_available():
+    if sqlite3.sqlite_version_info < (3, 34, 0):
+        # The trigram tokenizer was added in SQLite 3.34
+        return False
+
+    tmp_db = sqlite3.connect(":memory:")
+    try:
+        tmp_db.execute(
+            "CREATE VIRTUAL TABLE fts5test USING fts5 (data, tokenize='trigram');"
+        )
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        tmp_db.close()
+
+    return True
+
+
+def fts_trigram_table_exists():
+    from wagtail.search.models import SQLiteFTSTrigramIndexEntry
+
+    try:
+        SQLiteFTSTrigramIndexEntry.objects.exists()
+    except OperationalError:
+        return False
+
+    return True
@@ -94,6 +94,8 @@ class Elasticsearch5Mapping:
 
     def __init__(self, model):
         self.model = model
+        self._field_column_names = {}
+        self._nested_mappings = {}
 
     def get_parent(self):
         for base in self.model.__bases__:
@@ -104,6 +106,14 @@ class Elasticsearch5Mapping:
         return self.model.indexed_get_content_type()
 
     def get_field_column_name(self, field):
+        # This is called for every field of every document, but the result only depends
+        # on the model so it is cached on the mapping
+        if field not in self._field_column_names:
+            self._field_column_names[field] = self._get_field_column_name(field)
+
+        return self._field_column_names[field]
+
+    def _get_field_column_name(self, field):
         # Fields in derived models get prefixed with their model name, fields
         # in the root model don't get prefixed at all
         # This is to prevent mapping clashes in cases where two page types have
@@ -247,7 +257,10 @@ class Elasticsearch5Mapping:
         doc = {}
         edgengrams = []
         model = type(obj)
-        mapping = type(self)(model)
+        try:
+            mapping = self._nested_mappings[model]
+        except KeyError:
+            mapping = self._nested_mappings[model] = type(self)(model)
 
         for field in fields:
             value = field.get_value(obj)
@@ -677,6 +690,7 @@ class Elasticsearch5AutocompleteQueryCompiler(
 class Elasticsearch5SearchResults(BaseSearchResults):
     fields_param_name = "stored_fields"
     supports_facet = True
+    _next_search_after = None
 
     def facet(self, field_name):
         # Get field
@@ -722,17 +736,82 @@ class Elasticsearch5SearchResults(BaseSearchResults):
             ]
         )
 
+    def _get_cursor_sort(self, sort):
+        """
+        Returns the sort to use with search_after, which needs a unique tiebreaker
+        """
+        sort = list(sort) if sort is not None else ["_score"]
+
+        for sort_item in sort:
+            if sort_item == "pk" or (isinstance(sort_item, dict) and "pk" in sort_item):
+                break
+        else:
+            sort.append({"pk": "asc"})
+
+        return sort
+
     def _get_es_body(self, for_count=False):
         body = {"query": self.query_compiler.get_query()}
 
         if not for_count:
             sort = self.query_compiler.get_sort()
 
+            if self._use_cursor:
+                sort = self._get_cursor_sort(sort)
+
+                if self._search_after is not None:
+                    body["search_after"] = self._search_after
+
             if sort is not None:
                 body["sort"] = sort
 
         return body
 
+    def _get_search_params(self):
+        return {
+            "index": self.backend.get_index_for_model(
+                self.query_compiler.queryset.model
+            ).name,
+            "body": self._get_es_body(),
+            "_source": False,
+            self.fields_param_name: "pk",
+        }
+
+    def _get_next_position(self, results):
+        if self._use_cursor:
+            if self._next_search_after is not None:
+                return {"after": self._next_search_after}
+            return
+
+        return super()._get_next_position(results)
+
+    def _get_total_hits_params(self):
+        """
+        Returns any extra parameters needed for Elasticsearch to report the exact total
+        number of hits in a search response
+        """
+        return {}
+
+    def _record_total_hits(self, page):
+        """
+        Records the total number of hits reported in a search response, so that count()
+        doesn't need to make a separate request
+        """
+        total = page["hits"].get("total")
+
+        if isinstance(total, dict):
+            # Elasticsearch 7+ only reports a lower bound unless track_total_hits is set
+            if total.get("relation", "eq") != "eq":
+                return
+
+            total = total["value"]
+
+        if total is not None:
+            self._set_total_hits(total)
+
+    def _handle_search_response(self, page):
+        self._record_total_hits(page)
+
     def _get_results_from_hits(self, hits):
         """
         Yields Django model instances from a page of hits returned by Elasticsearch
@@ -765,16 +844,11 @@ class Elasticsearch5SearchResults(BaseSearchResults):
         else:
             limit = None
 
-        use_scroll = limit is None or limit > PAGE_SIZE
+        # Cursors are built from the sort values of the last hit, which the scroll API
+        # doesn't need, so always fetch a single page of hits when using them
+        use_scroll = not self._use_cursor and (limit is None or limit > PAGE_SIZE)
 
-        params = {
-            "index": self.backend.get_index_for_model(
-                self.query_compiler.queryset.model
-            ).name,
-            "body": self._get_es_body(),
-            "_source": False,
-            self.fields_param_name: "pk",
-        }
+        params = self._get_search_params()
 
         if use_scroll:
             params.update(
@@ -789,6 +863,7 @@ class Elasticsearch5SearchResults(BaseSearchResults):
 
             # Send to Elasticsearch
             page = self.backend.es.search(**params)
+            self._handle_search_response(page)
 
             while True:
                 hits = page["hits"]["hits"]
@@ -832,9 +907,15 @@ class Elasticsearch5SearchResults(BaseSearchResults):
                     "size": limit or PAGE_SIZE,
                 }
             )
+            params.update(self._get_total_hits_params())
 
             # Send to Elasticsearch
-            hits = self.backend.es.search(**params)["hits"]["hits"]
+            page = self.backend.es.search(**params)
+            self._handle_search_response(page)
+            hits = page["hits"]["hits"]
+
+            if self._use_cursor and hits and len(hits) == params["size"]:
+                self._next_search_after = hits[-1]["sort"]
 
             # Get results
             for result in self._get_results_from_hits(hits):
@@ -850,11 +931,7 @@ class Elasticsearch5SearchResults(BaseSearchResults):
         )["count"]
 
         # Add limits
-        hit_count -= self.start
-        if self.stop is not None:
-            hit_count = min(hit_count, self.stop - self.start)
-
-        return max(hit_count, 0)
+        return self._apply_limits_to_count(hit_count)
 
 
 class Elasticsearch5Index:
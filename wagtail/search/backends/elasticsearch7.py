@@ -81,7 +81,60 @@ class Elasticsearch7SearchQueryCompiler(Elasticsearch6SearchQueryCompiler):
 
 
 class Elasticsearch7SearchResults(Elasticsearch6SearchResults):
-    pass
+    point_in_time_keep_alive = "1m"
+    _point_in_time = None
+
+    def _clone(self):
+        new = super()._clone()
+        new._point_in_time = self._point_in_time
+        return new
+
+    def _get_total_hits_params(self):
+        return {"track_total_hits": True}
+
+    def _get_search_params(self):
+        params = super()._get_search_params()
+
+        if self._point_in_time is not None:
+            # Searches against a point in time must not specify an index
+            del params["index"]
+            params["body"]["pit"] = {
+                "id": self._point_in_time["id"],
+                "keep_alive": self.point_in_time_keep_alive,
+            }
+
+        return params
+
+    def _handle_search_response(self, page):
+        super()._handle_search_response(page)
+
+        # Elasticsearch may return a new point in time id with each response
+        if self._point_in_time is not None and "pit_id" in page:
+            self._point_in_time["id"] = page["pit_id"]
+
+    def iter_all(self, batch_size=100):
+        # Search against a point in time (available from Elasticsearch 7.10) so that every
+        # batch sees the same view of the index, even if it is updated in the meantime
+        if self._point_in_time is not None or not hasattr(
+            self.backend.es, "open_point_in_time"
+        ):
+            yield from super().iter_all(batch_size=batch_size)
+            return
+
+        results = self._clone()
+        results._point_in_time = self.backend.es.open_point_in_time(
+            index=self.backend.get_index_for_model(
+                self.query_compiler.queryset.model
+            ).name,
+            keep_alive=self.point_in_time_keep_alive,
+        )
+
+        try:
+            yield from results.iter_all(batch_size=batch_size)
+        finally:
+            self.backend.es.close_point_in_time(
+                body={"id": results._point_in_time["id"]}
+            )
 
 
 class Elasticsearch7AutocompleteQueryCompiler(
@@ -0,0 +1,123 @@
+import atexit
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from wagtail.search.utils import normalise_query_string
+
+
+def save_query_hits(hits):
+    """
+    Adds hits to the search query log in bulk.
+
+    ``hits`` maps ``(query_string, date)`` tuples to the number of hits to add. Query strings
+    must already be normalised.
+    """
+    from wagtail.search.models import Query, QueryDailyHits
+
+    query_strings = {query_string for query_string, date in hits}
+
+    with transaction.atomic():
+        Query.objects.bulk_create(
+            [Query(query_string=query_string) for query_string in query_strings],
+            ignore_conflicts=True,
+        )
+        query_ids = dict(
+            Query.objects.filter(query_string__in=query_strings).values_list(
+                "query_string", "pk"
+            )
+        )
+
+        QueryDailyHits.objects.bulk_create(
+            [
+                QueryDailyHits(query_id=query_ids[query_string], date=date)
+                for query_string, date in hits
+            ],
+            ignore_conflicts=True,
+        )
+
+        # Most entries only get a handful of hits between flushes, so group the
+        # increments to update all entries with the same date and count at once
+        increments = defaultdict(list)
+        for (query_string, date), count in hits.items():
+            increments[(date, count)].append(query_ids[query_string])
+
+        for (date, count), ids in increments.items():
+            QueryDailyHits.objects.filter(date=date, query_id__in=ids).update(
+                hits=models.F("hits") + count
+            )
+
+
+class QueryHitBuffer:
+    """
+    Collects search query hits in memory and writes them to the database in bulk.
+
+    Hits are counted per query string and date, so a popular query costs a single
+    UPDATE per flush rather than a read and a write on every search. The buffer is
+    flushed when a hit is added more than ``flush_interval`` seconds after the last
+    flush, when it holds ``max_size`` distinct entries, and when the process exits.
+    """
+
+    def __init__(self, flush_interval=10, max_size=1000):
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self.hits = Counter()
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+        self.exit_handler_registered = False
+
+    def __len__(self):
+        return len(self.hits)
+
+    def add(self, query_string, date=None, count=1):
+        if date is None:
+            date = timezone.now().date()
+
+        with self.lock:
+            self.hits[(normalise_query_string(query_string), date)] += count
+
+            if not self.exit_handler_registered:
+                atexit.register(self.flush)
+                self.exit_handler_registered = True
+
+            should_flush = (
+                len(self.hits) >= self.max_size
+                or time.monotonic() - self.last_flush >= self.flush_interval
+            )
+
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            hits, self.hits = self.hits, Counter()
+            self.last_flush = time.monotonic()
+
+        if hits:
+            save_query_hits(hits)
+
+
+_query_hit_buffer = None
+
+
+def get_query_hit_buffer():
+    """
+    Returns the process-wide QueryHitBuffer if the WAGTAILSEARCH_BUFFER_HITS setting is
+    enabled, or None otherwise
+    """
+    global _query_hit_buffer
+
+    if not getattr(settings, "WAGTAILSEARCH_BUFFER_HITS", False):
+        return None
+
+    if _query_hit_buffer is None:
+        _query_hit_buffer = QueryHitBuffer(
+            flush_interval=getattr(settings, "WAGTAILSEARCH_HITS_FLUSH_INTERVAL", 10),
+            max_size=getattr(settings, "WAGTAILSEARCH_HITS_BUFFER_SIZE", 1000),
+        )
+
+    return _query_hit_buffer
@@ -1,11 +1,16 @@
+import hashlib
 import inspect
+import json
 import logging
 
+from django import VERSION as DJANGO_VERSION
 from django.apps import apps
 from django.core import checks
 from django.core.exceptions import FieldDoesNotExist
-from django.db import models
+from django.db import models, transaction
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.fields.related import ForeignObjectRel, OneToOneRel, RelatedField
+from django.utils.encoding import force_str
 from modelcluster.fields import ParentalManyToManyField
 
 from wagtail.search.backends import get_search_backends_with_name
@@ -158,13 +163,208 @@ def get_indexed_instance(instance, check_exists=True):
     return indexed_instance
 
 
-def insert_or_update_object(instance):
+def _get_digest_value(value):
+    if isinstance(value, models.Model):
+        return value.pk
+    elif isinstance(value, (models.Manager, models.QuerySet)):
+        return [item.pk for item in value.all()]
+    elif isinstance(value, (list, tuple)):
+        return [_get_digest_value(item) for item in value]
+
+    return value
+
+
+def _get_digest_document(obj, fields):
+    document = {}
+
+    for field in fields:
+        value = field.get_value(obj)
+
+        if isinstance(field, RelatedFields):
+            if callable(value) and not isinstance(value, models.Manager):
+                value = value()
+
+            if isinstance(value, (models.Manager, models.QuerySet)):
+                value = [
+                    _get_digest_document(item, field.fields) for item in value.all()
+                ]
+            elif isinstance(value, models.Model):
+                value = _get_digest_document(value, field.fields)
+        else:
+            value = _get_digest_value(value)
+
+        document["%s:%s" % (type(field).__name__, field.field_name)] = value
+
+    return document
+
+
+def _get_content_type(model):
+    from django.contrib.contenttypes.models import ContentType
+
+    return ContentType.objects.get_for_model(model)
+
+
+def get_document_digest(obj):
+    """
+    Returns a digest of the values of all the search fields of obj, including those on
+    related objects. If the digest hasn't changed since obj was last indexed, the search
+    backends already hold the same content for it.
+    """
+    document = _get_digest_document(obj, obj.get_search_fields())
+    document["pk"] = str(obj.pk)
+    serialized = json.dumps(document, sort_keys=True, default=str)
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+def get_changed_objects(backend_name, model, objs):
+    """
+    Finds which of objs have changed since they were last indexed into the given backend.
+
+    Returns a list of the objects that need to be reindexed, and a dict mapping their
+    IDs to their new digest, which should be saved with save_document_digests once
+    they have been indexed.
+    """
+    from wagtail.search.models import IndexDigest
+
+    digests = {force_str(obj.pk): get_document_digest(obj) for obj in objs}
+    indexed_digests = dict(
+        IndexDigest.objects.filter(
+            backend_name=backend_name,
+            content_type=_get_content_type(model),
+            object_id__in=digests.keys(),
+        ).values_list("object_id", "digest")
+    )
+
+    changed_objs = [
+        obj
+        for obj in objs
+        if indexed_digests.get(force_str(obj.pk)) != digests[force_str(obj.pk)]
+    ]
+    changed_digests = {
+        force_str(obj.pk): digests[force_str(obj.pk)] for obj in changed_objs
+    }
+    return changed_objs, changed_digests
+
+
+def save_document_digests(backend_name, model, digests):
+    """
+    Records the digests of objects that have just been indexed into the given backend.
+    digests is a dict mapping object IDs to the digest of their content.
+    """
+    from wagtail.search.models import IndexDigest
+
+    if not digests:
+        return
+
+    content_type = _get_content_type(model)
+    index_digests = [
+        IndexDigest(
+            backend_name=backend_name,
+            content_type=content_type,
+            object_id=object_id,
+            digest=digest,
+        )
+        for object_id, digest in digests.items()
+    ]
+
+    # The savepoint lets callers carry on in the current transaction if this fails
+    with transaction.atomic():
+        if DJANGO_VERSION >= (4, 1):
+            # Upsert, so that objects saved concurrently don't conflict with each other
+            IndexDigest.objects.bulk_create(
+                index_digests,
+                update_conflicts=True,
+                unique_fields=["backend_name", "content_type", "object_id"],
+                update_fields=["digest"],
+            )
+        else:
+            IndexDigest.objects.filter(
+                backend_name=backend_name,
+                content_type=content_type,
+                object_id__in=digests.keys(),
+            ).delete()
+            # A digest recorded concurrently since the delete is for the same content
+            IndexDigest.objects.bulk_create(index_digests, ignore_conflicts=True)
+
+
+def _save_document_digests_or_log(backend_name, model, digests):
+    # The object has been indexed by now, so a failure to record its digest only
+    # means it will be sent to the backend again next time
+    try:
+        save_document_digests(backend_name, model, digests)
+    except Exception:
+        logger.exception(
+            "Exception raised while saving the index digests of %d %r objects for the '%s' search backend",
+            len(digests),
+            model,
+            backend_name,
+        )
+
+
+def _delete_document_digests_or_log(model, object_id):
+    # A stale digest is harmless once the object is gone, so this shouldn't stop it
+    # from being removed from the backends
+    try:
+        delete_document_digests(model=model, object_id=object_id)
+    except Exception:
+        logger.exception(
+            "Exception raised while deleting the index digests of %r %r",
+            model,
+            object_id,
+        )
+
+
+def delete_document_digests(backend_name=None, model=None, object_id=None):
+    """
+    Deletes the stored digests, so that the objects they were recorded for will be
+    reindexed next time. Can be narrowed down to a backend, a model and a single object.
+    """
+    from wagtail.search.models import IndexDigest
+
+    digests = IndexDigest.objects.all()
+
+    if backend_name is not None:
+        digests = digests.filter(backend_name=backend_name)
+
+    if model is not None:
+        digests = digests.filter(content_type=_get_content_type(model))
+
+    if object_id is not None:
+        digests = digests.filter(object_id=force_str(object_id))
+
+    digests.delete()
+
+
+def insert_or_update_object(instance, skip_unchanged=False):
+    """
+    Adds the instance to all search backends that are updated automatically.
+
+    If skip_unchanged is True, backends with the SKIP_UNCHANGED option enabled (the
+    default) will not be sent the instance when its indexed content hasn't changed
+    since it was last added to them.
+    """
     indexed_instance = get_indexed_instance(instance)
 
     if indexed_instance:
+        model = type(indexed_instance)
+        object_id = force_str(indexed_instance.pk)
+        digest = None
+        indexed_digests = None
+
         for backend_name, backend in get_search_backends_with_name(
             with_auto_update=True
         ):
+            if getattr(backend, "skip_unchanged", False):
+                if digest is None:
+                    digest = get_document_digest(indexed_instance)
+
+                if skip_unchanged:
+                    if indexed_digests is None:
+                        indexed_digests = get_indexed_digests(indexed_instance)
+
+                    if indexed_digests.get(backend_name) == digest:
+                        continue
+
             try:
                 backend.add(indexed_instance)
             except Exception:
@@ -184,12 +384,77 @@ def insert_or_update_object(instance):
                 # query is made but then the error message wouldn't be very informative.
                 if not backend.catch_indexing_errors:
                     raise
+            else:
+                if digest is not None:
+                    _save_document_digests_or_log(
+                        backend_name, model, {object_id: digest}
+                    )
+
+
+def insert_or_update_objects(model, instances):
+    """
+    Adds many instances of the given model to all search backends that are updated
+    automatically, using a single bulk operation per backend. The instances must already
+    be in their indexed (most specific) class.
+    """
+    if not class_is_indexed(model) or not instances:
+        return
+
+    indexed_pks = set(
+        model.get_indexed_objects()
+        .filter(pk__in=[instance.pk for instance in instances])
+        .values_list("pk", flat=True)
+    )
+    instances = [instance for instance in instances if instance.pk in indexed_pks]
+    if not instances:
+        return
+
+    for backend_name, backend in get_search_backends_with_name(with_auto_update=True):
+        try:
+            backend.add_bulk(model, instances)
+        except Exception:
+            logger.exception(
+                "Exception raised while adding %d %r objects into the '%s' search backend",
+                len(instances),
+                model,
+                backend_name,
+            )
+
+            if not backend.catch_indexing_errors:
+                raise
+        else:
+            if getattr(backend, "skip_unchanged", False):
+                _save_document_digests_or_log(
+                    backend_name,
+                    model,
+                    {
+                        force_str(instance.pk): get_document_digest(instance)
+                        for instance in instances
+                    },
+                )
+
+
+def get_indexed_digests(obj):
+    """
+    Returns a dict mapping the names of the backends obj has been indexed into to the
+    digest of the content it was indexed with.
+    """
+    from wagtail.search.models import IndexDigest
+
+    return dict(
+        IndexDigest.objects.filter(
+            content_type=_get_content_type(type(obj)),
+            object_id=force_str(obj.pk),
+        ).values_list("backend_name", "digest")
+    )
 
 
 def remove_object(instance):
     indexed_instance = get_indexed_instance(instance, check_exists=False)
 
     if indexed_instance:
+        _delete_document_digests_or_log(type(indexed_instance), indexed_instance.pk)
+
         for backend_name, backend in get_search_backends_with_name(
             with_auto_update=True
         ):
@@ -213,6 +478,7 @@ class BaseField:
     def __init__(self, field_name, **kwargs):
         self.field_name = field_name
         self.kwargs = kwargs
+        self._value_extractors = {}
 
     def get_field(self, cls):
         return cls._meta.get_field(self.field_name)
@@ -256,34 +522,65 @@ class BaseField:
             return "CharField"
 
     def get_value(self, obj):
+        return self.get_value_extractor(obj.__class__)(obj)
+
+    def get_value_extractor(self, cls):
+        """
+        Returns a function that takes an instance of cls and returns the value of this field.
+
+        The field lookup and the checks for how the value should be converted only depend
+        on the model, so they are done once per model rather than for every object indexed.
+        """
+        try:
+            return self._value_extractors[cls]
+        except KeyError:
+            extractor = self._value_extractors[cls] = self._build_value_extractor(cls)
+            return extractor
+
+    def _build_value_extractor(self, cls):
         from taggit.managers import TaggableManager
 
         try:
-            field = self.get_field(obj.__class__)
-            value = field.value_from_object(obj)
-            if hasattr(field, "get_searchable_content"):
-                value = field.get_searchable_content(value)
-            elif isinstance(field, TaggableManager):
-                # As of django-taggit 1.0, value_from_object returns a list of Tag objects,
-                # which matches what we want
-                pass
-            elif isinstance(field, RelatedField):
-                # The type of the ForeignKey may have a get_searchable_content method that we should
-                # call. Firstly we need to find the field its referencing but it may be referencing
-                # another RelatedField (eg an FK to page_ptr_id) so we need to run this in a while
-                # loop to find the actual remote field.
-                remote_field = field
-                while isinstance(remote_field, RelatedField):
-                    remote_field = remote_field.target_field
-
-                if hasattr(remote_field, "get_searchable_content"):
-                    value = remote_field.get_searchable_content(value)
-            return value
+            field = self.get_field(cls)
         except FieldDoesNotExist:
-            value = getattr(obj, self.field_name, None)
-            if hasattr(value, "__call__"):
-                value = value()
-            return value
+            field_name = self.field_name
+
+            def get_attribute_value(obj):
+                value = getattr(obj, field_name, None)
+                if hasattr(value, "__call__"):
+                    value = value()
+                return value
+
+            return get_attribute_value
+
+        value_from_object = field.value_from_object
+        get_searchable_content = None
+
+        if hasattr(field, "get_searchable_content"):
+            get_searchable_content = field.get_searchable_content
+        elif isinstance(field, TaggableManager):
+            # As of django-taggit 1.0, value_from_object returns a list of Tag objects,
+            # which matches what we want
+            pass
+        elif isinstance(field, RelatedField):
+            # The type of the ForeignKey may have a get_searchable_content method that we should
+            # call. Firstly we need to find the field its referencing but it may be referencing
+            # another RelatedField (eg an FK to page_ptr_id) so we need to run this in a while
+            # loop to find the actual remote field.
+            remote_field = field
+            while isinstance(remote_field, RelatedField):
+                remote_field = remote_field.target_field
+
+            if hasattr(remote_field, "get_searchable_content"):
+                get_searchable_content = remote_field.get_searchable_content
+
+        if get_searchable_content is None:
+            return value_from_object
+
+        def get_searchable_value(obj):
+            return get_searchable_content(value_from_object(obj))
+
+        return get_searchable_value
 
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__, self.field_name)
@@ -308,6 +605,7 @@ class RelatedFields:
     def __init__(self, field_name, fields):
         self.field_name = field_name
         self.fields = fields
+        self._is_relation = {}
 
     def get_field(self, cls):
         return cls._meta.get_field(self.field_name)
@@ -317,9 +615,16 @@ class RelatedFields:
         return field.model
 
     def get_value(self, obj):
-        field = self.get_field(obj.__class__)
+        cls = obj.__class__
+        try:
+            is_relation = self._is_relation[cls]
+        except KeyError:
+            field = self.get_field(cls)
+            is_relation = self._is_relation[cls] = isinstance(
+                field, (RelatedField, ForeignObjectRel)
+            )
 
-        if isinstance(field, (RelatedField, ForeignObjectRel)):
+        if is_relation:
             return getattr(obj, self.field_name)
 
     def select_on_queryset(self, queryset):
@@ -330,27 +635,62 @@ class RelatedFields:
         It decides which method to call based on the number of related objects:
          - single (eg ForeignKey, OneToOne), it runs select_related
          - multiple (eg ManyToMany, reverse ForeignKey) it runs prefetch_related
+
+        RelatedFields nested within this one are followed as well, so that indexing
+        doesn't make a query per object for those relations either.
+        """
+        select_related, prefetch_related = self.get_related_lookups(queryset.model)
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        return queryset
+
+    def get_related_lookups(self, cls, prefix="", prefetching=False):
+        """
+        Returns a tuple of the lookups to pass to select_related and prefetch_related
+        to fetch this relation, and any relations nested within it, on a queryset of cls.
         """
+        select_related = []
+        prefetch_related = []
+
         try:
-            field = self.get_field(queryset.model)
+            field = self.get_field(cls)
         except FieldDoesNotExist:
-            return queryset
+            return select_related, prefetch_related
+
+        lookup = prefix + self.field_name
 
         if isinstance(field, RelatedField) and not isinstance(
             field, ParentalManyToManyField
         ):
-            if field.many_to_one or field.one_to_one:
-                queryset = queryset.select_related(self.field_name)
-            elif field.one_to_many or field.many_to_many:
-                queryset = queryset.prefetch_related(self.field_name)
-
+            single = field.many_to_one or field.one_to_one
         elif isinstance(field, ForeignObjectRel):
-            # Reverse relation
-            if isinstance(field, OneToOneRel):
-                # select_related for reverse OneToOneField
-                queryset = queryset.select_related(self.field_name)
-            else:
-                # prefetch_related for anything else (reverse ForeignKey/ManyToManyField)
-                queryset = queryset.prefetch_related(self.field_name)
+            # Reverse relation, we can only use select_related for reverse OneToOneField
+            single = isinstance(field, OneToOneRel)
+        else:
+            return select_related, prefetch_related
 
-        return queryset
+        # select_related can't follow relations that are fetched with a prefetch
+        if single and not prefetching:
+            select_related.append(lookup)
+        else:
+            prefetch_related.append(lookup)
+            prefetching = True
+
+        for sub_field in self.fields:
+            if isinstance(sub_field, RelatedFields):
+                (
+                    sub_select_related,
+                    sub_prefetch_related,
+                ) = sub_field.get_related_lookups(
+                    field.related_model,
+                    prefix=lookup + LOOKUP_SEP,
+                    prefetching=prefetching,
+                )
+                select_related.extend(sub_select_related)
+                prefetch_related.extend(sub_prefetch_related)
+
+        return select_related, prefetch_related
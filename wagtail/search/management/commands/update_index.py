@@ -3,9 +3,16 @@ import collections
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.utils.encoding import force_str
 
 from wagtail.search.backends import get_search_backend
-from wagtail.search.index import get_indexed_models
+from wagtail.search.index import (
+    delete_document_digests,
+    get_changed_objects,
+    get_document_digest,
+    get_indexed_models,
+    save_document_digests,
+)
 
 DEFAULT_CHUNK_SIZE = 1000
 
@@ -55,7 +62,11 @@ def group_models_by_index(backend, models):
 
 class Command(BaseCommand):
     def update_backend(
-        self, backend_name, schema_only=False, chunk_size=DEFAULT_CHUNK_SIZE
+        self,
+        backend_name,
+        schema_only=False,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        changed_only=False,
     ):
         self.stdout.write("Updating backend: " + backend_name)
 
@@ -65,6 +76,13 @@ class Command(BaseCommand):
             self.stdout.write("Backend '%s' doesn't require rebuilding" % backend_name)
             return
 
+        if changed_only:
+            self.update_changed_objects(backend_name, backend, chunk_size=chunk_size)
+            return
+
+        # The index is rebuilt from scratch, so none of the recorded digests are valid anymore
+        delete_document_digests(backend_name)
+
         models_grouped_by_index = group_models_by_index(
             backend, get_indexed_models()
         ).items()
@@ -100,6 +118,14 @@ class Command(BaseCommand):
                         )
                     ):
                         index.add_items(model, chunk)
+                        save_document_digests(
+                            backend_name,
+                            model,
+                            {
+                                force_str(obj.pk): get_document_digest(obj)
+                                for obj in chunk
+                            },
+                        )
                         object_count += len(chunk)
 
                     self.print_newline()
@@ -110,6 +136,45 @@ class Command(BaseCommand):
             self.stdout.write(backend_name + ": indexed %d objects" % object_count)
             self.print_newline()
 
+    def update_changed_objects(
+        self, backend_name, backend, chunk_size=DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Adds objects to the existing index of the backend, skipping those which haven't
+        changed since they were last indexed.
+        """
+        object_count = 0
+        changed_count = 0
+
+        for model in get_indexed_models():
+            self.stdout.write(
+                "{}: {}.{} ".format(
+                    backend_name, model._meta.app_label, model.__name__
+                ).ljust(35),
+                ending="",
+            )
+
+            for chunk in self.print_iter_progress(
+                self.queryset_chunks(
+                    model.get_indexed_objects().order_by("pk"), chunk_size
+                )
+            ):
+                changed_objs, digests = get_changed_objects(backend_name, model, chunk)
+                if changed_objs:
+                    backend.add_bulk(model, changed_objs)
+                    save_document_digests(backend_name, model, digests)
+
+                object_count += len(chunk)
+                changed_count += len(changed_objs)
+
+            self.print_newline()
+
+        self.stdout.write(
+            backend_name
+            + ": indexed %d changed objects out of %d" % (changed_count, object_count)
+        )
+        self.print_newline()
+
     def add_arguments(self, parser):
         parser.add_argument(
             "--backend",
@@ -133,6 +198,13 @@ class Command(BaseCommand):
             type=int,
             help="Set number of records to be fetched at once for inserting into the index",
         )
+        parser.add_argument(
+            "--changed-only",
+            action="store_true",
+            dest="changed_only",
+            default=False,
+            help="Only reindex objects whose indexed content has changed since they were last indexed, without rebuilding the index",
+        )
 
     def handle(self, **options):
         # Get list of backends to index
@@ -152,6 +224,7 @@ class Command(BaseCommand):
                 backend_name,
                 schema_only=options.get("schema_only", False),
                 chunk_size=options.get("chunk_size"),
+                changed_only=options.get("changed_only", False),
             )
 
     def print_newline(self):
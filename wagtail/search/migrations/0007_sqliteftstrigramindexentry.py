@@ -0,0 +1,93 @@
+from django.db import connection, migrations, models
+
+from wagtail.search.models import IndexEntry
+
+
+# This migration adds a second FTS5 table on SQLite, which indexes the autocomplete column
+# with the trigram tokenizer (available from SQLite 3.34) so that autocomplete can match
+# anywhere within a word rather than only on prefixes.
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailsearch", "0006_customise_indexentry"),
+    ]
+
+    operations = []
+
+    if connection.vendor == "sqlite":
+        from wagtail.search.backends.database.sqlite.utils import (
+            fts5_trigram_available,
+        )
+
+        if fts5_trigram_available():
+            operations.append(
+                migrations.SeparateDatabaseAndState(
+                    state_operations=[
+                        migrations.CreateModel(
+                            name="sqliteftstrigramindexentry",
+                            fields=[
+                                (
+                                    "index_entry",
+                                    models.OneToOneField(
+                                        primary_key=True,
+                                        serialize=False,
+                                        to="wagtailsearch.indexentry",
+                                        on_delete=models.CASCADE,
+                                        db_column="rowid",
+                                    ),
+                                ),
+                                ("autocomplete", models.TextField(null=True)),
+                            ],
+                            options={
+                                "db_table": "%s_fts_trigram" % IndexEntry._meta.db_table
+                            },
+                        ),
+                    ],
+                    database_operations=[
+                        migrations.RunSQL(
+                            sql=(
+                                "CREATE VIRTUAL TABLE %s_fts_trigram USING fts5(autocomplete, tokenize='trigram')"
+                                % IndexEntry._meta.db_table
+                            ),
+                            reverse_sql=(
+                                "DROP TABLE IF EXISTS %s_fts_trigram"
+                                % IndexEntry._meta.db_table
+                            ),
+                        ),
+                        migrations.RunSQL(
+                            sql=(
+                                "INSERT INTO %s_fts_trigram(autocomplete, rowid) SELECT autocomplete, id FROM %s"
+                                % (IndexEntry._meta.db_table, IndexEntry._meta.db_table)
+                            ),
+                            reverse_sql=migrations.RunSQL.noop,
+                        ),
+                        migrations.RunSQL(
+                            sql=(
+                                "CREATE TRIGGER insert_wagtailsearch_indexentry_fts_trigram AFTER INSERT ON %s BEGIN INSERT INTO %s_fts_trigram(autocomplete, rowid) VALUES (NEW.autocomplete, NEW.id); END"
+                                % (IndexEntry._meta.db_table, IndexEntry._meta.db_table)
+                            ),
+                            reverse_sql=(
+                                "DROP TRIGGER IF EXISTS insert_wagtailsearch_indexentry_fts_trigram"
+                            ),
+                        ),
+                        migrations.RunSQL(
+                            sql=(
+                                "CREATE TRIGGER update_wagtailsearch_indexentry_fts_trigram AFTER UPDATE OF autocomplete ON %s BEGIN UPDATE %s_fts_trigram SET autocomplete=NEW.autocomplete WHERE rowid=NEW.id; END"
+                                % (IndexEntry._meta.db_table, IndexEntry._meta.db_table)
+                            ),
+                            reverse_sql=(
+                                "DROP TRIGGER IF EXISTS update_wagtailsearch_indexentry_fts_trigram"
+                            ),
+                        ),
+                        migrations.RunSQL(
+                            sql=(
+                                "CREATE TRIGGER delete_wagtailsearch_indexentry_fts_trigram AFTER DELETE ON %s BEGIN DELETE FROM %s_fts_trigram WHERE rowid=OLD.id; END"
+                                % (IndexEntry._meta.db_table, IndexEntry._meta.db_table)
+                            ),
+                            reverse_sql=(
+                                "DROP TRIGGER IF EXISTS delete_wagtailsearch_indexentry_fts_trigram"
+                            ),
+                        ),
+                    ],
+                )
+            )
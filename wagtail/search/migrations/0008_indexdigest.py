@@ -0,0 +1,43 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("wagtailsearch", "0007_sqliteftstrigramindexentry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IndexDigest",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("backend_name", models.CharField(max_length=255)),
+                ("object_id", models.CharField(max_length=50)),
+                ("digest", models.CharField(max_length=40)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "index digest",
+                "verbose_name_plural": "index digests",
+                "unique_together": {("backend_name", "content_type", "object_id")},
+            },
+        ),
+    ]
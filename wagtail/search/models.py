@@ -13,6 +13,7 @@ from django.db.models.sql.where import WhereNode
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from wagtail.search.hits import get_query_hit_buffer
 from wagtail.search.utils import MAX_QUERY_STRING_LENGTH, normalise_query_string
 
 from .index import class_is_indexed
@@ -22,6 +23,8 @@ from .utils import get_descendants_content_types_pks
 class Query(models.Model):
     query_string = models.CharField(max_length=MAX_QUERY_STRING_LENGTH, unique=True)
 
+    wagtail_reference_index_ignore = True
+
     def save(self, *args, **kwargs):
         # Normalise query string
         self.query_string = normalise_query_string(self.query_string)
@@ -29,6 +32,11 @@ class Query(models.Model):
         super().save(*args, **kwargs)
 
     def add_hit(self, date=None):
+        hit_buffer = get_query_hit_buffer()
+        if hit_buffer is not None:
+            hit_buffer.add(self.query_string, date=date)
+            return
+
         if date is None:
             date = timezone.now().date()
         daily_hits, created = QueryDailyHits.objects.get_or_create(
@@ -65,6 +73,18 @@ class Query(models.Model):
             query_string=normalise_query_string(query_string)
         )[0]
 
+    @classmethod
+    def record_hit(cls, query_string, date=None):
+        """
+        Logs a search for query_string. When WAGTAILSEARCH_BUFFER_HITS is enabled, this
+        doesn't touch the database until the hit buffer is flushed.
+        """
+        hit_buffer = get_query_hit_buffer()
+        if hit_buffer is not None:
+            hit_buffer.add(query_string, date=date)
+        else:
+            cls.get(query_string).add_hit(date=date)
+
     @classmethod
     def get_most_popular(cls, date_since=None):
         # TODO: Implement date_since
@@ -157,6 +177,8 @@ class BaseIndexEntry(models.Model):
     # elevating more specific matches to the top.
     title_norm = models.FloatField(default=1.0)
 
+    wagtail_reference_index_ignore = True
+
     class Meta:
         unique_together = ("content_type", "object_id")
         verbose_name = _("index entry")
@@ -207,7 +229,10 @@ if connection.vendor == "postgresql":
     AbstractIndexEntry = AbstractPostgresIndexEntry
 
 elif connection.vendor == "sqlite":
-    from wagtail.search.backends.database.sqlite.utils import fts5_available
+    from wagtail.search.backends.database.sqlite.utils import (
+        fts5_available,
+        fts5_trigram_available,
+    )
 
     class AbstractSQLiteIndexEntry(BaseIndexEntry):
         """
@@ -236,9 +261,32 @@ elif connection.vendor == "sqlite":
                 db_column="rowid",
             )
 
+            wagtail_reference_index_ignore = True
+
             class Meta:
                 db_table = "wagtailsearch_indexentry_fts"
 
+    if fts5_trigram_available():
+
+        class SQLiteFTSTrigramIndexEntry(models.Model):
+            """
+            A copy of the autocomplete column, tokenized into trigrams so that
+            autocomplete queries can match anywhere within a word.
+            """
+
+            autocomplete = TextField(null=True)
+            index_entry = OneToOneField(
+                primary_key=True,
+                to="wagtailsearch.indexentry",
+                on_delete=models.CASCADE,
+                db_column="rowid",
+            )
+
+            wagtail_reference_index_ignore = True
+
+            class Meta:
+                db_table = "wagtailsearch_indexentry_fts_trigram"
+
 elif connection.vendor == "mysql":
 
     class AbstractMySQLIndexEntry(BaseIndexEntry):
@@ -270,3 +318,23 @@ class IndexEntry(AbstractIndexEntry):
         """
 
         abstract = False
+
+
+class IndexDigest(models.Model):
+    """
+    Stores a digest of the content each object was last indexed with in each search backend,
+    so that objects whose indexed content hasn't changed can be skipped when reindexing.
+    """
+
+    backend_name = models.CharField(max_length=255)
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    # We do not use an IntegerField since primary keys are not always integers.
+    object_id = models.CharField(max_length=50)
+    digest = models.CharField(max_length=40)
+
+    class Meta:
+        unique_together = ("backend_name", "content_type", "object_id")
+        verbose_name = _("index digest")
+        verbose_name_plural = _("index digests")
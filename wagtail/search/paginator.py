@@ -0,0 +1,56 @@
+from django.core.paginator import Paginator
+
+from wagtail.search.backends.base import BaseSearchResults
+
+
+class SearchResultsPaginator(Paginator):
+    """
+    A Paginator that runs the search for the requested page before counting the results.
+
+    Search backends that report the total number of hits alongside a page of results
+    (such as Elasticsearch) can then answer count() without making a second request.
+    Any other object list is paginated exactly as it would be by Django's Paginator.
+    """
+
+    _prefetched_page = None
+
+    def _prefetch_page(self, number):
+        if (
+            not isinstance(self.object_list, BaseSearchResults)
+            or "count" in self.__dict__
+        ):
+            return
+
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            return
+
+        if number >= 1:
+            bottom = (number - 1) * self.per_page
+            top = bottom + self.per_page + self.orphans
+            self._prefetched_page = self.object_list[bottom:top]
+            self._prefetched_page.results()
+
+    def get_page(self, number):
+        self._prefetch_page(number)
+        return super().get_page(number)
+
+    def page(self, number):
+        self._prefetch_page(number)
+        return super().page(number)
+
+    def _get_page(self, object_list, *args, **kwargs):
+        prefetched = self._prefetched_page
+
+        # Reuse the results fetched above if they cover the final slice for this page
+        if (
+            prefetched is not None
+            and isinstance(object_list, BaseSearchResults)
+            and object_list.start == prefetched.start
+            and object_list.stop is not None
+            and object_list.stop <= prefetched.stop
+        ):
+            object_list = prefetched[: object_list.stop - object_list.start]
+
+        return super()._get_page(object_list, *args, **kwargs)
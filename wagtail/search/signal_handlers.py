@@ -10,7 +10,7 @@ def post_save_signal_handler(instance, update_fields=None, **kwargs):
         # the fields that were not passed in update_fields
         instance = type(instance).objects.get(pk=instance.pk)
 
-    index.insert_or_update_object(instance)
+    index.insert_or_update_object(instance, skip_unchanged=True)
 
 
 def post_delete_signal_handler(instance, **kwargs):
@@ -0,0 +1,100 @@
+import random
+import unittest
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from wagtail.search.backends import get_search_backend
+from wagtail.search.backends.database.sqlite.utils import fts5_available
+from wagtail.test.benchmark import Benchmark
+from wagtail.test.search.models import Book
+
+WORDS = [
+    "arepa",
+    "biscuit",
+    "chutney",
+    "dumpling",
+    "empanada",
+    "falafel",
+    "gazpacho",
+    "hummus",
+    "injera",
+    "jambalaya",
+    "kimchi",
+    "lasagne",
+    "moussaka",
+    "nachos",
+    "omelette",
+    "paella",
+    "quesadilla",
+    "ratatouille",
+    "samosa",
+    "tagine",
+]
+
+
+class SearchBackendBenchmark(Benchmark):
+    """
+    Indexes the same synthetic corpus of books with the backend under test, and benches
+    a mix of search and autocomplete queries against it. Run with the SQLite and
+    PostgreSQL test databases to compare query latency between the two backends.
+    """
+
+    corpus_size = 2000
+    queries = ["paella", "samosa tagine", "kimchi nachos"]
+    autocomplete_queries = ["ta", "ratat", "illa"]
+
+    def setUp(self):
+        self.backend = get_search_backend("default")
+        self.backend.reset_index()
+
+        # Seed the random generator so that every backend gets exactly the same corpus
+        rng = random.Random(42)
+        books = Book.objects.bulk_create(
+            [
+                Book(
+                    title=" ".join(rng.choices(WORDS, k=4)),
+                    publication_date="2020-01-01",
+                    number_of_pages=rng.randint(50, 1000),
+                )
+                for i in range(self.corpus_size)
+            ]
+        )
+        self.backend.add_bulk(Book, books)
+
+    def bench(self):
+        for query in self.queries:
+            list(self.backend.search(query, Book)[:20])
+
+        for query in self.autocomplete_queries:
+            list(self.backend.autocomplete(query, Book)[:20])
+
+
+@unittest.skipUnless(
+    connection.vendor == "sqlite", "The current database is not SQLite"
+)
+@unittest.skipUnless(fts5_available(), "The SQLite fts5 extension is not available")
+@override_settings(
+    WAGTAILSEARCH_BACKENDS={
+        "default": {
+            "BACKEND": "wagtail.search.backends.database.sqlite.sqlite",
+        }
+    }
+)
+class BenchSQLiteSearchBackend(SearchBackendBenchmark, TestCase):
+    pass
+
+
+@unittest.skipUnless(
+    connection.vendor == "postgresql", "The current database is not PostgreSQL"
+)
+@override_settings(
+    WAGTAILSEARCH_BACKENDS={
+        "default": {
+            "BACKEND": "wagtail.search.backends.database.postgres.postgres",
+        }
+    }
+)
+class BenchPostgresSearchBackend(SearchBackendBenchmark, TestCase):
+    pass
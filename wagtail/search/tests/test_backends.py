@@ -17,7 +17,12 @@ from wagtail.search.backends import (
     get_search_backend,
     get_search_backends,
 )
-from wagtail.search.backends.base import BaseSearchBackend, FieldError, FilterFieldError
+from wagtail.search.backends.base import (
+    BaseSearchBackend,
+    FieldError,
+    FilterFieldError,
+    InvalidCursorError,
+)
 from wagtail.search.backends.database.fallback import DatabaseSearchBackend
 from wagtail.search.backends.database.sqlite.utils import fts5_available
 from wagtail.search.models import IndexEntry
@@ -267,6 +272,37 @@ class BackendTests(WagtailTestUtils):
             ],
         )
 
+    # INCREMENTAL UPDATE TESTS
+
+    def test_update_index_changed_only(self):
+        # Change a title without sending the post_save signal, so the index is out of date
+        models.Book.objects.filter(title="Learning Python").update(
+            title="Learning Ruby"
+        )
+
+        management.call_command(
+            "update_index",
+            backend_name=self.backend_name,
+            stdout=StringIO(),
+            changed_only=True,
+        )
+        self.backend.refresh_index()
+
+        results = self.backend.search("Ruby", models.Book)
+        self.assertUnsortedListEqual([r.title for r in results], ["Learning Ruby"])
+
+        # Nothing has changed since, so nothing should be reindexed this time
+        # (backends without a rebuilder search the database directly and aren't updated)
+        if self.backend.rebuilder_class:
+            stdout = StringIO()
+            management.call_command(
+                "update_index",
+                backend_name=self.backend_name,
+                stdout=stdout,
+                changed_only=True,
+            )
+            self.assertIn("indexed 0 changed objects", stdout.getvalue())
+
     # FILTERING TESTS
 
     def test_filter_exact_value(self):
@@ -594,6 +630,71 @@ class BackendTests(WagtailTestUtils):
             ],
         )
 
+    # CURSOR TESTS
+
+    def test_search_after(self):
+        # Note: we need consistent ordering for this test
+        results = self.backend.search(
+            MATCH_ALL,
+            models.Novel.objects.order_by("number_of_pages"),
+            order_by_relevance=False,
+        )
+
+        first_page = results.search_after(None)[:3]
+        self.assertListEqual(
+            [r.title for r in first_page],
+            ["Foundation", "The Hobbit", "The Two Towers"],
+        )
+
+        second_page = results.search_after(first_page.next_cursor)[:3]
+        self.assertListEqual(
+            [r.title for r in second_page],
+            [
+                "The Fellowship of the Ring",
+                "The Return of the King",
+                "A Game of Thrones",
+            ],
+        )
+
+        last_page = results.search_after(second_page.next_cursor)[:3]
+        self.assertListEqual(
+            [r.title for r in last_page],
+            ["A Clash of Kings", "A Storm of Swords"],
+        )
+        self.assertIsNone(last_page.next_cursor)
+
+    def test_search_after_on_sliced_results(self):
+        results = self.backend.search(MATCH_ALL, models.Novel)[3:]
+
+        with self.assertRaises(TypeError):
+            results.search_after(None)
+
+    def test_search_after_invalid_cursor(self):
+        results = self.backend.search(MATCH_ALL, models.Novel)
+
+        with self.assertRaises(InvalidCursorError):
+            results.search_after("not a cursor")
+
+    def test_iter_all(self):
+        results = self.backend.search(
+            MATCH_ALL,
+            models.Novel.objects.order_by("number_of_pages"),
+            order_by_relevance=False,
+        )
+
+        self.assertListEqual(
+            [r.title for r in results.iter_all(batch_size=3)],
+            [r.title for r in results],
+        )
+
+    def test_iter_all_ordered_by_relevance(self):
+        results = self.backend.search("JavaScript", models.Book)
+
+        self.assertUnsortedListEqual(
+            [r.title for r in results.iter_all(batch_size=1)],
+            ["JavaScript: The good parts", "JavaScript: The Definitive Guide"],
+        )
+
     # FACET TESTS
 
     def test_facet(self):
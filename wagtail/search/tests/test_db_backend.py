@@ -3,6 +3,9 @@ import unittest
 from django.test import TestCase
 from django.test.utils import override_settings
 
+from wagtail.search.backends.base import decode_cursor
+from wagtail.test.search import models
+
 from .test_backends import BackendTests
 
 
@@ -16,6 +19,23 @@ from .test_backends import BackendTests
 class TestDBBackend(BackendTests, TestCase):
     backend_path = "wagtail.search.backends.database.fallback"
 
+    def test_search_after_uses_keyset_pagination(self):
+        results = self.backend.search(
+            "JavaScript",
+            models.Book.objects.order_by("-number_of_pages"),
+            order_by_relevance=False,
+        )
+
+        first_page = results.search_after(None)[:1]
+        book = first_page[0]
+        self.assertEqual(
+            decode_cursor(first_page.next_cursor),
+            {"after": [book.number_of_pages, book.pk]},
+        )
+
+        second_page = results.search_after(first_page.next_cursor)[:1]
+        self.assertLess(second_page[0].number_of_pages, book.number_of_pages)
+
     # Doesn't support autocomplete
     @unittest.expectedFailure
     def test_autocomplete(self):
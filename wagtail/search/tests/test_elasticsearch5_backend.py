@@ -8,6 +8,7 @@ from django.test import TestCase
 from elasticsearch.serializer import JSONSerializer
 
 from wagtail.search.backends.elasticsearch5 import Elasticsearch5SearchBackend
+from wagtail.search.paginator import SearchResultsPaginator
 from wagtail.search.query import MATCH_ALL, Fuzzy, Phrase
 from wagtail.test.search import models
 
@@ -810,6 +811,112 @@ class TestElasticsearch5SearchResults(TestCase):
         self.assertEqual(results[1], models.Book.objects.get(id=2))
         self.assertEqual(results[2], models.Book.objects.get(id=1))
 
+    @mock.patch("elasticsearch.Elasticsearch.count")
+    @mock.patch("elasticsearch.Elasticsearch.search")
+    def test_count_uses_total_from_search(self, search, count):
+        response = self.construct_search_response([1, 2])
+        response["hits"]["total"] = 25
+        search.return_value = response
+        results = self.get_results()
+
+        list(results[10:12])  # Performs search
+
+        self.assertEqual(results.count(), 25)
+        self.assertEqual(results[20:].count(), 5)
+        self.assertEqual(results[:10].count(), 10)
+        count.assert_not_called()
+
+    @mock.patch("elasticsearch.Elasticsearch.count")
+    @mock.patch("elasticsearch.Elasticsearch.search")
+    def test_count_without_search(self, search, count):
+        count.return_value = {"count": 25}
+        results = self.get_results()
+
+        self.assertEqual(results[20:].count(), 5)
+        count.assert_called_once()
+        search.assert_not_called()
+
+    @mock.patch("elasticsearch.Elasticsearch.count")
+    @mock.patch("elasticsearch.Elasticsearch.search")
+    def test_paginator_makes_single_request(self, search, count):
+        response = self.construct_search_response([1, 2])
+        response["hits"]["total"] = 12
+        search.return_value = response
+        paginator = SearchResultsPaginator(self.get_results(), per_page=10)
+
+        page = paginator.get_page(2)
+
+        self.assertEqual(paginator.count, 12)
+        self.assertEqual(paginator.num_pages, 2)
+        self.assertEqual(
+            list(page),
+            [models.Book.objects.get(id=1), models.Book.objects.get(id=2)],
+        )
+        search.assert_called_once_with(
+            from_=10,
+            body={"query": "QUERY"},
+            _source=False,
+            stored_fields="pk",
+            index="wagtail__searchtests_book",
+            size=10,
+        )
+        count.assert_not_called()
+
+    @mock.patch("elasticsearch.Elasticsearch.search")
+    def test_search_after(self, search):
+        response = self.construct_search_response([1, 2])
+        for hit in response["hits"]["hits"]:
+            hit["sort"] = [1.0, hit["fields"]["pk"][0]]
+        search.return_value = response
+        results = self.get_results()
+
+        first_page = results.search_after(None)[:2]
+        list(first_page)  # Performs search
+
+        search.assert_called_with(
+            from_=0,
+            body={"query": "QUERY", "sort": ["_score", {"pk": "asc"}]},
+            _source=False,
+            stored_fields="pk",
+            index="wagtail__searchtests_book",
+            size=2,
+        )
+
+        second_page = results.search_after(first_page.next_cursor)[:2]
+        list(second_page)  # Performs search
+
+        search.assert_called_with(
+            from_=0,
+            body={
+                "query": "QUERY",
+                "sort": ["_score", {"pk": "asc"}],
+                "search_after": [1.0, "2"],
+            },
+            _source=False,
+            stored_fields="pk",
+            index="wagtail__searchtests_book",
+            size=2,
+        )
+
+    @mock.patch("elasticsearch.Elasticsearch.search")
+    def test_iter_all(self, search):
+        first_response = self.construct_search_response([1, 2])
+        for hit in first_response["hits"]["hits"]:
+            hit["sort"] = [1.0, hit["fields"]["pk"][0]]
+        search.side_effect = [first_response, self.construct_search_response([3])]
+
+        results = list(self.get_results().iter_all(batch_size=2))
+
+        self.assertEqual(
+            results,
+            [
+                models.Book.objects.get(id=1),
+                models.Book.objects.get(id=2),
+                models.Book.objects.get(id=3),
+            ],
+        )
+        self.assertEqual(search.call_count, 2)
+
 
 class TestElasticsearch5Mapping(TestCase):
     fixtures = ["search"]
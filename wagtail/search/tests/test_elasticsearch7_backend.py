@@ -753,6 +753,7 @@ class TestElasticsearch7SearchResults(TestCase):
             stored_fields="pk",
             index="wagtail__searchtests_book",
             size=1,
+            track_total_hits=True,
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search")
@@ -769,6 +770,7 @@ class TestElasticsearch7SearchResults(TestCase):
             stored_fields="pk",
             index="wagtail__searchtests_book",
             size=3,
+            track_total_hits=True,
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search")
@@ -785,6 +787,7 @@ class TestElasticsearch7SearchResults(TestCase):
             stored_fields="pk",
             index="wagtail__searchtests_book",
             size=10,
+            track_total_hits=True,
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search")
@@ -802,6 +805,7 @@ class TestElasticsearch7SearchResults(TestCase):
             stored_fields="pk",
             index="wagtail__searchtests_book",
             size=1,
+            track_total_hits=True,
         )
 
     @mock.patch("elasticsearch.Elasticsearch.search")
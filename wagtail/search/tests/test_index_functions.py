@@ -1,7 +1,10 @@
 from datetime import date
 from unittest import mock
 
+from django import VERSION as DJANGO_VERSION
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
 from wagtail.models import Page
 from wagtail.search import index
@@ -103,6 +106,40 @@ class TestInsertOrUpdateObject(TestCase, WagtailTestUtils):
         self.assertIn("Traceback (most recent call last):", cm.output[0])
         self.assertIn("ValueError: Test", cm.output[0])
 
+    def test_updates_existing_digest(self, backend):
+        obj = models.Book.objects.create(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+        obj.title = "Updated test"
+
+        # The digest recorded when the object was created is replaced, not duplicated
+        index.insert_or_update_object(obj)
+
+        self.assertEqual(
+            index.get_indexed_digests(obj),
+            {"default": index.get_document_digest(obj)},
+        )
+
+    def test_catches_digest_error(self, backend):
+        obj = models.Book.objects.create(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+        backend().reset_mock()
+
+        with mock.patch(
+            "wagtail.search.index.save_document_digests",
+            side_effect=ValueError("Test"),
+        ):
+            with self.assertLogs("wagtail.search.index", level="ERROR") as cm:
+                index.insert_or_update_object(obj)
+
+        backend().add.assert_called_with(obj)
+        self.assertEqual(len(cm.output), 1)
+        self.assertIn(
+            "Exception raised while saving the index digests of 1 <class 'wagtail.test.search.models.Book'> objects for the 'default' search backend",
+            cm.output[0],
+        )
+
 
 @mock.patch("wagtail.search.tests.DummySearchBackend", create=True)
 @override_settings(
@@ -150,6 +187,27 @@ class TestRemoveObject(TestCase, WagtailTestUtils):
         self.assertIn("Traceback (most recent call last):", cm.output[0])
         self.assertIn("ValueError: Test", cm.output[0])
 
+    def test_catches_digest_error(self, backend):
+        obj = models.Book.objects.create(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+        backend().reset_mock()
+
+        with mock.patch(
+            "wagtail.search.index.delete_document_digests",
+            side_effect=ValueError("Test"),
+        ):
+            with self.assertLogs("wagtail.search.index", level="ERROR") as cm:
+                index.remove_object(obj)
+
+        backend().delete.assert_called_with(obj)
+        self.assertEqual(len(cm.output), 1)
+        self.assertIn(
+            "Exception raised while deleting the index digests of <class 'wagtail.test.search.models.Book'> %d"
+            % obj.pk,
+            cm.output[0],
+        )
+
 
 @mock.patch("wagtail.search.tests.DummySearchBackend", create=True)
 @override_settings(
@@ -178,6 +236,47 @@ class TestSignalHandlers(TestCase, WagtailTestUtils):
         indexed_object = backend().add.call_args[0][0]
         self.assertEqual(indexed_object.title, "Updated test")
 
+    def test_skip_unchanged_on_update(self, backend):
+        obj = models.Book.objects.create(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+
+        backend().reset_mock()
+        obj.save()
+
+        # None of the indexed fields changed, so the object shouldn't be sent again
+        backend().add.assert_not_called()
+
+    def test_update_digest_queries(self, backend):
+        obj = models.Book.objects.create(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+        obj.title = "Updated test"
+
+        with CaptureQueriesContext(connection) as ctx:
+            obj.save()
+
+        # With SKIP_UNCHANGED (the default), indexing a save adds a lookup of the
+        # stored digests and an upsert of the new one (a delete and an insert before
+        # Django 4.1)
+        digest_queries = [
+            query["sql"]
+            for query in ctx.captured_queries
+            if "wagtailsearch_indexdigest" in query["sql"]
+        ]
+        self.assertEqual(len(digest_queries), 2 if DJANGO_VERSION >= (4, 1) else 3)
+
+    def test_index_unchanged_if_skip_unchanged_disabled(self, backend):
+        backend().skip_unchanged = False
+        obj = models.Book.objects.create(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+
+        backend().reset_mock()
+        obj.save()
+
+        backend().add.assert_called_with(obj)
+
     def test_index_on_delete(self, backend):
         obj = models.Book.objects.create(
             title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
@@ -1,12 +1,14 @@
 import datetime
 import json
 from io import StringIO
+from unittest import mock
 
 from django.core import management
-from django.test import SimpleTestCase, TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 
 from wagtail.contrib.search_promotions.models import SearchPromotion
 from wagtail.search import models
+from wagtail.search.hits import QueryHitBuffer, get_query_hit_buffer
 from wagtail.search.query import And, Or, Phrase, PlainText
 from wagtail.search.utils import (
     balanced_reduce,
@@ -37,6 +39,86 @@ class TestHitCounter(TestCase):
         self.assertEqual(models.Query.get("Hello").hits, 10)
 
 
+class TestQueryHitBuffer(TestCase):
+    def test_hits_are_saved_on_flush(self):
+        hit_buffer = QueryHitBuffer(flush_interval=3600)
+
+        with self.assertNumQueries(0):
+            for i in range(10):
+                hit_buffer.add("Hello")
+            hit_buffer.add("World")
+
+        self.assertEqual(len(hit_buffer), 2)
+        self.assertFalse(models.Query.objects.exists())
+
+        hit_buffer.flush()
+
+        self.assertEqual(len(hit_buffer), 0)
+        self.assertEqual(models.Query.get("Hello").hits, 10)
+        self.assertEqual(models.Query.get("World").hits, 1)
+
+    def test_hits_are_added_to_existing_counts(self):
+        models.Query.get("Hello").add_hit()
+        hit_buffer = QueryHitBuffer(flush_interval=3600)
+
+        hit_buffer.add("Hello")
+        hit_buffer.add("hello ")
+        hit_buffer.add("Hello", date=datetime.date(2022, 1, 1))
+        hit_buffer.flush()
+
+        query = models.Query.get("Hello")
+        self.assertEqual(query.hits, 4)
+        self.assertEqual(
+            query.daily_hits.get(date=datetime.date(2022, 1, 1)).hits,
+            1,
+        )
+
+    def test_flushes_when_full(self):
+        hit_buffer = QueryHitBuffer(flush_interval=3600, max_size=2)
+
+        hit_buffer.add("Hello")
+        hit_buffer.add("Hello")
+        self.assertFalse(models.Query.objects.exists())
+
+        hit_buffer.add("World")
+
+        self.assertEqual(len(hit_buffer), 0)
+        self.assertEqual(models.Query.get("Hello").hits, 2)
+        self.assertEqual(models.Query.get("World").hits, 1)
+
+    def test_flushes_after_interval(self):
+        hit_buffer = QueryHitBuffer(flush_interval=0)
+
+        hit_buffer.add("Hello")
+
+        self.assertEqual(len(hit_buffer), 0)
+        self.assertEqual(models.Query.get("Hello").hits, 1)
+
+    @override_settings(WAGTAILSEARCH_BUFFER_HITS=True)
+    def test_query_hits_use_buffer(self):
+        # Use a buffer of our own in place of the process-wide one, so that its settings
+        # don't leak into other tests
+        hit_buffer = QueryHitBuffer(flush_interval=3600)
+        patcher = mock.patch("wagtail.search.hits._query_hit_buffer", hit_buffer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.assertIs(get_query_hit_buffer(), hit_buffer)
+
+        models.Query.record_hit("Hello")
+        models.Query.get("Hello").add_hit()
+
+        self.assertEqual(models.Query.get("Hello").hits, 0)
+
+        hit_buffer.flush()
+
+        self.assertEqual(models.Query.get("Hello").hits, 2)
+
+    def test_record_hit_without_buffer(self):
+        models.Query.record_hit("Hello")
+
+        self.assertEqual(models.Query.get("Hello").hits, 1)
+
+
 class TestQueryStringNormalisation(TestCase):
     def setUp(self):
         self.query = models.Query.get("  Hello  World!  ")
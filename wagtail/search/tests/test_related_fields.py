@@ -1,7 +1,7 @@
 from django.test import TestCase
 
 from wagtail.search import index
-from wagtail.test.search.models import Book, Novel
+from wagtail.test.search.models import Book, Novel, ProgrammingGuide
 from wagtail.test.testapp.models import Advert, ManyToManyBlogPage
 
 
@@ -59,6 +59,9 @@ class TestSelectOnQuerySet(TestCase):
         self.assertIn("categories", queryset._prefetch_related_lookups)
         self.assertFalse(queryset.query.select_related)
 
+        # Nested relations of prefetched objects should be prefetched too
+        self.assertIn("categories__category", queryset._prefetch_related_lookups)
+
     def test_select_on_queryset_with_reverse_one_to_one(self):
         fields = index.RelatedFields(
             "novel",
@@ -100,3 +103,43 @@ class TestSelectOnQuerySet(TestCase):
         # Tags should be prefetch_related
         self.assertIn("tags", queryset._prefetch_related_lookups)
         self.assertFalse(queryset.query.select_related)
+
+    def test_select_on_queryset_with_nested_foreign_key(self):
+        fields = index.RelatedFields(
+            "protagonist",
+            [
+                index.SearchField("name"),
+                index.RelatedFields("novel", [index.SearchField("title")]),
+            ],
+        )
+
+        queryset = fields.select_on_queryset(Novel.objects.all())
+
+        # Nested ForeignKeys should be select_related through the parent relation
+        self.assertFalse(queryset._prefetch_related_lookups)
+        self.assertEqual(queryset.query.select_related, {"protagonist": {"novel": {}}})
+
+
+class TestGetValue(TestCase):
+    def test_get_value(self):
+        field = index.SearchField("title")
+        book = Book(title="Learning Python")
+
+        self.assertEqual(field.get_value(book), "Learning Python")
+        self.assertEqual(
+            field.get_value(Novel(title="A Game of Thrones")), "A Game of Thrones"
+        )
+
+    def test_get_value_of_method(self):
+        field = index.FilterField("get_programming_language_display")
+        book = ProgrammingGuide(programming_language="py")
+
+        self.assertEqual(field.get_value(book), "Python")
+
+    def test_value_extractor_is_reused(self):
+        field = index.SearchField("title")
+
+        self.assertIs(field.get_value_extractor(Book), field.get_value_extractor(Book))
+        self.assertIsNot(
+            field.get_value_extractor(Book), field.get_value_extractor(Novel)
+        )
@@ -6,8 +6,12 @@ from django.db import connection
 from django.test.testcases import TestCase
 from django.test.utils import override_settings
 
-from wagtail.search.backends.database.sqlite.utils import fts5_available
+from wagtail.search.backends.database.sqlite.utils import (
+    fts5_available,
+    fts5_trigram_available,
+)
 from wagtail.search.tests.test_backends import BackendTests
+from wagtail.test.search import models
 
 
 @unittest.skipUnless(
@@ -35,30 +39,27 @@ class TestSQLiteSearchBackend(BackendTests, TestCase):
     def test_boost(self):
         return super().test_boost()
 
-    @skip("The SQLite backend doesn't score annotations.")
-    def test_annotate_score(self):
-        return super().test_annotate_score()
-
-    @skip("The SQLite backend doesn't score annotations.")
-    def test_annotate_score_with_slice(self):
-        return super().test_annotate_score_with_slice()
+    @unittest.skipUnless(
+        fts5_trigram_available(), "The SQLite trigram tokenizer is not available"
+    )
+    def test_autocomplete_matches_within_words(self):
+        results = self.backend.autocomplete("ython", models.Book)
 
-    @skip("The SQLite backend doesn't support autocomplete.")
-    def test_autocomplete(self):
-        return super().test_autocomplete()
+        self.assertUnsortedListEqual(
+            [r.title for r in results],
+            [
+                "Learning Python",
+            ],
+        )
 
-    @skip("The SQLite backend doesn't support autocomplete.")
-    def test_autocomplete_not_affected_by_stemming(self):
-        return super().test_autocomplete_not_affected_by_stemming()
+    def test_bm25_weights_use_search_field_boosts(self):
+        results = self.backend.search("JavaScript", models.Book)
 
-    @skip("The SQLite backend doesn't support autocomplete.")
-    def test_autocomplete_uses_autocompletefield(self):
-        return super().test_autocomplete_uses_autocompletefield()
+        # Weights are given for the autocomplete, body and title columns
+        self.assertEqual(results.query_compiler.get_bm25_weights(), (1.0, 1.0, 2.0))
 
-    @skip("The SQLite backend doesn't support autocomplete.")
-    def test_autocomplete_with_fields_arg(self):
-        return super().test_autocomplete_with_fields_arg()
+    def test_bm25_weights_average_boosts_of_body_fields(self):
+        results = self.backend.search("JavaScript", models.Novel)
 
-    @skip("The SQLite backend doesn't guarantee correct ranking of results.")
-    def test_ranking(self):
-        return super().test_ranking()
+        # The setting, author, protagonist, character and tag names are all indexed into the body
+        self.assertEqual(results.query_compiler.get_bm25_weights(), (1.0, 0.75, 2.0))
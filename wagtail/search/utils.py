@@ -3,7 +3,9 @@ import re
 from functools import partial
 
 from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
 from django.db import connections
+from django.db.models import Q
 
 from wagtail.search.index import RelatedFields, SearchField
 
@@ -200,3 +202,74 @@ def get_postgresql_connections():
         for connection in connections.all()
         if connection.vendor == "postgresql"
     ]
+
+
+def get_keyset_ordering(queryset):
+    """
+    Returns the ordering of a queryset as a list of (attname, descending) tuples, ending with
+    the primary key, so that it can be used for keyset pagination.
+
+    Returns None if the queryset is ordered by anything that can't be compared reliably, such
+    as expressions, fields on related models or nullable fields.
+    """
+    opts = queryset.model._meta
+
+    if queryset.query.order_by:
+        order_by = queryset.query.order_by
+    elif queryset.query.default_ordering:
+        order_by = opts.ordering
+    else:
+        order_by = []
+
+    ordering = []
+    descending = False
+    for item in order_by:
+        if not isinstance(item, str) or item == "?":
+            return
+
+        descending = item.startswith("-")
+        field_name = item.lstrip("-")
+        if field_name == "pk":
+            field_name = opts.pk.name
+
+        try:
+            field = opts.get_field(field_name)
+        except FieldDoesNotExist:
+            return
+
+        # Ordering by a relation orders by the related model's ordering, not its key
+        if field.is_relation and field_name != field.attname and not field.primary_key:
+            return
+
+        if not field.concrete or field.null:
+            return
+
+        ordering.append((field.attname, descending))
+
+    if opts.pk.attname not in [attname for attname, descending in ordering]:
+        ordering.append((opts.pk.attname, descending))
+
+    return ordering
+
+
+def get_keyset_filter(ordering, values):
+    """
+    Returns a Q object that matches the rows that come after ``values`` in ``ordering``
+    (as returned by get_keyset_ordering)
+    """
+    filters = []
+    for i, (attname, descending) in enumerate(ordering):
+        lookups = {
+            previous_attname: value
+            for (previous_attname, previous_descending), value in zip(
+                ordering[:i], values[:i]
+            )
+        }
+        lookups[attname + ("__lt" if descending else "__gt")] = values[i]
+        filters.append(Q(**lookups))
+
+    return OR(filters)
+
+
+def get_keyset_values(ordering, obj):
+    return [getattr(obj, attname) for attname, descending in ordering]
@@ -1,10 +1,40 @@
 import logging
 
+from asgiref.local import Local
+from django.apps import apps
+from django.contrib.auth.models import Group
 from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save, pre_delete
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+    pre_init,
+)
 
 from wagtail.coreutils import get_locales_display_names
-from wagtail.models import Locale, Page, Site
+from wagtail.models import (
+    Collection,
+    CollectionViewRestriction,
+    GroupPagePermission,
+    Locale,
+    Page,
+    PagePermissionIndex,
+    PageViewRestriction,
+    ReferenceIndex,
+    Site,
+    collection_restricted_paths,
+    page_restricted_paths,
+)
+from wagtail.models.ancestors import invalidate_ancestor_cache
+from wagtail.models.reference_index import (
+    get_base_model,
+    get_indexed_fields,
+    get_parental_key,
+    reference_index_updates_paused,
+)
+from wagtail.signals import post_page_move
 
 logger = logging.getLogger("wagtail")
 
@@ -29,10 +59,147 @@ def post_delete_page_log_deletion(sender, instance, **kwargs):
     logger.info('Page deleted: "%s" id=%d', instance.title, instance.id)
 
 
+# Discard cached ancestor chains whenever the page tree changes.
+def post_save_page_invalidate_ancestor_cache(sender, instance, **kwargs):
+    if isinstance(instance, Page):
+        invalidate_ancestor_cache()
+
+
+def post_delete_page_invalidate_ancestor_cache(sender, instance, **kwargs):
+    invalidate_ancestor_cache()
+
+
+def post_page_move_invalidate_ancestor_cache(sender, instance, **kwargs):
+    invalidate_ancestor_cache()
+
+
+# Rebuild the maps of restricted paths whenever view restrictions, or the paths or
+# aliases they apply to, change.
+def post_save_page_invalidate_restricted_paths(sender, instance, **kwargs):
+    if isinstance(instance, Page):
+        page_restricted_paths.invalidate()
+
+
+def invalidate_page_restricted_paths(sender, **kwargs):
+    page_restricted_paths.invalidate()
+
+
+def invalidate_collection_restricted_paths(sender, **kwargs):
+    collection_restricted_paths.invalidate()
+
+
+# Discard the cached page permissions of users whenever page permissions, the groups
+# of users or the paths of pages change.
+def invalidate_page_permission_indexes(sender, **kwargs):
+    PagePermissionIndex.invalidate()
+
+
+def m2m_changed_groups_invalidate_page_permission_indexes(
+    sender, instance, model, **kwargs
+):
+    if isinstance(instance, Group) or model is Group:
+        PagePermissionIndex.invalidate()
+
+
 def reset_locales_display_names_cache(sender, instance, **kwargs):
     get_locales_display_names.cache_clear()
 
 
+# Keep the reference index up to date as objects are saved and deleted. The values of the
+# indexed fields of objects are recorded as they're loaded from the database, so that a save
+# only rewrites the rows of the fields that have changed. Child objects of a ClusterableModel
+# update their own rows within those of their parent.
+_initialising_from_db = Local()
+
+
+def check_reference_index_init_args(sender, args, kwargs, **extra):
+    # Model.from_db initialises objects with positional arguments, while objects built
+    # from keyword arguments, such as those restored from a revision, aren't known to
+    # match the index even if they have a primary key
+    _initialising_from_db.value = bool(args) and not kwargs
+
+
+def record_reference_index_field_states(sender, instance, **kwargs):
+    if getattr(_initialising_from_db, "value", False):
+        _initialising_from_db.value = False
+        ReferenceIndex.record_field_states(instance)
+
+
+def update_reference_index_on_save(
+    sender, instance, created=False, raw=False, update_fields=None, **kwargs
+):
+    # Objects loaded from fixtures may refer to objects that haven't been loaded yet
+    if raw or reference_index_updates_paused():
+        return
+
+    # Saves that only write fields without references, such as those made when a page
+    # revision is saved, leave the index as it is
+    if update_fields is not None and not ReferenceIndex.model_has_indexed_fields(
+        sender, update_fields
+    ):
+        return
+
+    ReferenceIndex.update_for_saved_object(
+        instance, created=created, update_fields=update_fields
+    )
+
+
+# The objects of each model that are about to be deleted, so that the rows of all the objects
+# deleted together are removed from the index with one query
+_pending_reference_index_removals = Local()
+
+
+def collect_reference_index_removal(sender, instance, **kwargs):
+    if reference_index_updates_paused():
+        return
+
+    pending = getattr(_pending_reference_index_removals, "value", None)
+    if pending is None:
+        pending = _pending_reference_index_removals.value = {}
+    pending.setdefault(sender, []).append(instance)
+
+
+def update_reference_index_on_delete(sender, instance, using=None, **kwargs):
+    # A deletion sends pre_delete for all of the objects it deletes before it sends
+    # post_delete for any of them, so the first post_delete removes the rows of the whole
+    # batch, and the rest find nothing left to do
+    pending = getattr(_pending_reference_index_removals, "value", {}).pop(sender, [])
+    if not any(obj is instance for obj in pending):
+        return
+
+    if len(pending) > 1:
+        # Objects can be left over from an earlier deletion that failed, in which case
+        # they're still in the database
+        remaining_pks = set(
+            sender._base_manager.using(using)
+            .filter(pk__in=[obj.pk for obj in pending])
+            .values_list("pk", flat=True)
+        )
+        pending = [obj for obj in pending if obj.pk not in remaining_pks]
+
+    ReferenceIndex.remove_for_objects(pending)
+
+
+def get_reference_index_models():
+    """
+    Returns the models whose objects are indexed in their own right, along with the models
+    of their child objects that hold references
+    """
+    models = []
+    for model in apps.get_models():
+        root_model = model
+        parental_key = get_parental_key(root_model)
+        while parental_key is not None:
+            root_model = parental_key.related_model
+            parental_key = get_parental_key(root_model)
+
+        if ReferenceIndex.model_is_indexable(root_model) and any(
+            get_indexed_fields(model)
+        ):
+            models.append(model)
+    return models
+
+
 def register_signal_handlers():
     post_save.connect(post_save_site_signal_handler, sender=Site)
     post_delete.connect(post_delete_site_signal_handler, sender=Site)
@@ -40,5 +207,45 @@ def register_signal_handlers():
     pre_delete.connect(pre_delete_page_unpublish, sender=Page)
     post_delete.connect(post_delete_page_log_deletion, sender=Page)
 
+    post_save.connect(post_save_page_invalidate_ancestor_cache)
+    post_delete.connect(post_delete_page_invalidate_ancestor_cache, sender=Page)
+    post_page_move.connect(post_page_move_invalidate_ancestor_cache)
+
+    post_save.connect(post_save_page_invalidate_restricted_paths)
+    post_delete.connect(invalidate_page_restricted_paths, sender=Page)
+    post_page_move.connect(invalidate_page_restricted_paths)
+    post_save.connect(invalidate_page_restricted_paths, sender=PageViewRestriction)
+    post_delete.connect(invalidate_page_restricted_paths, sender=PageViewRestriction)
+
+    post_save.connect(invalidate_collection_restricted_paths, sender=Collection)
+    post_delete.connect(invalidate_collection_restricted_paths, sender=Collection)
+    post_save.connect(
+        invalidate_collection_restricted_paths, sender=CollectionViewRestriction
+    )
+    post_delete.connect(
+        invalidate_collection_restricted_paths, sender=CollectionViewRestriction
+    )
+
+    post_save.connect(invalidate_page_permission_indexes, sender=GroupPagePermission)
+    post_delete.connect(invalidate_page_permission_indexes, sender=GroupPagePermission)
+    post_page_move.connect(invalidate_page_permission_indexes)
+    m2m_changed.connect(m2m_changed_groups_invalidate_page_permission_indexes)
+
     post_save.connect(reset_locales_display_names_cache, sender=Locale)
     post_delete.connect(reset_locales_display_names_cache, sender=Locale)
+
+    # Only connected to the models that hold references, so that deleting objects of
+    # other models can still be done without sending signals for each object. The init and
+    # save signals are sent with the specific model of each object, and the delete signals
+    # are also sent for the parent model of each multi-table inheritance child (e.g. Page for
+    # every page type), so these are only connected to the base models.
+    base_models = set()
+    for model in get_reference_index_models():
+        pre_init.connect(check_reference_index_init_args, sender=model)
+        post_init.connect(record_reference_index_field_states, sender=model)
+        post_save.connect(update_reference_index_on_save, sender=model)
+        base_models.add(get_base_model(model))
+
+    for model in base_models:
+        pre_delete.connect(collect_reference_index_removal, sender=model)
+        post_delete.connect(update_reference_index_on_delete, sender=model)
@@ -17,6 +17,10 @@ page_published = Signal()
 # provides args: instance
 page_unpublished = Signal()
 
+# Sent once all aliases of a published page have been updated
+# provides args: instance, aliases, revision
+page_aliases_updated = Signal()
+
 # provides args: instance, instance_before
 page_slug_changed = Signal()
 
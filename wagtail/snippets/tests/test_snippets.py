@@ -1,5 +1,6 @@
 import datetime
 import json
+from io import StringIO
 from unittest import mock
 
 from django.contrib.admin.utils import quote
@@ -11,6 +12,7 @@ from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.handlers.wsgi import WSGIRequest
+from django.core.management import call_command
 from django.http import HttpRequest, HttpResponse
 from django.test import RequestFactory, TestCase
 from django.test.utils import override_settings
@@ -2137,6 +2139,11 @@ class TestSnippetOrdering(TestCase):
 class TestUsageCount(TestCase):
     fixtures = ["test.json"]
 
+    @classmethod
+    def setUpTestData(cls):
+        # Objects loaded from fixtures aren't added to the reference index as they're saved
+        call_command("rebuild_references_index", stdout=StringIO())
+
     @override_settings(WAGTAIL_USAGE_COUNT_ENABLED=True)
     def test_snippet_usage_count(self):
         advert = Advert.objects.get(pk=1)
@@ -2146,6 +2153,11 @@ class TestUsageCount(TestCase):
 class TestUsedBy(TestCase):
     fixtures = ["test.json"]
 
+    @classmethod
+    def setUpTestData(cls):
+        # Objects loaded from fixtures aren't added to the reference index as they're saved
+        call_command("rebuild_references_index", stdout=StringIO())
+
     @override_settings(WAGTAIL_USAGE_COUNT_ENABLED=True)
     def test_snippet_used_by(self):
         advert = Advert.objects.get(pk=1)
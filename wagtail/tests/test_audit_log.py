@@ -1,14 +1,21 @@
+import gzip
+import json
+import os
+import tempfile
 from datetime import datetime, timedelta
+from io import StringIO
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core import management
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 from django.utils import timezone
 from freezegun import freeze_time
 
-from wagtail.log_actions import LogActionRegistry
+from wagtail.log_actions import LogActionRegistry, LogEntryBuffer, log
 from wagtail.models import (
+    LogEntrySummary,
     Page,
     PageLogEntry,
     PageViewRestriction,
@@ -61,6 +68,59 @@ class TestAuditLogManager(TestCase, WagtailTestUtils):
             PageLogEntry.objects.get_for_user(self.user).count(), 1
         )  # the create from setUp
 
+    def test_log_entry_buffer(self):
+        PageLogEntry.objects.all().delete()
+
+        with LogEntryBuffer() as log_entry_buffer:
+            with self.assertNumQueries(0):
+                log(self.page, "wagtail.edit", user=self.user)
+                log(self.simple_page, "wagtail.edit", user=self.user)
+                log(self.simple_page, "wagtail.publish", user=self.user)
+            self.assertFalse(PageLogEntry.objects.exists())
+
+            # The buffered log entries are written with a single query
+            with self.assertNumQueries(1):
+                log_entry_buffer.flush()
+
+        self.assertEqual(
+            list(
+                PageLogEntry.objects.order_by("page_id", "action").values_list(
+                    "page_id", "action"
+                )
+            ),
+            [
+                (self.page.pk, "wagtail.edit"),
+                (self.simple_page.pk, "wagtail.edit"),
+                (self.simple_page.pk, "wagtail.publish"),
+            ],
+        )
+
+    def test_log_entry_buffer_writes_in_batches(self):
+        PageLogEntry.objects.all().delete()
+
+        with LogEntryBuffer(max_size=2):
+            log(self.page, "wagtail.edit")
+            log(self.simple_page, "wagtail.edit")
+            self.assertEqual(PageLogEntry.objects.count(), 2)
+            log(self.simple_page, "wagtail.publish")
+
+        self.assertEqual(PageLogEntry.objects.count(), 3)
+
+    def test_log_entry_buffer_discards_entries_on_error(self):
+        PageLogEntry.objects.all().delete()
+
+        with self.assertRaises(ZeroDivisionError):
+            with LogEntryBuffer():
+                log(self.page, "wagtail.edit")
+                1 / 0
+
+        self.assertFalse(PageLogEntry.objects.exists())
+
+    def test_log_entry_buffer_checks_action_is_registered(self):
+        with LogEntryBuffer():
+            with self.assertRaises(ValidationError):
+                log(self.page, "test.custom_action")
+
 
 class TestAuditLog(TestCase):
     def setUp(self):
@@ -457,3 +517,83 @@ class TestAuditLogHooks(TestCase, WagtailTestUtils):
             self.assertEqual(
                 log_actions.get_action_label("test.custom_action"), "Custom action"
             )
+
+
+@freeze_time("2022-08-10 12:00:00")
+class TestLogEntrySummary(TestCase, WagtailTestUtils):
+    def setUp(self):
+        self.page = Page.objects.get(id=1)
+        self.editor = self.create_user(username="editor")
+        self.moderator = self.create_user(username="moderator")
+        PageLogEntry.objects.all().delete()
+
+        now = timezone.now()
+        for days, user in [(3, self.editor), (3, self.editor), (2, None)]:
+            PageLogEntry.objects.log_action(
+                self.page,
+                "wagtail.edit",
+                user=user,
+                timestamp=now - timedelta(days=days),
+            )
+        # Today's log entries aren't summarised until the day is over
+        PageLogEntry.objects.log_action(
+            self.page, "wagtail.publish", user=self.moderator, timestamp=now
+        )
+
+    def test_update_summary(self):
+        LogEntrySummary.update_summary()
+
+        self.assertEqual(LogEntrySummary.objects.count(), 2)
+        summary = LogEntrySummary.objects.get(user=self.editor)
+        self.assertEqual(summary.date, datetime(2022, 8, 7).date())
+        self.assertEqual(summary.action, "wagtail.edit")
+        self.assertEqual(summary.count, 2)
+        summary = LogEntrySummary.objects.get(user__isnull=True)
+        self.assertEqual(summary.date, datetime(2022, 8, 8).date())
+        self.assertEqual(summary.count, 1)
+
+        # Days that have been summarised aren't counted again
+        LogEntrySummary.update_summary()
+        self.assertEqual(LogEntrySummary.objects.count(), 2)
+
+        self.assertEqual(
+            set(get_user_model().objects.filter(pk__in=LogEntrySummary.get_user_ids())),
+            {self.editor, self.moderator},
+        )
+
+    def test_archive_log_entries(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            management.call_command(
+                "archive_log_entries",
+                days=2,
+                output_dir=output_dir,
+                stdout=StringIO(),
+            )
+
+            with gzip.open(
+                os.path.join(
+                    output_dir, "wagtailcore_pagelogentry", "2022-08.jsonl.gz"
+                ),
+                "rt",
+            ) as archive_file:
+                archived = [json.loads(line) for line in archive_file]
+
+        self.assertEqual(len(archived), 2)
+        self.assertEqual(archived[0]["action"], "wagtail.edit")
+        self.assertEqual(archived[0]["timestamp"], "2022-08-07T12:00:00Z")
+        self.assertEqual(PageLogEntry.objects.count(), 2)
+
+        # The archived log entries are still in the summary
+        self.assertEqual(
+            sum(LogEntrySummary.objects.values_list("count", flat=True)), 3
+        )
+        self.assertTrue(
+            get_user_model()
+            .objects.filter(pk__in=LogEntrySummary.get_user_ids())
+            .filter(pk=self.editor.pk)
+            .exists()
+        )
+
+    def test_archive_requires_output_dir(self):
+        with self.assertRaises(management.CommandError):
+            management.call_command("archive_log_entries", days=2, stdout=StringIO())
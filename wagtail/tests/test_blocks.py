@@ -2884,6 +2884,27 @@ class TestListBlockWithFixtures(TestCase):
             ],
         )
 
+    def test_extract_references(self):
+        block = blocks.ListBlock(
+            blocks.StructBlock(
+                [
+                    ("title", blocks.CharBlock()),
+                    ("page", blocks.PageChooserBlock(required=False)),
+                ]
+            )
+        )
+        value = [
+            {"type": "item", "value": {"title": "a", "page": 4}, "id": "first"},
+            {"type": "item", "value": {"title": "b", "page": None}, "id": "second"},
+        ]
+
+        # References are extracted from the JSON-ish representation, without loading pages
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                list(block.extract_references(value)),
+                [(Page, "4", "item.page", "first.page")],
+            )
+
 
 class TestStreamBlock(WagtailTestUtils, SimpleTestCase):
     def test_initialisation(self):
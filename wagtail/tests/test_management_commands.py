@@ -5,13 +5,27 @@ from unittest import mock
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.core import management
-from django.db import models
-from django.test import TestCase
+from django.core.management.base import CommandError
+from django.db import models, transaction
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
-from wagtail.models import Collection, Page, PageLogEntry, Revision
+from wagtail.management.commands.publish_scheduled_pages import claim
+from wagtail.models import (
+    Collection,
+    Comment,
+    ModelLogEntry,
+    Page,
+    PageLogEntry,
+    Revision,
+)
 from wagtail.signals import page_published, page_unpublished
-from wagtail.test.testapp.models import EventPage, SecretPage, SimplePage
+from wagtail.test.testapp.models import (
+    DraftStateModel,
+    EventPage,
+    SecretPage,
+    SimplePage,
+)
 from wagtail.test.utils import WagtailTestUtils
 
 
@@ -407,6 +421,103 @@ class TestPublishScheduledPagesCommand(WagtailTestUtils, TestCase):
             ).exists()
         )
 
+    def test_go_live_pages_published_in_batches(self):
+        for i in range(5):
+            page = SimplePage(
+                title="Hello world %d" % i,
+                slug="hello-world-%d" % i,
+                content="hello",
+                live=False,
+                has_unpublished_changes=True,
+                go_live_at=timezone.now() - timedelta(days=1),
+            )
+            self.root_page.add_child(instance=page)
+            page.save_revision(approved_go_live_at=timezone.now() - timedelta(days=1))
+
+        management.call_command("publish_scheduled_pages", "--batch-size=2")
+
+        self.assertEqual(
+            Page.objects.filter(slug__startswith="hello-world-", live=True).count(),
+            5,
+        )
+        self.assertFalse(
+            Revision.objects.filter(approved_go_live_at__isnull=False).exists()
+        )
+
+    def test_already_published_revision_is_not_published_again(self):
+        page = SimplePage(
+            title="Hello world!",
+            slug="hello-world",
+            content="hello",
+            live=False,
+            has_unpublished_changes=True,
+            go_live_at=timezone.now() - timedelta(days=1),
+        )
+        self.root_page.add_child(instance=page)
+        revision = page.save_revision(
+            approved_go_live_at=timezone.now() - timedelta(days=1)
+        )
+
+        revisions_for_publishing = Revision.objects.filter(
+            approved_go_live_at__lt=timezone.now()
+        )
+        pks = list(revisions_for_publishing.values_list("pk", flat=True))
+
+        # Another process publishes the revision after the batch has been fetched
+        revision.publish()
+
+        with transaction.atomic():
+            self.assertIsNone(claim(revisions_for_publishing, pks[0]))
+
+    def test_go_live_snippet_will_be_published(self):
+        snippet = DraftStateModel.objects.create(
+            text="Draft-enabled Foo",
+            live=False,
+            go_live_at=timezone.now() - timedelta(days=1),
+        )
+        revision = snippet.save_revision(
+            approved_go_live_at=timezone.now() - timedelta(days=1)
+        )
+
+        management.call_command("publish_scheduled_pages")
+
+        snippet.refresh_from_db()
+        self.assertTrue(snippet.live)
+        self.assertEqual(snippet.live_revision, revision)
+        self.assertIsNone(Revision.objects.get(pk=revision.pk).approved_go_live_at)
+        self.assertTrue(
+            ModelLogEntry.objects.filter(
+                object_id=str(snippet.pk), action="wagtail.publish.scheduled"
+            ).exists()
+        )
+
+    def test_expired_snippet_will_be_unpublished(self):
+        snippet = DraftStateModel.objects.create(
+            text="Draft-enabled Foo",
+            live=True,
+            expire_at=timezone.now() - timedelta(days=1),
+        )
+        snippet.save_revision()
+
+        management.call_command("publish_scheduled_pages")
+
+        snippet.refresh_from_db()
+        self.assertFalse(snippet.live)
+        self.assertTrue(snippet.expired)
+
+    def test_future_expired_snippet_will_not_be_unpublished(self):
+        snippet = DraftStateModel.objects.create(
+            text="Draft-enabled Foo",
+            live=True,
+            expire_at=timezone.now() + timedelta(days=1),
+        )
+
+        management.call_command("publish_scheduled_pages")
+
+        snippet.refresh_from_db()
+        self.assertTrue(snippet.live)
+        self.assertFalse(snippet.expired)
+
 
 class TestPurgeRevisionsCommand(TestCase):
     fixtures = ["test.json"]
@@ -516,6 +627,117 @@ class TestPurgeRevisionsCommand(TestCase):
             old_revision, Revision.page_revisions.filter(object_id=self.page.id)
         )
 
+    def test_purge_revisions_in_batches(self):
+        revisions = [self.page.save_revision() for i in range(5)]
+
+        stdout = StringIO()
+        management.call_command("purge_revisions", "--batch-size=2", stdout=stdout)
+
+        # All but the latest revision should be deleted
+        self.assertEqual(
+            list(Revision.page_revisions.filter(object_id=self.page.id)),
+            [revisions[-1]],
+        )
+
+        output = stdout.getvalue()
+        self.assertIn("Deleted 2 revisions...", output)
+        self.assertIn("Deleted 4 revisions...", output)
+        self.assertIn("Successfully deleted 4 revisions", output)
+
+    def test_comments_moved_to_next_kept_revision(self):
+        revision_1 = self.page.save_revision()
+        self.page.save_revision()
+        revision_3 = self.page.save_revision()
+
+        comment = Comment.objects.create(
+            page=self.page,
+            user=get_user_model().objects.first(),
+            text="test",
+            contentpath="title",
+            revision_created=revision_1,
+        )
+
+        self.run_command()
+
+        # The comment should be kept on the latest revision, rather than being
+        # deleted along with the revision it was created on
+        comment.refresh_from_db()
+        self.assertEqual(comment.revision_created, revision_3)
+
+
+class TestCompactRevisionsCommand(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.page = SimplePage(
+            title="Hello world!",
+            slug="hello-world",
+            content="hello",
+            live=False,
+        )
+        Page.objects.get(id=2).add_child(instance=self.page)
+
+        self.revisions = []
+        for i in range(5):
+            self.page.content = "revision %d" % i
+            self.revisions.append(self.page.save_revision())
+
+    def run_command(self, *args):
+        stdout = StringIO()
+        management.call_command("compact_revisions", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def assertContentUnchanged(self):
+        for i, revision in enumerate(self.revisions):
+            revision = Revision.objects.get(pk=revision.pk)
+            self.assertEqual(revision.as_object().content, "revision %d" % i)
+
+    def test_requires_compression_to_be_enabled(self):
+        with self.assertRaises(CommandError):
+            self.run_command()
+
+    @override_settings(
+        WAGTAIL_REVISION_CONTENT_DELTAS=True, WAGTAIL_REVISION_KEYFRAME_INTERVAL=3
+    )
+    def test_compact_revisions_in_batches(self):
+        output = self.run_command("--batch-size=2")
+
+        self.assertIn("Converted 2 revisions...", output)
+        self.assertIn("Converted 4 revisions...", output)
+        self.assertIn("Successfully converted", output)
+        self.assertFalse(
+            Revision.page_revisions.filter(
+                object_id=str(self.page.pk), content_encoding=""
+            ).exists()
+        )
+        self.assertEqual(
+            [
+                Revision.objects.get(pk=revision.pk).delta_base_id
+                for revision in self.revisions
+            ],
+            [
+                None,
+                self.revisions[0].pk,
+                self.revisions[1].pk,
+                None,
+                self.revisions[3].pk,
+            ],
+        )
+        self.assertContentUnchanged()
+
+        # Running it again has nothing left to do
+        self.assertIn("No revisions converted", self.run_command())
+
+    def test_decompress_revisions(self):
+        with override_settings(WAGTAIL_REVISION_CONTENT_DELTAS=True):
+            self.run_command()
+
+        self.run_command("--decompress")
+
+        self.assertFalse(Revision.objects.exclude(content_encoding="").exists())
+        self.assertFalse(Revision.objects.filter(content__isnull=True).exists())
+        self.assertContentUnchanged()
+
 
 class TestCreateLogEntriesFromRevisionsCommand(TestCase):
     fixtures = ["test.json"]
@@ -588,3 +810,46 @@ class TestCreateLogEntriesFromRevisionsCommand(TestCase):
         ):
             management.call_command("create_log_entries_from_revisions")
             self.assertEqual(PageLogEntry.objects.count(), 0)
+
+
+class TestSetLastPublishedByCommand(TestCase, WagtailTestUtils):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.editor = self.create_user(username="editor")
+        self.moderator = self.create_user(username="moderator")
+        self.page = Page.objects.get(id=2)
+
+        now = timezone.now()
+        PageLogEntry.objects.log_action(
+            self.page,
+            "wagtail.publish",
+            user=self.editor,
+            timestamp=now - timedelta(days=2),
+        )
+        PageLogEntry.objects.log_action(
+            self.page,
+            "wagtail.publish",
+            user=self.moderator,
+            timestamp=now - timedelta(days=1),
+        )
+        PageLogEntry.objects.log_action(self.page, "wagtail.edit", user=self.editor)
+
+        Page.objects.filter(id=self.page.id).update(
+            last_published_at=now, last_published_by=None
+        )
+
+    def test_set_last_published_by(self):
+        management.call_command(
+            "set_last_published_by", batch_size=2, stdout=StringIO()
+        )
+
+        self.page.refresh_from_db()
+        self.assertEqual(self.page.last_published_by, self.moderator)
+
+        # Pages without publish log entries are left without a user
+        self.assertFalse(
+            Page.objects.exclude(id=self.page.id)
+            .filter(last_published_by__isnull=False)
+            .exists()
+        )
@@ -8,9 +8,13 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Group
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Value
+from django.db.models.functions import Concat, Substr
 from django.http import Http404, HttpRequest
 from django.test import Client, TestCase, override_settings
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone, translation
 from freezegun import freeze_time
 
@@ -29,7 +33,7 @@ from wagtail.models import (
     get_page_models,
     get_translatable_models,
 )
-from wagtail.signals import page_published
+from wagtail.signals import page_aliases_updated, page_published
 from wagtail.test.testapp.models import (
     AbstractPage,
     Advert,
@@ -67,6 +71,7 @@ from wagtail.test.testapp.models import (
     TaggedPage,
 )
 from wagtail.test.utils import WagtailTestUtils
+from wagtail.views import route_by_url_path
 
 
 def get_ct(model):
@@ -866,6 +871,76 @@ class TestServeView(TestCase):
         self.assertContains(response, "bad googlebot no cookie")
 
 
+class TestRouteByUrlPath(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.homepage = Page.objects.get(url_path="/home/")
+        self.request = RequestFactory().get("/")
+
+        # Create a few levels of pages that use the default routing
+        parent = self.homepage
+        for slug in ["one", "two", "three", "four"]:
+            parent = parent.add_child(
+                instance=SimplePage(title=slug.title(), slug=slug, content="hello")
+            )
+        self.deepest_page = parent
+
+    def test_route_to_deep_page(self):
+        # One query to find the pages on the path and one to fetch the specific page
+        with self.assertNumQueries(2):
+            page, args, kwargs = route_by_url_path(
+                self.request, self.homepage, ["one", "two", "three", "four"]
+            )
+
+        self.assertEqual(page, self.deepest_page)
+        self.assertIsInstance(page, SimplePage)
+
+    def test_route_to_root_page(self):
+        page, args, kwargs = route_by_url_path(self.request, self.homepage, [])
+        self.assertEqual(page, self.homepage)
+
+    def test_route_to_unknown_page_returns_404(self):
+        with self.assertRaises(Http404):
+            route_by_url_path(self.request, self.homepage, ["one", "two", "nope"])
+
+    def test_route_to_unpublished_page_returns_404(self):
+        self.deepest_page.live = False
+        self.deepest_page.save()
+
+        with self.assertRaises(Http404):
+            route_by_url_path(
+                self.request, self.homepage, ["one", "two", "three", "four"]
+            )
+
+    def test_route_defers_to_custom_route_methods(self):
+        # EventIndex.route serves numbered pages of events directly
+        response = route_by_url_path(self.request, self.homepage, ["events", "2"])
+        self.assertEqual(response.status_code, 200)
+
+        # SingleEventPage.route accepts a "pointless-suffix" path component
+        page, args, kwargs = route_by_url_path(
+            self.request,
+            self.homepage,
+            ["events", "saint-patrick", "pointless-suffix"],
+        )
+        self.assertEqual(
+            page, SingleEventPage.objects.get(url_path="/home/events/saint-patrick/")
+        )
+
+    def test_route_with_out_of_date_url_path(self):
+        Page.objects.filter(id=self.deepest_page.id).update(
+            url_path="/home/one/two/three/wrong/"
+        )
+        Page.objects.filter(url_path="/home/one/").update(url_path="/home/one-wrong/")
+
+        # Falls back to routing through the tree
+        page, args, kwargs = route_by_url_path(
+            self.request, self.homepage, ["one", "two", "three", "four"]
+        )
+        self.assertEqual(page, self.deepest_page)
+
+
 class TestStaticSitePaths(TestCase):
     def setUp(self):
         self.root_page = Page.objects.get(id=1)
@@ -1529,6 +1604,38 @@ class TestCopyPage(TestCase):
             msg="Child objects in revisions were not given a new primary key",
         )
 
+    @override_settings(WAGTAIL_REVISION_CONTENT_DELTAS=True)
+    def test_copy_page_copies_compact_revisions(self):
+        christmas_event = EventPage.objects.get(url_path="/home/events/christmas/")
+        christmas_event.save_revision()
+        christmas_event.title = "Updated christmas event"
+        christmas_event.save_revision()
+
+        new_christmas_event = christmas_event.copy(
+            update_attrs={"title": "New christmas event", "slug": "new-christmas-event"}
+        )
+
+        # The copied revisions are deltas against revisions of the new page, not the old one
+        new_revisions = new_christmas_event.revisions.order_by("created_at", "pk")
+        self.assertEqual(new_revisions.count(), 3)
+        self.assertFalse(
+            new_revisions.exclude(delta_base__isnull=True)
+            .exclude(delta_base__object_id=str(new_christmas_event.pk))
+            .exists()
+        )
+
+        for revision in new_revisions:
+            self.assertEqual(revision.content["pk"], new_christmas_event.pk)
+            self.assertEqual(
+                revision.content["speakers"][0]["page"], new_christmas_event.pk
+            )
+
+        self.assertEqual(new_revisions[1].as_object().title, "Updated christmas event")
+        self.assertEqual(
+            new_christmas_event.get_latest_revision().as_object().title,
+            "New christmas event",
+        )
+
     def test_copy_page_copies_revisions_and_doesnt_submit_for_moderation(self):
         christmas_event = EventPage.objects.get(url_path="/home/events/christmas/")
         christmas_event.save_revision(submitted_for_moderation=True)
@@ -2182,6 +2289,152 @@ class TestCopyPage(TestCase):
         self.assertIsNone(about_us_alias_copy.alias_of)
 
 
+class TestBulkCopyPage(TestCase):
+    fixtures = ["test.json"]
+
+    def copy_home(self, slug, **kwargs):
+        homepage = Page.objects.get(url_path="/home/")
+        return homepage.copy(
+            recursive=True,
+            to=Page.get_first_root_node(),
+            update_attrs={"title": "Copy of home", "slug": slug},
+            **kwargs,
+        )
+
+    def get_tree_summary(self, root):
+        root_depth = root.depth
+        return [
+            (
+                page.url_path.split("/", 2)[2],
+                page.depth - root_depth,
+                page.numchild,
+                page.live,
+                page.specific_class,
+                page.revisions.count(),
+            )
+            for page in root.get_descendants().order_by("path")
+        ]
+
+    def test_bulk_copy_matches_recursive_copy(self):
+        copy = self.copy_home("copy")
+        bulk_copy = self.copy_home("bulk-copy", bulk=True)
+
+        self.assertEqual(self.get_tree_summary(bulk_copy), self.get_tree_summary(copy))
+        self.assertEqual(bulk_copy.numchild, copy.numchild)
+
+        # The tree is consistent
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+
+        # Every copied page points to its new latest revision
+        for page in bulk_copy.get_descendants():
+            self.assertEqual(page.latest_revision.object_id, str(page.pk))
+            self.assertEqual(page.live_revision, page.latest_revision)
+            self.assertEqual(page.latest_revision.as_object().title, page.title)
+
+    def test_bulk_copy_copies_child_objects_and_revisions(self):
+        christmas_event = EventPage.objects.get(url_path="/home/events/christmas/")
+        christmas_event.title = "Christmas draft"
+        christmas_event.save_revision()
+
+        self.copy_home("bulk-copy", bulk=True)
+
+        new_christmas_event = EventPage.objects.get(
+            url_path="/bulk-copy/events/christmas/"
+        )
+        self.assertEqual(new_christmas_event.speakers.count(), 1)
+        self.assertEqual(christmas_event.speakers.count(), 1)
+
+        new_speaker = new_christmas_event.speakers.get()
+        copied_revision = new_christmas_event.revisions.order_by("created_at").first()
+        self.assertEqual(copied_revision.content["pk"], new_christmas_event.pk)
+        self.assertEqual(copied_revision.content["title"], "Christmas draft")
+        self.assertEqual(
+            copied_revision.content["speakers"][0]["page"], new_christmas_event.pk
+        )
+        self.assertEqual(copied_revision.content["speakers"][0]["pk"], new_speaker.pk)
+
+        latest_revision = new_christmas_event.get_latest_revision()
+        self.assertEqual(latest_revision.content["speakers"][0]["pk"], new_speaker.pk)
+
+    def test_bulk_copy_logs_actions(self):
+        bulk_copy = self.copy_home("bulk-copy", bulk=True)
+
+        for page in bulk_copy.get_descendants():
+            actions = set(
+                PageLogEntry.objects.filter(page=page).values_list("action", flat=True)
+            )
+            self.assertIn("wagtail.create", actions)
+            self.assertIn("wagtail.copy", actions)
+            self.assertEqual("wagtail.publish" in actions, page.live)
+
+    def test_bulk_copy_indexes_pages(self):
+        bulk_copy = self.copy_home("bulk-copy", bulk=True)
+
+        results = Page.objects.live().descendant_of(bulk_copy).search("Christmas")
+        self.assertIn("Christmas", [page.title for page in results])
+
+    @override_settings(WAGTAIL_REVISION_CONTENT_COMPRESSION="zlib")
+    def test_bulk_copy_compresses_revisions(self):
+        christmas_event = EventPage.objects.get(url_path="/home/events/christmas/")
+        christmas_event.title = "Christmas draft"
+        christmas_event.save_revision()
+
+        self.copy_home("bulk-copy", bulk=True)
+
+        new_christmas_event = EventPage.objects.get(
+            url_path="/bulk-copy/events/christmas/"
+        )
+        new_revisions = new_christmas_event.revisions.order_by("created_at", "pk")
+        self.assertEqual(new_revisions.count(), 2)
+        for revision in new_revisions:
+            self.assertEqual(revision.content_encoding, "zlib")
+            self.assertIsNotNone(revision.compressed_content)
+            self.assertEqual(revision.content["pk"], new_christmas_event.pk)
+
+        # Content is only stored in the compressed column
+        self.assertFalse(new_revisions.filter(content__isnull=False).exists())
+        self.assertEqual(new_revisions[0].as_object().title, "Christmas draft")
+        self.assertEqual(
+            new_christmas_event.get_latest_revision().as_object().title,
+            "Christmas",
+        )
+
+    def test_page_published_signal_is_opt_in(self):
+        published_pages = []
+
+        def page_published_handler(sender, instance, **kwargs):
+            published_pages.append(instance.pk)
+
+        page_published.connect(page_published_handler)
+        try:
+            bulk_copy = self.copy_home("bulk-copy", bulk=True)
+            self.assertEqual(published_pages, [bulk_copy.pk])
+
+            published_pages.clear()
+            bulk_copy = self.copy_home(
+                "bulk-copy-2", bulk=True, send_published_signals=True
+            )
+            self.assertEqual(
+                set(published_pages),
+                set(
+                    bulk_copy.get_descendants(inclusive=True)
+                    .live()
+                    .values_list("pk", flat=True)
+                ),
+            )
+        finally:
+            page_published.disconnect(page_published_handler)
+
+    def test_bulk_copy_uses_fewer_queries(self):
+        with CaptureQueriesContext(connection) as recursive_queries:
+            self.copy_home("copy")
+
+        with CaptureQueriesContext(connection) as bulk_queries:
+            self.copy_home("bulk-copy", bulk=True)
+
+        self.assertLess(len(bulk_queries), len(recursive_queries) / 2)
+
+
 class TestCreateAlias(TestCase):
     fixtures = ["test.json"]
 
@@ -2704,6 +2957,125 @@ class TestUpdateAliases(TestCase):
             ).exists()
         )
 
+    def test_update_aliases_keeps_alias_slugs(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+
+        event_page.title = "Updated title"
+        event_page.slug = "updated-slug"
+        event_page.save()
+
+        event_page.update_aliases()
+
+        alias.refresh_from_db()
+        self.assertEqual(alias.title, "Updated title")
+        self.assertEqual(alias.slug, "new-event-page")
+        self.assertEqual(alias.url_path, "/home/events/new-event-page/")
+
+    def test_update_aliases_copies_parental_many_to_many_relations(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+        alias_alias = alias.create_alias(update_slug="new-event-page-2")
+
+        category = EventCategory.objects.create(name="Festive")
+        event_page.categories = [category]
+        event_page.save()
+
+        event_page.update_aliases()
+
+        self.assertEqual(list(alias.categories.all()), [category])
+        self.assertEqual(list(alias_alias.categories.all()), [category])
+        self.assertEqual(list(event_page.categories.all()), [category])
+
+    def test_update_aliases_copies_many_to_many_relations(self):
+        home_page = Page.objects.get(url_path="/home/")
+        blog_page = home_page.add_child(
+            instance=ManyToManyBlogPage(title="Blog", slug="blog")
+        )
+        alias = blog_page.create_alias(update_slug="blog-alias")
+        alias_alias = alias.create_alias(update_slug="blog-alias-2")
+
+        advert = Advert.objects.create(text="An advert")
+        blog_page.adverts.set([advert])
+
+        blog_page.update_aliases()
+
+        self.assertEqual(list(alias.adverts.all()), [advert])
+        self.assertEqual(list(alias_alias.adverts.all()), [advert])
+
+    def test_update_aliases_updates_descendant_url_paths(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+        child_page = alias.add_child(
+            instance=SimplePage(title="Child", slug="child", content="hello")
+        )
+
+        # Simulate the alias having gone out of line with its slug
+        Page.objects.filter(path__startswith=alias.path).update(
+            url_path=Concat(Value("/home/events/stale/"), Substr("url_path", 29))
+        )
+        child_page.refresh_from_db()
+        self.assertEqual(child_page.url_path, "/home/events/stale/child/")
+
+        event_page.update_aliases()
+
+        alias.refresh_from_db()
+        child_page.refresh_from_db()
+        self.assertEqual(alias.url_path, "/home/events/new-event-page/")
+        self.assertEqual(child_page.url_path, "/home/events/new-event-page/child/")
+
+    def test_update_aliases_sends_signals(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+        alias_alias = alias.create_alias(update_slug="new-event-page-2")
+
+        page_published_handler = Mock()
+        page_aliases_updated_handler = Mock()
+        page_published.connect(page_published_handler)
+        page_aliases_updated.connect(page_aliases_updated_handler)
+        try:
+            event_page.update_aliases()
+        finally:
+            page_published.disconnect(page_published_handler)
+            page_aliases_updated.disconnect(page_aliases_updated_handler)
+
+        self.assertEqual(page_published_handler.call_count, 2)
+        for call, page in zip(
+            page_published_handler.call_args_list, [alias, alias_alias]
+        ):
+            self.assertEqual(call.kwargs["instance"], page)
+            self.assertTrue(call.kwargs["alias"])
+
+        # The aliases are also sent together once all of them have been updated
+        page_aliases_updated_handler.assert_called_once()
+        call = page_aliases_updated_handler.call_args
+        self.assertEqual(call.kwargs["sender"], EventPage)
+        self.assertEqual(call.kwargs["instance"], event_page)
+        self.assertEqual(call.kwargs["aliases"], [alias, alias_alias])
+
+    def test_update_aliases_query_count(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        event_page.create_alias(update_slug="new-event-page-1")
+
+        # Warm up any caches
+        event_page.update_aliases()
+
+        with CaptureQueriesContext(connection) as one_alias_queries:
+            event_page.update_aliases()
+
+        for i in range(2, 6):
+            event_page.create_alias(update_slug="new-event-page-%d" % i)
+
+        # Aliases are updated in bulk, so the number of queries doesn't depend on the
+        # number of aliases
+        with self.assertNumQueries(len(one_alias_queries)):
+            event_page.update_aliases()
+
+        self.assertEqual(
+            EventPageSpeaker.objects.filter(page__alias_of=event_page).count(),
+            5 * event_page.speakers.count(),
+        )
+
 
 class TestCopyForTranslation(TestCase):
     fixtures = ["test.json"]
@@ -2,6 +2,7 @@ import json
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.test import Client, TestCase, override_settings
 from django.utils import timezone
 
@@ -10,6 +11,7 @@ from wagtail.models import (
     GroupPagePermission,
     Locale,
     Page,
+    PagePermissionIndex,
     UserPagePermissionsProxy,
     Workflow,
     WorkflowTask,
@@ -915,3 +917,60 @@ class TestPagePermissionTesterCanCopyTo(TestCase):
         self.assertFalse(
             singleton_page_perms.can_copy_to(self.singleton_page.get_parent())
         )
+
+
+class TestPagePermissionIndex(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.event_moderator = get_user_model().objects.get(
+            email="eventmoderator@example.com"
+        )
+        self.events_page = Page.objects.get(url_path="/home/events/")
+        self.christmas_page = Page.objects.get(url_path="/home/events/christmas/")
+        self.about_us_page = Page.objects.get(url_path="/home/about-us/")
+
+    def test_get_permission_types(self):
+        index = PagePermissionIndex.for_user(self.event_moderator)
+
+        self.assertEqual(
+            index.get_permission_types(self.christmas_page.path),
+            {"add", "edit", "publish", "lock", "unlock"},
+        )
+        self.assertEqual(index.get_permission_types(self.about_us_page.path), set())
+        self.assertEqual(index.get_paths("publish"), [self.events_page.path])
+        self.assertTrue(index.has_permission_type("unlock"))
+
+    def test_permission_checks_query_permissions_once(self):
+        user_perms = UserPagePermissionsProxy(self.event_moderator)
+        pages = list(Page.objects.all())
+
+        with self.assertNumQueries(1):
+            permissions = {
+                page.pk: user_perms.for_page(page).permissions for page in pages
+            }
+
+        self.assertIn("publish", permissions[self.christmas_page.pk])
+        self.assertEqual(permissions[self.about_us_page.pk], set())
+
+    @override_settings(
+        WAGTAIL_PAGE_PERMISSION_CACHE=True,
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            }
+        },
+    )
+    def test_cached_index_is_invalidated(self):
+        cache.clear()
+        PagePermissionIndex.for_user(self.event_moderator)
+
+        with self.assertNumQueries(0):
+            index = PagePermissionIndex.for_user(self.event_moderator)
+        self.assertFalse(index.get_permission_types(self.about_us_page.path))
+
+        # Adding a group to the user discards the cached index
+        self.event_moderator.groups.add(Group.objects.get(name="Site-wide editors"))
+
+        index = PagePermissionIndex.for_user(self.event_moderator)
+        self.assertIn("edit", index.get_permission_types(self.about_us_page.path))
@@ -1,7 +1,10 @@
 from django.contrib.auth.models import Group
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
+from wagtail.coreutils import get_dummy_request
 from wagtail.models import Page, PageViewRestriction
+from wagtail.models.ancestors import get_ancestor_cache
 from wagtail.test.utils import WagtailTestUtils
 
 
@@ -152,6 +155,23 @@ class TestPagePrivacy(TestCase, WagtailTestUtils):
             html=True,
         )
 
+    def test_aliases_of_restricted_pages_are_public_in_querysets(self):
+        secret_plans_page = Page.objects.get(url_path="/home/secret-plans/")
+        secret_plans_alias_page = secret_plans_page.create_alias(
+            update_slug="alias-secret-plans"
+        )
+
+        # Aliases only share the restrictions of their source page when they're served
+        self.assertEqual(
+            list(secret_plans_alias_page.get_view_restrictions()),
+            [self.view_restriction],
+        )
+        self.assertTrue(Page.objects.public().filter(id=secret_plans_alias_page.id))
+        self.assertFalse(
+            Page.objects.not_public().filter(id=secret_plans_alias_page.id)
+        )
+        self.assertTrue(Page.objects.not_public().filter(id=secret_plans_page.id))
+
     def test_view_restrictions_apply_to_subpages_of_aliases(self):
         secret_plans_page = Page.objects.get(url_path="/home/secret-plans/")
         secret_plans_alias_page = secret_plans_page.create_alias(
@@ -214,3 +234,129 @@ class TestPagePrivacy(TestCase, WagtailTestUtils):
         response = self.client.get("/secret-login-plans/")
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "<title>Secret login plans</title>")
+
+
+class TestViewRestrictionsAncestorCache(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.secret_plans_page = Page.objects.get(url_path="/home/secret-plans/")
+        self.underpants_page = Page.objects.get(
+            url_path="/home/secret-plans/steal-underpants/"
+        )
+        self.view_restriction = PageViewRestriction.objects.get(
+            page=self.secret_plans_page
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_ancestors_are_queried_once_per_request(self):
+        request = get_dummy_request()
+
+        with self.assertNumQueries(2):
+            self.assertEqual(
+                list(self.underpants_page.get_view_restrictions(request=request)),
+                [self.view_restriction],
+            )
+
+        # The ancestors of the secret plans page are already known
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                list(self.secret_plans_page.get_view_restrictions(request=request)),
+                [self.view_restriction],
+            )
+
+    def test_ancestor_records_are_shared(self):
+        ancestor_cache = get_ancestor_cache()
+
+        underpants_ancestors = ancestor_cache.get_ancestors(self.underpants_page)
+        secret_plans_ancestors = ancestor_cache.get_ancestors(
+            self.secret_plans_page, inclusive=True
+        )
+
+        self.assertEqual(
+            [record.id for record in underpants_ancestors],
+            [1, 2, self.secret_plans_page.id],
+        )
+        self.assertIs(underpants_ancestors[1], secret_plans_ancestors[1])
+
+    def test_view_restrictions_apply_to_aliases_of_aliases(self):
+        secret_plans_alias_page = self.secret_plans_page.create_alias(
+            update_slug="alias-secret-plans"
+        )
+        alias_of_alias_page = secret_plans_alias_page.create_alias(
+            update_slug="alias-of-alias-secret-plans"
+        )
+
+        self.assertEqual(
+            list(
+                alias_of_alias_page.get_view_restrictions(request=get_dummy_request())
+            ),
+            [self.view_restriction],
+        )
+
+    @override_settings(
+        WAGTAIL_PAGE_ANCESTOR_CACHE=True,
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            }
+        },
+    )
+    def test_process_cache(self):
+        with self.assertNumQueries(1):
+            get_ancestor_cache(get_dummy_request()).get_ancestors(self.underpants_page)
+
+        # The ancestors are kept between requests
+        with self.assertNumQueries(0):
+            get_ancestor_cache(get_dummy_request()).get_ancestors(self.underpants_page)
+
+        # Saving a page discards the cache
+        self.secret_plans_page.save()
+
+        with self.assertNumQueries(1):
+            get_ancestor_cache(get_dummy_request()).get_ancestors(self.underpants_page)
+
+
+@override_settings(
+    WAGTAIL_VIEW_RESTRICTION_CACHE=True,
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    },
+)
+class TestPagePrivacyWithRestrictionCache(TestPagePrivacy):
+    def setUp(self):
+        cache.clear()
+        super().setUp()
+
+    def test_unrestricted_page_does_not_query_restrictions(self):
+        about_us_page = Page.objects.get(url_path="/home/about-us/")
+        list(about_us_page.get_view_restrictions())
+
+        with self.assertNumQueries(0):
+            self.assertEqual(list(about_us_page.get_view_restrictions()), [])
+
+    def test_new_restriction_is_applied(self):
+        about_us_page = Page.objects.get(url_path="/home/about-us/")
+        response = self.client.get("/about-us/")
+        self.assertEqual(response.status_code, 200)
+
+        PageViewRestriction.objects.create(
+            page=about_us_page, restriction_type=PageViewRestriction.LOGIN
+        )
+        response = self.client.get("/about-us/")
+        self.assertRedirects(response, "/_util/login/?next=/about-us/")
+
+    def test_public_and_private(self):
+        self.assertNotIn(self.secret_plans_page, Page.objects.public())
+        self.assertIn(self.secret_plans_page, Page.objects.private())
+        self.assertIn(
+            Page.objects.get(url_path="/home/secret-plans/steal-underpants/"),
+            Page.objects.not_public(),
+        )
+        self.assertIn(
+            Page.objects.get(url_path="/home/about-us/"), Page.objects.public()
+        )
@@ -1,9 +1,12 @@
 from unittest import mock
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db.models import Count, Q
+from django.template import Context, Template
 from django.test import TestCase
 
+from wagtail.coreutils import get_dummy_request
 from wagtail.models import Locale, Page, PageViewRestriction, Site
 from wagtail.search.query import MATCH_ALL
 from wagtail.signals import page_unpublished
@@ -101,6 +104,39 @@ class TestPageQuerySet(TestCase):
         # Check that event index was included
         self.assertTrue(pages.filter(id=events_index.id).exists())
 
+    def test_descendant_of_paths_q(self):
+        paths = [
+            page.path
+            for page in Page.objects.filter(
+                url_path__in=[
+                    "/home/events/",
+                    "/home/events/christmas/",
+                    "/home/about-us/",
+                    "/home/contact-us/",
+                    "/home/secret-plans/steal-underpants/",
+                ]
+            )
+        ]
+
+        expected_q = Q()
+        for path in paths:
+            expected_q |= Q(path__startswith=path)
+
+        q = Page.objects.descendant_of_paths_q(paths)
+
+        self.assertEqual(
+            set(Page.objects.filter(q)), set(Page.objects.filter(expected_q))
+        )
+
+        # Christmas is within events, and the ranges of events, about us and contact us
+        # (which are consecutive siblings) are merged
+        self.assertEqual(len(q.children), 2)
+
+    def test_descendant_of_paths_q_without_paths(self):
+        self.assertFalse(
+            Page.objects.filter(Page.objects.descendant_of_paths_q([])).exists()
+        )
+
     def test_not_descendant_of(self):
         events_index = Page.objects.get(url_path="/home/events/")
         pages = Page.objects.not_descendant_of(events_index)
@@ -1176,3 +1212,97 @@ class TestFirstCommonAncestor(TestCase):
             self.assertNotIn("body", page.__dict__)
             with self.assertNumQueries(1):
                 page.body
+
+
+class TestAnnotateUrls(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        # Clear the cache of site root paths, as this is bypassed when the database is
+        # rolled back between tests
+        cache.delete("wagtail_site_root_paths")
+
+    def test_annotate_urls(self):
+        expected_urls = {page.pk: page.url for page in Page.objects.all()}
+
+        pages = list(Page.objects.all().annotate_urls())
+
+        with self.assertNumQueries(0):
+            for page in pages:
+                self.assertEqual(page.url, expected_urls[page.pk])
+                self.assertEqual(
+                    page.full_url,
+                    None if page.url is None else "http://localhost" + page.url,
+                )
+
+    def test_annotate_urls_looks_up_site_root_paths_once(self):
+        with mock.patch.object(
+            Site, "get_site_root_paths", wraps=Site.get_site_root_paths
+        ) as get_site_root_paths:
+            pages = list(Page.objects.all().annotate_urls())
+            for page in pages:
+                page.url
+
+        get_site_root_paths.assert_called_once()
+
+    def test_annotate_urls_with_iterator(self):
+        expected_urls = {page.pk: page.url for page in Page.objects.all()}
+
+        for page in Page.objects.all().annotate_urls().iterator():
+            with self.assertNumQueries(0):
+                self.assertEqual(page.url, expected_urls[page.pk])
+
+    def test_annotate_urls_with_request(self):
+        request = get_dummy_request()
+        pages = list(Page.objects.live().annotate_urls(request))
+
+        template = Template(
+            "{% load wagtailcore_tags %}{% for page in pages %}{% pageurl page %} {% endfor %}"
+        )
+        with self.assertNumQueries(0):
+            result = template.render(Context({"request": request, "pages": pages}))
+
+        self.assertIn("/events/christmas/ ", result)
+
+        # URLs computed for another request (or none) are not reused
+        other_request = get_dummy_request()
+        with mock.patch.object(
+            Site, "get_site_root_paths", wraps=Site.get_site_root_paths
+        ) as get_site_root_paths:
+            pages[0].get_url(request=other_request)
+        get_site_root_paths.assert_called_once()
+
+    def test_annotate_urls_with_specific(self):
+        # SingleEventPage overrides get_url_parts to add a suffix to the URL
+        page = (
+            Page.objects.filter(url_path="/home/events/saint-patrick/")
+            .annotate_urls()
+            .specific()
+            .get()
+        )
+        self.assertEqual(page.url, "/events/saint-patrick/pointless-suffix/")
+
+        page = (
+            Page.objects.filter(url_path="/home/events/saint-patrick/")
+            .annotate_urls()
+            .get()
+        )
+        self.assertEqual(page.specific.url, "/events/saint-patrick/pointless-suffix/")
+
+    def test_annotate_urls_with_values(self):
+        self.assertEqual(
+            list(
+                Page.objects.filter(url_path="/home/")
+                .annotate_urls()
+                .values_list("slug", flat=True)
+            ),
+            ["home"],
+        )
+
+    def test_changing_slug_updates_url(self):
+        page = Page.objects.filter(url_path="/home/events/").annotate_urls().get()
+        self.assertEqual(page.url, "/events/")
+
+        page.slug = "whats-on"
+        page.set_url_path(page.get_parent())
+        self.assertEqual(page.url, "/whats-on/")
@@ -0,0 +1,213 @@
+import json
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core import management
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from wagtail.documents import get_document_model
+from wagtail.images import get_image_model
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Page, ReferenceIndex
+from wagtail.test.testapp.models import EventPage, EventPageCarouselItem, StreamPage
+
+
+class TestReferenceIndex(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.root_page = Page.objects.get(id=2)
+        self.event_page = EventPage.objects.get(id=4)
+        self.image = get_image_model().objects.create(
+            title="Test image", file=get_test_image_file()
+        )
+        self.document = get_document_model().objects.get(id=1)
+
+    def create_stream_page(self):
+        page = StreamPage(
+            title="Stream page",
+            slug="stream-page",
+            body=json.dumps(
+                [
+                    {"type": "image", "value": self.image.id, "id": "image-block"},
+                    {
+                        "type": "rich_text",
+                        "value": '<p><a linktype="page" id="4">Event</a> and '
+                        '<a linktype="document" id="1">a document</a></p>',
+                        "id": "text-block",
+                    },
+                ]
+            ),
+        )
+        self.root_page.add_child(instance=page)
+        return page
+
+    def get_paths(self, obj):
+        return set(
+            ReferenceIndex.get_references_for_object(obj).values_list(
+                "model_path", "content_path"
+            )
+        )
+
+    def test_streamfield_and_rich_text_references(self):
+        page = self.create_stream_page()
+
+        self.assertEqual(
+            self.get_paths(page),
+            {
+                ("body.image", "body.image-block"),
+                ("body.rich_text", "body.text-block"),
+            },
+        )
+        self.assertEqual(ReferenceIndex.get_references_to(self.image).count(), 1)
+        self.assertEqual(ReferenceIndex.get_references_to(self.document).count(), 1)
+
+        # Pages are recorded under the base Page model
+        reference = ReferenceIndex.get_references_to(self.event_page).get()
+        self.assertEqual(
+            reference.to_content_type, ContentType.objects.get_for_model(Page)
+        )
+        self.assertEqual(
+            reference.content_type, ContentType.objects.get_for_model(StreamPage)
+        )
+
+    def test_stale_references_are_removed(self):
+        page = self.create_stream_page()
+        page.body = json.dumps(
+            [{"type": "image", "value": self.image.id, "id": "image-block"}]
+        )
+        page.save()
+
+        self.assertEqual(self.get_paths(page), {("body.image", "body.image-block")})
+        self.assertFalse(ReferenceIndex.get_references_to(self.document).exists())
+
+    def test_saving_unchanged_object_leaves_index_alone(self):
+        page = self.create_stream_page()
+        page = StreamPage.objects.get(id=page.id)
+
+        with self.assertNumQueries(0):
+            ReferenceIndex.update_for_saved_object(page)
+
+        # Only the rows of the fields that have changed are replaced
+        page.body = json.dumps(
+            [{"type": "image", "value": self.image.id, "id": "image-block"}]
+        )
+        ReferenceIndex.update_for_saved_object(page)
+        self.assertEqual(self.get_paths(page), {("body.image", "body.image-block")})
+
+    def test_publishing_revision_updates_references(self):
+        page = self.create_stream_page()
+        page.body = json.dumps(
+            [{"type": "image", "value": self.image.id, "id": "image-block"}]
+        )
+        page.save_revision().publish()
+
+        self.assertEqual(self.get_paths(page), {("body.image", "body.image-block")})
+        self.assertFalse(ReferenceIndex.get_references_to(self.document).exists())
+
+    def test_saving_revision_does_not_index_draft_content(self):
+        page = self.create_stream_page()
+        page.body = json.dumps([])
+        page.save_revision()
+
+        self.assertEqual(len(self.get_paths(page)), 2)
+
+    def test_child_object_references(self):
+        item = EventPageCarouselItem.objects.create(
+            page=self.event_page, image=self.image
+        )
+
+        reference = ReferenceIndex.get_references_to(self.image).get()
+        self.assertEqual(reference.model_path, "carousel_items.image")
+        self.assertEqual(reference.content_path, "carousel_items.%d.image" % item.pk)
+        self.assertEqual(reference.object_id, str(self.event_page.pk))
+        self.assertEqual(self.image.get_usage().get(), self.event_page.page_ptr)
+
+        other_image = get_image_model().objects.create(
+            title="Other image", file=get_test_image_file()
+        )
+        item = EventPageCarouselItem.objects.get(id=item.id)
+        item.image = other_image
+        item.save()
+        self.assertFalse(ReferenceIndex.get_references_to(self.image).exists())
+        self.assertEqual(
+            ReferenceIndex.get_references_to(other_image).get().content_path,
+            "carousel_items.%d.image" % item.pk,
+        )
+
+        item.delete()
+        self.assertFalse(ReferenceIndex.get_references_to(other_image).exists())
+
+    def test_deleting_object_removes_its_references(self):
+        page = self.create_stream_page()
+        page.delete()
+
+        self.assertFalse(ReferenceIndex.get_references_to(self.image).exists())
+
+    def test_deleting_objects_removes_their_references_together(self):
+        parent = self.root_page.add_child(
+            instance=StreamPage(title="Parent", slug="parent", body="[]")
+        )
+        for i in range(3):
+            parent.add_child(
+                instance=StreamPage(
+                    title="Child %d" % i,
+                    slug="child-%d" % i,
+                    body=json.dumps([{"type": "image", "value": self.image.id}]),
+                )
+            )
+        self.assertEqual(ReferenceIndex.get_references_to(self.image).count(), 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            parent.delete()
+
+        self.assertFalse(ReferenceIndex.get_references_to(self.image).exists())
+        # The rows of all the deleted pages are removed with a single query
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in queries.captured_queries
+                    if query["sql"].startswith("DELETE")
+                    and ReferenceIndex._meta.db_table in query["sql"]
+                ]
+            ),
+            1,
+        )
+
+    def test_get_usage_is_a_single_query(self):
+        self.create_stream_page()
+        EventPageCarouselItem.objects.create(page=self.event_page, image=self.image)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(len(self.image.get_usage()), 2)
+
+
+class TestRebuildReferencesIndexCommand(TestCase):
+    fixtures = ["test.json"]
+
+    def test_rebuild(self):
+        # The objects loaded from fixtures aren't indexed as they're saved
+        self.assertFalse(ReferenceIndex.objects.exists())
+
+        out = StringIO()
+        management.call_command(
+            "rebuild_references_index", batch_size=2, verbosity=2, stdout=out
+        )
+
+        self.assertEqual(
+            set(
+                ReferenceIndex.get_references_to(
+                    get_image_model().objects.get(id=1)
+                ).values_list("object_id", "model_path")
+            ),
+            {("4", "feed_image"), ("9", "body")},
+        )
+        self.assertIn("Indexed 2 event pages...", out.getvalue())
+
+        # Rebuilding again gives the same index
+        references_count = ReferenceIndex.objects.count()
+        management.call_command("rebuild_references_index", stdout=StringIO())
+        self.assertEqual(ReferenceIndex.objects.count(), references_count)
@@ -1,5 +1,5 @@
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from wagtail.models import Page, Revision, get_default_page_content_type
 from wagtail.test.testapp.models import (
@@ -125,3 +125,107 @@ class TestRevisableModel(TestCase):
         self.assertIsInstance(instance, SimplePage)
         self.assertEqual(instance.content, "updated")
         self.assertEqual(hello_page.content, "hello")
+
+
+@override_settings(
+    WAGTAIL_REVISION_CONTENT_COMPRESSION="zlib",
+    WAGTAIL_REVISION_CONTENT_DELTAS=True,
+    WAGTAIL_REVISION_KEYFRAME_INTERVAL=3,
+)
+class TestCompactRevisionContent(TestCase):
+    def setUp(self):
+        self.instance = RevisableModel.objects.create(text="foo")
+
+    def save_revisions(self, count):
+        revisions = []
+        for i in range(count):
+            self.instance.text = "revision %d" % i
+            revisions.append(self.instance.save_revision())
+        return revisions
+
+    def test_revisions_are_stored_as_deltas_with_keyframes(self):
+        revisions = self.save_revisions(5)
+        stored = Revision.objects.filter(pk__in=[r.pk for r in revisions]).order_by(
+            "pk"
+        )
+
+        self.assertEqual(
+            [revision.delta_base_id for revision in stored],
+            [None, revisions[0].pk, revisions[1].pk, None, revisions[3].pk],
+        )
+        for revision in stored:
+            self.assertEqual(revision.content_encoding, "zlib")
+            self.assertIsNotNone(revision.compressed_content)
+
+        # Nothing is stored in the plain JSON column
+        self.assertFalse(
+            Revision.objects.filter(
+                pk__in=[r.pk for r in revisions], content__isnull=False
+            ).exists()
+        )
+
+    def test_content_is_decoded_transparently(self):
+        revisions = self.save_revisions(5)
+
+        for i, revision in enumerate(revisions):
+            revision = Revision.objects.get(pk=revision.pk)
+            self.assertEqual(revision.content["text"], "revision %d" % i)
+            self.assertEqual(revision.as_object().text, "revision %d" % i)
+
+    def test_deleting_delta_base_rebases_dependent_revisions(self):
+        revisions = self.save_revisions(3)
+
+        Revision.objects.get(pk=revisions[1].pk).delete()
+
+        revision = Revision.objects.get(pk=revisions[2].pk)
+        self.assertIsNone(revision.delta_base_id)
+        self.assertEqual(revision.content["text"], "revision 2")
+
+    def test_deleting_whole_chain(self):
+        revisions = self.save_revisions(3)
+
+        Revision.objects.filter(pk__in=[r.pk for r in revisions]).delete()
+
+        self.assertFalse(Revision.objects.filter(object_id=self.instance.pk).exists())
+
+    def test_changing_content_rebases_dependent_revisions(self):
+        revisions = self.save_revisions(3)
+
+        revision = Revision.objects.get(pk=revisions[1].pk)
+        revision.content["text"] = "changed"
+        revision.save()
+
+        self.assertEqual(
+            Revision.objects.get(pk=revisions[1].pk).content["text"], "changed"
+        )
+        dependent_revision = Revision.objects.get(pk=revisions[2].pk)
+        self.assertIsNone(dependent_revision.delta_base_id)
+        self.assertEqual(dependent_revision.content["text"], "revision 2")
+
+    def test_saving_unchanged_revision_keeps_delta(self):
+        revisions = self.save_revisions(2)
+
+        revision = Revision.objects.get(pk=revisions[1].pk)
+        self.assertEqual(revision.content["text"], "revision 1")
+        revision.save()
+
+        revision = Revision.objects.get(pk=revisions[1].pk)
+        self.assertEqual(revision.delta_base_id, revisions[0].pk)
+        self.assertEqual(revision.content["text"], "revision 1")
+
+    def test_plain_revisions_can_be_delta_bases(self):
+        with override_settings(
+            WAGTAIL_REVISION_CONTENT_COMPRESSION=None,
+            WAGTAIL_REVISION_CONTENT_DELTAS=False,
+        ):
+            plain_revision = self.save_revisions(1)[0]
+
+        revision = self.save_revisions(1)[0]
+
+        self.assertEqual(revision.delta_base_id, plain_revision.pk)
+        self.assertEqual(
+            Revision.objects.get(pk=revision.pk).content["text"], "revision 0"
+        )
+        self.assertEqual(
+            Revision.objects.get(pk=plain_revision.pk).content_encoding, ""
+        )
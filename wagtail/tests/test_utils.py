@@ -12,6 +12,7 @@ from wagtail.coreutils import (
     accepts_kwarg,
     camelcase_to_underscore,
     cautious_slugify,
+    delete_in_batches,
     find_available_slug,
     get_content_languages,
     get_dummy_request,
@@ -21,6 +22,7 @@ from wagtail.coreutils import (
     string_to_ascii,
 )
 from wagtail.models import Page, Site
+from wagtail.test.testapp.models import Advert
 from wagtail.utils.utils import deep_update
 
 
@@ -438,6 +440,25 @@ class TestMultigetattr(TestCase):
         self.assertFalse(self.thing.poke_was_called)
 
 
+class TestDeleteInBatches(TestCase):
+    def setUp(self):
+        for i in range(5):
+            Advert.objects.create(text="Advert %d" % i)
+        self.kept = Advert.objects.create(text="Keep me")
+
+    def test_delete_in_batches(self):
+        queryset = Advert.objects.exclude(text="Keep me")
+        batch_counts = list(delete_in_batches(queryset, batch_size=2))
+
+        self.assertEqual(batch_counts, [2, 2, 1])
+        self.assertEqual(list(Advert.objects.all()), [self.kept])
+
+    def test_stop_between_batches(self):
+        batches = delete_in_batches(Advert.objects.all(), batch_size=4)
+        self.assertEqual(next(batches), 4)
+        self.assertEqual(Advert.objects.count(), 2)
+
+
 class TestGetDummyRequest(TestCase):
     def test_standard_port(self):
         site = Site.objects.first()
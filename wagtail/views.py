@@ -9,6 +9,52 @@ from wagtail.forms import PasswordViewRestrictionForm
 from wagtail.models import Page, PageViewRestriction, Site
 
 
+def route_by_url_path(request, root_page, path_components):
+    """
+    Routes the request to a page below ``root_page``, giving the same result as calling
+    ``root_page.specific.route(request, path_components)``.
+
+    Rather than looking up each path component in turn, the pages matching every prefix
+    of the path are fetched in a single query on ``url_path``. The deepest matching page
+    is then routed to with its own ``route()`` method and any remaining path components.
+    Pages that override ``route()`` are always routed to with the path components below
+    them, so that pages such as ``RoutablePageMixin`` subclasses keep working.
+    """
+    url_paths = [
+        root_page.url_path + "/".join(path_components[:i]) + "/"
+        for i in range(1, len(path_components) + 1)
+    ]
+    pages_by_url_path = {
+        page.url_path: page
+        for page in Page.objects.filter(
+            url_path__in=url_paths,
+            path__startswith=root_page.path,
+            depth__gt=root_page.depth,
+        )
+    }
+
+    page = root_page
+    while path_components:
+        specific_class = page.specific_class
+        if specific_class is None or specific_class.route is not Page.route:
+            break
+
+        # Only follow the page that the default route() method would have found, in
+        # case the url_path of a page is out of step with its position in the tree
+        child_page = pages_by_url_path.get(page.url_path + path_components[0] + "/")
+        if (
+            child_page is None
+            or child_page.slug != path_components[0]
+            or not child_page.is_child_of(page)
+        ):
+            break
+
+        page = child_page
+        path_components = path_components[1:]
+
+    return page.specific.route(request, path_components)
+
+
 def serve(request, path):
     # we need a valid Site object corresponding to this request in order to proceed
     site = Site.find_for_request(request)
@@ -16,8 +62,8 @@ def serve(request, path):
         raise Http404
 
     path_components = [component for component in path.split("/") if component]
-    page, args, kwargs = site.root_page.localized.specific.route(
-        request, path_components
+    page, args, kwargs = route_by_url_path(
+        request, site.root_page.localized, path_components
     )
 
     for fn in hooks.get_hooks("before_serve_page"):
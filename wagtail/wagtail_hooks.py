@@ -30,7 +30,7 @@ def check_view_restrictions(page, request, serve_args, serve_kwargs):
     include a password / login form that will allow them to proceed). If
     there are no such restrictions, return None
     """
-    for restriction in page.get_view_restrictions():
+    for restriction in page.get_view_restrictions(request=request):
         if not restriction.accept_request(request):
             if restriction.restriction_type == PageViewRestriction.PASSWORD:
                 from wagtail.forms import PasswordViewRestrictionForm